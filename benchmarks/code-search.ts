@@ -0,0 +1,134 @@
+/**
+ * Code Search Benchmark
+ *
+ * Compares CodeSearchTool's full scan (read every candidate file) against
+ * the trigram-index path (read only files containing the query's required
+ * trigrams): index build and sync time, p50/p99 query latency and files
+ * read per query. Both paths must return identical matches.
+ *
+ * Usage:
+ *   npx tsx benchmarks/code-search.ts [--root /path/to/large/checkout]
+ *     [--iterations 10] [--patterns "useState,class\\s+\\w+Service"]
+ *
+ * Point --root at a large checkout (e.g. a monorepo) for meaningful
+ * numbers. The index is written to a temporary directory, not the checkout.
+ * Patterns with no usable trigrams (e.g. "\\d+") show the scan fallback.
+ */
+
+import { mkdtempSync, rmSync } from "fs";
+import { tmpdir } from "os";
+import { join, resolve } from "path";
+import { performance } from "perf_hooks";
+import { CodeSearchTool } from "../src/infrastructure/tools/builtin/CodeSearchTool.js";
+import type { CodeSearchResult } from "../src/infrastructure/tools/builtin/CodeSearchTool.js";
+
+function arg(name: string, fallback: string): string {
+  const i = process.argv.indexOf(`--${name}`);
+  return i >= 0 && process.argv[i + 1] ? process.argv[i + 1] : fallback;
+}
+
+const root = resolve(arg("root", process.cwd()));
+const iterations = Number(arg("iterations", "10"));
+const patterns = arg(
+  "patterns",
+  [
+    "getWorkspaceIndex",
+    "TODO|FIXME",
+    "class\\s+\\w+Tool",
+    "import .* from \"fs\"",
+    "readFile(Sync)?\\(",
+    "zzz_no_such_identifier",
+    "\\d{4}",
+  ].join(","),
+).split(",");
+
+const dataDirectory = mkdtempSync(join(tmpdir(), "code-search-bench-"));
+const common = { baseDirectory: root, maxMatches: 1_000_000 };
+const scan = new CodeSearchTool({ ...common, trigramIndex: false });
+const indexed = new CodeSearchTool({
+  ...common,
+  trigramIndex: true,
+  dataDirectory,
+});
+
+async function search(
+  tool: CodeSearchTool,
+  pattern: string,
+): Promise<{ ms: number; result: CodeSearchResult }> {
+  const start = performance.now();
+  const outcome = await tool.execute({ pattern });
+  const ms = performance.now() - start;
+  if (!outcome.success) {
+    throw new Error(`Search failed for ${pattern}: ${outcome.error}`);
+  }
+  return { ms, result: outcome.data as CodeSearchResult };
+}
+
+function percentile(values: number[], p: number): number {
+  const sorted = [...values].sort((a, b) => a - b);
+  return sorted[Math.min(sorted.length - 1, Math.floor(sorted.length * p))];
+}
+
+function signature(result: CodeSearchResult): string {
+  return result.matches
+    .map((match) => `${match.file}:${match.line}:${match.column}`)
+    .join("\n");
+}
+
+try {
+  // Warm the shared workspace index so both paths start from memory
+  await search(scan, "warmup");
+
+  const build = await search(indexed, "warmup_build");
+  const sync = await search(indexed, "warmup_sync");
+  console.log(`root: ${root}`);
+  console.log(
+    `index build: ${build.ms.toFixed(0)} ms ` +
+      `(${build.result.statistics.index?.filesIndexed ?? 0} files), ` +
+      `warm sync: ${sync.result.statistics.index?.indexTimeMs ?? 0} ms`,
+  );
+  console.log(
+    "\npattern                          matches   scan p50   scan p99  " +
+      "index p50  index p99   files read (scan/index)   speedup",
+  );
+
+  for (const pattern of patterns) {
+    const scanTimes: number[] = [];
+    const indexTimes: number[] = [];
+    let scanResult: CodeSearchResult | undefined;
+    let indexResult: CodeSearchResult | undefined;
+
+    for (let i = 0; i < iterations; i++) {
+      const a = await search(scan, pattern);
+      const b = await search(indexed, pattern);
+      scanTimes.push(a.ms);
+      indexTimes.push(b.ms);
+      scanResult = a.result;
+      indexResult = b.result;
+    }
+
+    if (signature(scanResult!) !== signature(indexResult!)) {
+      throw new Error(`Result mismatch for pattern ${pattern}`);
+    }
+
+    const scanP50 = percentile(scanTimes, 0.5);
+    const indexP50 = percentile(indexTimes, 0.5);
+    console.log(
+      [
+        pattern.slice(0, 32).padEnd(32),
+        String(scanResult!.totalMatches).padStart(8),
+        scanP50.toFixed(1).padStart(10),
+        percentile(scanTimes, 0.99).toFixed(1).padStart(10),
+        indexP50.toFixed(1).padStart(10),
+        percentile(indexTimes, 0.99).toFixed(1).padStart(10),
+        `${scanResult!.filesSearched}/${indexResult!.filesSearched}`.padStart(
+          25,
+        ),
+        `${(scanP50 / indexP50).toFixed(2)}x`.padStart(9),
+        indexResult!.statistics.index ? "" : " (no trigrams: scan)",
+      ].join(" "),
+    );
+  }
+} finally {
+  rmSync(dataDirectory, { recursive: true, force: true });
+}
@@ -0,0 +1,179 @@
+/**
+ * SSE Parser Benchmark
+ *
+ * Compares the incremental byte-level SseParser used by CopilotClient.stream
+ * against the previous implementation (decode, append to a string buffer,
+ * split on "\n", JSON-free line scan): time per chunk and heap allocated per
+ * chunk, for several network chunk sizes.
+ *
+ * Usage:
+ *   npm run bench:sse -- [--chunks 16,64,512,4096]
+ *     [--iterations 1000] [--fixtures chat-completion,tool-call,long-line]
+ *
+ * Fixtures in benchmarks/fixtures/ are recorded chat completion streams.
+ * The synthetic "long-line" fixture is a single 256 KiB data line, where
+ * re-splitting the buffered text made the old loop quadratic.
+ * Run with --expose-gc (as the npm script does) for allocation figures.
+ */
+
+import { readFileSync } from "fs";
+import { join } from "path";
+import { performance } from "perf_hooks";
+import { SseParser } from "../src/infrastructure/llm/SseParser.js";
+
+function arg(name: string, fallback: string): string {
+  const i = process.argv.indexOf(`--${name}`);
+  return i >= 0 && process.argv[i + 1] ? process.argv[i + 1] : fallback;
+}
+
+const chunkSizes = arg("chunks", "16,64,512,4096").split(",").map(Number);
+const iterations = Number(arg("iterations", "1000"));
+const fixtures = arg("fixtures", "chat-completion,tool-call,long-line").split(
+  ",",
+);
+const fixtureDir = join(process.cwd(), "benchmarks", "fixtures");
+
+const gc = (globalThis as { gc?: () => void }).gc;
+
+/**
+ * Previous CopilotClient.stream parsing loop, without JSON.parse
+ */
+function legacyParse(chunks: Uint8Array[]): number {
+  const decoder = new TextDecoder();
+  let buffer = "";
+  let events = 0;
+
+  for (const value of chunks) {
+    buffer += decoder.decode(value, { stream: true });
+    const lines = buffer.split("\n");
+    buffer = lines.pop() || "";
+
+    for (const line of lines) {
+      if (line.startsWith("data: ")) {
+        const data = line.slice(6);
+        if (data === "[DONE]") continue;
+        events++;
+      }
+    }
+  }
+
+  return events;
+}
+
+function incrementalParse(chunks: Uint8Array[]): number {
+  const parser = new SseParser();
+  let events = 0;
+
+  for (const value of chunks) {
+    for (const event of parser.push(value)) {
+      if (event.data !== "[DONE]") events++;
+    }
+  }
+  for (const event of parser.end()) {
+    if (event.data !== "[DONE]") events++;
+  }
+
+  return events;
+}
+
+function loadFixture(name: string): Uint8Array {
+  if (name === "long-line") {
+    const payload = JSON.stringify({ content: "x".repeat(256 * 1024) });
+    return new TextEncoder().encode(`data: ${payload}\n\ndata: [DONE]\n\n`);
+  }
+  return new Uint8Array(readFileSync(join(fixtureDir, `${name}.sse`)));
+}
+
+function split(bytes: Uint8Array, size: number): Uint8Array[] {
+  const chunks: Uint8Array[] = [];
+  for (let i = 0; i < bytes.length; i += size) {
+    chunks.push(bytes.slice(i, i + size));
+  }
+  return chunks;
+}
+
+function timePerChunk(
+  parse: (chunks: Uint8Array[]) => number,
+  chunks: Uint8Array[],
+): number {
+  const start = performance.now();
+  for (let i = 0; i < iterations; i++) parse(chunks);
+  return ((performance.now() - start) * 1000) / (iterations * chunks.length);
+}
+
+/**
+ * Heap growth per chunk over a few runs, small enough to fit in the young
+ * generation so no collection hides allocations (needs --expose-gc)
+ */
+function allocatedPerChunk(
+  parse: (chunks: Uint8Array[]) => number,
+  chunks: Uint8Array[],
+): number {
+  const runs = 3;
+  gc?.();
+  const before = process.memoryUsage().heapUsed;
+  for (let i = 0; i < runs; i++) parse(chunks);
+  const growth = process.memoryUsage().heapUsed - before;
+  return Math.max(0, growth) / (runs * chunks.length);
+}
+
+function measure(
+  parse: (chunks: Uint8Array[]) => number,
+  chunks: Uint8Array[],
+): { events: number; usPerChunk: number; bytesPerChunk: number } {
+  return {
+    events: parse(chunks),
+    usPerChunk: timePerChunk(parse, chunks),
+    bytesPerChunk: allocatedPerChunk(parse, chunks),
+  };
+}
+
+function speedup(baseline: number, value: number): string {
+  return `${(baseline / value).toFixed(2)}x`.padStart(9);
+}
+
+for (const name of fixtures) {
+  const bytes = loadFixture(name);
+  console.log(`\n${name} (${(bytes.length / 1024).toFixed(1)} KiB)`);
+  console.log(
+    "chunk  impl          events   us/chunk   bytes/chunk   speedup",
+  );
+
+  for (const size of chunkSizes) {
+    const chunks = split(bytes, size);
+
+    // Warm up both implementations (to optimized code) before measuring
+    const warmup = Math.ceil(50000 / chunks.length);
+    for (let i = 0; i < warmup; i++) {
+      legacyParse(chunks);
+      incrementalParse(chunks);
+    }
+
+    const legacy = measure(legacyParse, chunks);
+    const incremental = measure(incrementalParse, chunks);
+
+    if (legacy.events !== incremental.events) {
+      throw new Error(
+        `Event count mismatch: ${legacy.events} vs ${incremental.events}`,
+      );
+    }
+
+    for (const [label, result] of [
+      ["legacy", legacy],
+      ["incremental", incremental],
+    ] as const) {
+      console.log(
+        [
+          String(size).padEnd(6),
+          label.padEnd(13),
+          String(result.events).padStart(6),
+          result.usPerChunk.toFixed(2).padStart(10),
+          result.bytesPerChunk.toFixed(0).padStart(13),
+          label === "incremental"
+            ? speedup(legacy.usPerChunk, result.usPerChunk)
+            : "",
+        ].join(" "),
+      );
+    }
+  }
+}
@@ -0,0 +1,122 @@
+/**
+ * Vector Search Benchmark
+ *
+ * Compares the exact in-memory scan (VectorIndex) against approximate HNSW
+ * search (HnswIndex): recall@k and p50/p99 query latency.
+ *
+ * Usage:
+ *   npx tsx benchmarks/vector-search.ts [--sizes 10000,100000,1000000]
+ *     [--dim 128] [--queries 200] [--k 10] [--m 16]
+ *     [--ef-construction 200] [--ef-search 64]
+ *
+ * Vectors are random Gaussian mixtures (clustered, like real embeddings).
+ * Memory use is roughly 3 * size * dim * 4 bytes, so lower --dim for 1M.
+ */
+
+import { performance } from "perf_hooks";
+import { VectorIndex } from "../src/infrastructure/memory/VectorIndex.js";
+import { HnswIndex } from "../src/infrastructure/memory/HnswIndex.js";
+
+function arg(name: string, fallback: string): string {
+  const i = process.argv.indexOf(`--${name}`);
+  return i >= 0 && process.argv[i + 1] ? process.argv[i + 1] : fallback;
+}
+
+const sizes = arg("sizes", "10000,100000,1000000").split(",").map(Number);
+const dim = Number(arg("dim", "128"));
+const queries = Number(arg("queries", "200"));
+const k = Number(arg("k", "10"));
+const hnswConfig = {
+  M: Number(arg("m", "16")),
+  efConstruction: Number(arg("ef-construction", "200")),
+  efSearch: Number(arg("ef-search", "64")),
+};
+
+function gaussian(): number {
+  const u = 1 - Math.random();
+  const v = Math.random();
+  return Math.sqrt(-2 * Math.log(u)) * Math.cos(2 * Math.PI * v);
+}
+
+function makeGenerator(clusters: number): () => Float32Array {
+  const centers = Array.from({ length: clusters }, () =>
+    Float32Array.from({ length: dim }, gaussian),
+  );
+  return () => {
+    const center = centers[Math.floor(Math.random() * clusters)];
+    return Float32Array.from(
+      { length: dim },
+      (_, i) => center[i] + 0.5 * gaussian(),
+    );
+  };
+}
+
+function percentile(sorted: number[], p: number): number {
+  return sorted[Math.min(sorted.length - 1, Math.floor(p * sorted.length))];
+}
+
+function run(size: number): void {
+  const next = makeGenerator(Math.max(10, Math.floor(size / 1000)));
+  const data = new Float32Array(size * dim);
+  for (let i = 0; i < size; i++) {
+    data.set(next(), i * dim);
+  }
+
+  const exact = new VectorIndex(dim);
+  const hnsw = new HnswIndex(dim, hnswConfig);
+
+  let start = performance.now();
+  for (let i = 0; i < size; i++) {
+    exact.upsert(
+      { id: `m${i}`, type: "semantic", expiresAt: null },
+      data.subarray(i * dim, (i + 1) * dim),
+    );
+  }
+  const exactBuild = performance.now() - start;
+
+  start = performance.now();
+  for (let i = 0; i < size; i++) {
+    hnsw.upsert(
+      { id: `m${i}`, type: "semantic", expiresAt: null },
+      data.subarray(i * dim, (i + 1) * dim),
+    );
+    if (i > 0 && i % 100000 === 0) {
+      console.log(`  hnsw: inserted ${i}/${size}`);
+    }
+  }
+  const hnswBuild = performance.now() - start;
+
+  const exactTimes: number[] = [];
+  const hnswTimes: number[] = [];
+  let recall = 0;
+
+  for (let q = 0; q < queries; q++) {
+    const query = next();
+
+    start = performance.now();
+    const truth = exact.search(query, { limit: k, threshold: -1 });
+    exactTimes.push(performance.now() - start);
+
+    start = performance.now();
+    const approx = hnsw.search(query, { limit: k, threshold: -1 });
+    hnswTimes.push(performance.now() - start);
+
+    const expected = new Set(truth.map((hit) => hit.id));
+    recall += approx.filter((hit) => expected.has(hit.id)).length / k;
+  }
+
+  exactTimes.sort((a, b) => a - b);
+  hnswTimes.sort((a, b) => a - b);
+
+  console.log(`\nN=${size} dim=${dim} k=${k} queries=${queries}`);
+  console.log(
+    `  exact  build ${exactBuild.toFixed(0)}ms  p50 ${percentile(exactTimes, 0.5).toFixed(3)}ms  p99 ${percentile(exactTimes, 0.99).toFixed(3)}ms  recall 1.000`,
+  );
+  console.log(
+    `  hnsw   build ${hnswBuild.toFixed(0)}ms  p50 ${percentile(hnswTimes, 0.5).toFixed(3)}ms  p99 ${percentile(hnswTimes, 0.99).toFixed(3)}ms  recall ${(recall / queries).toFixed(3)}  (M=${hnswConfig.M} efC=${hnswConfig.efConstruction} efS=${hnswConfig.efSearch})`,
+  );
+}
+
+for (const size of sizes) {
+  run(size);
+}
@@ -33,6 +33,8 @@ export {
   type TaskManagerOptions,
   type TaskResult,
   type TaskStatistics,
+  type TaskHistograms,
+  type HistogramSnapshot,
 } from './tasks';
 
 // Plugin System
@@ -5,19 +5,22 @@
  * priority queuing, monitoring, and fault tolerance.
  *
  * Features:
- * - Async task queue with priority levels
- * - Task scheduling (cron-like)
- * - Concurrent execution with limits
+ * - Async task queue with priority levels (indexed binary heap)
+ * - Task scheduling (cron-like) from a min-heap with a single timer
+ * - Concurrent execution with limits (event-driven dispatch)
  * - Task lifecycle management
  * - Progress tracking and reporting
  * - Retry logic with exponential backoff
  * - Task persistence and recovery
  * - Resource monitoring and throttling
+ * - Queue-wait and run-time histograms
  *
  * @module BackgroundTaskManager
  */
 
 import { EventEmitter } from 'events';
+import type { MetricsCollector } from '../metrics/MetricsCollector';
+import { IndexedHeap } from './IndexedHeap';
 
 /**
  * Task status
@@ -118,6 +121,8 @@ export interface TaskManagerOptions {
   persistencePath?: string;
   cleanupInterval?: number;
   maxCompletedTasks?: number;
+  /** Also record queue-wait/run-time histograms here */
+  metrics?: MetricsCollector;
 }
 
 /**
@@ -146,6 +151,107 @@ export interface TaskStatistics {
   totalDuration: number;
 }
 
+/**
+ * Dequeue order: lower rank first, FIFO within a rank
+ */
+interface QueueKey {
+  rank: number;
+  seq: number;
+}
+
+const PRIORITY_RANK: Record<TaskPriority, number> = {
+  urgent: 0,
+  high: 1,
+  normal: 2,
+  low: 3,
+};
+
+/** Longest delay setTimeout accepts */
+const MAX_TIMER_DELAY = 2 ** 31 - 1;
+
+/**
+ * Histogram snapshot (durations in ms)
+ */
+export interface HistogramSnapshot {
+  count: number;
+  sum: number;
+  min: number;
+  max: number;
+  mean: number;
+  /** Percentiles estimated from bucket upper bounds */
+  p50: number;
+  p95: number;
+  p99: number;
+  /** Per-bucket counts (not cumulative); `le` is the upper bound */
+  buckets: Array<{ le: number; count: number }>;
+}
+
+/**
+ * Task timing histograms
+ */
+export interface TaskHistograms {
+  /** Time from enqueue to start */
+  queueWait: HistogramSnapshot;
+  /** Time from start to completion or failure */
+  runTime: HistogramSnapshot;
+}
+
+/**
+ * Fixed-bucket duration histogram
+ */
+class DurationHistogram {
+  private static readonly BOUNDS = [
+    1, 2, 5, 10, 25, 50, 100, 250, 500, 1000, 2500, 5000, 10000, 30000,
+    60000, 300000, Infinity,
+  ];
+
+  private counts = new Array<number>(DurationHistogram.BOUNDS.length).fill(0);
+  private count = 0;
+  private sum = 0;
+  private min = Infinity;
+  private max = 0;
+
+  record(value: number): void {
+    let i = 0;
+    while (value > DurationHistogram.BOUNDS[i]) i++;
+    this.counts[i]++;
+    this.count++;
+    this.sum += value;
+    this.min = Math.min(this.min, value);
+    this.max = Math.max(this.max, value);
+  }
+
+  snapshot(): HistogramSnapshot {
+    return {
+      count: this.count,
+      sum: this.sum,
+      min: this.count > 0 ? this.min : 0,
+      max: this.max,
+      mean: this.count > 0 ? this.sum / this.count : 0,
+      p50: this.percentile(50),
+      p95: this.percentile(95),
+      p99: this.percentile(99),
+      buckets: DurationHistogram.BOUNDS.map((le, i) => ({
+        le,
+        count: this.counts[i],
+      })),
+    };
+  }
+
+  private percentile(p: number): number {
+    if (this.count === 0) return 0;
+    const rank = Math.ceil((p / 100) * this.count);
+    let seen = 0;
+    for (let i = 0; i < this.counts.length; i++) {
+      seen += this.counts[i];
+      if (seen >= rank) {
+        return Math.min(DurationHistogram.BOUNDS[i], this.max);
+      }
+    }
+    return this.max;
+  }
+}
+
 /**
  * Background Task Manager
  *
@@ -187,21 +293,37 @@ export interface TaskStatistics {
  */
 export class BackgroundTaskManager extends EventEmitter {
   private tasks: Map<string, BackgroundTask>;
-  private queue: string[];
+  private queue: IndexedHeap<string, QueueKey>;
+  private scheduled: IndexedHeap<string, number>;
   private running: Set<string>;
   private abortControllers: Map<string, AbortController>;
-  private options: Required<TaskManagerOptions>;
-  private processingInterval?: NodeJS.Timeout;
+  private options: Required<Omit<TaskManagerOptions, 'metrics'>>;
+  private metrics?: MetricsCollector;
+  private scheduleTimer?: NodeJS.Timeout;
+  private scheduleTimerAt = Infinity;
   private cleanupInterval?: NodeJS.Timeout;
 
+  // Dispatch
+  private dispatchPending = false;
+  private enqueueSeq = 0;
+  private enqueuedAt: Map<string, number>;
+  private queueWait = new DurationHistogram();
+  private runTime = new DurationHistogram();
+
   constructor(options: TaskManagerOptions = {}) {
     super();
 
     this.tasks = new Map();
-    this.queue = [];
+    this.queue = new IndexedHeap(
+      (a, b) => a.rank - b.rank || a.seq - b.seq,
+    );
+    this.scheduled = new IndexedHeap((a, b) => a - b);
     this.running = new Set();
     this.abortControllers = new Map();
+    this.enqueuedAt = new Map();
+    this.metrics = options.metrics;
 
+    const { metrics: _metrics, ...rest } = options;
     this.options = {
       maxConcurrent: 5,
       defaultTimeout: 300000, // 5 minutes
@@ -211,10 +333,9 @@ export class BackgroundTaskManager extends EventEmitter {
       persistencePath: './tasks.json',
       cleanupInterval: 3600000, // 1 hour
       maxCompletedTasks: 1000,
-      ...options,
+      ...rest,
     };
 
-    this.startProcessing();
     this.startCleanup();
   }
 
@@ -255,6 +376,8 @@ export class BackgroundTaskManager extends EventEmitter {
 
     if (task.mode === 'immediate') {
       this.enqueue(task.id);
+    } else {
+      this.scheduleRun(task);
     }
 
     this.emit('task:added', { taskId: task.id, task });
@@ -309,19 +432,19 @@ export class BackgroundTaskManager extends EventEmitter {
       throw new Error(`Task ${taskId} not found`);
     }
 
-    // Abort if running
+    // Abort if running; the slot is freed once the handler has settled
     if (task.status === 'running') {
       const controller = this.abortControllers.get(taskId);
       if (controller) {
         controller.abort();
       }
-      this.running.delete(taskId);
     }
 
-    // Remove from queue
-    const queueIndex = this.queue.indexOf(taskId);
-    if (queueIndex >= 0) {
-      this.queue.splice(queueIndex, 1);
+    // Remove from queue and schedule
+    this.queue.remove(taskId);
+    this.enqueuedAt.delete(taskId);
+    if (this.scheduled.remove(taskId)) {
+      this.armScheduleTimer();
     }
 
     task.status = 'cancelled';
@@ -345,10 +468,30 @@ export class BackgroundTaskManager extends EventEmitter {
 
     if (task.status === 'running' || task.status === 'queued') {
       task.status = 'paused';
+      this.queue.remove(taskId);
+      this.enqueuedAt.delete(taskId);
       this.emit('task:paused', { taskId });
     }
   }
 
+  /**
+   * Change task priority
+   *
+   * A queued task moves to its new place in the queue immediately.
+   */
+  setPriority(taskId: string, priority: TaskPriority): void {
+    const task = this.tasks.get(taskId);
+    if (!task) {
+      throw new Error(`Task ${taskId} not found`);
+    }
+
+    task.priority = priority;
+    const key = this.queue.get(taskId);
+    if (key) {
+      this.queue.update(taskId, { rank: PRIORITY_RANK[priority], seq: key.seq });
+    }
+  }
+
   /**
    * Resume task
    */
@@ -444,6 +587,24 @@ export class BackgroundTaskManager extends EventEmitter {
     return stats;
   }
 
+  /**
+   * Get queue-wait and run-time histograms
+   */
+  getHistograms(): TaskHistograms {
+    return {
+      queueWait: this.queueWait.snapshot(),
+      runTime: this.runTime.snapshot(),
+    };
+  }
+
+  /**
+   * Reset timing histograms
+   */
+  resetHistograms(): void {
+    this.queueWait = new DurationHistogram();
+    this.runTime = new DurationHistogram();
+  }
+
   /**
    * Clear completed tasks
    */
@@ -464,13 +625,18 @@ export class BackgroundTaskManager extends EventEmitter {
   }
 
   /**
-   * Start task processing loop
+   * Dispatch on the next microtask
+   *
+   * Coalesces bursts (e.g. many addTask calls in one tick) into one pass
+   * over the queue.
    */
-  private startProcessing(): void {
-    this.processingInterval = setInterval(() => {
+  private scheduleDispatch(): void {
+    if (this.dispatchPending) return;
+    this.dispatchPending = true;
+    queueMicrotask(() => {
+      this.dispatchPending = false;
       this.processQueue();
-      this.processScheduled();
-    }, 100);
+    });
   }
 
   /**
@@ -484,38 +650,93 @@ export class BackgroundTaskManager extends EventEmitter {
 
   /**
    * Process task queue
+   *
+   * Starts tasks until `maxConcurrent` are running; does not wait for them.
    */
-  private async processQueue(): Promise<void> {
+  private processQueue(): void {
     // Check if we can run more tasks
     while (
       this.running.size < this.options.maxConcurrent &&
-      this.queue.length > 0
+      this.queue.size > 0
     ) {
-      const taskId = this.queue.shift()!;
+      const [taskId] = this.queue.pop()!;
       const task = this.tasks.get(taskId);
+      const enqueuedAt = this.enqueuedAt.get(taskId);
+      this.enqueuedAt.delete(taskId);
 
       if (task && task.status === 'queued') {
-        await this.executeTask(task);
+        if (enqueuedAt !== undefined) {
+          this.recordTiming('queue_wait', this.queueWait, Date.now() - enqueuedAt);
+        }
+        void this.executeTask(task);
       }
     }
   }
 
   /**
-   * Process scheduled tasks
+   * Record a duration in a local histogram and the metrics collector
+   */
+  private recordTiming(
+    name: 'queue_wait' | 'run_time',
+    histogram: DurationHistogram,
+    value: number,
+  ): void {
+    histogram.record(value);
+    this.metrics?.histogram(`tasks.${name}`, value);
+  }
+
+  /**
+   * Add a scheduled task to the schedule heap
+   */
+  private scheduleRun(task: BackgroundTask): void {
+    if (task.status !== 'scheduled' || task.nextRunAt === undefined) return;
+
+    this.scheduled.push(task.id, task.nextRunAt);
+    this.armScheduleTimer();
+  }
+
+  /**
+   * Point the schedule timer at the earliest due time
+   */
+  private armScheduleTimer(): void {
+    const next = this.scheduled.peek();
+    const dueAt = next ? next[1] : Infinity;
+    if (dueAt === this.scheduleTimerAt) return;
+
+    if (this.scheduleTimer) {
+      clearTimeout(this.scheduleTimer);
+      this.scheduleTimer = undefined;
+    }
+    this.scheduleTimerAt = dueAt;
+
+    if (next) {
+      const delay = Math.min(Math.max(0, dueAt - Date.now()), MAX_TIMER_DELAY);
+      this.scheduleTimer = setTimeout(() => {
+        this.scheduleTimer = undefined;
+        this.scheduleTimerAt = Infinity;
+        this.processScheduled();
+      }, delay);
+    }
+  }
+
+  /**
+   * Queue every scheduled task that is due
    */
   private processScheduled(): void {
     const now = Date.now();
 
-    for (const task of this.tasks.values()) {
-      if (
-        task.status === 'scheduled' &&
-        task.nextRunAt &&
-        task.nextRunAt <= now
-      ) {
+    let next = this.scheduled.peek();
+    while (next && next[1] <= now) {
+      this.scheduled.pop();
+      const task = this.tasks.get(next[0]);
+      if (task && task.status === 'scheduled') {
         task.status = 'queued';
         this.enqueue(task.id);
       }
+      next = this.scheduled.peek();
     }
+
+    this.armScheduleTimer();
   }
 
   /**
@@ -549,10 +770,12 @@ export class BackgroundTaskManager extends EventEmitter {
 
     this.emit('task:started', { taskId: task.id, task });
 
+    let timeoutHandle: NodeJS.Timeout | undefined;
+
     try {
       // Set timeout
       const timeoutPromise = new Promise<never>((_, reject) => {
-        setTimeout(() => {
+        timeoutHandle = setTimeout(() => {
           reject(new Error(`Task timeout after ${task.timeout}ms`));
         }, task.timeout);
       });
@@ -563,6 +786,11 @@ export class BackgroundTaskManager extends EventEmitter {
         timeoutPromise,
       ]);
 
+      // Cancelled while running: keep the cancelled state
+      if (controller.signal.aborted) {
+        return;
+      }
+
       task.output = result;
       task.status = 'completed';
       task.completedAt = Date.now();
@@ -578,8 +806,13 @@ export class BackgroundTaskManager extends EventEmitter {
         task.status = 'scheduled';
         task.lastRunAt = Date.now();
         task.nextRunAt = this.calculateNextRun(task.schedule);
+        this.scheduleRun(task);
       }
     } catch (error) {
+      if (controller.signal.aborted) {
+        return;
+      }
+
       task.error = error as Error;
       task.errorStack = (error as Error).stack;
 
@@ -612,8 +845,11 @@ export class BackgroundTaskManager extends EventEmitter {
         });
       }
     } finally {
+      clearTimeout(timeoutHandle);
+      this.recordTiming('run_time', this.runTime, Date.now() - task.startedAt!);
       this.running.delete(task.id);
       this.abortControllers.delete(task.id);
+      this.scheduleDispatch();
 
       if (this.options.enablePersistence) {
         await this.persistTasks();
@@ -628,20 +864,18 @@ export class BackgroundTaskManager extends EventEmitter {
     const task = this.tasks.get(taskId);
     if (!task) return;
 
-    // Insert based on priority
-    const priorityOrder = { urgent: 0, high: 1, normal: 2, low: 3 };
-    const taskPriority = priorityOrder[task.priority];
-
-    let insertIndex = this.queue.length;
-    for (let i = 0; i < this.queue.length; i++) {
-      const queuedTask = this.tasks.get(this.queue[i]);
-      if (queuedTask && priorityOrder[queuedTask.priority] > taskPriority) {
-        insertIndex = i;
-        break;
-      }
+    // Ordered by priority, then enqueue order; already queued tasks keep
+    // their place
+    if (!this.queue.has(taskId)) {
+      this.queue.push(taskId, {
+        rank: PRIORITY_RANK[task.priority],
+        seq: this.enqueueSeq++,
+      });
     }
-
-    this.queue.splice(insertIndex, 0, taskId);
+    if (!this.enqueuedAt.has(taskId)) {
+      this.enqueuedAt.set(taskId, Date.now());
+    }
+    this.scheduleDispatch();
   }
 
   /**
@@ -709,9 +943,10 @@ export class BackgroundTaskManager extends EventEmitter {
       await this.cancelTask(taskId);
     }
 
-    // Stop intervals
-    if (this.processingInterval) {
-      clearInterval(this.processingInterval);
+    // Stop timers
+    if (this.scheduleTimer) {
+      clearTimeout(this.scheduleTimer);
+      this.scheduleTimer = undefined;
     }
 
     if (this.cleanupInterval) {
@@ -0,0 +1,190 @@
+/**
+ * Indexed Binary Heap
+ *
+ * Min-heap of values addressed by a unique key. A key -> position index
+ * makes lookup O(1) and removal or re-prioritization O(log N).
+ *
+ * @module IndexedHeap
+ */
+
+/**
+ * Indexed binary min-heap
+ *
+ * @example
+ * ```typescript
+ * const heap = new IndexedHeap<string, number>((a, b) => a - b);
+ * heap.push('b', 2);
+ * heap.push('a', 1);
+ * heap.update('b', 0);
+ * heap.pop(); // ['b', 0]
+ * ```
+ */
+export class IndexedHeap<K, V> {
+  private keys: K[] = [];
+  private values: V[] = [];
+  private positions = new Map<K, number>();
+  private compare: (a: V, b: V) => number;
+
+  /**
+   * @param compare - Negative when `a` should come out before `b`
+   */
+  constructor(compare: (a: V, b: V) => number) {
+    this.compare = compare;
+  }
+
+  /**
+   * Number of entries
+   */
+  get size(): number {
+    return this.keys.length;
+  }
+
+  /**
+   * Whether a key is in the heap
+   */
+  has(key: K): boolean {
+    return this.positions.has(key);
+  }
+
+  /**
+   * Get the value stored for a key
+   */
+  get(key: K): V | undefined {
+    const index = this.positions.get(key);
+    return index === undefined ? undefined : this.values[index];
+  }
+
+  /**
+   * Insert an entry, or update its value if the key is present
+   */
+  push(key: K, value: V): void {
+    if (this.positions.has(key)) {
+      this.update(key, value);
+      return;
+    }
+
+    const index = this.keys.length;
+    this.keys.push(key);
+    this.values.push(value);
+    this.positions.set(key, index);
+    this.siftUp(index);
+  }
+
+  /**
+   * Change the value of an entry and restore heap order
+   *
+   * @returns False if the key is not in the heap
+   */
+  update(key: K, value: V): boolean {
+    const index = this.positions.get(key);
+    if (index === undefined) return false;
+
+    this.values[index] = value;
+    this.siftDown(this.siftUp(index));
+    return true;
+  }
+
+  /**
+   * Remove an entry
+   *
+   * @returns False if the key is not in the heap
+   */
+  remove(key: K): boolean {
+    const index = this.positions.get(key);
+    if (index === undefined) return false;
+
+    this.removeAt(index);
+    return true;
+  }
+
+  /**
+   * Smallest entry without removing it
+   */
+  peek(): [K, V] | undefined {
+    return this.keys.length > 0 ? [this.keys[0], this.values[0]] : undefined;
+  }
+
+  /**
+   * Remove and return the smallest entry
+   */
+  pop(): [K, V] | undefined {
+    if (this.keys.length === 0) return undefined;
+
+    const entry: [K, V] = [this.keys[0], this.values[0]];
+    this.removeAt(0);
+    return entry;
+  }
+
+  /**
+   * Remove all entries
+   */
+  clear(): void {
+    this.keys = [];
+    this.values = [];
+    this.positions.clear();
+  }
+
+  private removeAt(index: number): void {
+    const last = this.keys.length - 1;
+    this.positions.delete(this.keys[index]);
+
+    if (index !== last) {
+      this.keys[index] = this.keys[last];
+      this.values[index] = this.values[last];
+      this.positions.set(this.keys[index], index);
+    }
+    this.keys.pop();
+    this.values.pop();
+
+    if (index < this.keys.length) {
+      this.siftDown(this.siftUp(index));
+    }
+  }
+
+  private siftUp(index: number): number {
+    while (index > 0) {
+      const parent = (index - 1) >> 1;
+      if (this.compare(this.values[index], this.values[parent]) >= 0) break;
+      this.swap(index, parent);
+      index = parent;
+    }
+    return index;
+  }
+
+  private siftDown(index: number): number {
+    const length = this.keys.length;
+    while (true) {
+      const left = 2 * index + 1;
+      const right = left + 1;
+      let smallest = index;
+
+      if (
+        left < length &&
+        this.compare(this.values[left], this.values[smallest]) < 0
+      ) {
+        smallest = left;
+      }
+      if (
+        right < length &&
+        this.compare(this.values[right], this.values[smallest]) < 0
+      ) {
+        smallest = right;
+      }
+      if (smallest === index) return index;
+
+      this.swap(index, smallest);
+      index = smallest;
+    }
+  }
+
+  private swap(a: number, b: number): void {
+    const key = this.keys[a];
+    const value = this.values[a];
+    this.keys[a] = this.keys[b];
+    this.values[a] = this.values[b];
+    this.keys[b] = key;
+    this.values[b] = value;
+    this.positions.set(this.keys[a], a);
+    this.positions.set(this.keys[b], b);
+  }
+}
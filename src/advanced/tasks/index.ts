@@ -17,4 +17,6 @@ export {
   type TaskManagerOptions,
   type TaskResult,
   type TaskStatistics,
+  type TaskHistograms,
+  type HistogramSnapshot,
 } from './BackgroundTaskManager';
@@ -339,6 +339,7 @@ export class AgentFactory {
 
     // Create vector store - pass null for now as we need database wrapper
     const vectorStore = new VectorStore(null as any);
+    memoryStore.attachVectorStore(vectorStore);
 
     return { memoryStore, vectorStore };
   }
@@ -73,8 +73,8 @@ export class ContextFactory {
       defaultAutoPrune: config.defaultAutoPrune !== false,
     };
 
-    // Initialize token counter
-    this.tokenCounter = new TokenCounter();
+    // Initialize token counter (large tool outputs are encoded off-thread)
+    this.tokenCounter = new TokenCounter({ workers: 2 });
   }
 
   /**
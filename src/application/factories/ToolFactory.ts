@@ -32,6 +32,7 @@ import { GitLogTool } from "../../infrastructure/tools/builtin/GitLogTool.js";
 import { CodeSearchTool } from "../../infrastructure/tools/builtin/CodeSearchTool.js";
 import { FileSearchTool } from "../../infrastructure/tools/builtin/FileSearchTool.js";
 import { SymbolSearchTool } from "../../infrastructure/tools/builtin/SymbolSearchTool.js";
+import type { DatabaseWrapper } from "../../infrastructure/storage/Database.js";
 
 /**
  * Tool Factory Configuration
@@ -58,6 +59,9 @@ export interface ToolFactoryConfig {
 
   /** Tool-specific configurations */
   toolConfigs?: Record<string, Partial<ToolConfig>>;
+
+  /** Application database (persists the symbol search index) */
+  database?: DatabaseWrapper;
 }
 
 /**
@@ -96,6 +100,7 @@ export class ToolFactory {
       customToolDirs: config.customToolDirs || [],
       autoRegisterBuiltins: config.autoRegisterBuiltins !== false,
       toolConfigs: config.toolConfigs || {},
+      database: config.database,
     };
 
     this.registry = new ToolRegistry();
@@ -150,7 +155,7 @@ export class ToolFactory {
       // Search tools
       new CodeSearchTool(),
       new FileSearchTool(),
-      new SymbolSearchTool(),
+      new SymbolSearchTool({ database: this.config.database }),
     ];
 
     for (const tool of builtinTools) {
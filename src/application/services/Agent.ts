@@ -11,7 +11,7 @@
  * - Action logging and statistics
  * - State management (idle, thinking, acting, paused, stopped)
  * - Error handling and recovery
- * - Streaming support
+ * - Streaming support (tool calls start as soon as their arguments close)
  */
 
 import type { ILLMClient } from "../../core/interfaces/ILLMClient.js";
@@ -23,12 +23,15 @@ import type {
 } from "../../core/interfaces/ITool.js";
 import type {
   ChatRequest,
-  ChatResponse,
   ToolCall,
 } from "../../core/types/llm.types.js";
 import type { AgentConfig } from "../../infrastructure/config/AgentConfigParser.js";
 import { MemoryStore } from "../../infrastructure/memory/MemoryStore.js";
 import { VectorStore } from "../../infrastructure/memory/VectorStore.js";
+import {
+  streamChat,
+  type StreamChatResult,
+} from "../../infrastructure/llm/ChatStream.js";
 
 /**
  * Agent State
@@ -352,9 +355,10 @@ export class Agent {
         break;
       }
 
-      // THINK: Get LLM response
+      // THINK: Stream LLM response; tool calls start as their arguments close
       this.state = "thinking";
-      const response = await this.think(task);
+      const started = new Map<string, Promise<ToolResult>>();
+      const response = await this.think(task, started);
 
       // Check if task is complete (no tool calls)
       if (!response.toolCalls || response.toolCalls.length === 0) {
@@ -371,7 +375,7 @@ export class Agent {
 
       // ACT: Execute tool calls
       this.state = "acting";
-      const toolResults = await this.act(response.toolCalls, task);
+      const toolResults = await this.act(response.toolCalls, task, started);
 
       // OBSERVE: Add tool results to context
       this.state = "observing";
@@ -396,9 +400,17 @@ export class Agent {
 
   /**
    * THINK: Get LLM response with reasoning
+   *
+   * The response is streamed. Calls to tools without side effects are
+   * started as soon as their arguments are complete (in call order, one at
+   * a time), and each pending result is recorded in `started` under the
+   * call ID for act(). From the first call that may have side effects on,
+   * nothing more starts early, so calls still run in order and nothing
+   * mutating runs for a response that fails partway.
    */
   private async think(
     task: AgentTask,
+    started: Map<string, Promise<ToolResult>>,
   ): Promise<{ content: string; toolCalls?: ToolCall[] }> {
     this.log(`[THINK] Processing: ${task.description}`);
 
@@ -420,103 +432,176 @@ export class Agent {
     };
 
     // Call LLM
-    const response = await this.llmClient.chat(request);
+    let previous: Promise<unknown> = Promise.resolve();
+    let holding = false;
+    const startedCalls: ToolCall[] = [];
+    let response: StreamChatResult;
+    try {
+      response = await streamChat(this.llmClient, request, {
+        onToolCall: (toolCall) => {
+          if (!toolCall.id || started.has(toolCall.id) || holding) return;
+          const tool = this.tools.get(toolCall.function.name);
+          if (tool?.metadata.hasSideEffects !== false) {
+            holding = true;
+            return;
+          }
+          const result = previous.then(() =>
+            this.executeToolCall(toolCall, task),
+          );
+          started.set(toolCall.id, result);
+          startedCalls.push(toolCall);
+          previous = result;
+        },
+      });
+    } catch (error) {
+      // Calls that already ran stay in the conversation with their results
+      if (startedCalls.length > 0) {
+        await this.recordStartedCalls(startedCalls, started);
+      }
+      throw error;
+    }
     this.stats.llmCalls++;
     this.stats.tokensUsed += response.usage?.totalTokens || 0;
     this.stats.lastActivity = Date.now();
+    this.log(
+      `[THINK] First token after ${response.metrics.ttftMs ?? "-"}ms, done in ${response.metrics.totalMs}ms`,
+    );
+
+    const toolCalls =
+      response.toolCalls.length > 0 ? response.toolCalls : undefined;
 
     // Add assistant response to context
     await this.contextManager.addMessage({
       role: "assistant",
-      content: response.content || response.message.content,
-      tool_calls: response.message.tool_calls,
+      content: response.content,
+      tool_calls: toolCalls,
     });
 
     return {
-      content: response.content || response.message.content,
-      toolCalls: response.message.tool_calls,
+      content: response.content,
+      toolCalls,
     };
   }
 
+  /**
+   * Add tool calls started before a failed response, and their results,
+   * to the context
+   */
+  private async recordStartedCalls(
+    toolCalls: ToolCall[],
+    started: Map<string, Promise<ToolResult>>,
+  ): Promise<void> {
+    const results = await Promise.all(
+      toolCalls.map((toolCall) => started.get(toolCall.id)!),
+    );
+
+    await this.contextManager.addMessage({
+      role: "assistant",
+      content: "",
+      tool_calls: toolCalls,
+    });
+    await this.observe(
+      results.map((result, i) => ({
+        ...result,
+        metadata: { ...result.metadata, toolCallId: toolCalls[i].id },
+      })),
+    );
+  }
+
   /**
    * ACT: Execute tool calls
+   *
+   * Calls already started while the response streamed are awaited, the rest
+   * are executed in order.
    */
   private async act(
     toolCalls: ToolCall[],
     task: AgentTask,
+    started: Map<string, Promise<ToolResult>> = new Map(),
   ): Promise<ToolResult[]> {
     const results: ToolResult[] = [];
 
     for (const toolCall of toolCalls) {
-      const toolName = toolCall.function.name;
-      const tool = this.tools.get(toolName);
-
-      if (!tool) {
-        const error = `Tool "${toolName}" not found`;
-        this.logError("Tool execution failed", new Error(error));
-        results.push({
-          success: false,
-          error,
-        });
-        continue;
-      }
+      results.push(
+        await (started.get(toolCall.id) ?? this.executeToolCall(toolCall, task)),
+      );
+    }
 
-      this.log(`[ACT] Executing tool: ${toolName}`);
-
-      try {
-        // Parse arguments
-        const args = JSON.parse(toolCall.function.arguments);
-
-        // Create tool context
-        const toolContext: ToolContext = {
-          cwd: process.cwd(),
-          timeout: this.toolTimeout,
-        };
-
-        // Execute tool
-        const startTime = Date.now();
-        const result = await tool.execute(args, toolContext);
-        const executionTime = Date.now() - startTime;
-
-        // Create action
-        const action = this.createAction("tool_call", {
-          toolName,
-          toolArgs: args,
-          toolResult: result,
-          success: result.success,
-          executionTime,
-        });
-        task.actions.push(action);
+    return results;
+  }
 
-        this.stats.toolCalls++;
-        this.stats.actionsTaken++;
+  /**
+   * Execute a single tool call and record it as an action
+   */
+  private async executeToolCall(
+    toolCall: ToolCall,
+    task: AgentTask,
+  ): Promise<ToolResult> {
+    const toolName = toolCall.function.name;
+    const tool = this.tools.get(toolName);
+
+    if (!tool) {
+      const error = `Tool "${toolName}" not found`;
+      this.logError("Tool execution failed", new Error(error));
+      return {
+        success: false,
+        error,
+      };
+    }
 
-        results.push(result);
+    this.log(`[ACT] Executing tool: ${toolName}`);
 
-        this.log(`[ACT] Tool ${toolName} completed in ${executionTime}ms`);
-      } catch (error) {
-        const errorMessage =
-          error instanceof Error ? error.message : String(error);
-        this.logError(`Tool ${toolName} execution failed`, error);
+    try {
+      // Parse arguments
+      const args = JSON.parse(toolCall.function.arguments);
+
+      // Create tool context
+      const toolContext: ToolContext = {
+        cwd: process.cwd(),
+        timeout: this.toolTimeout,
+      };
+
+      // Execute tool
+      const startTime = Date.now();
+      const result = await tool.execute(args, toolContext);
+      const executionTime = Date.now() - startTime;
+
+      // Create action
+      const action = this.createAction("tool_call", {
+        toolName,
+        toolArgs: args,
+        toolResult: result,
+        success: result.success,
+        executionTime,
+      });
+      task.actions.push(action);
 
-        const result: ToolResult = {
-          success: false,
-          error: errorMessage,
-        };
+      this.stats.toolCalls++;
+      this.stats.actionsTaken++;
 
-        const action = this.createAction("tool_call", {
-          toolName,
-          toolResult: result,
-          success: false,
-          error: errorMessage,
-        });
-        task.actions.push(action);
+      this.log(`[ACT] Tool ${toolName} completed in ${executionTime}ms`);
 
-        results.push(result);
-      }
-    }
+      return result;
+    } catch (error) {
+      const errorMessage =
+        error instanceof Error ? error.message : String(error);
+      this.logError(`Tool ${toolName} execution failed`, error);
+
+      const result: ToolResult = {
+        success: false,
+        error: errorMessage,
+      };
+
+      const action = this.createAction("tool_call", {
+        toolName,
+        toolResult: result,
+        success: false,
+        error: errorMessage,
+      });
+      task.actions.push(action);
 
-    return results;
+      return result;
+    }
   }
 
   /**
@@ -599,6 +684,14 @@ export class Agent {
     this.state = "stopped";
     this.taskQueue = [];
     this.currentTask = undefined;
+
+    // Persist buffered access stats and importance updates
+    try {
+      this.memoryStore?.flush();
+    } catch (error) {
+      this.logError("Failed to flush memory writes", error);
+    }
+
     this.log("[STOP] Agent stopped");
   }
 
@@ -39,10 +39,33 @@ interface ChatOrchestratorOptions {
   agentFactory?: AgentFactory;
 }
 
+/**
+ * Handle for a chat message whose content arrives incrementally
+ */
+export interface StreamingMessage {
+  /** Message ID (the message is added on the first update) */
+  readonly id: string;
+
+  /** Append streamed text */
+  append(text: string): void;
+
+  /** Replace the whole content (e.g. a plan that grows as actions arrive) */
+  setContent(content: string): void;
+
+  /** Publish final content and metadata (e.g. ttftMs) and end streaming */
+  finish(content?: string, metadata?: Record<string, unknown>): void;
+
+  /** Drop the message (e.g. the stream failed and a fallback is shown) */
+  discard(): void;
+}
+
 /**
  * Chat Orchestrator Service
  */
 export class ChatOrchestrator {
+  /** Minimum interval between UI updates of a streaming message */
+  private static readonly STREAM_UPDATE_INTERVAL_MS = 50;
+
   private reactAgent?: ReActAgent;
   private routerClient?: ILLMClient;
   private commandRegistry: CommandRegistry;
@@ -690,6 +713,78 @@ Respond naturally in the user's language. Keep responses concise (2-3 sentences
     }
   }
 
+  /**
+   * Start a message whose content is streamed in
+   *
+   * The message is added on the first update, so an empty placeholder never
+   * shows. UI updates are throttled; `metadata.streaming` is true until
+   * finish() is called.
+   */
+  public createStreamingMessage(type: ChatMessage['type'] = 'assistant'): StreamingMessage {
+    const message = this.createMessage(type, '');
+    message.metadata = { streaming: true };
+    let added = false;
+    let closed = false;
+    let timer: NodeJS.Timeout | null = null;
+
+    const publish = () => {
+      if (timer) {
+        clearTimeout(timer);
+        timer = null;
+      }
+      if (!added) {
+        added = true;
+        this.addMessage(message);
+      } else {
+        this.updateMessage(message.id, { content: message.content, metadata: message.metadata });
+      }
+    };
+
+    const schedule = () => {
+      if (closed || timer) {
+        return;
+      }
+      if (!added) {
+        publish(); // Show the first token immediately
+        return;
+      }
+      timer = setTimeout(publish, ChatOrchestrator.STREAM_UPDATE_INTERVAL_MS);
+    };
+
+    return {
+      id: message.id,
+      append: (text: string) => {
+        message.content += text;
+        schedule();
+      },
+      setContent: (content: string) => {
+        message.content = content;
+        schedule();
+      },
+      finish: (content?: string, metadata?: Record<string, unknown>) => {
+        if (closed) {
+          return;
+        }
+        closed = true;
+        if (content !== undefined) {
+          message.content = content;
+        }
+        message.metadata = { ...message.metadata, ...metadata, streaming: false };
+        publish();
+      },
+      discard: () => {
+        closed = true;
+        if (timer) {
+          clearTimeout(timer);
+          timer = null;
+        }
+        if (added) {
+          this.removeMessage(message.id);
+        }
+      }
+    };
+  }
+
   /**
    * Clear messages
    */
@@ -9,6 +9,7 @@ import { readFileSync, writeFileSync, existsSync } from 'fs';
 import { join, dirname } from 'path';
 import { fileURLToPath } from 'url';
 import { Logger } from '../../infrastructure/logging/Logger.js';
+import type { LLMConfig, LLMRateLimitConfig } from '../../core/types/llm.types.js';
 
 /**
  * Model definition
@@ -38,6 +39,10 @@ interface ModelSettings {
   routerModel?: string;
   lastUsed: string[];
   favorites: string[];
+  rateLimits?: {
+    default?: Partial<LLMRateLimitConfig>;
+    models?: Record<string, Partial<LLMRateLimitConfig>>;
+  };
 }
 
 /**
@@ -248,6 +253,17 @@ export class ModelConfigService {
     return true;
   }
 
+  /**
+   * Get client-side rate limits (default plus per-model overrides)
+   */
+  getRateLimitConfig(): Pick<LLMConfig, 'rateLimit' | 'modelRateLimits'> {
+    const limits = this.modelSettings.rateLimits;
+    return {
+      rateLimit: limits?.default,
+      modelRateLimits: limits?.models,
+    };
+  }
+
   /**
    * Get list of free router models
    */
@@ -6,8 +6,14 @@
  *
  * This bridges the gap between ReActAgent's action planning
  * and actual tool execution with proper ITool interface.
+ *
+ * Actions are scheduled by dependency: read-only tools (per tool
+ * metadata) run concurrently up to a limit, while actions that mutate
+ * overlapping paths run in submission order. Results keep action order.
  */
 
+import * as path from 'path';
+
 import type { ITool, ToolResult } from '../../core/interfaces/ITool.js';
 import type { ProposedAction, ExecutionResult } from '../../presentation/ui/types.js';
 import { Logger } from '../../infrastructure/logging/Logger.js';
@@ -28,6 +34,7 @@ import { GitLogTool } from '../../infrastructure/tools/builtin/GitLogTool.js';
 import { CodeSearchTool } from '../../infrastructure/tools/builtin/CodeSearchTool.js';
 import { FileSearchTool } from '../../infrastructure/tools/builtin/FileSearchTool.js';
 import { SymbolSearchTool } from '../../infrastructure/tools/builtin/SymbolSearchTool.js';
+import { invalidateWorkspacePaths } from '../../infrastructure/tools/utils/WorkspaceIndex.js';
 
 /**
  * Tool Executor Configuration
@@ -52,6 +59,11 @@ export interface ToolExecutorConfig {
    * Tool execution timeout (ms)
    */
   timeout?: number;
+
+  /**
+   * Maximum actions executing at once
+   */
+  maxConcurrency?: number;
 }
 
 /**
@@ -62,6 +74,40 @@ interface ToolCall {
   args: Record<string, unknown>;
 }
 
+/**
+ * Action waiting for (or undergoing) execution
+ */
+interface ScheduledAction {
+  action: ProposedAction;
+  toolCall: ToolCall | null;
+  /** Tool may modify the filesystem or repository */
+  mutating: boolean;
+  /** Absolute paths the action touches; null if it may touch anything */
+  paths: string[] | null;
+  /** Earlier actions that must finish first */
+  dependencies: ScheduledAction[];
+  started: boolean;
+  done: boolean;
+  resolve: (result: ExecutionResult) => void;
+}
+
+/**
+ * Argument names that carry filesystem paths
+ */
+const PATH_ARGUMENTS = [
+  'path',
+  'paths',
+  'file',
+  'files',
+  'filePath',
+  'directory',
+  'source',
+  'destination',
+  'from',
+  'to',
+  'repository',
+];
+
 /**
  * Tool Executor
  *
@@ -72,6 +118,10 @@ export class ToolExecutor {
   private logger?: Logger;
   private enableLogging: boolean;
   private timeout: number;
+  private maxConcurrency: number;
+  /** Scheduled actions that have not finished, in submission order */
+  private pending: ScheduledAction[] = [];
+  private active = 0;
 
   constructor(config: ToolExecutorConfig) {
     this.tools = new Map();
@@ -82,6 +132,7 @@ export class ToolExecutor {
     this.logger = config.logger;
     this.enableLogging = config.enableLogging ?? true;
     this.timeout = config.timeout ?? 30000;
+    this.maxConcurrency = Math.max(1, config.maxConcurrency ?? 4);
 
     this.log('info', `ToolExecutor initialized with ${this.tools.size} tools`);
   }
@@ -89,46 +140,205 @@ export class ToolExecutor {
   /**
    * Execute proposed actions using available tools
    *
+   * Independent actions run concurrently; see executeAction().
+   *
    * @param actions Proposed actions from ReActAgent
-   * @returns Execution results
+   * @returns Execution results, in action order
    */
   async executeActions(actions: ProposedAction[]): Promise<ExecutionResult[]> {
-    const results: ExecutionResult[] = [];
+    return Promise.all(actions.map(action => this.executeAction(action)));
+  }
 
-    for (const action of actions) {
+  /**
+   * Schedule a single action
+   *
+   * The action waits for every earlier scheduled action it conflicts with:
+   * two actions conflict when at least one of them mutates and their paths
+   * overlap. Read-only actions never wait for each other.
+   *
+   * @param action Proposed action
+   * @returns Execution result once the action has run
+   */
+  executeAction(action: ProposedAction): Promise<ExecutionResult> {
+    return new Promise(resolve => {
+      let scheduled: ScheduledAction;
       try {
-        // Convert action to tool call
-        const toolCall = this.actionToToolCall(action);
-
-        if (!toolCall) {
-          // Not a tool action, skip
-          results.push({
-            success: false,
-            message: `Skipped: ${action.description}`,
-            error: 'Action does not map to a tool',
-            action
-          });
-          continue;
+        scheduled = this.scheduleAction(action, resolve);
+      } catch (error) {
+        resolve(this.failedResult(action, error));
+        return;
+      }
+
+      this.pending.push(scheduled);
+      this.dispatch();
+    });
+  }
+
+  /**
+   * Whether an action maps to a tool that declares no side effects
+   *
+   * @param action Proposed action
+   * @returns True if running the action cannot change anything
+   */
+  isReadOnly(action: ProposedAction): boolean {
+    try {
+      const toolCall = this.actionToToolCall(action);
+      const tool = toolCall ? this.tools.get(toolCall.toolName) : undefined;
+      return tool?.metadata.hasSideEffects === false;
+    } catch {
+      return false;
+    }
+  }
+
+  /**
+   * Classify an action and find the pending actions it depends on
+   */
+  private scheduleAction(
+    action: ProposedAction,
+    resolve: (result: ExecutionResult) => void
+  ): ScheduledAction {
+    // Convert action to tool call
+    const toolCall = this.actionToToolCall(action);
+    const tool = toolCall ? this.tools.get(toolCall.toolName) : undefined;
+    const mutating = tool?.metadata.hasSideEffects === true;
+
+    // Paths of mutating tools are only trusted for filesystem tools;
+    // commands and git operations can touch anything
+    const paths =
+      toolCall && (!mutating || tool?.metadata.category === 'filesystem')
+        ? this.extractPaths(toolCall.args)
+        : null;
+
+    const scheduled: ScheduledAction = {
+      action,
+      toolCall,
+      mutating,
+      paths,
+      dependencies: [],
+      started: false,
+      done: false,
+      resolve
+    };
+
+    if (toolCall) {
+      for (const other of this.pending) {
+        if (other.toolCall && this.conflicts(scheduled, other)) {
+          scheduled.dependencies.push(other);
         }
+      }
+    }
 
-        // Execute tool
-        const result = await this.executeTool(toolCall, action);
-        results.push(result);
+    return scheduled;
+  }
 
-      } catch (error) {
-        const errorMessage = error instanceof Error ? error.message : String(error);
-        this.log('error', `Failed to execute action: ${errorMessage}`);
+  /**
+   * Start every ready action, in submission order, up to the limit
+   */
+  private dispatch(): void {
+    for (const scheduled of this.pending) {
+      if (this.active >= this.maxConcurrency) {
+        return;
+      }
+      if (scheduled.started || !scheduled.dependencies.every(d => d.done)) {
+        continue;
+      }
 
-        results.push({
-          success: false,
-          message: `Failed: ${action.description}`,
-          error: errorMessage,
-          action
-        });
+      scheduled.started = true;
+      this.active++;
+      this.runScheduled(scheduled).then(result => {
+        if (scheduled.mutating) {
+          // Don't wait for watchers before the next search sees the change
+          invalidateWorkspacePaths(scheduled.paths ?? undefined);
+        }
+        scheduled.done = true;
+        this.active--;
+        this.pending = this.pending.filter(other => other !== scheduled);
+        scheduled.resolve(result);
+        this.dispatch();
+      });
+    }
+  }
+
+  /**
+   * Run a scheduled action (never rejects)
+   */
+  private async runScheduled(scheduled: ScheduledAction): Promise<ExecutionResult> {
+    const { action, toolCall } = scheduled;
+
+    if (!toolCall) {
+      // Not a tool action, skip
+      return {
+        success: false,
+        message: `Skipped: ${action.description}`,
+        error: 'Action does not map to a tool',
+        action
+      };
+    }
+
+    try {
+      // Execute tool
+      return await this.executeTool(toolCall, action);
+    } catch (error) {
+      return this.failedResult(action, error);
+    }
+  }
+
+  private failedResult(action: ProposedAction, error: unknown): ExecutionResult {
+    const errorMessage = error instanceof Error ? error.message : String(error);
+    this.log('error', `Failed to execute action: ${errorMessage}`);
+
+    return {
+      success: false,
+      message: `Failed: ${action.description}`,
+      error: errorMessage,
+      action
+    };
+  }
+
+  /**
+   * Whether two actions must not run concurrently
+   */
+  private conflicts(a: ScheduledAction, b: ScheduledAction): boolean {
+    if (!a.mutating && !b.mutating) {
+      return false;
+    }
+    if (a.paths === null || b.paths === null) {
+      return true;
+    }
+    return a.paths.some(pathA => b.paths!.some(pathB => this.pathsOverlap(pathA, pathB)));
+  }
+
+  /**
+   * Whether one path equals or contains the other
+   */
+  private pathsOverlap(a: string, b: string): boolean {
+    if (a === b) {
+      return true;
+    }
+    const [shorter, longer] = a.length < b.length ? [a, b] : [b, a];
+    return longer.startsWith(shorter.endsWith(path.sep) ? shorter : shorter + path.sep);
+  }
+
+  /**
+   * Collect absolute paths from tool arguments
+   *
+   * @returns Paths, or null if the arguments name none
+   */
+  private extractPaths(args: Record<string, unknown>): string[] | null {
+    const cwd = typeof args.cwd === 'string' ? args.cwd : '.';
+    const paths: string[] = [];
+
+    for (const name of PATH_ARGUMENTS) {
+      const value = args[name];
+      const values = Array.isArray(value) ? value : [value];
+      for (const item of values) {
+        if (typeof item === 'string' && item.length > 0) {
+          paths.push(path.resolve(cwd, item));
+        }
       }
     }
 
-    return results;
+    return paths.length > 0 ? paths : null;
   }
 
   /**
@@ -8,7 +8,8 @@
  * - Router LLM for intent analysis
  * - ReAct agent for action planning
  * - NO confirmations - immediate execution
- * - Real-time progress updates
+ * - Real-time progress updates (streamed plan and replies)
+ * - Actions start executing as soon as they are planned
  * - Safety guardrails for destructive operations
  *
  * This mode is ideal for:
@@ -26,7 +27,9 @@ import type { IModeHandler } from '../../../core/interfaces/IModeHandler.js';
 import type { CopilotClient } from '../../../infrastructure/llm/CopilotClient.js';
 import type { ChatOrchestrator } from '../ChatOrchestrator.js';
 import type { ReActAgent } from '../ReActAgent.js';
-import type { ProposedAction } from '../../../presentation/ui/types.js';
+import type { ProposedAction, ExecutionResult } from '../../../presentation/ui/types.js';
+import type { ChatRequest } from '../../../core/types/llm.types.js';
+import { streamChat, JsonStreamScanner } from '../../../infrastructure/llm/ChatStream.js';
 import { ToolExecutor } from '../ToolExecutor.js';
 import { OutputFormatter } from '../OutputFormatter.js';
 import { sanitizeError } from '../../../infrastructure/utils/ErrorSanitizer.js';
@@ -164,62 +167,59 @@ export class AgentModeHandler implements IModeHandler {
     }
 
     try {
-      // Step 1: Plan tool calls using LLM directly (bypasses ReActAgent completely!)
+      // Step 1: Stream the plan from the LLM (bypasses ReActAgent completely!)
+      // Each action is safety-checked as soon as its JSON closes; read-only
+      // actions start right away, the rest once the plan is complete -
+      // NO confirmation
       this.log('info', 'Planning tool calls with LLM...');
-      const proposedActions = await this.planToolCalls(trimmedInput);
+      const run = await this.executeStreamedPlan(trimmedInput);
 
-      // Step 2: Check if there are actions to execute
-      if (proposedActions.length === 0) {
+      // Step 2: Check if there were actions to execute
+      if (run.planned === 0) {
         // No actions needed, just have a conversation
         this.log('info', 'No actions needed, providing conversational response');
-
-        const response = await this.routerClient.chat({
-          messages: [
+        await this.streamReply(
+          [
             { role: 'system', content: 'You are a helpful autonomous coding assistant. Provide clear, helpful responses.' },
             { role: 'user', content: trimmedInput }
           ],
-          temperature: 0.7,
-          maxTokens: 500,
-        });
-
-        const content = response.content || response.message?.content || 'I understand your request.';
-
-        this.chatOrchestrator.addMessage(
-          this.chatOrchestrator.createMessage('assistant', content)
+          { temperature: 0.7, maxTokens: 500 },
+          'I understand your request.'
         );
         return;
       }
 
-      // Step 3: Safety check - prevent obviously destructive actions
-      if (this.enableSafetyChecks) {
-        const blocked = this.checkForDestructiveActions(proposedActions);
-        if (blocked.length > 0) {
-          this.log('warn', `Blocked ${blocked.length} potentially destructive actions`);
-          this.chatOrchestrator.addMessage(
-            this.chatOrchestrator.createMessage(
-              'error',
-              `⚠️ Blocked potentially destructive actions:\n\n` +
-              blocked.map((action, i) => `${i + 1}. ${action.description}`).join('\n') +
-              `\n\nThese actions require manual approval. Switch to Edit mode with /mode edit to review and approve actions.`
-            )
-          );
-          return;
-        }
-      }
-
-      // Step 4: Show what we're about to do
-      let planMessage = `🤖 I'll perform ${proposedActions.length} action(s):\n\n`;
-      proposedActions.forEach((action, i) => {
-        planMessage += `${i + 1}. ${action.description}\n`;
-      });
+      // Step 3: Report results of everything that ran
+      if (run.results.length > 0) {
+        // Format results beautifully (Claude Code style!)
+        this.chatOrchestrator.addMessage(
+          this.chatOrchestrator.createMessage(
+            'execution',
+            OutputFormatter.formatResults(run.results),
+            run.results
+          )
+        );
 
-      this.chatOrchestrator.addMessage(
-        this.chatOrchestrator.createMessage('assistant', planMessage)
-      );
+        const successCount = run.results.filter(r => r.success).length;
+        const failureCount = run.results.length - successCount;
+        this.log('info', `Execution complete: ${successCount} succeeded, ${failureCount} failed`);
+      }
 
-      // Step 5: EXECUTE IMMEDIATELY (no confirmation!)
-      this.log('info', `Executing ${proposedActions.length} actions autonomously...`);
-      await this.executeActionsAutonomously(proposedActions);
+      // Step 4: Report blocked actions (safety check)
+      if (run.blocked.length > 0) {
+        this.log('warn', `Blocked ${run.blocked.length} potentially destructive actions`);
+        this.chatOrchestrator.addMessage(
+          this.chatOrchestrator.createMessage(
+            'error',
+            `⚠️ Blocked potentially destructive actions:\n\n` +
+            run.blocked.map((action, i) => `${i + 1}. ${action.description}`).join('\n') +
+            (run.skipped.length > 0
+              ? `\n\n${run.skipped.length} other action(s) were not run.`
+              : '') +
+            `\n\nThese actions require manual approval. Switch to Edit mode with /mode edit to review and approve actions.`
+          )
+        );
+      }
 
     } catch (error) {
       const errorMessage = sanitizeError(error);
@@ -365,29 +365,14 @@ Guidelines:
 - WARN users that actions execute immediately
 - Suggest Edit mode (/mode edit) for safer execution`;
 
-      const response = await this.routerClient.chat({
-        messages: [
+      await this.streamReply(
+        [
           { role: 'system', content: systemPrompt },
           { role: 'user', content: input }
         ],
-        temperature: 0.7,
-        maxTokens: 200,
-      });
-
-      const content = response.content || response.message?.content || '';
-
-      if (content.trim()) {
-        this.chatOrchestrator.addMessage(
-          this.chatOrchestrator.createMessage('assistant', content.trim())
-        );
-      } else {
-        this.chatOrchestrator.addMessage(
-          this.chatOrchestrator.createMessage(
-            'assistant',
-            'I received your message. How can I help you today? (Note: I\'m in Agent mode - actions execute immediately!)'
-          )
-        );
-      }
+        { temperature: 0.7, maxTokens: 200 },
+        'I received your message. How can I help you today? (Note: I\'m in Agent mode - actions execute immediately!)'
+      );
     } catch (error) {
       this.log('error', `Failed to handle simple query: ${error}`);
       this.chatOrchestrator.addMessage(
@@ -440,10 +425,17 @@ Guidelines:
   /**
    * Plan tool calls using LLM directly (bypasses ReActAgent)
    *
+   * The reply is streamed and the JSON array parsed incrementally, so each
+   * action is reported through `onAction` as soon as its object closes.
+   *
    * @param input User input
+   * @param onAction Called with each action as it is planned
    * @returns Proposed actions
    */
-  private async planToolCalls(input: string): Promise<ProposedAction[]> {
+  private async planToolCalls(
+    input: string,
+    onAction?: (action: ProposedAction) => void
+  ): Promise<ProposedAction[]> {
     const tools = this.toolExecutor.getAvailableTools();
     const toolDescriptions = tools.map(t => `- ${t}: ${this.getToolDescription(t)}`).join('\n');
 
@@ -484,38 +476,51 @@ Respond with ONLY a JSON array (no markdown, no explanation):
 
 If no tools needed, return empty array: []`;
 
+    const actions: ProposedAction[] = [];
+    const scanner = new JsonStreamScanner({ elements: true });
+
+    const accept = (values: unknown[]) => {
+      for (const a of values as any[]) {
+        if (!a || typeof a !== 'object' || typeof a.tool !== 'string') {
+          continue;
+        }
+        const action: ProposedAction = {
+          id: `action-${Date.now()}-${Math.random().toString(36).substr(2, 9)}`,
+          description: a.description || a.tool,
+          command: a.tool,
+          category: 'system' as const,
+          parameters: a.parameters || {}
+        };
+        actions.push(action);
+        onAction?.(action);
+      }
+    };
+
     try {
-      const response = await this.routerClient.chat({
-        messages: [
-          { role: 'system', content: systemPrompt },
-          { role: 'user', content: input }
-        ],
-        temperature: 0.3,
-        maxTokens: 1000,
-      });
+      const result = await streamChat(
+        this.routerClient,
+        {
+          messages: [
+            { role: 'system', content: systemPrompt },
+            { role: 'user', content: input }
+          ],
+          temperature: 0.3,
+          maxTokens: 1000,
+        },
+        { onToken: (text) => accept(scanner.push(text)) }
+      );
 
-      const content = response.content || response.message?.content || '';
+      this.log('debug', `Plan streamed: ttft ${result.metrics.ttftMs}ms, total ${result.metrics.totalMs}ms`);
 
-      // Parse JSON response
-      const jsonMatch = content.match(/\[[\s\S]*\]/);
-      if (!jsonMatch) {
+      if (!scanner.done && actions.length === 0) {
         this.log('warn', 'No JSON array found in LLM response');
-        return [];
       }
 
-      const actions = JSON.parse(jsonMatch[0]);
-
-      return actions.map((a: any) => ({
-        id: `action-${Date.now()}-${Math.random().toString(36).substr(2, 9)}`,
-        description: a.description,
-        command: a.tool,
-        category: 'system' as const,
-        parameters: a.parameters || {}
-      }));
+      return actions;
 
     } catch (error) {
       this.log('error', `Failed to plan tool calls: ${error}`);
-      return [];
+      return actions;
     }
   }
 
@@ -541,46 +546,117 @@ If no tools needed, return empty array: []`;
   }
 
   /**
-   * Execute actions autonomously (no confirmation)
+   * Plan and execute actions autonomously (no confirmation)
+   *
+   * Read-only actions start as soon as they have been planned and passed
+   * the safety check, while the rest of the plan is still streaming. The
+   * first action with side effects, and everything after it, is held until
+   * the whole plan has streamed; held actions run only if no action in the
+   * plan was blocked. The ToolExecutor orders each action after earlier
+   * actions it conflicts with.
    *
-   * @param actions Actions to execute
+   * @param input User input
+   * @returns Execution results plus blocked and skipped actions
    */
-  private async executeActionsAutonomously(actions: ProposedAction[]): Promise<void> {
-    this.log('info', `Executing ${actions.length} actions autonomously using ToolExecutor...`);
+  private async executeStreamedPlan(input: string): Promise<{
+    planned: number;
+    results: ExecutionResult[];
+    blocked: ProposedAction[];
+    skipped: ProposedAction[];
+  }> {
+    const planMessage = this.chatOrchestrator.createStreamingMessage('assistant');
+    const accepted: ProposedAction[] = [];
+    const blocked: ProposedAction[] = [];
+    const skipped: ProposedAction[] = [];
+    const held: ProposedAction[] = [];
+    const executions: Promise<ExecutionResult>[] = [];
+
+    const execute = (action: ProposedAction) => {
+      // EXECUTE (no confirmation!) using ToolExecutor (with real tools!)
+      this.log('info', `Executing action: ${action.description}`);
+      executions.push(this.toolExecutor.executeAction(action));
+    };
 
-    try {
-      // Add progress message
-      this.chatOrchestrator.addMessage(
-        this.chatOrchestrator.createMessage(
-          'assistant',
-          `🤖 Executing ${actions.length} action(s)...`
-        )
-      );
+    const actions = await this.planToolCalls(input, (action) => {
+      // Safety check - prevent obviously destructive actions
+      if (this.enableSafetyChecks && this.checkForDestructiveActions([action]).length > 0) {
+        blocked.push(action);
+        return;
+      }
+      if (blocked.length > 0) {
+        skipped.push(action);
+        return;
+      }
 
-      // Execute actions using ToolExecutor (with real tools!)
-      const results = await this.toolExecutor.executeActions(actions);
+      accepted.push(action);
+      planMessage.setContent(this.formatActionList(accepted));
 
-      // Format results beautifully (Claude Code style!)
-      const formattedOutput = OutputFormatter.formatResults(results);
+      // Later actions may still be blocked: only start reads early, and keep
+      // plan order once anything has been held
+      if (held.length > 0 || !this.toolExecutor.isReadOnly(action)) {
+        held.push(action);
+        return;
+      }
+      execute(action);
+    });
 
-      this.chatOrchestrator.addMessage(
-        this.chatOrchestrator.createMessage('execution', formattedOutput, results)
-      );
+    // The whole plan has passed the safety check: run the held actions
+    if (blocked.length > 0) {
+      skipped.unshift(...held);
+    } else {
+      held.forEach(execute);
+    }
 
-      const successCount = results.filter(r => r.success).length;
-      const failureCount = results.filter(r => !r.success).length;
-      this.log('info', `Execution complete: ${successCount} succeeded, ${failureCount} failed`);
+    const results = await Promise.all(executions);
 
-    } catch (error) {
-      const errorMessage = sanitizeError(error);
-      this.log('error', `Action execution failed: ${errorMessage}`);
+    if (accepted.length > 0) {
+      planMessage.finish(this.formatActionList(accepted));
+    } else {
+      planMessage.discard();
+    }
 
-      this.chatOrchestrator.addMessage(
-        this.chatOrchestrator.createMessage(
-          'error',
-          `❌ Failed to execute actions: ${errorMessage}`
-        )
+    return { planned: actions.length, results, blocked, skipped };
+  }
+
+  /**
+   * Format the list of actions being performed
+   *
+   * @param actions Accepted actions
+   * @returns Plan message text
+   */
+  private formatActionList(actions: ProposedAction[]): string {
+    let message = `🤖 I'll perform ${actions.length} action(s):\n\n`;
+    actions.forEach((action, i) => {
+      message += `${i + 1}. ${action.description}\n`;
+    });
+    return message;
+  }
+
+  /**
+   * Stream a conversational reply from the router LLM into the chat
+   *
+   * @param messages Prompt messages
+   * @param params Sampling parameters
+   * @param fallback Text shown if the reply is empty
+   */
+  private async streamReply(
+    messages: ChatRequest['messages'],
+    params: { temperature: number; maxTokens: number },
+    fallback: string
+  ): Promise<void> {
+    const reply = this.chatOrchestrator.createStreamingMessage('assistant');
+
+    try {
+      const result = await streamChat(
+        this.routerClient,
+        { messages, ...params },
+        { onToken: (text) => reply.append(text) }
       );
+
+      reply.finish(result.content.trim() || fallback, { ttftMs: result.metrics.ttftMs });
+    } catch (error) {
+      reply.discard();
+      throw error;
     }
   }
 
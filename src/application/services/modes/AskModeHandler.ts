@@ -8,7 +8,7 @@
  * - No ReAct agent (eliminates toLowerCase bugs)
  * - No tool execution
  * - No confirmations
- * - Fast responses using router LLM
+ * - Fast responses using router LLM, streamed into the chat as they arrive
  * - Handles greetings, questions, and casual conversation
  *
  * This mode is ideal for:
@@ -21,6 +21,8 @@
 import type { IModeHandler } from '../../../core/interfaces/IModeHandler.js';
 import type { CopilotClient } from '../../../infrastructure/llm/CopilotClient.js';
 import type { ChatOrchestrator } from '../ChatOrchestrator.js';
+import { streamChat } from '../../../infrastructure/llm/ChatStream.js';
+import type { StreamChatResult } from '../../../infrastructure/llm/ChatStream.js';
 import { sanitizeError } from '../../../infrastructure/utils/ErrorSanitizer.js';
 
 /**
@@ -163,46 +165,39 @@ Examples:
 - "what can you do" → List capabilities, mention modes
 - "help me code" → Suggest Edit or Agent mode for task execution`;
 
-      // Call router LLM
-      const response = await this.routerClient.chat({
-        messages: [
-          { role: 'system', content: systemPrompt },
-          { role: 'user', content: trimmedInput },
-        ],
-        temperature: 0.7,
-        maxTokens: 200,
-      });
-
-      // Extract response content
-      let responseContent = '';
-
+      // Stream the router LLM reply into the chat as it arrives
+      const reply = this.chatOrchestrator.createStreamingMessage('assistant');
+      let result: StreamChatResult;
       try {
-        if (typeof response === 'string') {
-          responseContent = response;
-        } else if (response && typeof response === 'object') {
-          // Try different possible response structures (ChatResponse type)
-          responseContent =
-            response.content ||
-            response.message?.content ||
-            '';
-        }
-
-        responseContent = String(responseContent).trim();
+        result = await streamChat(
+          this.routerClient,
+          {
+            messages: [
+              { role: 'system', content: systemPrompt },
+              { role: 'user', content: trimmedInput },
+            ],
+            temperature: 0.7,
+            maxTokens: 200,
+          },
+          { onToken: (text) => reply.append(text) }
+        );
+      } catch (streamError) {
+        reply.discard();
+        throw streamError;
+      }
 
-        if (!responseContent || responseContent.length === 0) {
-          throw new Error('Empty response from router LLM');
-        }
+      const responseContent = result.content.trim();
+      if (responseContent.length === 0) {
+        reply.discard();
+        throw new Error('Empty response from router LLM');
+      }
 
-        this.log('debug', `Router response: "${responseContent.substring(0, 50)}..."`);
+      this.log(
+        'debug',
+        `Router response (ttft ${result.metrics.ttftMs}ms): "${responseContent.substring(0, 50)}..."`
+      );
 
-        // Add assistant message to chat
-        this.chatOrchestrator.addMessage(
-          this.chatOrchestrator.createMessage('assistant', responseContent)
-        );
-      } catch (parseError) {
-        this.log('error', `Failed to parse router response: ${parseError}`);
-        throw parseError;
-      }
+      reply.finish(responseContent, { ttftMs: result.metrics.ttftMs });
     } catch (error) {
       const errorMessage = sanitizeError(error);
       this.log('error', `Router LLM failed: ${errorMessage}`);
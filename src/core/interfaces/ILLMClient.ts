@@ -15,6 +15,7 @@ import type {
   LLMConfig,
   LLMStats,
   LLMRequestOptions,
+  LLMCacheStats,
 } from '../types/llm.types.js';
 
 /**
@@ -148,12 +149,66 @@ export interface ICachedLLMClient extends ILLMClient {
    *
    * @returns Promise resolving to cache stats
    */
-  getCacheStats(): Promise<{
-    size: number;
-    hits: number;
-    misses: number;
-    hitRate: number;
-  }>;
+  getCacheStats(): Promise<LLMCacheStats>;
+}
+
+/**
+ * Pluggable storage backend for cached chat responses
+ */
+export interface ILLMResponseCache {
+  /**
+   * Backend name (e.g., 'memory', 'sqlite', 'directory')
+   */
+  readonly name: string;
+
+  /**
+   * Get a cached response
+   *
+   * @param key - Cache key
+   * @returns Promise resolving to the response, or null on miss/expiry
+   */
+  get(key: string): Promise<ChatResponse | null>;
+
+  /**
+   * Store a response
+   *
+   * @param key - Cache key
+   * @param response - Response to cache
+   */
+  set(key: string, response: ChatResponse): Promise<void>;
+
+  /**
+   * Check if a live entry exists without counting a hit
+   *
+   * @param key - Cache key
+   */
+  has(key: string): Promise<boolean>;
+
+  /**
+   * Remove a single entry
+   *
+   * @param key - Cache key
+   * @returns Promise resolving to true if an entry was removed
+   */
+  delete(key: string): Promise<boolean>;
+
+  /**
+   * Remove entries
+   *
+   * @param pattern - Optional key pattern (`*` and `?` wildcards, otherwise substring)
+   * @returns Promise resolving to number of entries removed
+   */
+  clear(pattern?: string): Promise<number>;
+
+  /**
+   * Get hit/miss, size and eviction statistics
+   */
+  getStats(): LLMCacheStats;
+
+  /**
+   * Release resources (timers, handles); persisted entries are kept
+   */
+  close(): Promise<void>;
 }
 
 /**
@@ -7,6 +7,7 @@
 export type {
   ILLMClient,
   ICachedLLMClient,
+  ILLMResponseCache,
   ITokenCounter,
   IEmbeddingClient,
 } from "./ILLMClient.js";
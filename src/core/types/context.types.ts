@@ -6,6 +6,7 @@
  */
 
 import type { ChatMessage } from "./llm.types.js";
+import type { IEmbeddingClient } from "../interfaces/ILLMClient.js";
 
 /**
  * Context pruning strategy type
@@ -29,6 +30,8 @@ export interface ContextMessage extends ChatMessage {
   timestamp: number;
   priority?: MessagePriority;
   tokens?: number;
+  /** Digest `tokens` was counted for; a different digest means it is stale */
+  tokensDigest?: string;
   metadata?: Record<string, unknown>;
 }
 
@@ -136,6 +139,8 @@ export interface ContextManagerConfig {
       model?: string,
     ) => Promise<number>;
   };
+  /** Embedding client for the semantic strategy (default: local embedder) */
+  embeddingClient?: IEmbeddingClient;
 }
 
 /**
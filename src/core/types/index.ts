@@ -17,6 +17,9 @@ export type {
   LLMRequestOptions,
   LLMCacheEntry,
   LLMCacheStats,
+  LLMCacheConfig,
+  LLMRateLimitConfig,
+  LLMRateLimitStats,
   ToolCall,
   ToolDefinition,
   TokenUsage,
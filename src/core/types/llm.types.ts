@@ -30,6 +30,8 @@ export interface ChatMessage {
   tool_calls?: ToolCall[];
   tool_call_id?: string;
   metadata?: Record<string, unknown>;
+  /** Precomputed SHA-256 content digest (used for cache keys, not sent) */
+  digest?: string;
 }
 
 /**
@@ -183,6 +185,10 @@ export interface LLMConfig {
   retryDelay: number;
   streaming?: boolean;
   caching?: boolean;
+  cache?: LLMCacheConfig;
+  /** Default client-side limits, overridden per model by `modelRateLimits` */
+  rateLimit?: Partial<LLMRateLimitConfig>;
+  modelRateLimits?: Record<string, Partial<LLMRateLimitConfig>>;
   customHeaders?: Record<string, string>;
   metadata?: Record<string, unknown>;
 }
@@ -219,6 +225,12 @@ export interface LLMStats {
   totalTokensUsed: number;
   averageLatency: number;
   cacheHitRate: number;
+  /** Calls served by joining an identical in-flight request */
+  coalescedCalls: number;
+  /** Streaming calls that received a response */
+  streamedCalls: number;
+  /** Mean time (ms) from stream request to first content/tool-call delta */
+  averageTimeToFirstToken: number;
   callsByModel: Record<string, number>;
   errorsByType: Record<string, number>;
 }
@@ -243,6 +255,55 @@ export interface LLMCacheStats {
   misses: number;
   hitRate: number;
   totalSize: number;
+  evictions: number;
+  expirations: number;
+  tiers?: Record<string, LLMCacheStats>;
+}
+
+/**
+ * Client-side request limits for one model
+ */
+export interface LLMRateLimitConfig {
+  /** Sustained request rate (token bucket refill; 0 = unlimited) */
+  requestsPerMinute: number;
+  /** Bucket capacity: requests allowed back-to-back */
+  burst: number;
+  /** Max concurrent upstream requests (0 = unlimited) */
+  maxInFlight: number;
+}
+
+/**
+ * Rate limiter metrics for one model
+ */
+export interface LLMRateLimitStats {
+  inFlight: number;
+  queueDepth: number;
+  maxQueueDepth: number;
+  acquired: number;
+  /** Requests that had to wait for a slot */
+  delayed: number;
+  averageWaitMs: number;
+  maxWaitMs: number;
+  /** 429 responses reported to the limiter */
+  rateLimited: number;
+  /** Timestamp until which requests are held after a 429 */
+  pausedUntil: number | null;
+}
+
+/**
+ * Response cache settings for an LLM client
+ */
+export interface LLMCacheConfig {
+  /** Max entries held in memory */
+  maxEntries?: number;
+  /** Max serialized bytes held in memory */
+  maxBytes?: number;
+  /** Entry time-to-live in ms (0 = never expires) */
+  ttlMs?: number;
+  /** Directory for a persistent on-disk tier */
+  directory?: string;
+  /** Max serialized bytes held on disk */
+  maxDiskBytes?: number;
 }
 
 /**
@@ -9,7 +9,7 @@
  * - Automatic pruning when token limit is exceeded
  * - Multiple pruning strategies (sliding window, priority, summary, semantic)
  * - System message management
- * - Token counting integration
+ * - Token counting integration (counts memoized per message digest)
  * - Message search and selection
  * - Export/import for persistence
  * - Statistics tracking
@@ -37,6 +37,8 @@ import { SlidingWindowStrategy } from "./strategies/SlidingWindowStrategy.js";
 import { PriorityBasedStrategy } from "./strategies/PriorityBasedStrategy.js";
 import { SummaryBasedStrategy } from "./strategies/SummaryBasedStrategy.js";
 import { SemanticStrategy } from "./strategies/SemanticStrategy.js";
+import { computeMessageDigest } from "../llm/MessageDigest.js";
+import { getLocalEmbeddingClient } from "../llm/LocalEmbeddingClient.js";
 
 /**
  * Context Manager Implementation
@@ -107,15 +109,10 @@ export class ContextManager implements IContextManager {
   ): Promise<string> {
     const id = this.generateId();
     const timestamp = Date.now();
+    const digest = message.digest ?? computeMessageDigest(message);
 
     // Count tokens for this message
-    let tokens = 0;
-    if (this._config.tokenCounter) {
-      tokens = await this._config.tokenCounter.countMessageTokens([message]);
-    } else {
-      // Fallback estimation: ~4 chars per token
-      tokens = Math.ceil(message.content.length / 4);
-    }
+    const tokens = await this.countTokens({ ...message, digest });
 
     const contextMessage: ContextMessage = {
       ...message,
@@ -123,7 +120,9 @@ export class ContextManager implements IContextManager {
       timestamp,
       priority: options?.priority || "normal",
       tokens,
+      tokensDigest: digest,
       metadata: options?.metadata,
+      digest,
     };
 
     // Handle system messages specially
@@ -213,6 +212,7 @@ export class ContextManager implements IContextManager {
         name: this._state.systemMessage.name,
         tool_calls: this._state.systemMessage.tool_calls,
         tool_call_id: this._state.systemMessage.tool_call_id,
+        digest: this._state.systemMessage.digest,
       });
     }
 
@@ -224,6 +224,7 @@ export class ContextManager implements IContextManager {
         name: msg.name,
         tool_calls: msg.tool_calls,
         tool_call_id: msg.tool_call_id,
+        digest: msg.digest,
       });
     }
 
@@ -329,7 +330,8 @@ export class ContextManager implements IContextManager {
 
     this._state.systemMessage = systemMessage;
     this._state.messages = regularMessages;
-    this._state.totalTokens -= result.removedTokens;
+    // Strategies may insert messages (e.g., summaries), so re-sum their counts
+    this._state.totalTokens = this.sumTokens(result.messages);
 
     // Update stats
     this._stats.pruningCount++;
@@ -463,10 +465,23 @@ export class ContextManager implements IContextManager {
     // Clear current state
     this.reset();
 
-    // Import state
+    // Import state, reusing exported token counts. Older exports carry no
+    // digests; messages are only re-counted when their count is missing or
+    // was taken for different content.
+    const messages = await Promise.all(
+      data.state.messages.map((message) => this.withTokenCount(message)),
+    );
+    const systemMessage = data.state.systemMessage
+      ? await this.withTokenCount(data.state.systemMessage)
+      : undefined;
+
     this._state = {
       ...data.state,
-      messages: [...data.state.messages],
+      messages,
+      systemMessage,
+      totalTokens: this.sumTokens(
+        systemMessage ? [systemMessage, ...messages] : messages,
+      ),
     };
 
     // Import summaries
@@ -505,6 +520,43 @@ export class ContextManager implements IContextManager {
     };
   }
 
+  /**
+   * Count tokens for a message (digest lets the counter reuse its cache)
+   */
+  private async countTokens(message: ChatMessage): Promise<number> {
+    if (this._config.tokenCounter) {
+      return this._config.tokenCounter.countMessageTokens([message]);
+    }
+
+    // Fallback estimation: ~4 chars per token
+    return Math.ceil(message.content.length / 4);
+  }
+
+  /**
+   * Ensure a message has a current digest and a token count taken for it
+   *
+   * Hashing is cheap next to tokenizing, so the digest is always recomputed
+   * and only messages whose content changed since counting are re-encoded.
+   */
+  private async withTokenCount(
+    message: ContextMessage,
+  ): Promise<ContextMessage> {
+    const digest = computeMessageDigest(message);
+    const stale =
+      message.tokensDigest !== undefined && message.tokensDigest !== digest;
+
+    if (message.tokens !== undefined && !stale) {
+      return message.digest === digest ? message : { ...message, digest };
+    }
+
+    const tokens = await this.countTokens({ ...message, digest });
+    return { ...message, digest, tokens, tokensDigest: digest };
+  }
+
+  private sumTokens(messages: ContextMessage[]): number {
+    return messages.reduce((sum, msg) => sum + (msg.tokens || 0), 0);
+  }
+
   /**
    * Create a strategy instance from configuration
    */
@@ -520,7 +572,10 @@ export class ContextManager implements IContextManager {
           this._config.tokenCounter as any,
         );
       case "semantic":
-        return new SemanticStrategy(config, this._config.tokenCounter as any);
+        return new SemanticStrategy(
+          config,
+          this._config.embeddingClient ?? getLocalEmbeddingClient(),
+        );
       default:
         throw new Error(`Unknown strategy type: ${(config as any).type}`);
     }
@@ -9,7 +9,8 @@
  * - Keyword-based similarity (Jaccard index)
  * - Temporal relevance scoring
  * - Combined scoring with configurable weights
- * - Embedding caching for performance
+ * - Single-pass scoring with cached token sets and bounded top-K heap
+ * - Batched embedding requests, cached by content hash
  * - Token limit enforcement
  * - Fallback to keyword matching without embeddings
  */
@@ -21,6 +22,8 @@ import type {
   MessageEmbedding,
 } from "../../core/types/context.types.js";
 import type { IEmbeddingClient } from "../../core/interfaces/ILLMClient.js";
+import { EmbeddingBatcher } from "../llm/EmbeddingBatcher.js";
+import { computeContentDigest } from "../llm/MessageDigest.js";
 
 /**
  * Context selector configuration
@@ -70,6 +73,90 @@ interface ScoredMessage {
   };
 }
 
+/**
+ * Query state shared by all messages in one selection
+ */
+interface QueryScoring {
+  tokens: Set<string>;
+  embedding?: number[];
+  now: number;
+}
+
+/**
+ * Bounded min-heap keeping the K best-scored messages
+ *
+ * Ties keep the earlier message, matching a stable descending sort.
+ */
+class TopScoredHeap {
+  private items: Array<{ scored: ScoredMessage; index: number }> = [];
+  private readonly capacity: number;
+
+  constructor(capacity: number) {
+    this.capacity = capacity;
+  }
+
+  offer(scored: ScoredMessage, index: number): void {
+    const item = { scored, index };
+    if (this.items.length < this.capacity) {
+      this.items.push(item);
+      this.siftUp(this.items.length - 1);
+    } else if (this.isWorse(this.items[0], item)) {
+      this.items[0] = item;
+      this.siftDown(0);
+    }
+  }
+
+  /** Best first */
+  toSortedArray(): ScoredMessage[] {
+    return [...this.items]
+      .sort((a, b) => (this.isWorse(a, b) ? 1 : -1))
+      .map((item) => item.scored);
+  }
+
+  private isWorse(
+    a: { scored: ScoredMessage; index: number },
+    b: { scored: ScoredMessage; index: number },
+  ): boolean {
+    return (
+      a.scored.score < b.scored.score ||
+      (a.scored.score === b.scored.score && a.index > b.index)
+    );
+  }
+
+  private siftUp(i: number): void {
+    while (i > 0) {
+      const parent = (i - 1) >> 1;
+      if (!this.isWorse(this.items[i], this.items[parent])) break;
+      this.swap(i, parent);
+      i = parent;
+    }
+  }
+
+  private siftDown(i: number): void {
+    const n = this.items.length;
+    for (;;) {
+      const left = 2 * i + 1;
+      const right = left + 1;
+      let worst = i;
+      if (left < n && this.isWorse(this.items[left], this.items[worst])) {
+        worst = left;
+      }
+      if (right < n && this.isWorse(this.items[right], this.items[worst])) {
+        worst = right;
+      }
+      if (worst === i) break;
+      this.swap(i, worst);
+      i = worst;
+    }
+  }
+
+  private swap(i: number, j: number): void {
+    const item = this.items[i];
+    this.items[i] = this.items[j];
+    this.items[j] = item;
+  }
+}
+
 /**
  * Default configuration
  */
@@ -93,8 +180,13 @@ export class ContextSelector implements IContextSelector {
   public readonly config: ContextSelectorConfig;
 
   private embeddingClient?: IEmbeddingClient;
+  private batcher?: EmbeddingBatcher;
+  /** Keyed by content hash, so identical messages are embedded once */
   private embeddingCache: Map<string, EmbeddingCacheEntry> = new Map();
   private queryEmbeddingCache: Map<string, MessageEmbedding> = new Map();
+  /** Keyword token sets, keyed by content hash */
+  private tokenCache: Map<string, Set<string>> = new Map();
+  private contentKeys: WeakMap<ContextMessage, string> = new WeakMap();
   private selectionCount: number = 0;
   private totalMessagesProcessed: number = 0;
   private cacheHits: number = 0;
@@ -106,11 +198,17 @@ export class ContextSelector implements IContextSelector {
   ) {
     this.config = { ...DEFAULT_CONFIG, ...config };
     this.embeddingClient = embeddingClient;
+    this.batcher = embeddingClient
+      ? new EmbeddingBatcher(embeddingClient)
+      : undefined;
     this.validateConfig();
   }
 
   /**
    * Select relevant messages based on query
+   *
+   * The query is tokenized and embedded once; each message is scored in a
+   * single pass and the top results are kept in a bounded heap.
    */
   async selectRelevant(
     messages: ContextMessage[],
@@ -129,28 +227,26 @@ export class ContextSelector implements IContextSelector {
       return this.selectByRecency(messages, maxTokens);
     }
 
-    // Score all messages
-    const scoredMessages: ScoredMessage[] = await Promise.all(
-      messages.map(async (message) => {
-        const score = await this.calculateRelevance(query, message);
-        const breakdown = await this.calculateScoreBreakdown(query, message);
-        return { message, score, breakdown };
-      }),
-    );
-
-    // Filter by minimum score
-    const filtered = scoredMessages.filter(
-      (sm) => sm.score >= this.config.minScore,
-    );
+    // Embed the query and all uncached messages in batched requests
+    if (this.usesEmbeddings()) {
+      await this.prefetchEmbeddings(query, messages);
+    }
 
-    // Sort by score (descending)
-    filtered.sort((a, b) => b.score - a.score);
+    const scoring = await this.prepareQuery(query);
+    const top = new TopScoredHeap(this.config.maxResults);
 
-    // Take top results
-    const topResults = filtered.slice(0, this.config.maxResults);
+    messages.forEach((message, index) => {
+      const scored = this.scoreMessage(scoring, message);
+      if (scored.score >= this.config.minScore) {
+        top.offer(scored, index);
+      }
+    });
 
-    // Enforce token limit
-    const withinTokenLimit = this.enforceTokenLimit(topResults, maxTokens);
+    // Enforce token limit on the ranked results
+    const withinTokenLimit = this.enforceTokenLimit(
+      top.toSortedArray(),
+      maxTokens,
+    );
 
     // Convert to ContextSearchResult
     return withinTokenLimit.map((sm) => ({
@@ -167,100 +263,125 @@ export class ContextSelector implements IContextSelector {
     query: string,
     message: ContextMessage,
   ): Promise<number> {
-    const breakdown = await this.calculateScoreBreakdown(query, message);
-
-    // Combine scores using weights
-    let totalScore = 0;
-
-    if (breakdown.semantic !== undefined) {
-      totalScore += breakdown.semantic * this.config.weights.semantic;
-    }
-
-    if (breakdown.keyword !== undefined) {
-      totalScore += breakdown.keyword * this.config.weights.keyword;
-    }
-
-    if (breakdown.temporal !== undefined) {
-      totalScore += breakdown.temporal * this.config.weights.temporal;
+    if (this.usesEmbeddings()) {
+      await this.prefetchEmbeddings(query, [message]);
     }
 
-    // Normalize if not all factors were used
-    const usedWeights =
-      (breakdown.semantic !== undefined ? this.config.weights.semantic : 0) +
-      (breakdown.keyword !== undefined ? this.config.weights.keyword : 0) +
-      (breakdown.temporal !== undefined ? this.config.weights.temporal : 0);
+    const scoring = await this.prepareQuery(query);
+    return this.scoreMessage(scoring, message).score;
+  }
 
-    if (usedWeights > 0 && usedWeights < 1) {
-      totalScore = totalScore / usedWeights;
+  /**
+   * Build the per-selection query state: tokens, embedding and clock
+   */
+  private async prepareQuery(query: string): Promise<QueryScoring> {
+    let embedding: number[] | undefined;
+
+    if (this.usesEmbeddings()) {
+      try {
+        embedding = (await this.getQueryEmbedding(query)).embedding;
+      } catch (error) {
+        console.warn("Failed to embed query:", error);
+      }
     }
 
-    return Math.max(0, Math.min(1, totalScore));
+    return {
+      tokens: this.tokenize(query),
+      embedding,
+      now: Date.now(),
+    };
   }
 
   /**
-   * Calculate score breakdown for debugging
+   * Score a message against prepared query state
+   *
+   * Computes each component once and derives both the combined score and
+   * the breakdown from it.
    */
-  private async calculateScoreBreakdown(
-    query: string,
+  private scoreMessage(
+    scoring: QueryScoring,
     message: ContextMessage,
-  ): Promise<{
-    semantic?: number;
-    keyword?: number;
-    temporal?: number;
-  }> {
-    const breakdown: {
-      semantic?: number;
-      keyword?: number;
-      temporal?: number;
-    } = {};
+  ): ScoredMessage {
+    const breakdown: ScoredMessage["breakdown"] = {};
+    const { weights } = this.config;
 
     // Semantic similarity (if embeddings enabled and client available)
-    if (
-      this.config.useEmbeddings &&
-      this.embeddingClient &&
-      this.config.weights.semantic > 0
-    ) {
-      breakdown.semantic = await this.calculateSemanticSimilarity(
-        query,
-        message,
-      );
+    if (this.usesEmbeddings()) {
+      breakdown.semantic = this.calculateSemanticSimilarity(scoring, message);
     }
 
     // Keyword similarity
-    if (this.config.weights.keyword > 0) {
-      breakdown.keyword = this.calculateKeywordSimilarity(query, message);
+    if (weights.keyword > 0) {
+      breakdown.keyword = this.calculateKeywordSimilarity(
+        scoring.tokens,
+        this.getMessageTokens(message),
+      );
     }
 
     // Temporal relevance
-    if (this.config.weights.temporal > 0) {
-      breakdown.temporal = this.calculateTemporalRelevance(message);
+    if (weights.temporal > 0) {
+      breakdown.temporal = this.calculateTemporalRelevance(
+        message,
+        scoring.now,
+      );
+    }
+
+    // Combine scores using weights
+    let totalScore = 0;
+    let usedWeights = 0;
+
+    if (breakdown.semantic !== undefined) {
+      totalScore += breakdown.semantic * weights.semantic;
+      usedWeights += weights.semantic;
+    }
+
+    if (breakdown.keyword !== undefined) {
+      totalScore += breakdown.keyword * weights.keyword;
+      usedWeights += weights.keyword;
+    }
+
+    if (breakdown.temporal !== undefined) {
+      totalScore += breakdown.temporal * weights.temporal;
+      usedWeights += weights.temporal;
+    }
+
+    // Normalize if not all factors were used
+    if (usedWeights > 0 && usedWeights < 1) {
+      totalScore = totalScore / usedWeights;
     }
 
-    return breakdown;
+    return {
+      message,
+      score: Math.max(0, Math.min(1, totalScore)),
+      breakdown,
+    };
   }
 
   /**
-   * Calculate semantic similarity using embeddings
+   * Calculate semantic similarity from cached embeddings
+   *
+   * Embeddings are fetched up front by prefetchEmbeddings(); a message
+   * whose embedding could not be fetched scores 0.
    */
-  private async calculateSemanticSimilarity(
-    query: string,
+  private calculateSemanticSimilarity(
+    scoring: QueryScoring,
     message: ContextMessage,
-  ): Promise<number> {
-    if (!this.embeddingClient) {
+  ): number {
+    if (!scoring.embedding) {
       return 0;
     }
 
-    try {
-      // Get query embedding (with caching)
-      const queryEmbedding = await this.getQueryEmbedding(query);
-
-      // Get message embedding (with caching)
-      const messageEmbedding = await this.getMessageEmbedding(message);
+    const cached = this.embeddingCache.get(this.getContentKey(message));
+    if (!cached) {
+      this.cacheMisses++;
+      return 0;
+    }
 
-      // Calculate cosine similarity
+    this.cacheHits++;
+    try {
       return this.cosineSimilarity(
-        queryEmbedding.embedding,
-        messageEmbedding.embedding,
+        scoring.embedding,
+        cached.embedding.embedding,
       );
     } catch (error) {
       console.warn("Failed to calculate semantic similarity:", error);
@@ -272,34 +393,61 @@ export class ContextSelector implements IContextSelector {
    * Calculate keyword similarity using Jaccard index
    */
   private calculateKeywordSimilarity(
-    query: string,
-    message: ContextMessage,
+    queryTokens: Set<string>,
+    messageTokens: Set<string>,
   ): number {
-    const queryTokens = this.tokenize(query);
-    const messageTokens = this.tokenize(
-      typeof message.content === "string"
-        ? message.content
-        : JSON.stringify(message.content),
-    );
-
     if (queryTokens.size === 0 || messageTokens.size === 0) {
       return 0;
     }
 
-    // Calculate Jaccard index
-    const intersection = new Set(
-      [...queryTokens].filter((token) => messageTokens.has(token)),
+    // |A ∩ B| / |A ∪ B|, iterating the smaller set
+    const [small, large] =
+      queryTokens.size <= messageTokens.size
+        ? [queryTokens, messageTokens]
+        : [messageTokens, queryTokens];
+
+    let intersection = 0;
+    for (const token of small) {
+      if (large.has(token)) intersection++;
+    }
+
+    return (
+      intersection / (queryTokens.size + messageTokens.size - intersection)
     );
-    const union = new Set([...queryTokens, ...messageTokens]);
+  }
+
+  /**
+   * Get a message's keyword tokens, cached by content hash
+   */
+  private getMessageTokens(message: ContextMessage): Set<string> {
+    const key = this.getContentKey(message);
+    let tokens = this.tokenCache.get(key);
+    if (!tokens) {
+      tokens = this.tokenize(this.getContentText(message));
+      this.tokenCache.set(key, tokens);
+    }
+    return tokens;
+  }
 
-    return intersection.size / union.size;
+  /**
+   * Get a message's content hash, memoized per message object
+   */
+  private getContentKey(message: ContextMessage): string {
+    let key = this.contentKeys.get(message);
+    if (!key) {
+      key = computeContentDigest(this.getContentText(message));
+      this.contentKeys.set(message, key);
+    }
+    return key;
   }
 
   /**
    * Calculate temporal relevance (recency score)
    */
-  private calculateTemporalRelevance(message: ContextMessage): number {
-    const now = Date.now();
+  private calculateTemporalRelevance(
+    message: ContextMessage,
+    now: number = Date.now(),
+  ): number {
     const age = now - message.timestamp;
 
     // Convert age to hours
@@ -310,81 +458,112 @@ export class ContextSelector implements IContextSelector {
   }
 
   /**
-   * Get query embedding with caching
+   * Whether semantic scoring is active
    */
-  private async getQueryEmbedding(query: string): Promise<MessageEmbedding> {
-    // Check cache
-    const cached = this.queryEmbeddingCache.get(query);
-    if (cached) {
-      this.cacheHits++;
-      return cached;
+  private usesEmbeddings(): boolean {
+    return (
+      this.config.useEmbeddings &&
+      !!this.embeddingClient &&
+      this.config.weights.semantic > 0
+    );
+  }
+
+  /**
+   * Fill the embedding caches for a query and messages in one batched pass
+   *
+   * Failures are left to the per-message path, which falls back to 0.
+   */
+  private async prefetchEmbeddings(
+    query: string,
+    messages: ContextMessage[],
+  ): Promise<void> {
+    if (!this.batcher) {
+      return;
     }
 
-    this.cacheMisses++;
+    const texts: string[] = [];
+    const targets: Array<{ key: string; message?: ContextMessage }> = [];
 
-    // Generate embedding
-    if (!this.embeddingClient) {
-      throw new Error("Embedding client not available");
+    if (!this.queryEmbeddingCache.has(query)) {
+      texts.push(query);
+      targets.push({ key: query });
     }
 
-    const embeddings = await this.embeddingClient.embed(query, {
-      model: this.config.embeddingModel,
-    });
+    const seen = new Set<string>();
+    for (const message of messages) {
+      const key = this.getContentKey(message);
+      if (!this.embeddingCache.has(key) && !seen.has(key)) {
+        seen.add(key);
+        texts.push(this.getContentText(message));
+        targets.push({ key, message });
+      }
+    }
 
-    const messageEmbedding: MessageEmbedding = {
-      messageId: `query-${Date.now()}`,
-      embedding: embeddings[0],
-      model: this.config.embeddingModel || "unknown",
-      timestamp: Date.now(),
-    };
+    if (texts.length === 0) {
+      return;
+    }
 
-    // Cache it
-    this.queryEmbeddingCache.set(query, messageEmbedding);
+    try {
+      const vectors = await this.batcher.embedMany(texts, {
+        model: this.config.embeddingModel,
+      });
+      const now = Date.now();
+
+      targets.forEach(({ key, message }, i) => {
+        const embedding: MessageEmbedding = {
+          messageId: message ? message.id : `query-${now}`,
+          embedding: vectors[i],
+          model: this.config.embeddingModel || "unknown",
+          timestamp: now,
+        };
+        if (message) {
+          this.embeddingCache.set(key, { embedding, createdAt: now });
+        } else {
+          this.queryEmbeddingCache.set(key, embedding);
+        }
+      });
+    } catch (error) {
+      console.warn("Failed to prefetch embeddings:", error);
+    }
+  }
 
-    return messageEmbedding;
+  private getContentText(message: ContextMessage): string {
+    return typeof message.content === "string"
+      ? message.content
+      : JSON.stringify(message.content);
   }
 
   /**
-   * Get message embedding with caching
+   * Get query embedding with caching
    */
-  private async getMessageEmbedding(
-    message: ContextMessage,
-  ): Promise<MessageEmbedding> {
+  private async getQueryEmbedding(query: string): Promise<MessageEmbedding> {
     // Check cache
-    const cached = this.embeddingCache.get(message.id);
+    const cached = this.queryEmbeddingCache.get(query);
     if (cached) {
       this.cacheHits++;
-      return cached.embedding;
+      return cached;
     }
 
     this.cacheMisses++;
 
     // Generate embedding
-    if (!this.embeddingClient) {
+    if (!this.batcher) {
       throw new Error("Embedding client not available");
     }
 
-    const content =
-      typeof message.content === "string"
-        ? message.content
-        : JSON.stringify(message.content);
-
-    const embeddings = await this.embeddingClient.embed(content, {
+    const embeddings = await this.batcher.embed(query, {
       model: this.config.embeddingModel,
     });
 
     const messageEmbedding: MessageEmbedding = {
-      messageId: message.id,
+      messageId: `query-${Date.now()}`,
       embedding: embeddings[0],
       model: this.config.embeddingModel || "unknown",
       timestamp: Date.now(),
     };
 
     // Cache it
-    this.embeddingCache.set(message.id, {
-      embedding: messageEmbedding,
-      createdAt: Date.now(),
-    });
+    this.queryEmbeddingCache.set(query, messageEmbedding);
 
     return messageEmbedding;
   }
@@ -580,6 +759,7 @@ export class ContextSelector implements IContextSelector {
   clearCache(): void {
     this.embeddingCache.clear();
     this.queryEmbeddingCache.clear();
+    this.tokenCache.clear();
     this.cacheHits = 0;
     this.cacheMisses = 0;
   }
@@ -611,9 +791,11 @@ export class ContextSelector implements IContextSelector {
           : 0,
       embeddingCacheSize: this.embeddingCache.size,
       queryCacheSize: this.queryEmbeddingCache.size,
+      tokenCacheSize: this.tokenCache.size,
       cacheHits: this.cacheHits,
       cacheMisses: this.cacheMisses,
       cacheHitRate,
+      embeddingThroughput: this.batcher?.getStats(),
       config: {
         useEmbeddings: this.config.useEmbeddings,
         weights: this.config.weights,
@@ -637,6 +819,7 @@ export class ContextSelector implements IContextSelector {
    */
   setEmbeddingClient(client: IEmbeddingClient | undefined): void {
     this.embeddingClient = client;
+    this.batcher = client ? new EmbeddingBatcher(client) : undefined;
     if (!client && this.config.useEmbeddings) {
       console.warn(
         "Embedding client removed but useEmbeddings is true, will fall back to keyword matching",
@@ -8,7 +8,7 @@
  * - Embedding-based relevance scoring
  * - Cosine similarity calculation
  * - Keep top-K most relevant messages
- * - Embedding caching for performance
+ * - Batched embedding requests, cached by content hash
  * - Configurable relevance threshold
  * - Fallback to keyword-based similarity
  * - System message preservation
@@ -22,6 +22,8 @@ import type {
   MessageEmbedding,
 } from "../../../core/types/context.types.js";
 import type { IEmbeddingClient } from "../../../core/interfaces/ILLMClient.js";
+import { EmbeddingBatcher } from "../../llm/EmbeddingBatcher.js";
+import { computeContentDigest } from "../../llm/MessageDigest.js";
 
 /**
  * Embedding cache entry
@@ -47,6 +49,8 @@ export class SemanticStrategy implements IContextStrategy {
   public readonly config: SemanticConfig;
 
   private embeddingClient?: IEmbeddingClient;
+  private batcher?: EmbeddingBatcher;
+  /** Keyed by content hash, so identical messages are embedded once */
   private embeddingCache: Map<string, EmbeddingCacheEntry> = new Map();
   private pruneCount: number = 0;
   private totalRemoved: number = 0;
@@ -56,7 +60,7 @@ export class SemanticStrategy implements IContextStrategy {
 
   constructor(config: SemanticConfig, embeddingClient?: IEmbeddingClient) {
     this.config = config;
-    this.embeddingClient = embeddingClient;
+    this.setEmbeddingClient(embeddingClient);
     this.validateConfig();
   }
 
@@ -103,8 +107,9 @@ export class SemanticStrategy implements IContextStrategy {
   /**
    * Set embedding client
    */
-  setEmbeddingClient(client: IEmbeddingClient): void {
+  setEmbeddingClient(client: IEmbeddingClient | undefined): void {
     this.embeddingClient = client;
+    this.batcher = client ? new EmbeddingBatcher(client) : undefined;
   }
 
   /**
@@ -294,9 +299,16 @@ export class SemanticStrategy implements IContextStrategy {
     candidateMessages: ContextMessage[],
     referenceMessages: ContextMessage[],
   ): Promise<ScoredMessage[]> {
-    // Get embeddings for all messages
-    const candidateEmbeddings = await this.getEmbeddings(candidateMessages);
-    const referenceEmbeddings = await this.getEmbeddings(referenceMessages);
+    // Get embeddings for all messages in one batched pass
+    const allEmbeddings = await this.getEmbeddings([
+      ...candidateMessages,
+      ...referenceMessages,
+    ]);
+    const candidateEmbeddings = allEmbeddings.slice(
+      0,
+      candidateMessages.length,
+    );
+    const referenceEmbeddings = allEmbeddings.slice(candidateMessages.length);
 
     // Calculate average reference embedding
     const avgReferenceEmbedding = this.averageEmbeddings(referenceEmbeddings);
@@ -348,43 +360,48 @@ export class SemanticStrategy implements IContextStrategy {
   private async getEmbeddings(
     messages: ContextMessage[],
   ): Promise<MessageEmbedding[]> {
-    const embeddings: MessageEmbedding[] = [];
-
-    for (const message of messages) {
-      // Check cache first
-      const cached = this.embeddingCache.get(message.id);
-      if (cached) {
-        embeddings.push(cached.embedding);
-        continue;
+    const keys = messages.map((message) =>
+      computeContentDigest(message.content),
+    );
+
+    // Collect uncached contents (each distinct content once)
+    const missing = new Map<string, ContextMessage>();
+    keys.forEach((key, i) => {
+      if (!this.embeddingCache.has(key) && !missing.has(key)) {
+        missing.set(key, messages[i]);
       }
+    });
 
-      // Generate new embedding
-      if (!this.embeddingClient) {
+    if (missing.size > 0) {
+      if (!this.batcher) {
         throw new Error("Embedding client not available");
       }
 
-      const result = await this.embeddingClient.embed(message.content, {
-        model: this.config.embeddingModel,
-      });
-
-      const embedding: MessageEmbedding = {
-        messageId: message.id,
-        embedding: result[0], // result is number[][], take first embedding
-        model: this.config.embeddingModel || "default",
-        timestamp: Date.now(),
-      };
+      const pending = Array.from(missing.entries());
+      const vectors = await this.batcher.embedMany(
+        pending.map(([, message]) => message.content),
+        { model: this.config.embeddingModel },
+      );
 
-      // Cache the embedding
-      this.embeddingCache.set(message.id, {
-        embedding,
-        createdAt: Date.now(),
+      const now = Date.now();
+      pending.forEach(([key, message], i) => {
+        this.embeddingCache.set(key, {
+          embedding: {
+            messageId: message.id,
+            embedding: vectors[i],
+            model: this.config.embeddingModel || "default",
+            timestamp: now,
+          },
+          createdAt: now,
+        });
       });
-
-      embeddings.push(embedding);
-      this.totalEmbeddingsGenerated++;
+      this.totalEmbeddingsGenerated += pending.length;
     }
 
-    return embeddings;
+    return messages.map((message, i) => ({
+      ...this.embeddingCache.get(keys[i])!.embedding,
+      messageId: message.id,
+    }));
   }
 
   /**
@@ -632,6 +649,7 @@ export class SemanticStrategy implements IContextStrategy {
           ? Math.round((this.totalTokensRemoved / this.pruneCount) * 100) / 100
           : 0,
       cacheSize: this.embeddingCache.size,
+      embeddingThroughput: this.batcher?.getStats(),
       lastPruneTime: this.lastPruneTime,
       config: {
         maxMessages: this.config.maxMessages,
@@ -668,6 +686,7 @@ export class SemanticStrategy implements IContextStrategy {
     this.totalTokensRemoved = 0;
     this.totalEmbeddingsGenerated = 0;
     this.lastPruneTime = 0;
+    this.batcher?.resetStats();
   }
 }
 
@@ -0,0 +1,412 @@
+/**
+ * ChatStream - Consume a streamed chat completion as it arrives
+ *
+ * Features:
+ * - Forwards content deltas to a token callback as they arrive
+ * - Reassembles streamed tool calls and reports each one as soon as its
+ *   arguments JSON closes, so execution can start before the stream ends
+ * - Incremental JSON scanner for structured replies (e.g. a JSON array of
+ *   planned actions): each element is parsed once it is complete
+ * - Time-to-first-token and total duration for every call
+ * - Falls back to a buffered chat() call if streaming itself fails before
+ *   the first chunk (unsupported, malformed SSE); request errors, timeouts
+ *   and cancellations are rethrown
+ */
+
+import type { ILLMClient } from "../../core/interfaces/ILLMClient.js";
+import {
+  LLMError,
+  LLMResponseParsingError,
+  LLMTimeoutError,
+} from "../../core/errors/LLMError.js";
+import type {
+  ChatRequest,
+  FinishReason,
+  LLMRequestOptions,
+  TokenUsage,
+  ToolCall,
+} from "../../core/types/llm.types.js";
+
+/**
+ * Callbacks and options for streamChat
+ */
+export interface StreamChatOptions {
+  /** Called with every content delta */
+  onToken?: (text: string) => void;
+
+  /** Called once per tool call, as soon as its arguments are complete */
+  onToolCall?: (toolCall: ToolCall) => void;
+
+  /** Per-request overrides passed to the client */
+  requestOptions?: LLMRequestOptions;
+}
+
+/**
+ * Timing of a streamed call
+ */
+export interface StreamChatMetrics {
+  /** Milliseconds until the first content or tool-call delta (null if none) */
+  ttftMs: number | null;
+  /** Milliseconds until the stream ended */
+  totalMs: number;
+  /** Stream chunks received */
+  chunks: number;
+  /** False when the buffered chat() fallback was used */
+  streamed: boolean;
+}
+
+/**
+ * Result of a streamed call
+ */
+export interface StreamChatResult {
+  content: string;
+  toolCalls: ToolCall[];
+  finishReason?: FinishReason;
+  /** Token usage, when the provider reports it */
+  usage?: Partial<TokenUsage>;
+  metrics: StreamChatMetrics;
+}
+
+/**
+ * Streamed tool-call delta (OpenAI format carries the call's index)
+ */
+type ToolCallDelta = Partial<ToolCall> & {
+  index?: number;
+  function?: { name?: string; arguments?: string };
+};
+
+interface PendingToolCall {
+  id: string;
+  name: string;
+  arguments: string;
+  scanner: JsonStreamScanner;
+  emitted: boolean;
+}
+
+/**
+ * JsonStreamScanner - find complete JSON values in text fed piecewise
+ *
+ * Only string, escape and nesting state is tracked, so each character is
+ * looked at once; a value is handed to JSON.parse only when it has closed.
+ * Text before the first `{` or `[` (prose, markdown fences) is skipped.
+ *
+ * In `elements` mode the top-level value must be an array, and each of its
+ * elements is emitted as soon as it is complete. Otherwise the top-level
+ * value itself is emitted once it closes.
+ */
+export class JsonStreamScanner {
+  private buffer = "";
+  private position = 0;
+  private depth = 0;
+  private inString = false;
+  private escaped = false;
+  private started = false;
+  private elementStart = -1;
+  private valueStart = -1;
+  private finished = false;
+  private elements: boolean;
+
+  constructor(options: { elements?: boolean } = {}) {
+    this.elements = options.elements ?? false;
+  }
+
+  /**
+   * Whether the top-level value has closed
+   */
+  get done(): boolean {
+    return this.finished;
+  }
+
+  /**
+   * Feed more text
+   *
+   * @returns Values completed by this text (elements that fail to parse are
+   *   skipped)
+   */
+  push(text: string): unknown[] {
+    const values: unknown[] = [];
+    if (this.finished || text.length === 0) {
+      return values;
+    }
+
+    this.buffer += text;
+    const buffer = this.buffer;
+
+    for (let i = this.position; i < buffer.length; i++) {
+      const char = buffer[i];
+
+      if (this.inString) {
+        if (this.escaped) {
+          this.escaped = false;
+        } else if (char === "\\") {
+          this.escaped = true;
+        } else if (char === '"') {
+          this.inString = false;
+        }
+        continue;
+      }
+
+      if (!this.started) {
+        if (char === "[" || (char === "{" && !this.elements)) {
+          this.started = true;
+          this.depth = 1;
+          this.valueStart = i;
+        }
+        continue;
+      }
+
+      if (char === '"') {
+        this.inString = true;
+        this.markElementStart(i);
+      } else if (char === "{" || char === "[") {
+        this.markElementStart(i);
+        this.depth++;
+      } else if (char === "}" || char === "]") {
+        this.depth--;
+        if (this.depth === 0) {
+          this.closeElement(i, values);
+          this.finished = true;
+          if (!this.elements) {
+            this.parseInto(buffer.slice(this.valueStart, i + 1), values);
+          }
+          break;
+        }
+        if (this.depth === 1 && this.elements) {
+          // A nested object/array element just closed
+          this.closeElement(i + 1, values);
+        }
+      } else if (char === ",") {
+        if (this.depth === 1) {
+          this.closeElement(i, values);
+        }
+      } else if (char !== " " && char !== "\n" && char !== "\r" && char !== "\t") {
+        this.markElementStart(i);
+      }
+    }
+
+    this.position = buffer.length;
+    if (this.finished) {
+      this.buffer = "";
+    }
+    return values;
+  }
+
+  private markElementStart(index: number): void {
+    if (this.elements && this.depth === 1 && this.elementStart === -1) {
+      this.elementStart = index;
+    }
+  }
+
+  private closeElement(end: number, values: unknown[]): void {
+    if (!this.elements || this.elementStart === -1) {
+      return;
+    }
+    this.parseInto(this.buffer.slice(this.elementStart, end), values);
+    this.elementStart = -1;
+  }
+
+  private parseInto(text: string, values: unknown[]): void {
+    try {
+      values.push(JSON.parse(text));
+    } catch {
+      // Malformed element: skip it, later ones may still be usable
+    }
+  }
+}
+
+/**
+ * Stream a chat completion, reporting tokens and tool calls incrementally
+ *
+ * @param client - LLM client
+ * @param request - Chat request (`stream` is set by the client)
+ * @param options - Callbacks and request overrides
+ * @returns The assembled reply and its timing
+ */
+export async function streamChat(
+  client: ILLMClient,
+  request: ChatRequest,
+  options: StreamChatOptions = {},
+): Promise<StreamChatResult> {
+  const startTime = Date.now();
+  const pending = new Map<number, PendingToolCall>();
+  let content = "";
+  let finishReason: FinishReason | undefined;
+  let usage: Partial<TokenUsage> | undefined;
+  let ttftMs: number | null = null;
+  let chunks = 0;
+
+  const emit = (call: PendingToolCall): void => {
+    if (call.emitted) return;
+    call.emitted = true;
+    options.onToolCall?.(toToolCall(call));
+  };
+
+  try {
+    for await (const chunk of client.stream(request, options.requestOptions)) {
+      chunks++;
+      const { delta } = chunk;
+
+      if (delta.content) {
+        ttftMs ??= Date.now() - startTime;
+        content += delta.content;
+        options.onToken?.(delta.content);
+      }
+
+      const toolCalls = delta.tool_calls as ToolCallDelta[] | undefined;
+      if (toolCalls) {
+        ttftMs ??= Date.now() - startTime;
+        for (let i = 0; i < toolCalls.length; i++) {
+          const update = toolCalls[i];
+          const index = update.index ?? i;
+          let call = pending.get(index);
+          if (!call) {
+            call = {
+              id: "",
+              name: "",
+              arguments: "",
+              scanner: new JsonStreamScanner(),
+              emitted: false,
+            };
+            pending.set(index, call);
+          }
+          if (update.id) call.id = update.id;
+          if (update.function?.name) call.name += update.function.name;
+
+          const fragment = update.function?.arguments;
+          if (fragment) {
+            call.arguments += fragment;
+            call.scanner.push(fragment);
+            if (call.scanner.done && call.name) {
+              emit(call);
+            }
+          }
+        }
+      }
+
+      if (chunk.finishReason) {
+        finishReason = chunk.finishReason;
+      }
+      if (chunk.usage) {
+        usage = chunk.usage;
+      }
+    }
+  } catch (error) {
+    if (
+      chunks > 0 ||
+      options.requestOptions?.signal?.aborted ||
+      !isStreamFailure(error)
+    ) {
+      throw error;
+    }
+    return bufferedChat(client, request, options, startTime);
+  }
+
+  // Calls whose arguments never formed a closed object (e.g. no arguments)
+  const ordered = [...pending.entries()]
+    .sort(([a], [b]) => a - b)
+    .map(([, call]) => call);
+  for (const call of ordered) {
+    emit(call);
+  }
+
+  return {
+    content,
+    toolCalls: ordered.map(toToolCall),
+    finishReason,
+    usage,
+    metrics: {
+      ttftMs,
+      totalMs: Date.now() - startTime,
+      chunks,
+      streamed: true,
+    },
+  };
+}
+
+/**
+ * Whether a failure before the first chunk is specific to streaming, so the
+ * same request may still succeed as a buffered chat() call
+ *
+ * Cancellations, timeouts and errors reported by the API (4xx including
+ * rate limits and auth failures, 5xx) would fail again or double the wait,
+ * so they are not.
+ */
+function isStreamFailure(error: unknown): boolean {
+  if (isAbortError(error) || isTimeoutError(error)) {
+    return false;
+  }
+  if (error instanceof LLMResponseParsingError || error instanceof SyntaxError) {
+    return true; // Missing body or malformed SSE
+  }
+  if (error instanceof LLMError) {
+    return error.statusCode === 501; // Endpoint cannot stream
+  }
+  // Not an LLM error: the client's stream() is unsupported or broken
+  return true;
+}
+
+/**
+ * Whether an error reports a timed-out request
+ */
+function isTimeoutError(error: unknown): boolean {
+  return (
+    error instanceof LLMTimeoutError ||
+    (error instanceof Error && error.name === "TimeoutError")
+  );
+}
+
+/**
+ * Whether an error reports a cancelled request
+ */
+function isAbortError(error: unknown): boolean {
+  return (
+    (error instanceof Error && error.name === "AbortError") ||
+    (error instanceof LLMError && error.code === "LLM_ABORTED")
+  );
+}
+
+/**
+ * Non-streaming fallback: one chat() call, replayed through the callbacks
+ */
+async function bufferedChat(
+  client: ILLMClient,
+  request: ChatRequest,
+  options: StreamChatOptions,
+  startTime: number,
+): Promise<StreamChatResult> {
+  const response = await client.chat(request, options.requestOptions);
+  const content = response.content || response.message?.content || "";
+  const toolCalls = response.message?.tool_calls ?? [];
+  const elapsed = Date.now() - startTime;
+
+  if (content) {
+    options.onToken?.(content);
+  }
+  for (const call of toolCalls) {
+    options.onToolCall?.(call);
+  }
+
+  return {
+    content,
+    toolCalls,
+    finishReason: response.finishReason,
+    usage: response.usage,
+    metrics: {
+      ttftMs: content || toolCalls.length > 0 ? elapsed : null,
+      totalMs: elapsed,
+      chunks: 0,
+      streamed: false,
+    },
+  };
+}
+
+function toToolCall(call: PendingToolCall): ToolCall {
+  return {
+    id: call.id,
+    type: "function",
+    function: {
+      name: call.name,
+      arguments: call.arguments || "{}",
+    },
+  };
+}
@@ -8,6 +8,7 @@
 import type {
   ILLMClient,
   ICachedLLMClient,
+  ILLMResponseCache,
 } from "../../core/interfaces/ILLMClient.js";
 import type {
   ChatRequest,
@@ -20,6 +21,8 @@ import type {
   LLMConfig,
   LLMStats,
   LLMRequestOptions,
+  LLMCacheStats,
+  LLMRateLimitStats,
   FinishReason,
   TokenUsage,
 } from "../../core/types/llm.types.js";
@@ -35,6 +38,14 @@ import {
   LLMContextLengthError,
 } from "../../core/errors/LLMError.js";
 import { DEFAULT_LLM_CONFIG } from "../../core/constants/defaults.js";
+import { createResponseCache } from "./cache/index.js";
+import {
+  computeRequestKey,
+  getMessageDigest,
+  getValueDigest,
+} from "./MessageDigest.js";
+import { RateLimiter } from "./RateLimiter.js";
+import { SseParser } from "./SseParser.js";
 
 /**
  * Response from OpenAI-compatible API
@@ -79,6 +90,16 @@ interface APIErrorResponse {
   };
 }
 
+/**
+ * Upstream chat request shared by concurrent identical callers
+ */
+interface InFlightRequest {
+  promise: Promise<ChatResponse>;
+  controller: AbortController;
+  waiters: number;
+  settled: boolean;
+}
+
 /**
  * CopilotClient - Main LLM client implementation
  */
@@ -88,10 +109,19 @@ export class CopilotClient implements ILLMClient, ICachedLLMClient {
   public readonly config: LLMConfig;
 
   private stats: LLMStats;
-  private cache: Map<string, ChatResponse>;
+  private cache: ILLMResponseCache;
+  private ownsCache: boolean;
   private abortControllers: Map<string, AbortController>;
+  private inFlight: Map<string, InFlightRequest>;
+  private limiters: Map<string, RateLimiter>;
+  private firstTokenSamples = 0;
 
-  constructor(config?: Partial<LLMConfig>) {
+  /**
+   * @param config - Client configuration
+   * @param cache - Shared response cache backend; when omitted the client
+   *   builds its own from `config.cache`
+   */
+  constructor(config?: Partial<LLMConfig>, cache?: ILLMResponseCache) {
     this.config = {
       ...DEFAULT_LLM_CONFIG,
       ...config,
@@ -106,12 +136,18 @@ export class CopilotClient implements ILLMClient, ICachedLLMClient {
       totalTokensUsed: 0,
       averageLatency: 0,
       cacheHitRate: 0,
+      coalescedCalls: 0,
+      streamedCalls: 0,
+      averageTimeToFirstToken: 0,
       callsByModel: {},
       errorsByType: {},
     };
 
-    this.cache = new Map();
+    this.cache = cache ?? createResponseCache(this.config.cache);
+    this.ownsCache = !cache;
     this.abortControllers = new Map();
+    this.inFlight = new Map();
+    this.limiters = new Map();
   }
 
   /**
@@ -133,43 +169,46 @@ export class CopilotClient implements ILLMClient, ICachedLLMClient {
         (this.stats.callsByModel[model] || 0) + 1;
 
       // Check cache if enabled
-      if (options?.cache !== false) {
-        const cacheKey = this.getCacheKey(request);
-        if (cacheKey) {
-          const cached = await this.getCached(cacheKey);
-          if (cached) {
-            return cached;
-          }
+      const requestKey =
+        options?.cache !== false ? this.getCacheKey(request) : "";
+      const cacheKey = this.config.caching !== false ? requestKey : "";
+      if (cacheKey) {
+        const cached = await this.getCached(cacheKey);
+        if (cached) {
+          return cached;
         }
       }
 
-      // Prepare request body
-      const body = this.prepareRequestBody(request);
-
-      // Make HTTP request with retries
-      const response = await this.makeRequest(
-        "/v1/chat/completions",
-        body,
-        options,
-        requestId,
-      );
+      // Join an identical request that is already in flight
+      const existing = requestKey ? this.inFlight.get(requestKey) : undefined;
+      if (existing) {
+        this.stats.coalescedCalls++;
+        return await this.awaitInFlight(existing, options?.signal, requestId);
+      }
 
-      // Parse response
-      const chatResponse = this.parseResponse(response, requestId);
+      let chatResponse: ChatResponse;
+      if (requestKey) {
+        const flight = this.startInFlight(
+          requestKey,
+          cacheKey,
+          request,
+          options,
+          requestId,
+        );
+        chatResponse = await this.awaitInFlight(
+          flight,
+          options?.signal,
+          requestId,
+        );
+      } else {
+        chatResponse = await this.requestChat(request, options, requestId);
+      }
 
       // Update stats
       this.stats.successfulCalls++;
       this.stats.totalTokensUsed += chatResponse.usage.totalTokens;
       this.updateAverageLatency(Date.now() - startTime);
 
-      // Cache if enabled
-      if (options?.cache !== false) {
-        const cacheKey = this.getCacheKey(request);
-        if (cacheKey) {
-          this.cache.set(cacheKey, chatResponse);
-        }
-      }
-
       return chatResponse;
     } catch (error) {
       this.stats.failedCalls++;
@@ -189,6 +228,8 @@ export class CopilotClient implements ILLMClient, ICachedLLMClient {
     options?: LLMRequestOptions,
   ): AsyncGenerator<StreamChunk, void, unknown> {
     const requestId = this.generateRequestId();
+    const startTime = Date.now();
+    let release: (() => void) | null = null;
 
     try {
       // Prepare request body with streaming enabled
@@ -198,6 +239,9 @@ export class CopilotClient implements ILLMClient, ICachedLLMClient {
       const abortController = new AbortController();
       this.abortControllers.set(requestId, abortController);
 
+      // Hold a limiter slot for the lifetime of the stream
+      release = await this.getLimiter(body.model).acquire(options?.signal);
+
       // Make streaming request
       const response = await fetch(`${this.baseURL}/v1/chat/completions`, {
         method: "POST",
@@ -211,7 +255,13 @@ export class CopilotClient implements ILLMClient, ICachedLLMClient {
       });
 
       if (!response.ok) {
-        throw await this.handleErrorResponse(response, requestId);
+        const error = await this.handleErrorResponse(response, requestId);
+        if (error instanceof LLMRateLimitError) {
+          this.getLimiter(body.model).pause(
+            (error.retryAfter ?? 1) * 1000,
+          );
+        }
+        throw error;
       }
 
       if (!response.body) {
@@ -221,35 +271,42 @@ export class CopilotClient implements ILLMClient, ICachedLLMClient {
         });
       }
 
-      // Parse SSE stream
+      this.stats.streamedCalls++;
+
+      // Parse SSE stream incrementally from the raw bytes
       const reader = response.body.getReader();
-      const decoder = new TextDecoder();
-      let buffer = "";
+      const parser = new SseParser();
+      let sawFirstToken = false;
 
       while (true) {
         const { done, value } = await reader.read();
-        if (done) break;
+        const events = done ? parser.end() : parser.push(value);
+
+        for (const event of events) {
+          if (event.data === "[DONE]") continue;
 
-        buffer += decoder.decode(value, { stream: true });
-        const lines = buffer.split("\n");
-        buffer = lines.pop() || "";
-
-        for (const line of lines) {
-          if (line.startsWith("data: ")) {
-            const data = line.slice(6);
-            if (data === "[DONE]") continue;
-
-            try {
-              const chunk = JSON.parse(data);
-              yield this.parseStreamChunk(chunk);
-            } catch (error) {
-              // Skip malformed chunks
-              continue;
-            }
+          let chunk: any;
+          try {
+            chunk = JSON.parse(event.data);
+          } catch {
+            // Skip malformed chunks
+            continue;
           }
+          const streamChunk = this.parseStreamChunk(chunk);
+          if (
+            !sawFirstToken &&
+            (streamChunk.delta.content || streamChunk.delta.tool_calls)
+          ) {
+            sawFirstToken = true;
+            this.updateTimeToFirstToken(Date.now() - startTime);
+          }
+          yield streamChunk;
         }
+
+        if (done) break;
       }
     } finally {
+      release?.();
       this.abortControllers.delete(requestId);
     }
   }
@@ -357,6 +414,7 @@ export class CopilotClient implements ILLMClient, ICachedLLMClient {
    * Reset statistics
    */
   resetStats(): void {
+    this.firstTokenSamples = 0;
     this.stats = {
       totalCalls: 0,
       successfulCalls: 0,
@@ -364,6 +422,9 @@ export class CopilotClient implements ILLMClient, ICachedLLMClient {
       totalTokensUsed: 0,
       averageLatency: 0,
       cacheHitRate: 0,
+      coalescedCalls: 0,
+      streamedCalls: 0,
+      averageTimeToFirstToken: 0,
       callsByModel: {},
       errorsByType: {},
     };
@@ -385,25 +446,56 @@ export class CopilotClient implements ILLMClient, ICachedLLMClient {
       controller.abort();
     }
     this.abortControllers.clear();
-    this.cache.clear();
+
+    // A shared cache is closed by whoever created it
+    if (this.ownsCache) {
+      await this.cache.close();
+    }
+  }
+
+  /**
+   * Get rate limiter metrics per model (queue depth, wait times, 429s)
+   */
+  getRateLimitStats(): Record<string, LLMRateLimitStats> {
+    const stats: Record<string, LLMRateLimitStats> = {};
+    for (const [model, limiter] of this.limiters) {
+      stats[model] = limiter.getStats();
+    }
+    return stats;
   }
 
   // ICachedLLMClient implementation
 
   /**
    * Get cache key for request
+   *
+   * `<model>:<digest>`, where the digest is a SHA-256 over per-message
+   * digests plus every parameter that affects the completion; messages
+   * carrying a precomputed `digest` are not rehashed. The model prefix is
+   * what `clearCache` patterns can usefully match.
    */
   getCacheKey(request: ChatRequest): string {
     if (request.stream) return ""; // Don't cache streaming requests
 
-    const key = JSON.stringify({
-      messages: request.messages,
-      model: request.model || this.config.defaultModel || this.config.model,
-      temperature: request.temperature,
-      maxTokens: request.maxTokens,
+    const model =
+      request.model || this.config.defaultModel || this.config.model;
+    const digest = computeRequestKey(request.messages, {
+      model,
+      temperature: request.temperature ?? this.config.temperature,
+      maxTokens: request.maxTokens ?? this.config.maxTokens,
+      topP: request.topP,
+      frequencyPenalty: request.frequencyPenalty,
+      presencePenalty: request.presencePenalty,
+      stop: request.stop,
+      n: request.n,
+      toolChoice: request.toolChoice,
+      tools: request.tools?.length ? getValueDigest(request.tools) : undefined,
+      systemPrompt: request.systemPrompt
+        ? getMessageDigest({ role: "system", content: request.systemPrompt })
+        : undefined,
     });
 
-    return this.hashString(key);
+    return `${model}:${digest}`;
   }
 
   /**
@@ -415,49 +507,157 @@ export class CopilotClient implements ILLMClient, ICachedLLMClient {
   }
 
   /**
-   * Clear cache
+   * Clear cache (all tiers)
+   *
+   * @param pattern - Matched against `<model>:<digest>` keys; e.g.
+   *   `"gpt-4o:*"` clears every response cached for that model. Without
+   *   `*`/`?` the pattern matches any part of the key.
    */
   async clearCache(pattern?: string): Promise<number> {
-    let count = 0;
-    if (!pattern) {
-      count = this.cache.size;
-      this.cache.clear();
-      return count;
-    }
+    return this.cache.clear(pattern);
+  }
 
-    // Clear matching patterns
-    for (const key of this.cache.keys()) {
-      if (key.includes(pattern)) {
-        this.cache.delete(key);
-        count++;
-      }
-    }
-    return count;
+  /**
+   * Get cache statistics, including evictions and per-tier breakdown
+   */
+  async getCacheStats(): Promise<LLMCacheStats> {
+    return this.cache.getStats();
   }
 
+  // Private helper methods
+
   /**
-   * Get cache statistics
+   * Send a chat request upstream and parse the response
    */
-  async getCacheStats(): Promise<{
-    size: number;
-    hits: number;
-    misses: number;
-    hitRate: number;
-  }> {
-    const hits = Math.round(this.stats.totalCalls * this.stats.cacheHitRate);
-    const misses = this.stats.totalCalls - hits;
-    return {
-      size: this.cache.size,
-      hitRate: this.stats.cacheHitRate,
-      hits,
-      misses,
+  private async requestChat(
+    request: ChatRequest,
+    options: LLMRequestOptions | undefined,
+    requestId: string,
+  ): Promise<ChatResponse> {
+    const body = this.prepareRequestBody(request);
+    const response = await this.makeRequest(
+      "/v1/chat/completions",
+      body,
+      options,
+      requestId,
+    );
+    return this.parseResponse(response, requestId);
+  }
+
+  /**
+   * Start an upstream request that concurrent identical callers can join
+   *
+   * The upstream call gets its own abort controller (registered under the
+   * leader's request ID) so one caller leaving does not cancel the others.
+   * The response is cached before the entry is removed, so later callers
+   * either join the flight or hit the cache.
+   */
+  private startInFlight(
+    requestKey: string,
+    cacheKey: string,
+    request: ChatRequest,
+    options: LLMRequestOptions | undefined,
+    requestId: string,
+  ): InFlightRequest {
+    const controller = new AbortController();
+    this.abortControllers.set(requestId, controller);
+
+    const flight: InFlightRequest = {
+      promise: this.requestChat(
+        request,
+        { ...options, signal: controller.signal },
+        requestId,
+      )
+        .then(async (response) => {
+          if (cacheKey) {
+            await this.setCached(cacheKey, response);
+          }
+          return response;
+        })
+        .finally(() => {
+          flight.settled = true;
+          this.inFlight.delete(requestKey);
+          this.abortControllers.delete(requestId);
+        }),
+      controller,
+      waiters: 0,
+      settled: false,
     };
+
+    this.inFlight.set(requestKey, flight);
+    return flight;
   }
 
-  // Private helper methods
+  /**
+   * Wait on a shared upstream request
+   *
+   * A caller whose signal aborts stops waiting immediately; the upstream
+   * call is only aborted once every waiter has gone.
+   */
+  private awaitInFlight(
+    flight: InFlightRequest,
+    signal: AbortSignal | undefined,
+    requestId: string,
+  ): Promise<ChatResponse> {
+    const aborted = () =>
+      new LLMError("Request aborted", {
+        code: "LLM_ABORTED",
+        provider: this.provider,
+        requestId,
+      });
+
+    if (signal?.aborted) {
+      if (flight.waiters === 0 && !flight.settled) {
+        flight.controller.abort();
+      }
+      return Promise.reject(aborted());
+    }
+
+    flight.waiters++;
+
+    return new Promise<ChatResponse>((resolve, reject) => {
+      let left = false;
+      const leave = () => {
+        if (left) return;
+        left = true;
+        signal?.removeEventListener("abort", onAbort);
+        flight.waiters--;
+        if (flight.waiters === 0 && !flight.settled) {
+          flight.controller.abort();
+        }
+      };
+      const onAbort = () => {
+        leave();
+        reject(aborted());
+      };
+
+      signal?.addEventListener("abort", onAbort, { once: true });
+      flight.promise.then(
+        (response) => {
+          leave();
+          resolve(response);
+        },
+        (error) => {
+          leave();
+          reject(error);
+        },
+      );
+    });
+  }
 
   private prepareRequestBody(request: ChatRequest): any {
-    const messages = [...request.messages];
+    // Send only API fields (drop digest, metadata, context bookkeeping)
+    const messages: ChatMessage[] = request.messages.map((message) => ({
+      role: message.role,
+      content: message.content,
+      ...(message.name !== undefined && { name: message.name }),
+      ...(message.tool_calls !== undefined && {
+        tool_calls: message.tool_calls,
+      }),
+      ...(message.tool_call_id !== undefined && {
+        tool_call_id: message.tool_call_id,
+      }),
+    }));
 
     // Add system prompt if provided
     if (request.systemPrompt) {
@@ -511,12 +711,19 @@ export class CopilotClient implements ILLMClient, ICachedLLMClient {
   ): Promise<OpenAIResponse> {
     const maxRetries = options?.maxRetries ?? this.config.maxRetries;
     const timeout = options?.timeout ?? this.config.timeout;
+    const limiter = this.getLimiter(body.model);
     let lastError: Error | null = null;
 
     for (let attempt = 0; attempt <= maxRetries; attempt++) {
+      let release: (() => void) | null = null;
+      let backoff = 0;
       try {
+        release = await limiter.acquire(options?.signal);
+
         const controller = new AbortController();
         const timeoutId = setTimeout(() => controller.abort(), timeout);
+        const onAbort = () => controller.abort();
+        options?.signal?.addEventListener("abort", onAbort, { once: true });
 
         const response = await fetch(`${this.baseURL}${endpoint}`, {
           method: "POST",
@@ -526,11 +733,12 @@ export class CopilotClient implements ILLMClient, ICachedLLMClient {
             ...this.config.customHeaders,
           },
           body: JSON.stringify(body),
-          signal: options?.signal || controller.signal,
+          signal: controller.signal,
+        }).finally(() => {
+          clearTimeout(timeoutId);
+          options?.signal?.removeEventListener("abort", onAbort);
         });
 
-        clearTimeout(timeoutId);
-
         if (!response.ok) {
           throw await this.handleErrorResponse(response, requestId);
         }
@@ -539,8 +747,9 @@ export class CopilotClient implements ILLMClient, ICachedLLMClient {
       } catch (error) {
         lastError = error as Error;
 
-        // Don't retry certain errors
+        // Don't retry certain errors, or a caller-cancelled request
         if (
+          options?.signal?.aborted ||
           error instanceof LLMAuthenticationError ||
           error instanceof LLMInvalidRequestError ||
           error instanceof LLMContextLengthError
@@ -548,11 +757,24 @@ export class CopilotClient implements ILLMClient, ICachedLLMClient {
           throw error;
         }
 
-        // Wait before retry
-        if (attempt < maxRetries) {
-          const delay = this.config.retryDelay * Math.pow(2, attempt);
-          await this.sleep(delay);
+        const delay = this.config.retryDelay * Math.pow(2, attempt);
+
+        // Hold every queued request for this model; the next acquire()
+        // waits out the pause instead of sleeping here
+        if (error instanceof LLMRateLimitError) {
+          limiter.pause(
+            error.retryAfter !== undefined ? error.retryAfter * 1000 : delay,
+          );
+        } else if (attempt < maxRetries) {
+          backoff = delay;
         }
+      } finally {
+        release?.();
+      }
+
+      // Wait before retry, after the limiter slot has been released
+      if (backoff > 0) {
+        await this.sleep(backoff);
       }
     }
 
@@ -582,12 +804,11 @@ export class CopilotClient implements ILLMClient, ICachedLLMClient {
           statusCode,
         });
       case 429:
-        const retryAfter = response.headers.get("Retry-After");
         return new LLMRateLimitError(message, {
           provider: this.provider,
           requestId,
           statusCode,
-          retryAfter: retryAfter ? parseInt(retryAfter) : undefined,
+          retryAfter: this.parseRetryAfter(response.headers.get("Retry-After")),
         });
       case 400:
         return new LLMInvalidRequestError(message, {
@@ -679,6 +900,13 @@ export class CopilotClient implements ILLMClient, ICachedLLMClient {
         tool_calls: choice?.delta?.tool_calls,
       },
       finishReason: choice?.finish_reason as FinishReason | undefined,
+      usage: chunk.usage
+        ? {
+            promptTokens: chunk.usage.prompt_tokens,
+            completionTokens: chunk.usage.completion_tokens,
+            totalTokens: chunk.usage.total_tokens,
+          }
+        : undefined,
     };
   }
 
@@ -698,7 +926,53 @@ export class CopilotClient implements ILLMClient, ICachedLLMClient {
   }
 
   private async getCached(key: string): Promise<ChatResponse | null> {
-    return this.cache.get(key) || null;
+    try {
+      return await this.cache.get(key);
+    } catch {
+      return null; // A failing cache tier must not fail the request
+    } finally {
+      this.stats.cacheHitRate = this.cache.getStats().hitRate;
+    }
+  }
+
+  private async setCached(key: string, response: ChatResponse): Promise<void> {
+    try {
+      await this.cache.set(key, response);
+    } catch {
+      // Caching is best-effort
+    }
+  }
+
+  /**
+   * Get the limiter for a model (shared with other clients of the endpoint)
+   */
+  private getLimiter(model: string): RateLimiter {
+    let limiter = this.limiters.get(model);
+    if (!limiter) {
+      limiter = RateLimiter.forKey(`${this.baseURL}|${model}`, {
+        ...this.config.rateLimit,
+        ...this.config.modelRateLimits?.[model],
+      });
+      this.limiters.set(model, limiter);
+    }
+    return limiter;
+  }
+
+  /**
+   * Parse a Retry-After header (delay-seconds or HTTP-date) into seconds
+   */
+  private parseRetryAfter(value: string | null): number | undefined {
+    if (!value) return undefined;
+
+    const seconds = Number(value);
+    if (Number.isFinite(seconds)) {
+      return Math.max(0, seconds);
+    }
+
+    const date = Date.parse(value);
+    return Number.isNaN(date)
+      ? undefined
+      : Math.max(0, (date - Date.now()) / 1000);
   }
 
   private updateAverageLatency(latency: number): void {
@@ -707,18 +981,14 @@ export class CopilotClient implements ILLMClient, ICachedLLMClient {
       (this.stats.averageLatency * (total - 1) + latency) / total;
   }
 
-  private generateRequestId(): string {
-    return `req_${Date.now()}_${Math.random().toString(36).slice(2, 9)}`;
+  private updateTimeToFirstToken(ttft: number): void {
+    const total = ++this.firstTokenSamples;
+    this.stats.averageTimeToFirstToken =
+      (this.stats.averageTimeToFirstToken * (total - 1) + ttft) / total;
   }
 
-  private hashString(str: string): string {
-    let hash = 0;
-    for (let i = 0; i < str.length; i++) {
-      const char = str.charCodeAt(i);
-      hash = (hash << 5) - hash + char;
-      hash = hash & hash; // Convert to 32-bit integer
-    }
-    return hash.toString(36);
+  private generateRequestId(): string {
+    return `req_${Date.now()}_${Math.random().toString(36).slice(2, 9)}`;
   }
 
   private sleep(ms: number): Promise<void> {
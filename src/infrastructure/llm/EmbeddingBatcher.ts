@@ -0,0 +1,253 @@
+/**
+ * EmbeddingBatcher - Batched, concurrent embedding requests
+ *
+ * Features:
+ * - Packs texts into batches bounded by count and estimated tokens
+ * - Sends batches concurrently up to a configurable limit
+ * - Deduplicates identical texts within a call and across concurrent calls
+ * - Implements IEmbeddingClient, so it can wrap any embedding client
+ * - Throughput statistics
+ */
+
+import type { IEmbeddingClient } from "../../core/interfaces/ILLMClient.js";
+import { computeContentDigest } from "./MessageDigest.js";
+
+/**
+ * Batcher configuration
+ */
+export interface EmbeddingBatcherConfig {
+  /** Max texts per embed() request */
+  maxBatchSize: number;
+  /** Max estimated tokens per embed() request (~4 chars per token) */
+  maxBatchTokens: number;
+  /** Max concurrent embed() requests */
+  maxConcurrency: number;
+}
+
+/**
+ * Batcher statistics
+ */
+export interface EmbeddingBatcherStats {
+  requests: number;
+  textsRequested: number;
+  textsEmbedded: number;
+  deduplicated: number;
+  failedRequests: number;
+  averageBatchSize: number;
+  totalTimeMs: number;
+  textsPerSecond: number;
+}
+
+type EmbedOptions = { model?: string; dimensions?: number };
+
+/**
+ * EmbeddingBatcher - wraps an IEmbeddingClient with batching
+ */
+export class EmbeddingBatcher implements IEmbeddingClient {
+  private static readonly DEFAULT_CONFIG: EmbeddingBatcherConfig = {
+    maxBatchSize: 96,
+    maxBatchTokens: 50000,
+    maxConcurrency: 4,
+  };
+
+  private client: IEmbeddingClient;
+  private config: EmbeddingBatcherConfig;
+  private pending: Map<string, Promise<number[]>> = new Map();
+  private stats = {
+    requests: 0,
+    textsRequested: 0,
+    textsEmbedded: 0,
+    deduplicated: 0,
+    failedRequests: 0,
+    totalTimeMs: 0,
+  };
+
+  constructor(
+    client: IEmbeddingClient,
+    config: Partial<EmbeddingBatcherConfig> = {},
+  ) {
+    this.client = client;
+    this.config = { ...EmbeddingBatcher.DEFAULT_CONFIG, ...config };
+  }
+
+  /**
+   * Embed texts, returning vectors in input order
+   */
+  async embed(
+    input: string | string[],
+    options?: EmbedOptions,
+  ): Promise<number[][]> {
+    return this.embedMany(Array.isArray(input) ? input : [input], options);
+  }
+
+  /**
+   * Embed many texts with batching, concurrency and deduplication
+   */
+  async embedMany(
+    texts: string[],
+    options?: EmbedOptions,
+  ): Promise<number[][]> {
+    this.stats.textsRequested += texts.length;
+
+    const keys = texts.map((text) => this.keyFor(text, options));
+    const waits = new Map<string, Promise<number[]>>();
+    const toSend: Array<{ key: string; text: string }> = [];
+
+    for (let i = 0; i < texts.length; i++) {
+      const key = keys[i];
+      if (waits.has(key)) {
+        this.stats.deduplicated++;
+        continue;
+      }
+
+      const inFlight = this.pending.get(key);
+      if (inFlight) {
+        this.stats.deduplicated++;
+        waits.set(key, inFlight);
+        continue;
+      }
+
+      toSend.push({ key, text: texts[i] });
+    }
+
+    if (toSend.length > 0) {
+      const run = this.send(toSend, options);
+      toSend.forEach(({ key }, index) => {
+        const vector = run.then((vectors) => vectors[index]);
+        waits.set(key, vector);
+        this.pending.set(key, vector);
+      });
+      run
+        .finally(() => {
+          for (const { key } of toSend) {
+            this.pending.delete(key);
+          }
+        })
+        .catch(() => {}); // Surfaced to callers via waits
+    }
+
+    const unique = Array.from(waits.keys());
+    const vectors = await Promise.all(unique.map((key) => waits.get(key)!));
+    const resolved = new Map(unique.map((key, i) => [key, vectors[i]]));
+    return keys.map((key) => resolved.get(key)!);
+  }
+
+  /**
+   * Calculate cosine similarity (delegates to the wrapped client)
+   */
+  cosineSimilarity(embedding1: number[], embedding2: number[]): number {
+    return this.client.cosineSimilarity(embedding1, embedding2);
+  }
+
+  /**
+   * Get throughput statistics
+   */
+  getStats(): EmbeddingBatcherStats {
+    const { requests, textsEmbedded, totalTimeMs } = this.stats;
+    return {
+      ...this.stats,
+      averageBatchSize: requests > 0 ? textsEmbedded / requests : 0,
+      textsPerSecond:
+        totalTimeMs > 0 ? (textsEmbedded * 1000) / totalTimeMs : 0,
+    };
+  }
+
+  /**
+   * Reset statistics
+   */
+  resetStats(): void {
+    this.stats = {
+      requests: 0,
+      textsRequested: 0,
+      textsEmbedded: 0,
+      deduplicated: 0,
+      failedRequests: 0,
+      totalTimeMs: 0,
+    };
+  }
+
+  private keyFor(text: string, options?: EmbedOptions): string {
+    const model = options?.model ?? "";
+    const dimensions = options?.dimensions ?? "";
+    return `${model}:${dimensions}:${computeContentDigest(text)}`;
+  }
+
+  /**
+   * Split into batches and embed them with bounded concurrency
+   */
+  private async send(
+    items: Array<{ key: string; text: string }>,
+    options?: EmbedOptions,
+  ): Promise<number[][]> {
+    const startTime = Date.now();
+    const batches = this.createBatches(items.map((item) => item.text));
+    const results: number[][] = new Array(items.length);
+
+    let next = 0;
+    const worker = async (): Promise<void> => {
+      while (next < batches.length) {
+        const batch = batches[next++];
+        const texts = batch.indices.map((index) => items[index].text);
+
+        this.stats.requests++;
+        let vectors: number[][];
+        try {
+          vectors = await this.client.embed(texts, options);
+        } catch (error) {
+          this.stats.failedRequests++;
+          throw error;
+        }
+
+        if (vectors.length !== texts.length) {
+          this.stats.failedRequests++;
+          throw new Error(
+            `Embedding client returned ${vectors.length} vectors for ${texts.length} inputs`,
+          );
+        }
+
+        batch.indices.forEach((index, i) => {
+          results[index] = vectors[i];
+        });
+        this.stats.textsEmbedded += texts.length;
+      }
+    };
+
+    try {
+      const workers = Math.min(this.config.maxConcurrency, batches.length);
+      await Promise.all(Array.from({ length: workers }, worker));
+    } finally {
+      this.stats.totalTimeMs += Date.now() - startTime;
+    }
+
+    return results;
+  }
+
+  /**
+   * Greedily pack texts into count- and token-bounded batches
+   */
+  private createBatches(texts: string[]): Array<{ indices: number[] }> {
+    const batches: Array<{ indices: number[] }> = [];
+    let current: number[] = [];
+    let currentTokens = 0;
+
+    texts.forEach((text, index) => {
+      const tokens = Math.ceil(text.length / 4);
+      if (
+        current.length > 0 &&
+        (current.length >= this.config.maxBatchSize ||
+          currentTokens + tokens > this.config.maxBatchTokens)
+      ) {
+        batches.push({ indices: current });
+        current = [];
+        currentTokens = 0;
+      }
+      current.push(index);
+      currentTokens += tokens;
+    });
+
+    if (current.length > 0) {
+      batches.push({ indices: current });
+    }
+    return batches;
+  }
+}
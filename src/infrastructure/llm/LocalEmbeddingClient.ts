@@ -0,0 +1,427 @@
+/**
+ * LocalEmbeddingClient - Offline embeddings without a remote API
+ *
+ * Features:
+ * - Hashed word + character n-gram features projected to a fixed dimension
+ *   (signed feature hashing, sublinear TF, optional fitted IDF, L2-normalized)
+ * - Worker thread pool for large batches; small batches run inline
+ * - Optional ONNX sentence-embedding model (requires `onnxruntime-node`)
+ * - Implements IEmbeddingClient for SemanticStrategy, ContextSelector and
+ *   VectorStore ingestion
+ */
+
+import { availableParallelism } from "os";
+import type { IEmbeddingClient } from "../../core/interfaces/ILLMClient.js";
+import { WorkerPool } from "../utils/WorkerPool.js";
+
+/**
+ * ONNX model settings
+ */
+export interface OnnxEmbeddingModel {
+  /** Path to the .onnx model file */
+  modelPath: string;
+  /** Tokenizer producing model input ids (e.g., a WordPiece tokenizer) */
+  tokenize: (text: string) => number[];
+  /** Output tensor holding token embeddings (default: first output) */
+  outputName?: string;
+}
+
+/**
+ * Local embedder configuration
+ */
+export interface LocalEmbeddingConfig {
+  /** Output vector dimension */
+  dimension: number;
+  /** Shortest character n-gram */
+  minNgram: number;
+  /** Longest character n-gram */
+  maxNgram: number;
+  /** Worker threads (0 = always inline) */
+  workers: number;
+  /** Requests with fewer texts than this run on the calling thread */
+  inlineThreshold: number;
+  /** Texts per worker task */
+  taskSize: number;
+  /** Optional ONNX model used instead of hashed features */
+  onnx?: OnnxEmbeddingModel;
+}
+
+interface FeaturizePayload {
+  texts: string[];
+  dimension: number;
+  minNgram: number;
+  maxNgram: number;
+  idf: Float32Array | null;
+}
+
+/**
+ * Hashed n-gram featurizer
+ *
+ * Self-contained (no outer references and no nested named functions,
+ * which bundlers in keep-names mode wrap in a `__name` helper the worker
+ * does not have): its source is also run inside worker threads. Returns
+ * `texts.length * dimension` floats, row-major.
+ */
+function featurize(
+  texts: string[],
+  dimension: number,
+  minNgram: number,
+  maxNgram: number,
+  idf: Float32Array | null,
+): Float32Array {
+  const out = new Float32Array(texts.length * dimension);
+  const row = new Float64Array(dimension);
+  const wordPattern = /[\p{L}\p{N}_]+/gu;
+
+  for (let t = 0; t < texts.length; t++) {
+    row.fill(0);
+    const words = texts[t].toLowerCase().match(wordPattern) || [];
+
+    for (const word of words) {
+      // Whole-word feature (seeded so it never collides with an n-gram)
+      let wordHash = 0x9e3779b9;
+      for (let i = 0; i < word.length; i++) {
+        wordHash = Math.imul(wordHash ^ word.charCodeAt(i), 0x01000193);
+      }
+      wordHash >>>= 0;
+      row[(wordHash & 0x7fffffff) % dimension] += wordHash & 0x80000000 ? -1 : 1;
+
+      // Character n-grams over the word padded with boundary markers
+      const padded = `<${word}>`;
+      for (let start = 0; start < padded.length; start++) {
+        let hash = 0x811c9dc5;
+        const end = Math.min(padded.length, start + maxNgram);
+        for (let i = start; i < end; i++) {
+          hash = Math.imul(hash ^ padded.charCodeAt(i), 0x01000193);
+          if (i - start + 1 >= minNgram) {
+            const signed = hash >>> 0;
+            row[(signed & 0x7fffffff) % dimension] += signed & 0x80000000 ? -1 : 1;
+          }
+        }
+      }
+    }
+
+    // Sublinear TF, IDF weighting, L2 normalization
+    let norm = 0;
+    for (let d = 0; d < dimension; d++) {
+      const count = row[d];
+      if (count === 0) continue;
+      let value = Math.sign(count) * Math.log1p(Math.abs(count));
+      if (idf) value *= idf[d];
+      row[d] = value;
+      norm += value * value;
+    }
+
+    const offset = t * dimension;
+    if (norm > 0) {
+      const scale = 1 / Math.sqrt(norm);
+      for (let d = 0; d < dimension; d++) {
+        out[offset + d] = row[d] * scale;
+      }
+    }
+  }
+
+  return out;
+}
+
+const WORKER_SOURCE = `
+const { parentPort } = require("worker_threads");
+const featurize = ${featurize.toString()};
+parentPort.on("message", (task) => {
+  try {
+    const vectors = featurize(
+      task.texts, task.dimension, task.minNgram, task.maxNgram, task.idf,
+    );
+    parentPort.postMessage({ id: task.id, result: vectors }, [vectors.buffer]);
+  } catch (error) {
+    parentPort.postMessage({
+      id: task.id,
+      error: error && error.message ? error.message : String(error),
+    });
+  }
+});
+`;
+
+/**
+ * LocalEmbeddingClient - hashed n-gram embedder with a worker pool
+ */
+export class LocalEmbeddingClient implements IEmbeddingClient {
+  private static readonly DEFAULT_CONFIG: LocalEmbeddingConfig = {
+    dimension: 384,
+    minNgram: 3,
+    maxNgram: 5,
+    workers: Math.max(0, Math.min(4, availableParallelism() - 1)),
+    inlineThreshold: 64,
+    taskSize: 256,
+  };
+
+  public readonly config: LocalEmbeddingConfig;
+
+  private idf: Float32Array | null = null;
+  private pool: WorkerPool<FeaturizePayload, Float32Array>;
+  private onnxSession: Promise<any> | null = null;
+  private stats = {
+    texts: 0,
+    inlineTexts: 0,
+    workerTexts: 0,
+    totalTimeMs: 0,
+  };
+
+  constructor(config: Partial<LocalEmbeddingConfig> = {}) {
+    this.config = { ...LocalEmbeddingClient.DEFAULT_CONFIG, ...config };
+
+    if (this.config.minNgram < 1 || this.config.maxNgram < this.config.minNgram) {
+      throw new Error("Invalid n-gram range");
+    }
+
+    this.pool = new WorkerPool({
+      name: "LocalEmbeddingClient",
+      source: WORKER_SOURCE,
+      workers: this.config.workers,
+    });
+  }
+
+  /**
+   * Generate embeddings for text
+   */
+  async embed(
+    input: string | string[],
+    options?: { model?: string; dimensions?: number },
+  ): Promise<number[][]> {
+    const texts = Array.isArray(input) ? input : [input];
+    if (texts.length === 0) {
+      return [];
+    }
+
+    if (
+      options?.dimensions !== undefined &&
+      options.dimensions !== this.config.dimension &&
+      !this.config.onnx
+    ) {
+      throw new Error(
+        `Local embedder dimension is ${this.config.dimension}, got request for ${options.dimensions}`,
+      );
+    }
+
+    const startTime = Date.now();
+    try {
+      if (this.config.onnx) {
+        return await this.embedWithOnnx(texts);
+      }
+
+      const flat = await this.embedHashed(texts);
+      const dimension = this.config.dimension;
+      const vectors: number[][] = new Array(texts.length);
+      for (let i = 0; i < texts.length; i++) {
+        vectors[i] = Array.from(
+          flat.subarray(i * dimension, (i + 1) * dimension),
+        );
+      }
+      return vectors;
+    } finally {
+      this.stats.texts += texts.length;
+      this.stats.totalTimeMs += Date.now() - startTime;
+    }
+  }
+
+  /**
+   * Calculate cosine similarity between two embeddings
+   */
+  cosineSimilarity(embedding1: number[], embedding2: number[]): number {
+    if (embedding1.length !== embedding2.length) {
+      throw new Error("Vectors must have same length");
+    }
+
+    let dot = 0;
+    let normA = 0;
+    let normB = 0;
+    for (let i = 0; i < embedding1.length; i++) {
+      dot += embedding1[i] * embedding2[i];
+      normA += embedding1[i] * embedding1[i];
+      normB += embedding2[i] * embedding2[i];
+    }
+
+    if (normA === 0 || normB === 0) {
+      return 0;
+    }
+    return dot / (Math.sqrt(normA) * Math.sqrt(normB));
+  }
+
+  /**
+   * Fit IDF weights from a corpus
+   *
+   * Weights are per hash bucket. Refitting changes every vector, so embed
+   * stored memories again afterwards.
+   */
+  fit(corpus: string[]): void {
+    const { dimension, minNgram, maxNgram } = this.config;
+    const df = new Float64Array(dimension);
+    const vectors = featurize(corpus, dimension, minNgram, maxNgram, null);
+
+    for (let t = 0; t < corpus.length; t++) {
+      const offset = t * dimension;
+      for (let d = 0; d < dimension; d++) {
+        if (vectors[offset + d] !== 0) df[d]++;
+      }
+    }
+
+    const idf = new Float32Array(dimension);
+    for (let d = 0; d < dimension; d++) {
+      idf[d] = Math.log((1 + corpus.length) / (1 + df[d])) + 1;
+    }
+    this.idf = idf;
+  }
+
+  /**
+   * Get throughput statistics
+   */
+  getStats(): {
+    texts: number;
+    inlineTexts: number;
+    workerTexts: number;
+    workers: number;
+    queuedTasks: number;
+    textsPerSecond: number;
+  } {
+    const poolStats = this.pool.getStats();
+    return {
+      texts: this.stats.texts,
+      inlineTexts: this.stats.inlineTexts,
+      workerTexts: this.stats.workerTexts,
+      workers: poolStats.workers,
+      queuedTasks: poolStats.queued,
+      textsPerSecond:
+        this.stats.totalTimeMs > 0
+          ? (this.stats.texts * 1000) / this.stats.totalTimeMs
+          : 0,
+    };
+  }
+
+  /**
+   * Terminate worker threads (later batches are embedded inline)
+   */
+  async close(): Promise<void> {
+    await this.pool.close();
+  }
+
+  private async embedHashed(texts: string[]): Promise<Float32Array> {
+    const { dimension, minNgram, maxNgram } = this.config;
+
+    if (!this.pool.isAvailable() || texts.length < this.config.inlineThreshold) {
+      this.stats.inlineTexts += texts.length;
+      return featurize(texts, dimension, minNgram, maxNgram, this.idf);
+    }
+
+    this.stats.workerTexts += texts.length;
+    const out = new Float32Array(texts.length * dimension);
+    const tasks: Promise<void>[] = [];
+
+    for (let start = 0; start < texts.length; start += this.config.taskSize) {
+      const chunk = texts.slice(start, start + this.config.taskSize);
+      tasks.push(
+        this.runTask(chunk)
+          .catch(() => {
+            // Worker unavailable or failed: embed this chunk on our thread
+            this.stats.workerTexts -= chunk.length;
+            this.stats.inlineTexts += chunk.length;
+            return featurize(chunk, dimension, minNgram, maxNgram, this.idf);
+          })
+          .then((vectors) => {
+            out.set(vectors, start * dimension);
+          }),
+      );
+    }
+
+    await Promise.all(tasks);
+    return out;
+  }
+
+  private runTask(texts: string[]): Promise<Float32Array> {
+    return this.pool.run({
+      texts,
+      dimension: this.config.dimension,
+      minNgram: this.config.minNgram,
+      maxNgram: this.config.maxNgram,
+      idf: this.idf,
+    });
+  }
+
+  /**
+   * Embed with an ONNX model: mean-pooled token embeddings, L2-normalized
+   */
+  private async embedWithOnnx(texts: string[]): Promise<number[][]> {
+    const model = this.config.onnx!;
+    const session = await this.getOnnxSession(model);
+    const ort = await LocalEmbeddingClient.loadOnnxRuntime();
+    const vectors: number[][] = [];
+
+    for (const text of texts) {
+      const ids = model.tokenize(text);
+      const shape = [1, ids.length];
+      const feeds: Record<string, unknown> = {
+        input_ids: new ort.Tensor("int64", BigInt64Array.from(ids.map(BigInt)), shape),
+        attention_mask: new ort.Tensor(
+          "int64",
+          new BigInt64Array(ids.length).fill(1n),
+          shape,
+        ),
+      };
+      if (session.inputNames.includes("token_type_ids")) {
+        feeds.token_type_ids = new ort.Tensor(
+          "int64",
+          new BigInt64Array(ids.length),
+          shape,
+        );
+      }
+
+      const output = await session.run(feeds);
+      const tensor = output[model.outputName ?? session.outputNames[0]];
+      const hidden = tensor.dims[tensor.dims.length - 1] as number;
+      const data = tensor.data as Float32Array;
+
+      const pooled = new Array<number>(hidden).fill(0);
+      for (let token = 0; token < ids.length; token++) {
+        for (let d = 0; d < hidden; d++) {
+          pooled[d] += data[token * hidden + d] / ids.length;
+        }
+      }
+
+      const norm = Math.sqrt(pooled.reduce((sum, v) => sum + v * v, 0));
+      vectors.push(norm > 0 ? pooled.map((v) => v / norm) : pooled);
+    }
+
+    return vectors;
+  }
+
+  private getOnnxSession(model: OnnxEmbeddingModel): Promise<any> {
+    if (!this.onnxSession) {
+      this.onnxSession = LocalEmbeddingClient.loadOnnxRuntime().then((ort) =>
+        ort.InferenceSession.create(model.modelPath),
+      );
+    }
+    return this.onnxSession;
+  }
+
+  private static async loadOnnxRuntime(): Promise<any> {
+    const moduleName = "onnxruntime-node";
+    try {
+      return await import(moduleName);
+    } catch {
+      throw new Error(
+        "ONNX embeddings require the optional 'onnxruntime-node' package",
+      );
+    }
+  }
+}
+
+let sharedClient: LocalEmbeddingClient | null = null;
+
+/**
+ * Get the shared local embedder (created on first use)
+ */
+export function getLocalEmbeddingClient(): LocalEmbeddingClient {
+  if (!sharedClient) {
+    sharedClient = new LocalEmbeddingClient();
+  }
+  return sharedClient;
+}
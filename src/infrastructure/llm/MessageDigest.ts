@@ -0,0 +1,140 @@
+/**
+ * Message Digest - Content hashing for cache keys
+ *
+ * Features:
+ * - SHA-256 digest per chat message over role, name, tool fields and content
+ * - Digests carried on messages (`digest`) are reused instead of rehashing
+ * - Messages without one are memoized by object identity, revalidated
+ *   against the fields they were hashed from so later mutation is caught
+ * - Request keys hash message digests plus model parameters, so key cost
+ *   is independent of prompt size once digests exist
+ */
+
+import { createHash } from "crypto";
+import type { ChatMessage } from "../../core/types/llm.types.js";
+
+/**
+ * Message fields a memoized digest was computed from
+ */
+interface MessageMemo {
+  digest: string;
+  role: string;
+  name: string | undefined;
+  toolCallId: string | undefined;
+  toolCalls: string | undefined;
+  content: string;
+}
+
+const memo = new WeakMap<object, string>();
+const messageMemo = new WeakMap<ChatMessage, MessageMemo>();
+
+/**
+ * Compute the content digest of a message
+ *
+ * Fields are length-prefixed so no two distinct messages share an encoding.
+ */
+export function computeMessageDigest(message: ChatMessage): string {
+  const hash = createHash("sha256");
+  const fields = [
+    message.role,
+    message.name ?? "",
+    message.tool_call_id ?? "",
+    message.tool_calls ? JSON.stringify(message.tool_calls) : "",
+    message.content ?? "",
+  ];
+
+  for (const field of fields) {
+    hash.update(`${field.length}:`);
+    hash.update(field);
+  }
+
+  return hash.digest("hex");
+}
+
+/**
+ * Get a message digest, reusing a precomputed or memoized value
+ */
+export function getMessageDigest(message: ChatMessage): string {
+  if (message.digest) {
+    return message.digest;
+  }
+
+  // Strings compare by reference first, so an unchanged message costs a
+  // few pointer checks; a mutated one is rehashed
+  const toolCalls = message.tool_calls
+    ? JSON.stringify(message.tool_calls)
+    : undefined;
+  const cached = messageMemo.get(message);
+  if (
+    cached &&
+    cached.content === message.content &&
+    cached.role === message.role &&
+    cached.name === message.name &&
+    cached.toolCallId === message.tool_call_id &&
+    cached.toolCalls === toolCalls
+  ) {
+    return cached.digest;
+  }
+
+  const digest = computeMessageDigest(message);
+  messageMemo.set(message, {
+    digest,
+    role: message.role,
+    name: message.name,
+    toolCallId: message.tool_call_id,
+    toolCalls,
+    content: message.content,
+  });
+  return digest;
+}
+
+/**
+ * Digest an arbitrary JSON value, memoized by identity for objects
+ *
+ * Used for tool definition arrays, which are typically reused across calls.
+ */
+export function getValueDigest(value: unknown): string {
+  const cacheable = typeof value === "object" && value !== null;
+  if (cacheable) {
+    const cached = memo.get(value as object);
+    if (cached) return cached;
+  }
+
+  const digest = createHash("sha256")
+    .update(JSON.stringify(value) ?? "")
+    .digest("hex");
+
+  if (cacheable) {
+    memo.set(value as object, digest);
+  }
+  return digest;
+}
+
+/**
+ * Build a request key from message digests and request parameters
+ *
+ * @param messages - Conversation messages (digests reused when present)
+ * @param params - Small, JSON-serializable parameters (model, sampling, ...)
+ */
+export function computeRequestKey(
+  messages: ChatMessage[],
+  params: Record<string, unknown>,
+): string {
+  const hash = createHash("sha256");
+
+  hash.update(`${messages.length}\n`);
+  for (const message of messages) {
+    hash.update(getMessageDigest(message));
+    hash.update("\n");
+  }
+  hash.update(JSON.stringify(params));
+
+  return hash.digest("hex");
+}
+
+/**
+ * Digest plain text content (e.g., as an embedding cache key)
+ */
+export function computeContentDigest(text: string): string {
+  return createHash("sha256").update(text).digest("hex");
+}
@@ -0,0 +1,272 @@
+/**
+ * RateLimiter - Client-side request governor for LLM APIs
+ *
+ * Features:
+ * - Token bucket (sustained rate + burst) combined with a max-in-flight cap
+ * - FIFO wait queue with AbortSignal support
+ * - Shared pause after a 429, honouring Retry-After for every waiter
+ * - Queue depth and wait-time metrics
+ * - Process-wide limiters keyed by endpoint + model, shared across clients
+ */
+
+import type {
+  LLMRateLimitConfig,
+  LLMRateLimitStats,
+} from "../../core/types/llm.types.js";
+import { LLMError } from "../../core/errors/LLMError.js";
+
+interface Waiter {
+  enqueuedAt: number;
+  resolve: (release: () => void) => void;
+  reject: (error: Error) => void;
+  signal?: AbortSignal;
+  onAbort?: () => void;
+}
+
+/**
+ * RateLimiter - token bucket + concurrency limit
+ */
+export class RateLimiter {
+  private static readonly DEFAULT_CONFIG: LLMRateLimitConfig = {
+    requestsPerMinute: 60,
+    burst: 10,
+    maxInFlight: 4,
+  };
+
+  private static readonly shared: Map<string, RateLimiter> = new Map();
+
+  private config: LLMRateLimitConfig;
+  private tokens: number;
+  private lastRefill: number;
+  private inFlight = 0;
+  private queue: Waiter[] = [];
+  private timer: NodeJS.Timeout | null = null;
+  private pausedUntil = 0;
+  private metrics = {
+    acquired: 0,
+    delayed: 0,
+    totalWaitMs: 0,
+    maxWaitMs: 0,
+    maxQueueDepth: 0,
+    rateLimited: 0,
+  };
+
+  constructor(config: Partial<LLMRateLimitConfig> = {}) {
+    this.config = RateLimiter.normalize({
+      ...RateLimiter.DEFAULT_CONFIG,
+      ...config,
+    });
+    this.tokens = this.config.burst;
+    this.lastRefill = Date.now();
+  }
+
+  /**
+   * Get (or create) the limiter shared by all clients for a key
+   *
+   * A later call with a config reconfigures the existing limiter.
+   */
+  static forKey(
+    key: string,
+    config?: Partial<LLMRateLimitConfig>,
+  ): RateLimiter {
+    let limiter = RateLimiter.shared.get(key);
+    if (!limiter) {
+      limiter = new RateLimiter(config);
+      RateLimiter.shared.set(key, limiter);
+    } else if (config) {
+      limiter.configure(config);
+    }
+    return limiter;
+  }
+
+  /**
+   * Drop all shared limiters (tests, reconfiguration)
+   */
+  static resetShared(): void {
+    RateLimiter.shared.clear();
+  }
+
+  /**
+   * Update limits; queued requests are re-evaluated immediately
+   */
+  configure(config: Partial<LLMRateLimitConfig>): void {
+    this.refill(Date.now());
+    this.config = RateLimiter.normalize({ ...this.config, ...config });
+    this.tokens = Math.min(this.tokens, this.config.burst);
+    this.drain();
+  }
+
+  /**
+   * Wait for a request slot
+   *
+   * @param signal - Aborts the wait (the request is removed from the queue)
+   * @returns Promise resolving to a release function; call it exactly once
+   *   when the upstream request has finished
+   */
+  acquire(signal?: AbortSignal): Promise<() => void> {
+    if (signal?.aborted) {
+      return Promise.reject(this.abortError());
+    }
+
+    return new Promise((resolve, reject) => {
+      const waiter: Waiter = {
+        enqueuedAt: Date.now(),
+        resolve,
+        reject,
+        signal,
+      };
+
+      if (signal) {
+        waiter.onAbort = () => {
+          const index = this.queue.indexOf(waiter);
+          if (index !== -1) {
+            this.queue.splice(index, 1);
+            reject(this.abortError());
+          }
+          // With nobody left waiting, a pending wake-up must not keep the
+          // process alive
+          if (this.queue.length === 0 && this.timer) {
+            clearTimeout(this.timer);
+            this.timer = null;
+          }
+        };
+        signal.addEventListener("abort", waiter.onAbort, { once: true });
+      }
+
+      this.queue.push(waiter);
+      this.metrics.maxQueueDepth = Math.max(
+        this.metrics.maxQueueDepth,
+        this.queue.length,
+      );
+      this.drain();
+    });
+  }
+
+  /**
+   * Hold all requests after a rate-limit response
+   *
+   * @param delayMs - How long to wait (from Retry-After or backoff)
+   */
+  pause(delayMs: number): void {
+    this.metrics.rateLimited++;
+    this.pausedUntil = Math.max(this.pausedUntil, Date.now() + delayMs);
+    // Start refilling from an empty bucket when the pause ends, so queued
+    // requests resume at the configured rate rather than in one burst
+    this.tokens = 0;
+    this.lastRefill = this.pausedUntil;
+    this.drain();
+  }
+
+  /**
+   * Get limiter metrics
+   */
+  getStats(): LLMRateLimitStats {
+    const { acquired, totalWaitMs } = this.metrics;
+    return {
+      inFlight: this.inFlight,
+      queueDepth: this.queue.length,
+      maxQueueDepth: this.metrics.maxQueueDepth,
+      acquired,
+      delayed: this.metrics.delayed,
+      averageWaitMs: acquired > 0 ? totalWaitMs / acquired : 0,
+      maxWaitMs: this.metrics.maxWaitMs,
+      rateLimited: this.metrics.rateLimited,
+      pausedUntil: this.pausedUntil > Date.now() ? this.pausedUntil : null,
+    };
+  }
+
+  /**
+   * Get current limits
+   */
+  getConfig(): LLMRateLimitConfig {
+    return { ...this.config };
+  }
+
+  private static normalize(config: LLMRateLimitConfig): LLMRateLimitConfig {
+    return { ...config, burst: Math.max(1, config.burst) };
+  }
+
+  private refill(now: number): void {
+    if (now < this.lastRefill) {
+      return; // Paused: nothing accrues until the pause ends
+    }
+
+    if (this.config.requestsPerMinute <= 0) {
+      this.tokens = this.config.burst;
+    } else {
+      const elapsed = now - this.lastRefill;
+      this.tokens = Math.min(
+        this.config.burst,
+        this.tokens + (elapsed * this.config.requestsPerMinute) / 60000,
+      );
+    }
+    this.lastRefill = now;
+  }
+
+  /**
+   * Grant slots to queued requests in FIFO order, or schedule a wake-up
+   */
+  private drain(): void {
+    if (this.timer) {
+      clearTimeout(this.timer);
+      this.timer = null;
+    }
+
+    while (this.queue.length > 0) {
+      const { maxInFlight } = this.config;
+      if (maxInFlight > 0 && this.inFlight >= maxInFlight) {
+        return; // Woken by release()
+      }
+
+      const now = Date.now();
+      if (now < this.pausedUntil) {
+        this.schedule(this.pausedUntil - now);
+        return;
+      }
+
+      this.refill(now);
+      if (this.tokens < 1) {
+        const perMs = this.config.requestsPerMinute / 60000;
+        this.schedule(Math.ceil((1 - this.tokens) / perMs));
+        return;
+      }
+
+      this.tokens -= 1;
+      this.inFlight++;
+
+      const waiter = this.queue.shift()!;
+      if (waiter.signal && waiter.onAbort) {
+        waiter.signal.removeEventListener("abort", waiter.onAbort);
+      }
+
+      const waited = now - waiter.enqueuedAt;
+      this.metrics.acquired++;
+      this.metrics.totalWaitMs += waited;
+      this.metrics.maxWaitMs = Math.max(this.metrics.maxWaitMs, waited);
+      if (waited > 0) {
+        this.metrics.delayed++;
+      }
+
+      let released = false;
+      waiter.resolve(() => {
+        if (released) return;
+        released = true;
+        this.inFlight--;
+        this.drain();
+      });
+    }
+  }
+
+  private schedule(delayMs: number): void {
+    this.timer = setTimeout(() => {
+      this.timer = null;
+      this.drain();
+    }, Math.max(1, delayMs));
+  }
+
+  private abortError(): LLMError {
+    return new LLMError("Request aborted while waiting for rate limiter", {
+      code: "LLM_ABORTED",
+    });
+  }
+}
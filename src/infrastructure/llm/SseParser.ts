@@ -0,0 +1,211 @@
+/**
+ * SseParser - Incremental Server-Sent Events parser over bytes
+ *
+ * Features:
+ * - Works on raw response bytes: the complete-line prefix of each chunk is
+ *   decoded in one call, only the trailing partial line is carried over
+ *   (as bytes, so multi-byte characters split across chunks are safe)
+ * - Lines are scanned with a moving offset; buffered text is never
+ *   re-split, so cost stays linear in stream length
+ * - Multi-line `data:` fields, `event:`, `id:` and `retry:` fields, comments
+ * - LF and CRLF line endings, leading BOM
+ */
+
+/**
+ * A dispatched SSE event
+ */
+export interface SseEvent {
+  /** Event type (`message` unless set by an `event:` field) */
+  event: string;
+  /** Data lines joined with "\n" */
+  data: string;
+  /** Last event ID seen on the stream, if any */
+  id?: string;
+  /** Reconnection time (ms) if a `retry:` field preceded this event */
+  retry?: number;
+}
+
+const LF = 0x0a;
+
+/**
+ * SseParser - feed response body chunks, receive complete events
+ */
+export class SseParser {
+  private decoder = new TextDecoder();
+  /** Carried-over bytes of an incomplete line */
+  private pending: Uint8Array = new Uint8Array(0);
+  private pendingLength = 0;
+  private sawFirstLine = false;
+
+  private dataLines: string[] = [];
+  private eventType = "";
+  private retry: number | undefined;
+
+  /** Last event ID (persists across events, per the SSE spec) */
+  lastEventId: string | undefined;
+
+  /**
+   * Parse a chunk of the byte stream
+   *
+   * @returns Events completed by this chunk (often empty)
+   */
+  push(chunk: Uint8Array): SseEvent[] {
+    const events: SseEvent[] = [];
+    const lastNewline = chunk.lastIndexOf(LF);
+
+    if (lastNewline === -1) {
+      this.appendPending(chunk, 0, chunk.length);
+      return events;
+    }
+
+    // Decode everything up to the last newline at once. A newline byte never
+    // occurs inside a multi-byte UTF-8 sequence, so the split is safe.
+    let text: string;
+    if (this.pendingLength > 0) {
+      this.appendPending(chunk, 0, lastNewline + 1);
+      text = this.decoder.decode(this.pending.subarray(0, this.pendingLength));
+      this.pendingLength = 0;
+    } else {
+      text = this.decoder.decode(chunk.subarray(0, lastNewline + 1));
+    }
+
+    if (lastNewline + 1 < chunk.length) {
+      this.appendPending(chunk, lastNewline + 1, chunk.length);
+    }
+
+    this.processLines(text, events);
+    return events;
+  }
+
+  /**
+   * Flush at end of stream
+   *
+   * A final line without a newline is processed; an event not terminated
+   * by a blank line is discarded, as the SSE spec requires.
+   */
+  end(): SseEvent[] {
+    const events: SseEvent[] = [];
+    if (this.pendingLength > 0) {
+      const text = this.decoder.decode(
+        this.pending.subarray(0, this.pendingLength),
+      );
+      this.pendingLength = 0;
+      this.processLine(text, 0, text.length, events);
+    }
+    this.dataLines = [];
+    this.eventType = "";
+    this.retry = undefined;
+    return events;
+  }
+
+  private appendPending(source: Uint8Array, start: number, end: number): void {
+    const needed = this.pendingLength + (end - start);
+    if (needed > this.pending.length) {
+      const grown = new Uint8Array(
+        Math.max(needed, this.pending.length * 2, 256),
+      );
+      grown.set(this.pending.subarray(0, this.pendingLength));
+      this.pending = grown;
+    }
+    this.pending.set(source.subarray(start, end), this.pendingLength);
+    this.pendingLength = needed;
+  }
+
+  /**
+   * Process newline-terminated text line by line
+   */
+  private processLines(text: string, events: SseEvent[]): void {
+    let offset = 0;
+    let newline = text.indexOf("\n");
+    while (newline !== -1) {
+      this.processLine(text, offset, newline, events);
+      offset = newline + 1;
+      newline = text.indexOf("\n", offset);
+    }
+  }
+
+  /**
+   * Process one line, text[start, end) without the LF
+   */
+  private processLine(
+    text: string,
+    start: number,
+    end: number,
+    events: SseEvent[],
+  ): void {
+    if (end > start && text.charCodeAt(end - 1) === 0x0d) {
+      end--; // CRLF
+    }
+
+    if (!this.sawFirstLine) {
+      this.sawFirstLine = true;
+      if (end > start && text.charCodeAt(start) === 0xfeff) {
+        start++;
+      }
+    }
+
+    if (start === end) {
+      this.dispatch(events);
+      return;
+    }
+
+    if (text.charCodeAt(start) === 0x3a) {
+      return; // Comment / keep-alive
+    }
+
+    let colon = text.indexOf(":", start);
+    if (colon === -1 || colon > end) {
+      colon = end;
+    }
+
+    let valueStart = colon < end ? colon + 1 : end;
+    if (valueStart < end && text.charCodeAt(valueStart) === 0x20) {
+      valueStart++;
+    }
+
+    const nameLength = colon - start;
+    if (nameLength === 4 && text.startsWith("data", start)) {
+      this.dataLines.push(text.slice(valueStart, end));
+    } else if (nameLength === 5 && text.startsWith("event", start)) {
+      this.eventType = text.slice(valueStart, end);
+    } else if (nameLength === 2 && text.startsWith("id", start)) {
+      const id = text.slice(valueStart, end);
+      if (!id.includes("\0")) {
+        this.lastEventId = id;
+      }
+    } else if (nameLength === 5 && text.startsWith("retry", start)) {
+      const value = text.slice(valueStart, end);
+      if (/^\d+$/.test(value)) {
+        this.retry = Number(value);
+      }
+    }
+    // Unknown fields are ignored
+  }
+
+  private dispatch(events: SseEvent[]): void {
+    if (this.dataLines.length === 0) {
+      this.eventType = "";
+      this.retry = undefined;
+      return;
+    }
+
+    const event: SseEvent = {
+      event: this.eventType || "message",
+      data:
+        this.dataLines.length === 1
+          ? this.dataLines[0]
+          : this.dataLines.join("\n"),
+    };
+    if (this.lastEventId !== undefined) {
+      event.id = this.lastEventId;
+    }
+    if (this.retry !== undefined) {
+      event.retry = this.retry;
+    }
+
+    events.push(event);
+    this.dataLines = [];
+    this.eventType = "";
+    this.retry = undefined;
+  }
+}
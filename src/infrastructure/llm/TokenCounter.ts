@@ -3,6 +3,10 @@
  *
  * Provides accurate token counting for various models using tiktoken.
  * Implements ITokenCounter interface with caching for performance.
+ * Counts are cached by SHA-256 content digest; per-message counts reuse
+ * message digests, so unchanged messages are never re-encoded.
+ * Large texts can be encoded on a worker thread pool, and an approximate
+ * mode counts without running the encoder at all.
  */
 
 import { encoding_for_model, get_encoding, type TiktokenModel, type Tiktoken } from 'tiktoken';
@@ -15,6 +19,8 @@ import {
   TOKENS_PER_NAME,
   CHARS_PER_TOKEN,
 } from '../../core/constants/defaults.js';
+import { computeContentDigest, getMessageDigest } from './MessageDigest.js';
+import { TokenizerPool } from './TokenizerPool.js';
 
 /**
  * Cache entry for tokenizer instances
@@ -24,6 +30,17 @@ interface TokenizerCacheEntry {
   lastUsed: number;
 }
 
+/**
+ * Token counting options
+ */
+export interface TokenCountOptions {
+  /**
+   * Count with a fast scanner instead of the encoder. Intended as an upper
+   * bound for budget checks; never below the exact count for typical text.
+   */
+  approximate?: boolean;
+}
+
 /**
  * TokenCounter implementation with tiktoken
  */
@@ -32,11 +49,22 @@ export class TokenCounter implements ITokenCounter {
   private tokenCountCache: Map<string, { count: number; timestamp: number }>;
   private cacheMaxAge: number;
   private cacheCleanupInterval: NodeJS.Timeout | null;
-
-  constructor(options?: { cacheMaxAge?: number; enableCacheCleanup?: boolean }) {
+  private pool: TokenizerPool | null;
+  private inlineThresholdBytes: number;
+
+  constructor(options?: {
+    cacheMaxAge?: number;
+    enableCacheCleanup?: boolean;
+    /** Worker threads for large texts (0 = always encode inline) */
+    workers?: number;
+    /** Texts of at least this many UTF-8 bytes are sent to workers */
+    inlineThresholdBytes?: number;
+  }) {
     this.encodingCache = new Map();
     this.tokenCountCache = new Map();
     this.cacheMaxAge = options?.cacheMaxAge || 3600000; // 1 hour default
+    this.pool = options?.workers ? new TokenizerPool({ workers: options.workers }) : null;
+    this.inlineThresholdBytes = options?.inlineThresholdBytes ?? 64 * 1024;
 
     // Setup periodic cache cleanup if enabled
     if (options?.enableCacheCleanup !== false) {
@@ -52,7 +80,11 @@ export class TokenCounter implements ITokenCounter {
   /**
    * Count tokens in a text string
    */
-  async countTokens(text: string, model?: string): Promise<number> {
+  async countTokens(text: string, model?: string, options?: TokenCountOptions): Promise<number> {
+    if (options?.approximate) {
+      return this.approximateTokens(text);
+    }
+
     // Check cache first
     const cacheKey = this.getCacheKey(text, model);
     const cached = this.tokenCountCache.get(cacheKey);
@@ -62,8 +94,7 @@ export class TokenCounter implements ITokenCounter {
 
     try {
       const encoding = await this.getEncoding(model);
-      const tokens = encoding.encode(text);
-      const count = tokens.length;
+      const count = await this.encodeLength(encoding, text, model);
 
       // Cache the result
       this.tokenCountCache.set(cacheKey, { count, timestamp: Date.now() });
@@ -82,50 +113,33 @@ export class TokenCounter implements ITokenCounter {
    */
   async countMessageTokens(
     messages: ChatMessage[],
-    model?: string
+    model?: string,
+    options?: TokenCountOptions
   ): Promise<number> {
     if (messages.length === 0) {
       return 0;
     }
 
+    if (options?.approximate) {
+      return this.approximateMessageTokens(messages);
+    }
+
     try {
       const encoding = await this.getEncoding(model);
+      const now = Date.now();
       let totalTokens = 0;
 
       for (const message of messages) {
-        // Base message overhead
-        totalTokens += TOKENS_PER_MESSAGE;
-
-        // Role tokens
-        const roleTokens = encoding.encode(message.role);
-        totalTokens += roleTokens.length;
-
-        // Content tokens
-        if (message.content) {
-          const contentTokens = encoding.encode(message.content);
-          totalTokens += contentTokens.length;
-        }
-
-        // Name tokens (if present)
-        if (message.name) {
-          const nameTokens = encoding.encode(message.name);
-          totalTokens += nameTokens.length + TOKENS_PER_NAME;
+        const cacheKey = `msg:${model || 'default'}:${getMessageDigest(message)}`;
+        const cached = this.tokenCountCache.get(cacheKey);
+        if (cached && now - cached.timestamp < this.cacheMaxAge) {
+          totalTokens += cached.count;
+          continue;
         }
 
-        // Tool calls tokens (if present)
-        if (message.tool_calls && message.tool_calls.length > 0) {
-          for (const toolCall of message.tool_calls) {
-            const toolNameTokens = encoding.encode(toolCall.function.name);
-            const toolArgsTokens = encoding.encode(toolCall.function.arguments);
-            totalTokens += toolNameTokens.length + toolArgsTokens.length + 3; // 3 for formatting
-          }
-        }
-
-        // Tool call ID tokens (for tool response messages)
-        if (message.tool_call_id) {
-          const toolCallIdTokens = encoding.encode(message.tool_call_id);
-          totalTokens += toolCallIdTokens.length;
-        }
+        const count = await this.encodeMessage(encoding, message, model);
+        this.tokenCountCache.set(cacheKey, { count, timestamp: now });
+        totalTokens += count;
       }
 
       // Add 3 tokens for the assistant's reply priming
@@ -139,6 +153,143 @@ export class TokenCounter implements ITokenCounter {
     }
   }
 
+  /**
+   * Count tokens for a single message, including format overhead
+   */
+  private async encodeMessage(
+    encoding: Tiktoken,
+    message: ChatMessage,
+    model?: string
+  ): Promise<number> {
+    // Base message overhead
+    let tokens = TOKENS_PER_MESSAGE;
+
+    // Role tokens
+    tokens += encoding.encode(message.role).length;
+
+    // Content tokens
+    if (message.content) {
+      tokens += await this.encodeLength(encoding, message.content, model);
+    }
+
+    // Name tokens (if present)
+    if (message.name) {
+      tokens += encoding.encode(message.name).length + TOKENS_PER_NAME;
+    }
+
+    // Tool calls tokens (if present)
+    if (message.tool_calls && message.tool_calls.length > 0) {
+      for (const toolCall of message.tool_calls) {
+        const toolNameTokens = encoding.encode(toolCall.function.name);
+        const toolArgsTokens = await this.encodeLength(encoding, toolCall.function.arguments, model);
+        tokens += toolNameTokens.length + toolArgsTokens + 3; // 3 for formatting
+      }
+    }
+
+    // Tool call ID tokens (for tool response messages)
+    if (message.tool_call_id) {
+      tokens += encoding.encode(message.tool_call_id).length;
+    }
+
+    return tokens;
+  }
+
+  /**
+   * Encode a text's length, on a worker thread when it is large
+   *
+   * Falls back to encoding inline if the worker pool is unavailable.
+   */
+  private async encodeLength(encoding: Tiktoken, text: string, model?: string): Promise<number> {
+    if (
+      this.pool &&
+      text.length * 3 >= this.inlineThresholdBytes &&
+      Buffer.byteLength(text, 'utf8') >= this.inlineThresholdBytes
+    ) {
+      const tiktokenModel = model && this.isValidTiktokenModel(model) ? model : undefined;
+      const encodingName = model ? this.getEncodingForModel(model) : DEFAULT_ENCODING;
+      try {
+        return await this.pool.count(text, tiktokenModel, encodingName);
+      } catch (error) {
+        console.warn(`Tokenizer worker unavailable, encoding inline:`, error);
+        this.pool = null;
+      }
+    }
+
+    return encoding.encode(text).length;
+  }
+
+  /**
+   * Approximate token count without running the encoder
+   *
+   * Scans the text once, splitting it the way tiktoken's pre-tokenizer
+   * does, and charges each piece conservatively: letter runs one token per
+   * 3 characters, digits one per 3-digit group, punctuation one per
+   * character, non-ASCII two per character and whitespace runs one each
+   * (a single space before a word is free, as BPE merges it).
+   */
+  approximateTokens(text: string): number {
+    let tokens = 0;
+    let i = 0;
+    const length = text.length;
+
+    while (i < length) {
+      const code = text.charCodeAt(i);
+      const start = i;
+
+      if (isAsciiLetter(code)) {
+        while (i < length && isAsciiLetter(text.charCodeAt(i))) i++;
+        tokens += Math.ceil((i - start) / 3);
+      } else if (code >= 48 && code <= 57) {
+        while (i < length && isDigit(text.charCodeAt(i))) i++;
+        tokens += Math.ceil((i - start) / 3);
+      } else if (code === 32 || code === 9 || code === 10 || code === 13) {
+        while (i < length && isWhitespace(text.charCodeAt(i))) i++;
+        const next = i < length ? text.charCodeAt(i) : -1;
+        if (!(i - start === 1 && code === 32 && next !== -1 && !isWhitespace(next))) {
+          tokens += 1;
+        }
+      } else if (code < 128) {
+        i++;
+        tokens += 1;
+      } else {
+        // Surrogate pairs count once per code unit, which only overestimates
+        i++;
+        tokens += 2;
+      }
+    }
+
+    return tokens;
+  }
+
+  /**
+   * Approximate message token count (same overheads as the exact count)
+   */
+  private approximateMessageTokens(messages: ChatMessage[]): number {
+    let totalTokens = 3; // Assistant's reply priming
+
+    for (const message of messages) {
+      totalTokens += TOKENS_PER_MESSAGE + this.approximateTokens(message.role);
+      totalTokens += this.approximateTokens(message.content || '');
+
+      if (message.name) {
+        totalTokens += this.approximateTokens(message.name) + TOKENS_PER_NAME;
+      }
+
+      if (message.tool_calls) {
+        for (const toolCall of message.tool_calls) {
+          totalTokens += this.approximateTokens(toolCall.function.name);
+          totalTokens += this.approximateTokens(toolCall.function.arguments) + 3;
+        }
+      }
+
+      if (message.tool_call_id) {
+        totalTokens += this.approximateTokens(message.tool_call_id);
+      }
+    }
+
+    return totalTokens;
+  }
+
   /**
    * Estimate tokens without loading tokenizer (faster but less accurate)
    * Uses character-based heuristic
@@ -248,22 +399,7 @@ export class TokenCounter implements ITokenCounter {
    */
   private getCacheKey(text: string, model?: string): string {
     const modelPart = model || 'default';
-    // Use a simple hash for the text to keep cache keys manageable
-    const textHash = this.simpleHash(text);
-    return `${modelPart}:${textHash}`;
-  }
-
-  /**
-   * Simple string hash function
-   */
-  private simpleHash(str: string): string {
-    let hash = 0;
-    for (let i = 0; i < str.length; i++) {
-      const char = str.charCodeAt(i);
-      hash = (hash << 5) - hash + char;
-      hash = hash & hash; // Convert to 32bit integer
-    }
-    return hash.toString(36);
+    return `${modelPart}:${computeContentDigest(text)}`;
   }
 
   /**
@@ -325,11 +461,29 @@ export class TokenCounter implements ITokenCounter {
       this.cacheCleanupInterval = null;
     }
 
+    // Stop tokenizer workers
+    if (this.pool) {
+      void this.pool.close();
+      this.pool = null;
+    }
+
     // Clear caches and free resources
     this.clearCache();
   }
 }
 
+function isAsciiLetter(code: number): boolean {
+  return (code >= 65 && code <= 90) || (code >= 97 && code <= 122);
+}
+
+function isDigit(code: number): boolean {
+  return code >= 48 && code <= 57;
+}
+
+function isWhitespace(code: number): boolean {
+  return code === 32 || code === 9 || code === 10 || code === 13;
+}
+
 /**
  * Create a singleton token counter instance
  */
@@ -0,0 +1,121 @@
+/**
+ * TokenizerPool - tiktoken encoding on worker threads
+ *
+ * Keeps large encodes (multi-megabyte tool output, diffs) off the main
+ * event loop so UI rendering and streaming stay responsive.
+ *
+ * Features:
+ * - Lazily spawned, bounded pool of worker threads
+ * - Per-worker encoding cache
+ * - Workers are unref'd while idle, so they never hold the process open
+ * - A worker failure disables the pool instead of respawning workers
+ */
+
+import { createRequire } from "module";
+import { WorkerPool } from "../utils/WorkerPool.js";
+
+/**
+ * Tokenizer pool configuration
+ */
+export interface TokenizerPoolConfig {
+  /** Maximum worker threads */
+  workers: number;
+}
+
+interface CountPayload {
+  text: string;
+  model?: string;
+  encodingName: string;
+}
+
+const WORKER_SOURCE = `
+const { parentPort, workerData } = require("worker_threads");
+const tiktoken = require(workerData.tiktokenPath);
+const encodings = new Map();
+
+function getEncoding(model, encodingName) {
+  const key = model || encodingName;
+  let encoding = encodings.get(key);
+  if (!encoding) {
+    try {
+      encoding = model
+        ? tiktoken.encoding_for_model(model)
+        : tiktoken.get_encoding(encodingName);
+    } catch {
+      encoding = tiktoken.get_encoding(encodingName);
+    }
+    encodings.set(key, encoding);
+  }
+  return encoding;
+}
+
+parentPort.on("message", (task) => {
+  try {
+    const count = getEncoding(task.model, task.encodingName).encode(task.text).length;
+    parentPort.postMessage({ id: task.id, result: count });
+  } catch (error) {
+    parentPort.postMessage({
+      id: task.id,
+      error: error && error.message ? error.message : String(error),
+    });
+  }
+});
+`;
+
+/**
+ * TokenizerPool - counts tokens on worker threads
+ */
+export class TokenizerPool {
+  private static readonly DEFAULT_CONFIG: TokenizerPoolConfig = {
+    workers: 2,
+  };
+
+  private config: TokenizerPoolConfig;
+  private pool: WorkerPool<CountPayload, number>;
+  private tiktokenPath: string | null = null;
+
+  constructor(config: Partial<TokenizerPoolConfig> = {}) {
+    this.config = { ...TokenizerPool.DEFAULT_CONFIG, ...config };
+    this.pool = new WorkerPool({
+      name: "TokenizerPool",
+      source: WORKER_SOURCE,
+      workers: this.config.workers,
+      workerData: () => ({ tiktokenPath: this.resolveTiktoken() }),
+    });
+  }
+
+  /**
+   * Count tokens of a text on a worker thread
+   *
+   * Rejects once the pool is closed or disabled by a worker failure;
+   * callers then count on their own thread.
+   *
+   * @param model - tiktoken model name, or undefined to use `encodingName`
+   * @param encodingName - Encoding used when the model is unknown
+   */
+  count(text: string, model: string | undefined, encodingName: string): Promise<number> {
+    return this.pool.run({ text, model, encodingName });
+  }
+
+  /**
+   * Get pool statistics
+   */
+  getStats(): { workers: number; busy: number; queued: number } {
+    return this.pool.getStats();
+  }
+
+  /**
+   * Terminate all workers and reject queued tasks
+   */
+  async close(): Promise<void> {
+    await this.pool.close();
+  }
+
+  private resolveTiktoken(): string {
+    if (!this.tiktokenPath) {
+      // Resolve from this module so workers load the same installation
+      this.tiktokenPath = createRequire(import.meta.url).resolve("tiktoken");
+    }
+    return this.tiktokenPath;
+  }
+}
@@ -0,0 +1,292 @@
+/**
+ * DirectoryResponseCache - Content-addressed on-disk LLM response tier
+ *
+ * Features:
+ * - One JSON file per entry at `<dir>/<key[0..2]>/<key>.json`
+ * - Atomic writes (temp file + rename)
+ * - Bounded by entry count and byte size, evicting by last access (mtime)
+ * - Per-entry TTL stored in the file
+ * - Index of keys, sizes and access times loaded lazily on first use
+ */
+
+import { promises as fs } from "fs";
+import { join } from "path";
+import { createHash } from "crypto";
+import type { ILLMResponseCache } from "../../../core/interfaces/ILLMClient.js";
+import type {
+  ChatResponse,
+  LLMCacheStats,
+} from "../../../core/types/llm.types.js";
+import { emptyCacheStats, matchesKeyPattern } from "./MemoryResponseCache.js";
+
+/**
+ * Directory tier configuration
+ */
+export interface DirectoryResponseCacheConfig {
+  /** Root directory for cache files */
+  directory: string;
+  /** Max number of files */
+  maxEntries: number;
+  /** Max total file size in bytes */
+  maxBytes: number;
+  /** Entry time-to-live in ms (0 = never expires) */
+  ttlMs: number;
+}
+
+interface StoredEntry {
+  key: string;
+  createdAt: number;
+  expiresAt: number | null;
+  response: ChatResponse;
+}
+
+interface IndexEntry {
+  size: number;
+  lastAccessedAt: number;
+}
+
+/**
+ * DirectoryResponseCache - file-per-entry cache with LRU eviction
+ */
+export class DirectoryResponseCache implements ILLMResponseCache {
+  public readonly name = "directory";
+
+  private static readonly DEFAULT_CONFIG: Omit<
+    DirectoryResponseCacheConfig,
+    "directory"
+  > = {
+    maxEntries: 10000,
+    maxBytes: 256 * 1024 * 1024, // 256MB
+    ttlMs: 7 * 24 * 60 * 60 * 1000, // 7 days
+  };
+
+  private config: DirectoryResponseCacheConfig;
+  private index: Map<string, IndexEntry> = new Map();
+  private loading: Promise<void> | null = null;
+  private totalSize = 0;
+  private stats = emptyCacheStats();
+
+  constructor(
+    config: Partial<DirectoryResponseCacheConfig> & { directory: string },
+  ) {
+    this.config = { ...DirectoryResponseCache.DEFAULT_CONFIG, ...config };
+  }
+
+  async get(key: string): Promise<ChatResponse | null> {
+    await this.load();
+
+    if (!this.index.has(key)) {
+      this.stats.misses++;
+      return null;
+    }
+
+    const entry = await this.readEntry(key);
+    if (!entry) {
+      this.stats.misses++;
+      return null;
+    }
+
+    const now = Date.now();
+    if (entry.expiresAt !== null && entry.expiresAt <= now) {
+      await this.remove(key);
+      this.stats.expirations++;
+      this.stats.misses++;
+      return null;
+    }
+
+    this.touch(key, now);
+    this.stats.hits++;
+    return entry.response;
+  }
+
+  async set(key: string, response: ChatResponse): Promise<void> {
+    await this.load();
+
+    const now = Date.now();
+    const stored: StoredEntry = {
+      key,
+      createdAt: now,
+      expiresAt: this.config.ttlMs > 0 ? now + this.config.ttlMs : null,
+      response,
+    };
+    const data = JSON.stringify(stored);
+    const size = Buffer.byteLength(data, "utf8");
+    if (size > this.config.maxBytes) {
+      return;
+    }
+
+    const path = this.pathFor(key);
+    const tempPath = `${path}.${process.pid}.tmp`;
+    await fs.mkdir(join(path, ".."), { recursive: true });
+    await fs.writeFile(tempPath, data, "utf8");
+    await fs.rename(tempPath, path);
+
+    const previous = this.index.get(key);
+    this.totalSize += size - (previous?.size ?? 0);
+    this.index.delete(key);
+    this.index.set(key, { size, lastAccessedAt: now });
+
+    await this.evict();
+  }
+
+  async has(key: string): Promise<boolean> {
+    await this.load();
+    if (!this.index.has(key)) {
+      return false;
+    }
+    const entry = await this.readEntry(key);
+    return !!entry && (entry.expiresAt === null || entry.expiresAt > Date.now());
+  }
+
+  async delete(key: string): Promise<boolean> {
+    await this.load();
+    return this.remove(key);
+  }
+
+  async clear(pattern?: string): Promise<number> {
+    await this.load();
+
+    let count = 0;
+    for (const key of Array.from(this.index.keys())) {
+      if (!pattern || matchesKeyPattern(key, pattern)) {
+        if (await this.remove(key)) {
+          count++;
+        }
+      }
+    }
+    return count;
+  }
+
+  getStats(): LLMCacheStats {
+    const lookups = this.stats.hits + this.stats.misses;
+    return {
+      ...this.stats,
+      size: this.index.size,
+      totalSize: this.totalSize,
+      hitRate: lookups > 0 ? this.stats.hits / lookups : 0,
+    };
+  }
+
+  async close(): Promise<void> {
+    // Files persist; nothing to release
+  }
+
+  /**
+   * File path for a key, sharded by the first two characters
+   *
+   * Keys that are not filename-safe are addressed by their sha256 instead.
+   */
+  private pathFor(key: string): string {
+    const name = /^[A-Za-z0-9_-]{2,128}$/.test(key)
+      ? key
+      : createHash("sha256").update(key).digest("hex");
+    return join(this.config.directory, name.slice(0, 2), `${name}.json`);
+  }
+
+  /**
+   * Build the in-memory index from the files on disk (once)
+   */
+  private load(): Promise<void> {
+    if (!this.loading) {
+      this.loading = this.scan();
+    }
+    return this.loading;
+  }
+
+  private async scan(): Promise<void> {
+    let shards: string[];
+    try {
+      shards = await fs.readdir(this.config.directory);
+    } catch {
+      return; // Directory not created yet
+    }
+
+    const found: Array<{ key: string; size: number; mtime: number }> = [];
+    for (const shard of shards) {
+      let files: string[];
+      try {
+        files = await fs.readdir(join(this.config.directory, shard));
+      } catch {
+        continue;
+      }
+
+      for (const file of files) {
+        if (!file.endsWith(".json")) continue;
+        const path = join(this.config.directory, shard, file);
+        try {
+          const content = await fs.readFile(path, "utf8");
+          const stored = JSON.parse(content) as StoredEntry;
+          const stat = await fs.stat(path);
+          found.push({ key: stored.key, size: stat.size, mtime: stat.mtimeMs });
+        } catch {
+          await fs.rm(path, { force: true }); // Corrupt entry
+        }
+      }
+    }
+
+    // Oldest access first so Map order doubles as LRU order
+    found.sort((a, b) => a.mtime - b.mtime);
+    for (const entry of found) {
+      this.index.set(entry.key, {
+        size: entry.size,
+        lastAccessedAt: entry.mtime,
+      });
+      this.totalSize += entry.size;
+    }
+  }
+
+  private async readEntry(key: string): Promise<StoredEntry | null> {
+    try {
+      const content = await fs.readFile(this.pathFor(key), "utf8");
+      return JSON.parse(content) as StoredEntry;
+    } catch {
+      // Removed externally or corrupt
+      await this.remove(key);
+      return null;
+    }
+  }
+
+  /**
+   * Record an access: move to MRU position and bump the file mtime so
+   * LRU order survives restarts
+   */
+  private touch(key: string, now: number): void {
+    const entry = this.index.get(key);
+    if (!entry) return;
+
+    entry.lastAccessedAt = now;
+    this.index.delete(key);
+    this.index.set(key, entry);
+
+    const time = new Date(now);
+    fs.utimes(this.pathFor(key), time, time).catch(() => {});
+  }
+
+  private async remove(key: string): Promise<boolean> {
+    const entry = this.index.get(key);
+    if (!entry) {
+      return false;
+    }
+    this.index.delete(key);
+    this.totalSize -= entry.size;
+    await fs.rm(this.pathFor(key), { force: true });
+    return true;
+  }
+
+  /**
+   * Drop least-recently-used files until within bounds
+   */
+  private async evict(): Promise<void> {
+    while (
+      this.index.size > this.config.maxEntries ||
+      this.totalSize > this.config.maxBytes
+    ) {
+      const oldest = this.index.keys().next().value;
+      if (oldest === undefined) {
+        break;
+      }
+      await this.remove(oldest);
+      this.stats.evictions++;
+    }
+  }
+}
@@ -0,0 +1,215 @@
+/**
+ * MemoryResponseCache - In-process LRU tier for LLM responses
+ *
+ * Features:
+ * - LRU ordering via Map insertion order
+ * - Bounded by entry count and serialized byte size
+ * - Per-entry TTL with lazy expiry
+ * - Hit/miss/eviction/expiration counters
+ */
+
+import type { ILLMResponseCache } from "../../../core/interfaces/ILLMClient.js";
+import type {
+  ChatResponse,
+  LLMCacheStats,
+} from "../../../core/types/llm.types.js";
+
+/**
+ * Memory tier configuration
+ */
+export interface MemoryResponseCacheConfig {
+  /** Max number of entries */
+  maxEntries: number;
+  /** Max total serialized size in bytes */
+  maxBytes: number;
+  /** Entry time-to-live in ms (0 = never expires) */
+  ttlMs: number;
+}
+
+interface MemoryEntry {
+  response: ChatResponse;
+  size: number;
+  expiresAt: number | null;
+}
+
+/**
+ * Measure the serialized size of a response in bytes
+ */
+export function measureResponse(response: ChatResponse): number {
+  return Buffer.byteLength(JSON.stringify(response), "utf8");
+}
+
+/**
+ * Test a cache key against a clearCache pattern
+ *
+ * Patterns containing `*` or `?` are matched as globs against the whole key;
+ * anything else matches as a substring.
+ */
+export function matchesKeyPattern(key: string, pattern: string): boolean {
+  if (!/[*?]/.test(pattern)) {
+    return key.includes(pattern);
+  }
+  const source = pattern
+    .replace(/[.+^${}()|[\]\\]/g, "\\$&")
+    .replace(/\*/g, ".*")
+    .replace(/\?/g, ".");
+  return new RegExp(`^${source}$`).test(key);
+}
+
+/**
+ * Build an empty stats object
+ */
+export function emptyCacheStats(): LLMCacheStats {
+  return {
+    size: 0,
+    hits: 0,
+    misses: 0,
+    hitRate: 0,
+    totalSize: 0,
+    evictions: 0,
+    expirations: 0,
+  };
+}
+
+/**
+ * MemoryResponseCache - bounded LRU with TTL
+ */
+export class MemoryResponseCache implements ILLMResponseCache {
+  public readonly name = "memory";
+
+  private static readonly DEFAULT_CONFIG: MemoryResponseCacheConfig = {
+    maxEntries: 1000,
+    maxBytes: 32 * 1024 * 1024, // 32MB
+    ttlMs: 60 * 60 * 1000, // 1 hour
+  };
+
+  private config: MemoryResponseCacheConfig;
+  private entries: Map<string, MemoryEntry> = new Map();
+  private totalSize = 0;
+  private stats = emptyCacheStats();
+
+  constructor(config: Partial<MemoryResponseCacheConfig> = {}) {
+    this.config = { ...MemoryResponseCache.DEFAULT_CONFIG, ...config };
+  }
+
+  async get(key: string): Promise<ChatResponse | null> {
+    const entry = this.getLive(key);
+    if (!entry) {
+      this.stats.misses++;
+      return null;
+    }
+
+    // Move to most-recently-used position
+    this.entries.delete(key);
+    this.entries.set(key, entry);
+    this.stats.hits++;
+    return entry.response;
+  }
+
+  async set(key: string, response: ChatResponse): Promise<void> {
+    this.put(key, response, measureResponse(response));
+  }
+
+  /**
+   * Insert with a known size (used when promoting from a disk tier)
+   */
+  put(key: string, response: ChatResponse, size: number): void {
+    this.remove(key);
+
+    // Entries larger than the whole budget are never admitted
+    if (size > this.config.maxBytes) {
+      return;
+    }
+
+    this.entries.set(key, {
+      response,
+      size,
+      expiresAt: this.config.ttlMs > 0 ? Date.now() + this.config.ttlMs : null,
+    });
+    this.totalSize += size;
+    this.evict();
+  }
+
+  async has(key: string): Promise<boolean> {
+    return this.getLive(key) !== null;
+  }
+
+  async delete(key: string): Promise<boolean> {
+    return this.remove(key);
+  }
+
+  async clear(pattern?: string): Promise<number> {
+    if (!pattern) {
+      const count = this.entries.size;
+      this.entries.clear();
+      this.totalSize = 0;
+      return count;
+    }
+
+    let count = 0;
+    for (const key of Array.from(this.entries.keys())) {
+      if (matchesKeyPattern(key, pattern)) {
+        this.remove(key);
+        count++;
+      }
+    }
+    return count;
+  }
+
+  getStats(): LLMCacheStats {
+    const lookups = this.stats.hits + this.stats.misses;
+    return {
+      ...this.stats,
+      size: this.entries.size,
+      totalSize: this.totalSize,
+      hitRate: lookups > 0 ? this.stats.hits / lookups : 0,
+    };
+  }
+
+  async close(): Promise<void> {
+    await this.clear();
+  }
+
+  /**
+   * Return the entry if present and not expired, dropping it if expired
+   */
+  private getLive(key: string): MemoryEntry | null {
+    const entry = this.entries.get(key);
+    if (!entry) {
+      return null;
+    }
+    if (entry.expiresAt !== null && entry.expiresAt <= Date.now()) {
+      this.remove(key);
+      this.stats.expirations++;
+      return null;
+    }
+    return entry;
+  }
+
+  private remove(key: string): boolean {
+    const entry = this.entries.get(key);
+    if (!entry) {
+      return false;
+    }
+    this.entries.delete(key);
+    this.totalSize -= entry.size;
+    return true;
+  }
+
+  /**
+   * Drop least-recently-used entries until within bounds
+   */
+  private evict(): void {
+    while (
+      this.entries.size > this.config.maxEntries ||
+      this.totalSize > this.config.maxBytes
+    ) {
+      const oldest = this.entries.keys().next().value;
+      if (oldest === undefined) {
+        break;
+      }
+      this.remove(oldest);
+      this.stats.evictions++;
+    }
+  }
+}
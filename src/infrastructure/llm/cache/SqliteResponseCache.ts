@@ -0,0 +1,249 @@
+/**
+ * SqliteResponseCache - Persistent LLM response tier in the app database
+ *
+ * Features:
+ * - Stores responses in `llm_response_cache` (migration 004)
+ * - Bounded by entry count and serialized byte size, evicting by last access
+ * - Per-entry TTL; expired rows are dropped on read and during eviction
+ * - Survives restarts, so identical prompts are served across runs
+ */
+
+import type { ILLMResponseCache } from "../../../core/interfaces/ILLMClient.js";
+import type {
+  ChatResponse,
+  LLMCacheStats,
+} from "../../../core/types/llm.types.js";
+import type { DatabaseWrapper } from "../../storage/Database.js";
+import { emptyCacheStats } from "./MemoryResponseCache.js";
+
+/**
+ * SQLite tier configuration
+ */
+export interface SqliteResponseCacheConfig {
+  /** Max number of rows */
+  maxEntries: number;
+  /** Max total serialized size in bytes */
+  maxBytes: number;
+  /** Entry time-to-live in ms (0 = never expires) */
+  ttlMs: number;
+}
+
+interface CacheRow {
+  response: string;
+  size: number;
+  expires_at: number | null;
+}
+
+/**
+ * SqliteResponseCache - LRU-by-last-access table cache
+ */
+export class SqliteResponseCache implements ILLMResponseCache {
+  public readonly name = "sqlite";
+
+  private static readonly DEFAULT_CONFIG: SqliteResponseCacheConfig = {
+    maxEntries: 10000,
+    maxBytes: 256 * 1024 * 1024, // 256MB
+    ttlMs: 7 * 24 * 60 * 60 * 1000, // 7 days
+  };
+
+  private static readonly EVICTION_BATCH = 100;
+
+  private db: DatabaseWrapper;
+  private config: SqliteResponseCacheConfig;
+  private stats = emptyCacheStats();
+  private count = 0;
+  private totalSize = 0;
+
+  constructor(
+    db: DatabaseWrapper,
+    config: Partial<SqliteResponseCacheConfig> = {},
+  ) {
+    this.db = db;
+    this.config = { ...SqliteResponseCache.DEFAULT_CONFIG, ...config };
+    this.purgeExpired();
+    this.refreshTotals();
+  }
+
+  async get(key: string): Promise<ChatResponse | null> {
+    const row = this.db.queryOne<CacheRow>(
+      "SELECT response, size, expires_at FROM llm_response_cache WHERE key = ?",
+      [key],
+    );
+
+    if (!row) {
+      this.stats.misses++;
+      return null;
+    }
+
+    const now = Date.now();
+    if (row.expires_at !== null && row.expires_at <= now) {
+      this.deleteRow(key, row.size);
+      this.stats.expirations++;
+      this.stats.misses++;
+      return null;
+    }
+
+    this.db.execute(
+      "UPDATE llm_response_cache SET last_accessed_at = ?, hits = hits + 1 WHERE key = ?",
+      [now, key],
+    );
+    this.stats.hits++;
+    return JSON.parse(row.response) as ChatResponse;
+  }
+
+  async set(key: string, response: ChatResponse): Promise<void> {
+    const serialized = JSON.stringify(response);
+    const size = Buffer.byteLength(serialized, "utf8");
+    if (size > this.config.maxBytes) {
+      return;
+    }
+
+    const now = Date.now();
+    const expiresAt = this.config.ttlMs > 0 ? now + this.config.ttlMs : null;
+
+    this.db.transaction(() => {
+      const existing = this.db.queryOne<{ size: number }>(
+        "SELECT size FROM llm_response_cache WHERE key = ?",
+        [key],
+      );
+
+      this.db.execute(
+        `INSERT OR REPLACE INTO llm_response_cache
+         (key, response, size, created_at, expires_at, last_accessed_at, hits)
+         VALUES (?, ?, ?, ?, ?, ?, 0)`,
+        [key, serialized, size, now, expiresAt, now],
+      );
+
+      if (existing) {
+        this.totalSize += size - existing.size;
+      } else {
+        this.count++;
+        this.totalSize += size;
+      }
+    });
+
+    if (
+      this.count > this.config.maxEntries ||
+      this.totalSize > this.config.maxBytes
+    ) {
+      this.evict();
+    }
+  }
+
+  async has(key: string): Promise<boolean> {
+    const row = this.db.queryOne<{ expires_at: number | null }>(
+      "SELECT expires_at FROM llm_response_cache WHERE key = ?",
+      [key],
+    );
+    return !!row && (row.expires_at === null || row.expires_at > Date.now());
+  }
+
+  async delete(key: string): Promise<boolean> {
+    const row = this.db.queryOne<{ size: number }>(
+      "SELECT size FROM llm_response_cache WHERE key = ?",
+      [key],
+    );
+    if (!row) {
+      return false;
+    }
+    this.deleteRow(key, row.size);
+    return true;
+  }
+
+  async clear(pattern?: string): Promise<number> {
+    let result;
+    if (!pattern) {
+      result = this.db.execute("DELETE FROM llm_response_cache");
+    } else if (/[*?]/.test(pattern)) {
+      result = this.db.execute(
+        "DELETE FROM llm_response_cache WHERE key GLOB ?",
+        [pattern],
+      );
+    } else {
+      result = this.db.execute(
+        "DELETE FROM llm_response_cache WHERE instr(key, ?) > 0",
+        [pattern],
+      );
+    }
+
+    this.refreshTotals();
+    return result.changes;
+  }
+
+  getStats(): LLMCacheStats {
+    const lookups = this.stats.hits + this.stats.misses;
+    return {
+      ...this.stats,
+      size: this.count,
+      totalSize: this.totalSize,
+      hitRate: lookups > 0 ? this.stats.hits / lookups : 0,
+    };
+  }
+
+  async close(): Promise<void> {
+    // The database handle is owned by the caller
+  }
+
+  private deleteRow(key: string, size: number): void {
+    const result = this.db.execute(
+      "DELETE FROM llm_response_cache WHERE key = ?",
+      [key],
+    );
+    if (result.changes > 0) {
+      this.count--;
+      this.totalSize -= size;
+    }
+  }
+
+  private purgeExpired(): number {
+    const result = this.db.execute(
+      "DELETE FROM llm_response_cache WHERE expires_at IS NOT NULL AND expires_at <= ?",
+      [Date.now()],
+    );
+    this.stats.expirations += result.changes;
+    return result.changes;
+  }
+
+  private refreshTotals(): void {
+    const row = this.db.queryOne<{ count: number; total: number }>(
+      "SELECT COUNT(*) as count, COALESCE(SUM(size), 0) as total FROM llm_response_cache",
+    );
+    this.count = row?.count ?? 0;
+    this.totalSize = row?.total ?? 0;
+  }
+
+  /**
+   * Drop expired rows, then least-recently-accessed rows until within bounds
+   */
+  private evict(): void {
+    this.db.transaction(() => {
+      if (this.purgeExpired() > 0) {
+        this.refreshTotals();
+      }
+
+      while (
+        this.count > this.config.maxEntries ||
+        this.totalSize > this.config.maxBytes
+      ) {
+        const victims = this.db.query<{ key: string; size: number }>(
+          "SELECT key, size FROM llm_response_cache ORDER BY last_accessed_at ASC LIMIT ?",
+          [SqliteResponseCache.EVICTION_BATCH],
+        );
+        if (victims.length === 0) {
+          break;
+        }
+
+        for (const victim of victims) {
+          if (
+            this.count <= this.config.maxEntries &&
+            this.totalSize <= this.config.maxBytes
+          ) {
+            break;
+          }
+          this.deleteRow(victim.key, victim.size);
+          this.stats.evictions++;
+        }
+      }
+    });
+  }
+}
@@ -0,0 +1,99 @@
+/**
+ * TieredResponseCache - Memory LRU in front of a persistent tier
+ *
+ * Features:
+ * - Reads check memory first, then the persistent tier (promoting hits)
+ * - Writes go through to both tiers
+ * - clear(pattern) applies to both tiers
+ * - Combined stats with per-tier breakdown
+ */
+
+import type { ILLMResponseCache } from "../../../core/interfaces/ILLMClient.js";
+import type {
+  ChatResponse,
+  LLMCacheStats,
+} from "../../../core/types/llm.types.js";
+import { MemoryResponseCache, measureResponse } from "./MemoryResponseCache.js";
+
+/**
+ * TieredResponseCache - two-level write-through cache
+ */
+export class TieredResponseCache implements ILLMResponseCache {
+  public readonly name: string;
+
+  private memory: MemoryResponseCache;
+  private persistent: ILLMResponseCache;
+
+  constructor(memory: MemoryResponseCache, persistent: ILLMResponseCache) {
+    this.memory = memory;
+    this.persistent = persistent;
+    this.name = `${memory.name}+${persistent.name}`;
+  }
+
+  async get(key: string): Promise<ChatResponse | null> {
+    const cached = await this.memory.get(key);
+    if (cached) {
+      return cached;
+    }
+
+    const stored = await this.persistent.get(key);
+    if (stored) {
+      this.memory.put(key, stored, measureResponse(stored));
+    }
+    return stored;
+  }
+
+  async set(key: string, response: ChatResponse): Promise<void> {
+    await this.memory.set(key, response);
+    await this.persistent.set(key, response);
+  }
+
+  async has(key: string): Promise<boolean> {
+    return (await this.memory.has(key)) || this.persistent.has(key);
+  }
+
+  async delete(key: string): Promise<boolean> {
+    const inMemory = await this.memory.delete(key);
+    const persisted = await this.persistent.delete(key);
+    return inMemory || persisted;
+  }
+
+  /**
+   * Clear both tiers
+   *
+   * Memory is a write-through subset of the persistent tier, so the larger
+   * of the two counts is the number of distinct entries removed.
+   */
+  async clear(pattern?: string): Promise<number> {
+    const inMemory = await this.memory.clear(pattern);
+    const persisted = await this.persistent.clear(pattern);
+    return Math.max(inMemory, persisted);
+  }
+
+  getStats(): LLMCacheStats {
+    const memory = this.memory.getStats();
+    const persistent = this.persistent.getStats();
+    const hits = memory.hits + persistent.hits;
+    const misses = persistent.misses;
+    const lookups = hits + misses;
+
+    return {
+      size: persistent.size,
+      hits,
+      misses,
+      hitRate: lookups > 0 ? hits / lookups : 0,
+      totalSize: persistent.totalSize,
+      evictions: memory.evictions + persistent.evictions,
+      expirations: memory.expirations + persistent.expirations,
+      tiers: {
+        [this.memory.name]: memory,
+        [this.persistent.name]: persistent,
+      },
+    };
+  }
+
+  async close(): Promise<void> {
+    await this.memory.close();
+    await this.persistent.close();
+  }
+}
@@ -0,0 +1,66 @@
+/**
+ * LLM Response Cache Module
+ *
+ * Pluggable response cache backends for ICachedLLMClient implementations.
+ */
+
+import type { ILLMResponseCache } from "../../../core/interfaces/ILLMClient.js";
+import type { LLMCacheConfig } from "../../../core/types/llm.types.js";
+import type { DatabaseWrapper } from "../../storage/Database.js";
+import { MemoryResponseCache } from "./MemoryResponseCache.js";
+import { SqliteResponseCache } from "./SqliteResponseCache.js";
+import { DirectoryResponseCache } from "./DirectoryResponseCache.js";
+import { TieredResponseCache } from "./TieredResponseCache.js";
+
+export {
+  MemoryResponseCache,
+  SqliteResponseCache,
+  DirectoryResponseCache,
+  TieredResponseCache,
+};
+export { matchesKeyPattern } from "./MemoryResponseCache.js";
+
+export type { MemoryResponseCacheConfig } from "./MemoryResponseCache.js";
+export type { SqliteResponseCacheConfig } from "./SqliteResponseCache.js";
+export type { DirectoryResponseCacheConfig } from "./DirectoryResponseCache.js";
+
+/**
+ * Create a response cache from client settings
+ *
+ * Always includes the memory LRU tier. A persistent tier is added when a
+ * database is given (SQLite table) or `config.directory` is set.
+ */
+export function createResponseCache(
+  config: LLMCacheConfig = {},
+  db?: DatabaseWrapper,
+): ILLMResponseCache {
+  const memory = new MemoryResponseCache({
+    ...(config.maxEntries !== undefined && { maxEntries: config.maxEntries }),
+    ...(config.maxBytes !== undefined && { maxBytes: config.maxBytes }),
+    ...(config.ttlMs !== undefined && { ttlMs: config.ttlMs }),
+  });
+
+  const persistentConfig = {
+    ...(config.maxDiskBytes !== undefined && { maxBytes: config.maxDiskBytes }),
+    ...(config.ttlMs !== undefined && { ttlMs: config.ttlMs }),
+  };
+
+  if (db) {
+    return new TieredResponseCache(
+      memory,
+      new SqliteResponseCache(db, persistentConfig),
+    );
+  }
+
+  if (config.directory) {
+    return new TieredResponseCache(
+      memory,
+      new DirectoryResponseCache({
+        ...persistentConfig,
+        directory: config.directory,
+      }),
+    );
+  }
+
+  return memory;
+}
@@ -6,11 +6,55 @@
 
 export { CopilotClient } from './CopilotClient.js';
 export { TokenCounter, getTokenCounter, resetTokenCounter } from './TokenCounter.js';
+export type { TokenCountOptions } from './TokenCounter.js';
+export { TokenizerPool } from './TokenizerPool.js';
+export type { TokenizerPoolConfig } from './TokenizerPool.js';
+export { EmbeddingBatcher } from './EmbeddingBatcher.js';
+export type {
+  EmbeddingBatcherConfig,
+  EmbeddingBatcherStats,
+} from './EmbeddingBatcher.js';
+export {
+  LocalEmbeddingClient,
+  getLocalEmbeddingClient,
+} from './LocalEmbeddingClient.js';
+export type {
+  LocalEmbeddingConfig,
+  OnnxEmbeddingModel,
+} from './LocalEmbeddingClient.js';
+export { RateLimiter } from './RateLimiter.js';
+export { SseParser } from './SseParser.js';
+export type { SseEvent } from './SseParser.js';
+export { streamChat, JsonStreamScanner } from './ChatStream.js';
+export type {
+  StreamChatOptions,
+  StreamChatMetrics,
+  StreamChatResult,
+} from './ChatStream.js';
+export {
+  computeMessageDigest,
+  computeContentDigest,
+  computeRequestKey,
+} from './MessageDigest.js';
+export {
+  MemoryResponseCache,
+  SqliteResponseCache,
+  DirectoryResponseCache,
+  TieredResponseCache,
+  createResponseCache,
+  matchesKeyPattern,
+} from './cache/index.js';
+export type {
+  MemoryResponseCacheConfig,
+  SqliteResponseCacheConfig,
+  DirectoryResponseCacheConfig,
+} from './cache/index.js';
 
 // Re-export types and interfaces for convenience
 export type {
   ILLMClient,
   ICachedLLMClient,
+  ILLMResponseCache,
   ITokenCounter,
   IEmbeddingClient,
 } from '../../core/interfaces/ILLMClient.js';
@@ -26,6 +70,8 @@ export type {
   LLMConfig,
   LLMStats,
   LLMRequestOptions,
+  LLMCacheStats,
+  LLMCacheConfig,
   ToolCall,
   ToolDefinition,
   TokenUsage,
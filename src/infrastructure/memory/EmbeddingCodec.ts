@@ -0,0 +1,75 @@
+/**
+ * Embedding Codec
+ *
+ * Binary encoding for embedding vectors stored in `memories.embedding`.
+ *
+ * Vectors are stored as little-endian Float32 BLOBs (4 bytes per dimension).
+ * Rows written before the binary format was introduced hold a JSON array of
+ * numbers; `decodeEmbedding` still accepts those so reads never break while
+ * the migration has not yet run.
+ */
+
+/**
+ * Whether the host stores typed arrays in little-endian byte order
+ */
+const IS_LITTLE_ENDIAN =
+  new Uint8Array(new Uint16Array([1]).buffer)[0] === 1;
+
+/**
+ * Raw embedding value as returned by SQLite
+ */
+export type StoredEmbedding = Buffer | Uint8Array | string | null | undefined;
+
+/**
+ * Encode a vector as a little-endian Float32 BLOB
+ */
+export function encodeEmbedding(vector: ArrayLike<number>): Buffer {
+  if (IS_LITTLE_ENDIAN) {
+    const floats =
+      vector instanceof Float32Array ? vector : Float32Array.from(vector);
+    return Buffer.from(floats.buffer, floats.byteOffset, floats.byteLength);
+  }
+
+  const buffer = Buffer.allocUnsafe(vector.length * 4);
+  for (let i = 0; i < vector.length; i++) {
+    buffer.writeFloatLE(vector[i], i * 4);
+  }
+  return buffer;
+}
+
+/**
+ * Decode a stored embedding into a Float32Array
+ *
+ * Accepts both the binary format and legacy JSON arrays.
+ */
+export function decodeEmbedding(value: StoredEmbedding): Float32Array | null {
+  if (value === null || value === undefined) {
+    return null;
+  }
+
+  if (typeof value === "string") {
+    return Float32Array.from(JSON.parse(value) as number[]);
+  }
+
+  if (value.byteLength % 4 !== 0) {
+    throw new Error(
+      `Invalid embedding blob: ${value.byteLength} bytes is not a multiple of 4`,
+    );
+  }
+
+  const dimension = value.byteLength / 4;
+
+  if (IS_LITTLE_ENDIAN) {
+    // Copy so the result is 4-byte aligned and detached from pooled buffers
+    const copy = new Uint8Array(value.byteLength);
+    copy.set(value);
+    return new Float32Array(copy.buffer, 0, dimension);
+  }
+
+  const view = new DataView(value.buffer, value.byteOffset, value.byteLength);
+  const result = new Float32Array(dimension);
+  for (let i = 0; i < dimension; i++) {
+    result[i] = view.getFloat32(i * 4, true);
+  }
+  return result;
+}
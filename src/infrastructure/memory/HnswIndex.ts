@@ -0,0 +1,728 @@
+/**
+ * HNSW Index
+ *
+ * Approximate nearest-neighbour index (Hierarchical Navigable Small World
+ * graph) for cosine similarity over a single agent's embeddings.
+ *
+ * Features:
+ * - Configurable M, efConstruction and efSearch
+ * - Incremental inserts; deletes are tombstoned and compacted lazily
+ * - Filtered search (type, expiration, excluded ids) with adaptive ef
+ * - Binary serialization for sidecar persistence
+ */
+
+import type {
+  VectorIndexEntry,
+  VectorIndexHit,
+  VectorIndexSearchOptions,
+  VectorSearchIndex,
+} from "./VectorIndex.js";
+import { VectorIndex } from "./VectorIndex.js";
+import { decodeEmbedding, encodeEmbedding } from "./EmbeddingCodec.js";
+
+/**
+ * HNSW Parameters
+ */
+export interface HnswConfig {
+  /** Max neighbours per node on upper layers (layer 0 uses 2*M) */
+  M: number;
+
+  /** Candidate list size while building the graph */
+  efConstruction: number;
+
+  /** Candidate list size while searching */
+  efSearch: number;
+}
+
+/**
+ * File magic for serialized indexes
+ */
+const MAGIC = Buffer.from("NHNSW\u0001", "latin1");
+
+/**
+ * Fraction of tombstoned nodes that triggers a compacting rebuild
+ */
+const COMPACT_RATIO = 0.3;
+
+/**
+ * Binary heap of (node, distance) pairs ordered by ascending key
+ */
+class NodeHeap {
+  private nodes: number[] = [];
+  private keys: number[] = [];
+
+  get size(): number {
+    return this.nodes.length;
+  }
+
+  push(node: number, key: number): void {
+    const nodes = this.nodes;
+    const keys = this.keys;
+    let i = nodes.length;
+    nodes.push(node);
+    keys.push(key);
+
+    while (i > 0) {
+      const parent = (i - 1) >> 1;
+      if (keys[parent] <= key) break;
+      nodes[i] = nodes[parent];
+      keys[i] = keys[parent];
+      i = parent;
+    }
+    nodes[i] = node;
+    keys[i] = key;
+  }
+
+  peekKey(): number {
+    return this.keys[0];
+  }
+
+  peekNode(): number {
+    return this.nodes[0];
+  }
+
+  pop(): void {
+    const nodes = this.nodes;
+    const keys = this.keys;
+    const lastNode = nodes.pop()!;
+    const lastKey = keys.pop()!;
+    const n = nodes.length;
+    if (n === 0) return;
+
+    let i = 0;
+    while (true) {
+      const left = 2 * i + 1;
+      if (left >= n) break;
+      const right = left + 1;
+      const child = right < n && keys[right] < keys[left] ? right : left;
+      if (keys[child] >= lastKey) break;
+      nodes[i] = nodes[child];
+      keys[i] = keys[child];
+      i = child;
+    }
+    nodes[i] = lastNode;
+    keys[i] = lastKey;
+  }
+}
+
+/**
+ * HNSW Index
+ */
+export class HnswIndex implements VectorSearchIndex {
+  private readonly dimension: number;
+  private readonly config: HnswConfig;
+  private readonly levelMultiplier: number;
+
+  private vectors: Float32Array;
+  private entries: Array<VectorIndexEntry | null> = [];
+  private levels: number[] = [];
+  private links: number[][][] = [];
+  private nodeById: Map<string, number> = new Map();
+  private entryPoint = -1;
+  private maxLevel = -1;
+  private deletedCount = 0;
+
+  private visited: Uint32Array;
+  private visitStamp = 0;
+
+  /**
+   * Default parameters
+   */
+  static readonly DEFAULT_CONFIG: HnswConfig = {
+    M: 16,
+    efConstruction: 200,
+    efSearch: 64,
+  };
+
+  constructor(dimension: number, config?: Partial<HnswConfig>) {
+    this.dimension = dimension;
+    this.config = { ...HnswIndex.DEFAULT_CONFIG, ...config };
+
+    if (this.config.M < 2) {
+      throw new Error(
+        `HNSW parameter M must be at least 2, got ${this.config.M}`,
+      );
+    }
+
+    this.levelMultiplier = 1 / Math.log(this.config.M);
+    this.vectors = new Float32Array(64 * dimension);
+    this.visited = new Uint32Array(64);
+  }
+
+  /**
+   * Vector dimension of this index
+   */
+  getDimension(): number {
+    return this.dimension;
+  }
+
+  /**
+   * Index parameters
+   */
+  getConfig(): HnswConfig {
+    return { ...this.config };
+  }
+
+  /**
+   * Change efSearch without rebuilding
+   */
+  setEfSearch(efSearch: number): void {
+    this.config.efSearch = Math.max(1, efSearch);
+  }
+
+  /**
+   * Number of live (non-deleted) vectors
+   */
+  get size(): number {
+    return this.nodeById.size;
+  }
+
+  /**
+   * Check whether a memory is indexed
+   */
+  has(id: string): boolean {
+    return this.nodeById.has(id);
+  }
+
+  /**
+   * Insert or replace a vector
+   */
+  upsert(entry: VectorIndexEntry, vector: ArrayLike<number>): void {
+    if (vector.length !== this.dimension) {
+      throw new Error(
+        `Vector dimension mismatch: ${vector.length} vs ${this.dimension}`,
+      );
+    }
+
+    const existing = this.nodeById.get(entry.id);
+    if (existing !== undefined) {
+      this.tombstone(existing);
+    }
+
+    this.insertNode(entry, VectorIndex.normalizeToFloat32(vector));
+    this.maybeCompact();
+  }
+
+  /**
+   * Remove a vector (tombstoned until the next compaction)
+   */
+  remove(id: string): boolean {
+    const node = this.nodeById.get(id);
+    if (node === undefined) {
+      return false;
+    }
+
+    this.tombstone(node);
+    this.maybeCompact();
+    return true;
+  }
+
+  /**
+   * Remove all vectors
+   */
+  clear(): void {
+    this.vectors = new Float32Array(64 * this.dimension);
+    this.entries = [];
+    this.levels = [];
+    this.links = [];
+    this.nodeById.clear();
+    this.entryPoint = -1;
+    this.maxLevel = -1;
+    this.deletedCount = 0;
+    this.visited = new Uint32Array(64);
+    this.visitStamp = 0;
+  }
+
+  /**
+   * Find approximately the most similar rows to a query vector
+   *
+   * Returns hits sorted by similarity (highest first). When filters reject
+   * too many candidates, ef is doubled until enough hits are found or the
+   * whole graph has been visited.
+   */
+  search(
+    query: ArrayLike<number>,
+    options: VectorIndexSearchOptions,
+  ): VectorIndexHit[] {
+    if (query.length !== this.dimension) {
+      throw new Error(
+        `Vector dimension mismatch: ${query.length} vs ${this.dimension}`,
+      );
+    }
+
+    const limit = options.limit;
+    if (limit <= 0 || this.size === 0) {
+      return [];
+    }
+
+    const q = VectorIndex.normalizeToFloat32(query);
+    const now = options.now ?? Date.now();
+    const types =
+      options.types && options.types.length > 0 ? new Set(options.types) : null;
+    const excluded =
+      options.excludeIds && options.excludeIds.length > 0
+        ? new Set(options.excludeIds)
+        : null;
+    const maxDistance = 1 - options.threshold;
+    const total = this.entries.length;
+
+    const entry = this.descend(q, 1);
+    let ef = Math.min(Math.max(this.config.efSearch, limit), total);
+
+    while (true) {
+      const candidates = this.searchLayer(q, [entry], ef, 0);
+      const hits: VectorIndexHit[] = [];
+
+      for (const [node, distance] of candidates) {
+        if (distance > maxDistance) break;
+
+        const meta = this.entries[node];
+        if (!meta) continue;
+        if (meta.expiresAt !== null && meta.expiresAt <= now) continue;
+        if (types && !types.has(meta.type)) continue;
+        if (excluded && excluded.has(meta.id)) continue;
+
+        hits.push({ id: meta.id, similarity: 1 - distance });
+        if (hits.length === limit) break;
+      }
+
+      const exhausted =
+        candidates.length === 0 ||
+        candidates[candidates.length - 1][1] > maxDistance;
+
+      if (hits.length >= limit || exhausted || ef >= total) {
+        return hits;
+      }
+
+      ef = Math.min(ef * 2, total);
+    }
+  }
+
+  /**
+   * Serialize the index
+   *
+   * The fingerprint is stored verbatim so callers can detect stale files.
+   */
+  serialize(fingerprint: string): Buffer {
+    const header = Buffer.from(
+      JSON.stringify({
+        dimension: this.dimension,
+        config: this.config,
+        fingerprint,
+        entryPoint: this.entryPoint,
+        maxLevel: this.maxLevel,
+        entries: this.entries.map((entry, node) =>
+          entry
+            ? [entry.id, entry.type, entry.expiresAt, this.levels[node]]
+            : [null, null, null, this.levels[node]],
+        ),
+      }),
+      "utf8",
+    );
+
+    const count = this.entries.length;
+    const vectorBytes = count * this.dimension * 4;
+
+    let linkWords = 0;
+    for (let node = 0; node < count; node++) {
+      for (const neighbours of this.links[node]) {
+        linkWords += 1 + neighbours.length;
+      }
+    }
+
+    const buffer = Buffer.allocUnsafe(
+      MAGIC.length + 4 + header.length + vectorBytes + linkWords * 4,
+    );
+    let offset = MAGIC.copy(buffer, 0);
+    offset = buffer.writeUInt32LE(header.length, offset);
+    offset += header.copy(buffer, offset);
+
+    offset += encodeEmbedding(
+      this.vectors.subarray(0, count * this.dimension),
+    ).copy(buffer, offset);
+
+    for (let node = 0; node < count; node++) {
+      for (const neighbours of this.links[node]) {
+        offset = buffer.writeUInt32LE(neighbours.length, offset);
+        for (const neighbour of neighbours) {
+          offset = buffer.writeUInt32LE(neighbour, offset);
+        }
+      }
+    }
+
+    return buffer;
+  }
+
+  /**
+   * Restore an index written by `serialize`
+   */
+  static deserialize(buffer: Buffer): {
+    index: HnswIndex;
+    fingerprint: string;
+  } {
+    if (
+      buffer.length < MAGIC.length + 4 ||
+      !buffer.subarray(0, MAGIC.length).equals(MAGIC)
+    ) {
+      throw new Error("Invalid HNSW index file");
+    }
+
+    let offset = MAGIC.length;
+    const headerLength = buffer.readUInt32LE(offset);
+    offset += 4;
+    const header = JSON.parse(
+      buffer.toString("utf8", offset, offset + headerLength),
+    ) as {
+      dimension: number;
+      config: HnswConfig;
+      fingerprint: string;
+      entryPoint: number;
+      maxLevel: number;
+      entries: Array<[string | null, string | null, number | null, number]>;
+    };
+    offset += headerLength;
+
+    const index = new HnswIndex(header.dimension, header.config);
+    const count = header.entries.length;
+    const dimension = header.dimension;
+
+    index.ensureCapacity(count);
+    index.vectors.set(
+      decodeEmbedding(buffer.subarray(offset, offset + count * dimension * 4))!,
+    );
+    offset += count * dimension * 4;
+
+    for (let node = 0; node < count; node++) {
+      const [id, type, expiresAt, level] = header.entries[node];
+      const layers: number[][] = [];
+
+      for (let l = 0; l <= level; l++) {
+        const length = buffer.readUInt32LE(offset);
+        offset += 4;
+        const neighbours = new Array<number>(length);
+        for (let j = 0; j < length; j++) {
+          neighbours[j] = buffer.readUInt32LE(offset);
+          offset += 4;
+        }
+        layers.push(neighbours);
+      }
+
+      index.levels.push(level);
+      index.links.push(layers);
+
+      if (id === null) {
+        index.entries.push(null);
+        index.deletedCount++;
+      } else {
+        index.entries.push({ id, type: type!, expiresAt });
+        index.nodeById.set(id, node);
+      }
+    }
+
+    index.entryPoint = header.entryPoint;
+    index.maxLevel = header.maxLevel;
+
+    return { index, fingerprint: header.fingerprint };
+  }
+
+  /**
+   * Insert a normalized vector as a new node
+   */
+  private insertNode(entry: VectorIndexEntry, vector: Float32Array): void {
+    const node = this.entries.length;
+    this.ensureCapacity(node + 1);
+    this.vectors.set(vector, node * this.dimension);
+
+    const level = Math.floor(
+      -Math.log(1 - Math.random()) * this.levelMultiplier,
+    );
+    const layers: number[][] = [];
+    for (let l = 0; l <= level; l++) {
+      layers.push([]);
+    }
+
+    this.entries.push(entry);
+    this.levels.push(level);
+    this.links.push(layers);
+    this.nodeById.set(entry.id, node);
+
+    if (this.entryPoint === -1) {
+      this.entryPoint = node;
+      this.maxLevel = level;
+      return;
+    }
+
+    let entryPoints = [this.descend(vector, level + 1)];
+
+    for (let l = Math.min(level, this.maxLevel); l >= 0; l--) {
+      const candidates = this.searchLayer(
+        vector,
+        entryPoints,
+        this.config.efConstruction,
+        l,
+      );
+      const maxLinks = this.maxLinks(l);
+      const neighbours = this.selectNeighbours(candidates, this.config.M);
+      layers[l] = neighbours;
+
+      for (const neighbour of neighbours) {
+        const back = this.links[neighbour][l];
+        back.push(node);
+
+        if (back.length > maxLinks) {
+          this.links[neighbour][l] = this.pruneLinks(neighbour, back, maxLinks);
+        }
+      }
+
+      entryPoints = candidates.map(([candidate]) => candidate);
+    }
+
+    if (level > this.maxLevel) {
+      this.entryPoint = node;
+      this.maxLevel = level;
+    }
+  }
+
+  /**
+   * Greedy descent from the top layer down to `targetLevel`
+   */
+  private descend(query: Float32Array, targetLevel: number): number {
+    let current = this.entryPoint;
+    let currentDistance = this.distanceTo(query, current);
+
+    for (let l = this.maxLevel; l >= targetLevel; l--) {
+      let changed = true;
+      while (changed) {
+        changed = false;
+        for (const neighbour of this.links[current][l] ?? []) {
+          const distance = this.distanceTo(query, neighbour);
+          if (distance < currentDistance) {
+            current = neighbour;
+            currentDistance = distance;
+            changed = true;
+          }
+        }
+      }
+    }
+
+    return current;
+  }
+
+  /**
+   * Best-first search on one layer
+   *
+   * Returns up to `ef` [node, distance] pairs sorted by ascending distance.
+   */
+  private searchLayer(
+    query: Float32Array,
+    entryPoints: number[],
+    ef: number,
+    level: number,
+  ): Array<[number, number]> {
+    const stamp = this.nextVisitStamp();
+    const visited = this.visited;
+    const candidates = new NodeHeap(); // closest first
+    const results = new NodeHeap(); // furthest first (negated keys)
+
+    for (const entry of entryPoints) {
+      if (visited[entry] === stamp) continue;
+      visited[entry] = stamp;
+      const distance = this.distanceTo(query, entry);
+      candidates.push(entry, distance);
+      results.push(entry, -distance);
+    }
+
+    while (results.size > ef) results.pop();
+
+    while (candidates.size > 0) {
+      const current = candidates.peekNode();
+      const currentDistance = candidates.peekKey();
+      candidates.pop();
+
+      if (results.size >= ef && currentDistance > -results.peekKey()) {
+        break;
+      }
+
+      for (const neighbour of this.links[current][level] ?? []) {
+        if (visited[neighbour] === stamp) continue;
+        visited[neighbour] = stamp;
+
+        const distance = this.distanceTo(query, neighbour);
+        if (results.size < ef || distance < -results.peekKey()) {
+          candidates.push(neighbour, distance);
+          results.push(neighbour, -distance);
+          if (results.size > ef) results.pop();
+        }
+      }
+    }
+
+    const ordered: Array<[number, number]> = new Array(results.size);
+    for (let i = ordered.length - 1; i >= 0; i--) {
+      ordered[i] = [results.peekNode(), -results.peekKey()];
+      results.pop();
+    }
+    return ordered;
+  }
+
+  /**
+   * Neighbour selection heuristic (keeps diverse, close neighbours)
+   */
+  private selectNeighbours(
+    candidates: Array<[number, number]>,
+    count: number,
+  ): number[] {
+    const selected: number[] = [];
+    const skipped: number[] = [];
+
+    for (const [candidate, distance] of candidates) {
+      if (selected.length >= count) break;
+
+      let diverse = true;
+      for (const chosen of selected) {
+        if (this.distanceBetween(candidate, chosen) < distance) {
+          diverse = false;
+          break;
+        }
+      }
+
+      if (diverse) {
+        selected.push(candidate);
+      } else {
+        skipped.push(candidate);
+      }
+    }
+
+    for (let i = 0; i < skipped.length && selected.length < count; i++) {
+      selected.push(skipped[i]);
+    }
+
+    return selected;
+  }
+
+  /**
+   * Shrink a node's neighbour list back to `maxLinks`
+   */
+  private pruneLinks(
+    node: number,
+    neighbours: number[],
+    maxLinks: number,
+  ): number[] {
+    const scored: Array<[number, number]> = neighbours.map((neighbour) => [
+      neighbour,
+      this.distanceBetween(node, neighbour),
+    ]);
+    scored.sort((a, b) => a[1] - b[1]);
+    return this.selectNeighbours(scored, maxLinks);
+  }
+
+  /**
+   * Mark a node as deleted; it still routes searches until compaction
+   */
+  private tombstone(node: number): void {
+    const entry = this.entries[node];
+    if (!entry) return;
+
+    this.nodeById.delete(entry.id);
+    this.entries[node] = null;
+    this.deletedCount++;
+  }
+
+  /**
+   * Rebuild the graph without tombstoned nodes once they dominate
+   */
+  private maybeCompact(): void {
+    const total = this.entries.length;
+    if (total < 64 || this.deletedCount < total * COMPACT_RATIO) {
+      return;
+    }
+
+    const live: Array<{ entry: VectorIndexEntry; vector: Float32Array }> = [];
+    for (let node = 0; node < total; node++) {
+      const entry = this.entries[node];
+      if (entry) {
+        const start = node * this.dimension;
+        live.push({
+          entry,
+          vector: this.vectors.slice(start, start + this.dimension),
+        });
+      }
+    }
+
+    this.clear();
+    for (const { entry, vector } of live) {
+      this.insertNode(entry, vector);
+    }
+  }
+
+  /**
+   * Max neighbours for a layer
+   */
+  private maxLinks(level: number): number {
+    return level === 0 ? this.config.M * 2 : this.config.M;
+  }
+
+  /**
+   * Cosine distance between a query and a stored node
+   */
+  private distanceTo(query: Float32Array, node: number): number {
+    const vectors = this.vectors;
+    const offset = node * this.dimension;
+    let dot = 0;
+    for (let i = 0; i < this.dimension; i++) {
+      dot += query[i] * vectors[offset + i];
+    }
+    return 1 - dot;
+  }
+
+  /**
+   * Cosine distance between two stored nodes
+   */
+  private distanceBetween(a: number, b: number): number {
+    const vectors = this.vectors;
+    const offsetA = a * this.dimension;
+    const offsetB = b * this.dimension;
+    let dot = 0;
+    for (let i = 0; i < this.dimension; i++) {
+      dot += vectors[offsetA + i] * vectors[offsetB + i];
+    }
+    return 1 - dot;
+  }
+
+  /**
+   * Start a new visited-set generation
+   */
+  private nextVisitStamp(): number {
+    if (this.visited.length < this.entries.length) {
+      this.visited = new Uint32Array(
+        Math.max(this.entries.length, this.visited.length * 2),
+      );
+      this.visitStamp = 0;
+    }
+
+    this.visitStamp++;
+    if (this.visitStamp === 0xffffffff) {
+      this.visited.fill(0);
+      this.visitStamp = 1;
+    }
+    return this.visitStamp;
+  }
+
+  /**
+   * Grow vector storage to hold at least `nodes` nodes
+   */
+  private ensureCapacity(nodes: number): void {
+    const required = nodes * this.dimension;
+    if (required <= this.vectors.length) {
+      return;
+    }
+
+    let capacity = Math.max(this.vectors.length, this.dimension);
+    while (capacity < required) {
+      capacity *= 2;
+    }
+
+    const grown = new Float32Array(capacity);
+    grown.set(this.vectors.subarray(0, this.entries.length * this.dimension));
+    this.vectors = grown;
+  }
+}
@@ -11,9 +11,13 @@
  * - Memory relationships
  * - Memory expiration
  * - Memory consolidation
+ * - BM25-ranked full-text search (FTS5)
+ * - Write-behind batching of access statistics and importance updates
  */
 
 import type { DatabaseWrapper } from "../storage/Database.js";
+import { encodeEmbedding } from "./EmbeddingCodec.js";
+import type { VectorStore } from "./VectorStore.js";
 
 /**
  * Memory Entity
@@ -24,7 +28,7 @@ export interface Memory {
   session_id: string | null;
   type: MemoryType;
   content: string;
-  embedding: string | null; // JSON array of numbers
+  embedding: Buffer | null; // Little-endian Float32 BLOB
   importance: number; // 0-1
   access_count: number;
   last_accessed_at: number | null;
@@ -102,6 +106,25 @@ export interface MemoryQueryOptions {
   sort_order?: "ASC" | "DESC";
 }
 
+/**
+ * Full-Text Search Options
+ */
+export interface MemoryTextSearchOptions {
+  limit?: number;
+  types?: MemoryType[];
+  min_importance?: number;
+  session_id?: string;
+}
+
+/**
+ * Full-Text Search Match
+ */
+export interface MemoryTextMatch {
+  memory: Memory;
+  /** FTS5 bm25() value (more negative is more relevant) */
+  bm25: number;
+}
+
 /**
  * Memory Statistics
  */
@@ -115,11 +138,105 @@ export interface MemoryStats {
   long_term_memory_count: number;
 }
 
+/**
+ * Memory Store Configuration
+ */
+export interface MemoryStoreConfig {
+  /** Buffer access-stat and importance writes (default: true) */
+  writeBehind: boolean;
+
+  /** Flush when this many memories have pending writes (default: 256) */
+  writeBufferSize: number;
+
+  /** Flush pending writes after this delay in ms (default: 1000) */
+  flushIntervalMs: number;
+}
+
+/**
+ * Buffered writes for a single memory
+ */
+interface PendingMemoryWrite {
+  accessCount: number;
+  lastAccessedAt: number | null;
+  importance: number | null;
+}
+
+/**
+ * Stores whose buffered writes are flushed if the process exits first
+ */
+const storesWithPendingWrites = new Set<MemoryStore>();
+let exitFlushInstalled = false;
+
+/**
+ * Flush a store's buffered writes before the process exits
+ *
+ * The flush timer is unref'd, so without this hook writes still buffered
+ * when the event loop drains would be lost.
+ */
+function flushBeforeExit(store: MemoryStore): void {
+  storesWithPendingWrites.add(store);
+  if (exitFlushInstalled) {
+    return;
+  }
+
+  exitFlushInstalled = true;
+  process.on("beforeExit", () => {
+    for (const pending of Array.from(storesWithPendingWrites)) {
+      try {
+        pending.flush();
+      } catch {
+        // The database may already be closed; nothing left to retry with
+        storesWithPendingWrites.delete(pending);
+      }
+    }
+  });
+}
+
 /**
  * Memory Store
  */
 export class MemoryStore {
   private db: DatabaseWrapper;
+  private config: MemoryStoreConfig;
+  private pendingWrites: Map<string, PendingMemoryWrite> = new Map();
+  private flushTimer: NodeJS.Timeout | null = null;
+  private vectorStore: VectorStore | null = null;
+
+  /**
+   * Default configuration
+   */
+  private static readonly DEFAULT_CONFIG: MemoryStoreConfig = {
+    writeBehind: true,
+    writeBufferSize: 256,
+    flushIntervalMs: 1000,
+  };
+
+  /**
+   * Columns written on insert
+   */
+  private static readonly INSERT_COLUMNS = [
+    "id",
+    "agent_id",
+    "session_id",
+    "type",
+    "content",
+    "embedding",
+    "importance",
+    "access_count",
+    "last_accessed_at",
+    "created_at",
+    "expires_at",
+    "metadata",
+  ];
+
+  /**
+   * Columns whose latest values may only exist in the write buffer
+   */
+  private static readonly BUFFERED_COLUMNS = new Set([
+    "importance",
+    "access_count",
+    "last_accessed_at",
+  ]);
 
   /**
    * Default memory decay rate (per day)
@@ -136,57 +253,72 @@ export class MemoryStore {
    */
   private static readonly MIN_IMPORTANCE = 0.3;
 
-  constructor(db: DatabaseWrapper) {
+  constructor(db: DatabaseWrapper, config?: Partial<MemoryStoreConfig>) {
     this.db = db;
+    this.config = { ...MemoryStore.DEFAULT_CONFIG, ...config };
+  }
+
+  /**
+   * Keep a VectorStore's loaded search indexes in sync with inserts
+   *
+   * Embeddings passed to `store`/`storeMany` are written straight to the
+   * database; the attached store is told about them so searches see new
+   * memories without reloading the index.
+   */
+  attachVectorStore(vectorStore: VectorStore | null): void {
+    this.vectorStore = vectorStore;
   }
 
   /**
    * Store a new memory
    */
   store(input: MemoryCreateInput): Memory {
-    const now = Date.now();
-    const expires_at = this.calculateExpiration(input.type, input.expires_at);
-
-    const memory: Partial<Memory> = {
-      id: input.id,
-      agent_id: input.agent_id,
-      session_id: input.session_id ?? null,
-      type: input.type,
-      content: input.content,
-      embedding: input.embedding ? JSON.stringify(input.embedding) : null,
-      importance: input.importance ?? this.calculateInitialImportance(input.type),
-      access_count: 0,
-      last_accessed_at: null,
-      created_at: now,
-      expires_at,
-      metadata: input.metadata ? JSON.stringify(input.metadata) : null,
-    };
+    const memory = this.buildMemory(input, Date.now());
 
     const sql = `
-      INSERT INTO memories (
-        id, agent_id, session_id, type, content, embedding,
-        importance, access_count, last_accessed_at, created_at,
-        expires_at, metadata
-      )
+      INSERT INTO memories (${MemoryStore.INSERT_COLUMNS.join(", ")})
       VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
     `;
 
-    this.db.execute(sql, [
-      memory.id,
-      memory.agent_id,
-      memory.session_id,
-      memory.type,
-      memory.content,
-      memory.embedding,
-      memory.importance,
-      memory.access_count,
-      memory.last_accessed_at,
-      memory.created_at,
-      memory.expires_at,
-      memory.metadata,
-    ]);
+    this.db.execute(sql, this.toRow(memory));
+    this.vectorStore?.indexMemories([memory]);
+
+    return memory;
+  }
+
+  /**
+   * Store many memories in one transaction using multi-row INSERTs
+   *
+   * Intended for ingesting conversation histories and memory dumps.
+   * Set `returnMemories: false` to skip building the result array.
+   */
+  storeMany(
+    inputs: MemoryCreateInput[],
+    options: { returnMemories?: boolean; ignoreDuplicates?: boolean } = {},
+  ): Memory[] {
+    const now = Date.now();
+    const memories = inputs.map((input) => this.buildMemory(input, now));
+
+    const inserted = this.db.insertMany(
+      "memories",
+      MemoryStore.INSERT_COLUMNS,
+      memories.map((memory) => this.toRow(memory)),
+      { onConflict: options.ignoreDuplicates ? "ignore" : "abort" },
+    );
+
+    if (this.vectorStore) {
+      if (inserted === memories.length) {
+        this.vectorStore.indexMemories(memories);
+      } else {
+        // Some rows were skipped as duplicates; reload rather than index
+        // vectors the database does not hold
+        for (const agentId of new Set(memories.map((m) => m.agent_id))) {
+          this.vectorStore.invalidateIndex(agentId);
+        }
+      }
+    }
 
-    return memory as Memory;
+    return options.returnMemories === false ? [] : memories;
   }
 
   /**
@@ -201,6 +333,7 @@ export class MemoryStore {
     const memory = this.db.queryOne<Memory>(sql, [memoryId, agentId]);
 
     if (memory) {
+      this.applyPendingWrites(memory);
       this.updateAccessStats(memoryId);
       this.applyDecay(memory);
     }
@@ -212,6 +345,13 @@ export class MemoryStore {
    * Query memories
    */
   query(options: MemoryQueryOptions): Memory[] {
+    // SQL that filters or sorts on buffered columns must see current values
+    const columns = [options.sort_by || "importance"];
+    if (options.min_importance !== undefined) {
+      columns.push("importance");
+    }
+    this.flushIfBuffered(columns);
+
     let sql = `SELECT * FROM memories WHERE agent_id = ?`;
     const params: any[] = [options.agent_id];
 
@@ -258,7 +398,10 @@ export class MemoryStore {
     const memories = this.db.query<Memory>(sql, params);
 
     // Apply decay to all retrieved memories
-    memories.forEach((memory) => this.applyDecay(memory));
+    memories.forEach((memory) => {
+      this.applyPendingWrites(memory);
+      this.applyDecay(memory);
+    });
 
     return memories;
   }
@@ -338,36 +481,155 @@ export class MemoryStore {
    * Search memories by content
    */
   search(agentId: string, pattern: string, limit: number = 20): Memory[] {
-    const sql = `
-      SELECT * FROM memories
-      WHERE agent_id = ? AND content LIKE ?
-      AND (expires_at IS NULL OR expires_at > ?)
-      ORDER BY importance DESC, created_at DESC
-      LIMIT ?
+    return this.searchText(agentId, [pattern], { limit }).map(
+      (match) => match.memory,
+    );
+  }
+
+  /**
+   * Full-text search for any of several terms in one BM25-ranked query
+   *
+   * Each term is matched as a prefix phrase. Results are ordered by
+   * relevance (best first).
+   */
+  searchText(
+    agentId: string,
+    terms: string[],
+    options: MemoryTextSearchOptions = {},
+  ): MemoryTextMatch[] {
+    const expression = MemoryStore.buildMatchExpression(terms);
+    if (!expression) {
+      return [];
+    }
+
+    // Importance is filtered on and breaks ranking ties in SQL
+    this.flushIfBuffered(["importance"]);
+
+    let sql = `
+      SELECT memories.*, bm25(memories_fts) AS fts_rank
+      FROM memories_fts
+      JOIN memories ON memories.rowid = memories_fts.rowid
+      WHERE memories_fts MATCH ?
+      AND memories.agent_id = ?
+      AND (memories.expires_at IS NULL OR memories.expires_at > ?)
     `;
+    const params: any[] = [expression, agentId, Date.now()];
 
-    return this.db.query<Memory>(sql, [
-      agentId,
-      `%${pattern}%`,
-      Date.now(),
-      limit,
-    ]);
+    if (options.types && options.types.length > 0) {
+      sql += ` AND memories.type IN (${options.types.map(() => "?").join(", ")})`;
+      params.push(...options.types);
+    }
+
+    if (options.min_importance !== undefined) {
+      sql += ` AND memories.importance >= ?`;
+      params.push(options.min_importance);
+    }
+
+    if (options.session_id !== undefined) {
+      sql += ` AND memories.session_id = ?`;
+      params.push(options.session_id);
+    }
+
+    sql += ` ORDER BY fts_rank, memories.importance DESC LIMIT ?`;
+    params.push(options.limit ?? 20);
+
+    const rows = this.db.query<Memory & { fts_rank: number }>(sql, params);
+
+    return rows.map(({ fts_rank, ...memory }) => ({
+      memory: this.applyPendingWrites(memory as Memory),
+      bm25: fts_rank,
+    }));
   }
 
   /**
    * Update memory importance
    */
   updateImportance(memoryId: string, importance: number): boolean {
+    const clamped = Math.max(0, Math.min(1, importance));
+
+    if (this.config.writeBehind) {
+      this.bufferWrite(memoryId).importance = clamped;
+      this.scheduleFlush();
+      return true;
+    }
+
     const sql = `
       UPDATE memories
       SET importance = ?
       WHERE id = ?
     `;
 
-    this.db.execute(sql, [Math.max(0, Math.min(1, importance)), memoryId]);
+    this.db.execute(sql, [clamped, memoryId]);
     return true;
   }
 
+  /**
+   * Write buffered access statistics and importance changes
+   *
+   * All pending updates are applied in a single transaction.
+   */
+  flush(): void {
+    if (this.flushTimer) {
+      clearTimeout(this.flushTimer);
+      this.flushTimer = null;
+    }
+
+    if (this.pendingWrites.size === 0) {
+      return;
+    }
+
+    const pending = this.pendingWrites;
+    this.pendingWrites = new Map();
+    storesWithPendingWrites.delete(this);
+
+    const sql = `
+      UPDATE memories
+      SET access_count = access_count + ?,
+          last_accessed_at = COALESCE(?, last_accessed_at),
+          importance = COALESCE(?, importance)
+      WHERE id = ?
+    `;
+
+    try {
+      this.db.transaction(() => {
+        for (const [memoryId, write] of pending) {
+          this.db.execute(sql, [
+            write.accessCount,
+            write.lastAccessedAt,
+            write.importance,
+            memoryId,
+          ]);
+        }
+      });
+    } catch (error) {
+      // Keep the writes (merged under any newer ones) for the next flush
+      for (const [memoryId, write] of pending) {
+        const newer = this.pendingWrites.get(memoryId);
+        this.pendingWrites.set(memoryId, {
+          accessCount: write.accessCount + (newer?.accessCount ?? 0),
+          lastAccessedAt: newer?.lastAccessedAt ?? write.lastAccessedAt,
+          importance: newer?.importance ?? write.importance,
+        });
+      }
+      flushBeforeExit(this);
+      throw error;
+    }
+  }
+
+  /**
+   * Number of memories with unflushed writes
+   */
+  getPendingWriteCount(): number {
+    return this.pendingWrites.size;
+  }
+
+  /**
+   * Flush pending writes and stop the flush timer (call on shutdown)
+   */
+  close(): void {
+    this.flush();
+  }
+
   /**
    * Delete a memory
    */
@@ -400,6 +662,8 @@ export class MemoryStore {
    * Delete low-importance memories
    */
   deleteUnimportant(threshold: number = 0.1): number {
+    this.flush();
+
     const sql = `
       DELETE FROM memories
       WHERE importance < ? AND type NOT IN ('working', 'conversation')
@@ -506,6 +770,8 @@ export class MemoryStore {
    * Consolidate memories (strengthen important ones, weaken unimportant ones)
    */
   consolidate(agentId: string): { strengthened: number; weakened: number } {
+    this.flush();
+
     return this.db.transaction(() => {
       // Strengthen frequently accessed memories
       const strengthenSql = `
@@ -545,6 +811,8 @@ export class MemoryStore {
    * Get memory statistics
    */
   getStatistics(agentId: string): MemoryStats {
+    this.flush();
+
     // Total count
     const totalSql = `SELECT COUNT(*) as count FROM memories WHERE agent_id = ?`;
     const totalResult = this.db.queryOne<{ count: number }>(totalSql, [agentId]);
@@ -664,6 +932,14 @@ export class MemoryStore {
    * Update access statistics
    */
   private updateAccessStats(memoryId: string): void {
+    if (this.config.writeBehind) {
+      const write = this.bufferWrite(memoryId);
+      write.accessCount++;
+      write.lastAccessedAt = Date.now();
+      this.scheduleFlush();
+      return;
+    }
+
     const sql = `
       UPDATE memories
       SET access_count = access_count + 1,
@@ -674,6 +950,92 @@ export class MemoryStore {
     this.db.execute(sql, [Date.now(), memoryId]);
   }
 
+  /**
+   * Get (or create) the buffered write entry for a memory
+   */
+  private bufferWrite(memoryId: string): PendingMemoryWrite {
+    let write = this.pendingWrites.get(memoryId);
+    if (!write) {
+      write = { accessCount: 0, lastAccessedAt: null, importance: null };
+      this.pendingWrites.set(memoryId, write);
+    }
+    return write;
+  }
+
+  /**
+   * Flush now if the buffer is full, otherwise arm the flush timer
+   */
+  private scheduleFlush(): void {
+    if (this.pendingWrites.size >= this.config.writeBufferSize) {
+      this.flush();
+      return;
+    }
+
+    if (!this.flushTimer) {
+      this.flushTimer = setTimeout(() => {
+        this.flushTimer = null;
+        try {
+          this.flush();
+        } catch {
+          // Writes stay buffered and are retried on the next flush
+        }
+      }, this.config.flushIntervalMs);
+      this.flushTimer.unref();
+      flushBeforeExit(this);
+    }
+  }
+
+  /**
+   * Flush if any buffered write touches one of the given columns
+   *
+   * Rows are still overlaid with pending values after a read; this only
+   * makes SQL that filters or sorts on those columns see them too.
+   * Buffered access stats alone do not force a flush on the default
+   * importance-ordered query.
+   */
+  private flushIfBuffered(columns: Iterable<string>): void {
+    if (this.pendingWrites.size === 0) {
+      return;
+    }
+
+    const touched = new Set(
+      Array.from(columns).filter((column) =>
+        MemoryStore.BUFFERED_COLUMNS.has(column),
+      ),
+    );
+    if (touched.size === 0) {
+      return;
+    }
+
+    for (const write of this.pendingWrites.values()) {
+      if (
+        (touched.has("importance") && write.importance !== null) ||
+        (touched.has("access_count") && write.accessCount !== 0) ||
+        (touched.has("last_accessed_at") && write.lastAccessedAt !== null)
+      ) {
+        this.flush();
+        return;
+      }
+    }
+  }
+
+  /**
+   * Overlay buffered values onto a row read from the database
+   */
+  private applyPendingWrites(memory: Memory): Memory {
+    const write = this.pendingWrites.get(memory.id);
+    if (write) {
+      memory.access_count += write.accessCount;
+      if (write.lastAccessedAt !== null) {
+        memory.last_accessed_at = write.lastAccessedAt;
+      }
+      if (write.importance !== null) {
+        memory.importance = write.importance;
+      }
+    }
+    return memory;
+  }
+
   /**
    * Apply time-based decay to memory importance
    */
@@ -695,6 +1057,64 @@ export class MemoryStore {
     }
   }
 
+  /**
+   * Build an FTS5 MATCH expression that ORs quoted prefix phrases
+   *
+   * Quoting keeps user text from being parsed as FTS5 query syntax.
+   */
+  private static buildMatchExpression(terms: string[]): string | null {
+    const phrases = new Set<string>();
+
+    for (const term of terms) {
+      const normalized = term.trim().replace(/\s+/g, " ");
+      if (normalized) {
+        phrases.add(`"${normalized.replace(/"/g, '""')}"*`);
+      }
+    }
+
+    return phrases.size > 0 ? Array.from(phrases).join(" OR ") : null;
+  }
+
+  /**
+   * Build a memory row from create input
+   */
+  private buildMemory(input: MemoryCreateInput, now: number): Memory {
+    return {
+      id: input.id,
+      agent_id: input.agent_id,
+      session_id: input.session_id ?? null,
+      type: input.type,
+      content: input.content,
+      embedding: input.embedding ? encodeEmbedding(input.embedding) : null,
+      importance: input.importance ?? this.calculateInitialImportance(input.type),
+      access_count: 0,
+      last_accessed_at: null,
+      created_at: now,
+      expires_at: this.calculateExpiration(input.type, input.expires_at),
+      metadata: input.metadata ? JSON.stringify(input.metadata) : null,
+    };
+  }
+
+  /**
+   * Column values in INSERT_COLUMNS order
+   */
+  private toRow(memory: Memory): unknown[] {
+    return [
+      memory.id,
+      memory.agent_id,
+      memory.session_id,
+      memory.type,
+      memory.content,
+      memory.embedding,
+      memory.importance,
+      memory.access_count,
+      memory.last_accessed_at,
+      memory.created_at,
+      memory.expires_at,
+      memory.metadata,
+    ];
+  }
+
   /**
    * Calculate expiration time based on memory type
    */
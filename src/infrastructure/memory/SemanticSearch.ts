@@ -13,7 +13,12 @@
  */
 
 import type { DatabaseWrapper } from "../storage/Database.js";
-import { MemoryStore, type Memory, type MemoryType } from "./MemoryStore.js";
+import {
+  MemoryStore,
+  type Memory,
+  type MemoryTextMatch,
+  type MemoryType,
+} from "./MemoryStore.js";
 import { VectorStore, type SimilarityResult } from "./VectorStore.js";
 
 /**
@@ -121,6 +126,8 @@ export class SemanticSearch {
     this.memoryStore = memoryStore;
     this.vectorStore = vectorStore;
     this.config = { ...SemanticSearch.DEFAULT_CONFIG, ...config };
+
+    this.memoryStore.attachVectorStore(vectorStore);
   }
 
   /**
@@ -148,11 +155,12 @@ export class SemanticSearch {
     const combinedResults = new Map<string, Memory>();
     const scores = new Map<string, SearchScore>();
 
-    // Process text results
-    for (const memory of textResults) {
+    // Process text results (ordered best first)
+    const bestBm25 = textResults.length > 0 ? textResults[0].bm25 : 0;
+    for (const { memory, bm25 } of textResults) {
       combinedResults.set(memory.id, memory);
       scores.set(memory.id, {
-        textScore: this.calculateTextScore(memory.content, query.text),
+        textScore: this.calculateTextScore(bm25, bestBm25),
         vectorScore: 0,
         temporalScore: 0,
         importanceScore: 0,
@@ -468,8 +476,10 @@ export class SemanticSearch {
 
   /**
    * Perform text-based search
+   *
+   * All expanded terms go into a single BM25-ranked full-text query.
    */
-  private textSearch(query: SearchQuery): Memory[] {
+  private textSearch(query: SearchQuery): MemoryTextMatch[] {
     let expandedTerms = [query.text];
 
     // Query expansion (simple approach)
@@ -477,41 +487,12 @@ export class SemanticSearch {
       expandedTerms = this.expandQuery(query.text);
     }
 
-    // Search for each term
-    const results = new Map<string, Memory>();
-
-    for (const term of expandedTerms) {
-      const memories = this.memoryStore.search(
-        query.agentId,
-        term,
-        query.limit ? query.limit * 2 : 20
-      );
-
-      for (const memory of memories) {
-        // Apply filters
-        if (query.types && !query.types.includes(memory.type)) {
-          continue;
-        }
-
-        if (
-          query.minImportance !== undefined &&
-          memory.importance < query.minImportance
-        ) {
-          continue;
-        }
-
-        if (
-          query.sessionId !== undefined &&
-          memory.session_id !== query.sessionId
-        ) {
-          continue;
-        }
-
-        results.set(memory.id, memory);
-      }
-    }
-
-    return Array.from(results.values());
+    return this.memoryStore.searchText(query.agentId, expandedTerms, {
+      limit: query.limit ? query.limit * 2 : 20,
+      types: query.types,
+      min_importance: query.minImportance,
+      session_id: query.sessionId,
+    });
   }
 
   /**
@@ -536,28 +517,17 @@ export class SemanticSearch {
   }
 
   /**
-   * Calculate text similarity score
+   * Calculate text similarity score from BM25
+   *
+   * bm25() is negative (lower is better); scores are scaled relative to the
+   * best match so the top text hit scores 1.0.
    */
-  private calculateTextScore(content: string, query: string): number {
-    const contentLower = content.toLowerCase();
-    const queryLower = query.toLowerCase();
-    const queryTerms = queryLower.split(/\s+/);
-
-    let matchCount = 0;
-    let totalTerms = queryTerms.length;
-
-    for (const term of queryTerms) {
-      if (contentLower.includes(term)) {
-        matchCount++;
-      }
-    }
-
-    // Exact match bonus
-    if (contentLower.includes(queryLower)) {
-      matchCount += queryTerms.length * 0.5;
+  private calculateTextScore(bm25: number, bestBm25: number): number {
+    if (bestBm25 >= 0) {
+      return bm25 <= bestBm25 ? 1 : 0;
     }
 
-    return totalTerms > 0 ? matchCount / totalTerms : 0;
+    return Math.max(0, Math.min(1, bm25 / bestBm25));
   }
 
   /**
@@ -0,0 +1,272 @@
+/**
+ * Vector Index
+ *
+ * Memory-resident embedding matrix for a single agent.
+ *
+ * Features:
+ * - Contiguous Float32Array storage of pre-normalized rows
+ * - O(1) incremental insert, update and removal (swap-with-last)
+ * - Single-pass cosine scan with bounded top-k selection
+ * - Per-row type and expiration metadata for filtering without SQL
+ */
+
+/**
+ * Row metadata kept alongside each vector
+ */
+export interface VectorIndexEntry {
+  id: string;
+  type: string;
+  expiresAt: number | null;
+}
+
+/**
+ * Search options for the index scan
+ */
+export interface VectorIndexSearchOptions {
+  limit: number;
+  threshold: number;
+  types?: string[];
+  excludeIds?: string[];
+  now?: number;
+}
+
+/**
+ * Scan hit
+ */
+export interface VectorIndexHit {
+  id: string;
+  similarity: number;
+}
+
+/**
+ * Common contract for per-agent vector indexes
+ */
+export interface VectorSearchIndex {
+  readonly size: number;
+  getDimension(): number;
+  has(id: string): boolean;
+  upsert(entry: VectorIndexEntry, vector: ArrayLike<number>): void;
+  remove(id: string): boolean;
+  clear(): void;
+  search(
+    query: ArrayLike<number>,
+    options: VectorIndexSearchOptions,
+  ): VectorIndexHit[];
+}
+
+/**
+ * Vector Index (exact search)
+ */
+export class VectorIndex implements VectorSearchIndex {
+  private readonly dimension: number;
+  private matrix: Float32Array;
+  private entries: VectorIndexEntry[] = [];
+  private rowById: Map<string, number> = new Map();
+
+  /**
+   * Initial row capacity
+   */
+  private static readonly INITIAL_CAPACITY = 64;
+
+  constructor(dimension: number) {
+    this.dimension = dimension;
+    this.matrix = new Float32Array(VectorIndex.INITIAL_CAPACITY * dimension);
+  }
+
+  /**
+   * Vector dimension of this index
+   */
+  getDimension(): number {
+    return this.dimension;
+  }
+
+  /**
+   * Number of indexed vectors
+   */
+  get size(): number {
+    return this.entries.length;
+  }
+
+  /**
+   * Check whether a memory is indexed
+   */
+  has(id: string): boolean {
+    return this.rowById.has(id);
+  }
+
+  /**
+   * Insert or replace a vector
+   */
+  upsert(entry: VectorIndexEntry, vector: ArrayLike<number>): void {
+    if (vector.length !== this.dimension) {
+      throw new Error(
+        `Vector dimension mismatch: ${vector.length} vs ${this.dimension}`,
+      );
+    }
+
+    let row = this.rowById.get(entry.id);
+    if (row === undefined) {
+      row = this.entries.length;
+      this.ensureCapacity(row + 1);
+      this.entries.push(entry);
+      this.rowById.set(entry.id, row);
+    } else {
+      this.entries[row] = entry;
+    }
+
+    this.writeNormalized(row, vector);
+  }
+
+  /**
+   * Remove a vector
+   */
+  remove(id: string): boolean {
+    const row = this.rowById.get(id);
+    if (row === undefined) {
+      return false;
+    }
+
+    const last = this.entries.length - 1;
+    if (row !== last) {
+      // Move the last row into the freed slot
+      const d = this.dimension;
+      this.matrix.copyWithin(row * d, last * d, (last + 1) * d);
+      const moved = this.entries[last];
+      this.entries[row] = moved;
+      this.rowById.set(moved.id, row);
+    }
+
+    this.entries.pop();
+    this.rowById.delete(id);
+    return true;
+  }
+
+  /**
+   * Remove all vectors
+   */
+  clear(): void {
+    this.entries = [];
+    this.rowById.clear();
+    this.matrix = new Float32Array(
+      VectorIndex.INITIAL_CAPACITY * this.dimension,
+    );
+  }
+
+  /**
+   * Find the most similar rows to a query vector
+   *
+   * Returns hits sorted by similarity (highest first).
+   */
+  search(
+    query: ArrayLike<number>,
+    options: VectorIndexSearchOptions,
+  ): VectorIndexHit[] {
+    if (query.length !== this.dimension) {
+      throw new Error(
+        `Vector dimension mismatch: ${query.length} vs ${this.dimension}`,
+      );
+    }
+
+    const limit = options.limit;
+    if (limit <= 0 || this.entries.length === 0) {
+      return [];
+    }
+
+    const q = VectorIndex.normalizeToFloat32(query);
+    const d = this.dimension;
+    const matrix = this.matrix;
+    const now = options.now ?? Date.now();
+    const types =
+      options.types && options.types.length > 0 ? new Set(options.types) : null;
+    const excluded =
+      options.excludeIds && options.excludeIds.length > 0
+        ? new Set(options.excludeIds)
+        : null;
+
+    // Ascending by similarity, so hits[0] is the weakest kept hit
+    const hits: VectorIndexHit[] = [];
+
+    for (let row = 0; row < this.entries.length; row++) {
+      const entry = this.entries[row];
+
+      if (entry.expiresAt !== null && entry.expiresAt <= now) continue;
+      if (types && !types.has(entry.type)) continue;
+      if (excluded && excluded.has(entry.id)) continue;
+
+      let dot = 0;
+      const offset = row * d;
+      for (let i = 0; i < d; i++) {
+        dot += q[i] * matrix[offset + i];
+      }
+
+      if (dot < options.threshold) continue;
+      if (hits.length === limit && dot <= hits[0].similarity) continue;
+
+      // Insert in sorted position, dropping the weakest when full
+      let pos = 0;
+      while (pos < hits.length && hits[pos].similarity < dot) pos++;
+      hits.splice(pos, 0, { id: entry.id, similarity: dot });
+      if (hits.length > limit) hits.shift();
+    }
+
+    return hits.reverse();
+  }
+
+  /**
+   * Normalize a vector into a new Float32Array
+   */
+  static normalizeToFloat32(vector: ArrayLike<number>): Float32Array {
+    const result = Float32Array.from(vector);
+    let norm = 0;
+    for (let i = 0; i < result.length; i++) {
+      norm += result[i] * result[i];
+    }
+    norm = Math.sqrt(norm);
+
+    if (norm > 0) {
+      for (let i = 0; i < result.length; i++) {
+        result[i] /= norm;
+      }
+    }
+
+    return result;
+  }
+
+  /**
+   * Write a normalized copy of a vector into a matrix row
+   */
+  private writeNormalized(row: number, vector: ArrayLike<number>): void {
+    const d = this.dimension;
+    const offset = row * d;
+
+    let norm = 0;
+    for (let i = 0; i < d; i++) {
+      norm += vector[i] * vector[i];
+    }
+    norm = Math.sqrt(norm);
+    const inv = norm > 0 ? 1 / norm : 0;
+
+    for (let i = 0; i < d; i++) {
+      this.matrix[offset + i] = vector[i] * inv;
+    }
+  }
+
+  /**
+   * Grow the matrix to hold at least `rows` rows
+   */
+  private ensureCapacity(rows: number): void {
+    const required = rows * this.dimension;
+    if (required <= this.matrix.length) {
+      return;
+    }
+
+    let capacity = Math.max(this.matrix.length, this.dimension);
+    while (capacity < required) {
+      capacity *= 2;
+    }
+
+    const grown = new Float32Array(capacity);
+    grown.set(this.matrix.subarray(0, this.entries.length * this.dimension));
+    this.matrix = grown;
+  }
+}
@@ -10,10 +10,18 @@
  * - Batch embedding support
  * - Similarity caching
  * - Dimension validation
+ * - Binary Float32 storage with a per-agent in-memory index
+ * - Optional HNSW approximate search persisted to a sidecar file
+ * - Backfill of missing embeddings from any IEmbeddingClient
  */
 
+import { existsSync, readFileSync, unlinkSync, writeFileSync } from "fs";
 import type { DatabaseWrapper } from "../storage/Database.js";
+import type { IEmbeddingClient } from "../../core/interfaces/ILLMClient.js";
 import type { Memory } from "./MemoryStore.js";
+import { decodeEmbedding, encodeEmbedding } from "./EmbeddingCodec.js";
+import { VectorIndex, type VectorSearchIndex } from "./VectorIndex.js";
+import { HnswIndex, type HnswConfig } from "./HnswIndex.js";
 
 /**
  * Vector Embedding
@@ -58,6 +66,21 @@ export interface VectorStoreConfig {
 
   /** Enable caching of similarity calculations */
   enableCache: boolean;
+
+  /** Search index: exact linear scan or approximate HNSW graph */
+  indexType: "exact" | "hnsw";
+
+  /** HNSW: max neighbours per node */
+  hnswM: number;
+
+  /** HNSW: candidate list size while building */
+  hnswEfConstruction: number;
+
+  /** HNSW: candidate list size while searching (recall vs latency) */
+  hnswEfSearch: number;
+
+  /** HNSW: persist indexes to sidecar files next to the database */
+  persistIndex: boolean;
 }
 
 /**
@@ -67,6 +90,8 @@ export class VectorStore {
   private db: DatabaseWrapper;
   private config: VectorStoreConfig;
   private similarityCache: Map<string, number>;
+  private indexes: Map<string, VectorSearchIndex>;
+  private dirtyIndexes: Set<string>;
 
   /**
    * Default configuration
@@ -76,12 +101,19 @@ export class VectorStore {
     similarityThreshold: 0.7,
     maxResults: 10,
     enableCache: true,
+    indexType: "exact",
+    hnswM: 16,
+    hnswEfConstruction: 200,
+    hnswEfSearch: 64,
+    persistIndex: true,
   };
 
   constructor(db: DatabaseWrapper, config?: Partial<VectorStoreConfig>) {
     this.db = db;
     this.config = { ...VectorStore.DEFAULT_CONFIG, ...config };
     this.similarityCache = new Map();
+    this.indexes = new Map();
+    this.dirtyIndexes = new Set();
   }
 
   /**
@@ -102,27 +134,165 @@ export class VectorStore {
       );
     }
 
+    // Keep a loaded index and the sidecars in sync; skip the lookup when
+    // there is neither
+    const meta =
+      this.indexes.size > 0 || this.persistsIndexes()
+        ? this.getIndexMeta(memoryId)
+        : null;
+    const index = meta ? this.indexes.get(meta.agent_id) : undefined;
+
+    if (index && index.getDimension() !== dimension) {
+      throw new Error(
+        `Embedding dimension mismatch: expected ${index.getDimension()}, got ${dimension}`,
+      );
+    }
+
     const sql = `
       UPDATE memories
       SET embedding = ?
       WHERE id = ?
     `;
 
-    this.db.execute(sql, [JSON.stringify(normalized), memoryId]);
+    this.db.execute(sql, [encodeEmbedding(normalized), memoryId]);
+
+    if (index && meta) {
+      index.upsert(
+        { id: memoryId, type: meta.type, expiresAt: meta.expires_at },
+        normalized,
+      );
+      this.markDirty(meta.agent_id);
+    } else if (meta) {
+      // Not loaded: the fingerprint cannot see an in-place update
+      this.removeSidecar(meta.agent_id);
+    }
   }
 
   /**
    * Store multiple embeddings in a batch
+   *
+   * Runs one transaction with a single reused UPDATE statement and looks up
+   * index metadata in chunked IN queries instead of once per row.
    */
   storeBatch(
     embeddings: Array<{ memoryId: string; vector: number[] }>,
     options?: EmbeddingOptions,
   ): void {
+    if (embeddings.length === 0) {
+      return;
+    }
+
+    const prepared = embeddings.map(({ memoryId, vector }) => {
+      if (options?.dimension && vector.length !== options.dimension) {
+        throw new Error(
+          `Embedding dimension mismatch: expected ${options.dimension}, got ${vector.length}`,
+        );
+      }
+      return {
+        memoryId,
+        vector: options?.normalize ? this.normalize(vector) : vector,
+      };
+    });
+
+    // Resolve index metadata for all rows up front, in chunks
+    const metaById = new Map<
+      string,
+      { agent_id: string; type: string; expires_at: number | null }
+    >();
+    if (this.indexes.size > 0 || this.persistsIndexes()) {
+      const ids = prepared.map((item) => item.memoryId);
+      const chunkSize = 500;
+      for (let start = 0; start < ids.length; start += chunkSize) {
+        const chunk = ids.slice(start, start + chunkSize);
+        const rows = this.db.query<{
+          id: string;
+          agent_id: string;
+          type: string;
+          expires_at: number | null;
+        }>(
+          `SELECT id, agent_id, type, expires_at FROM memories
+           WHERE id IN (${chunk.map(() => "?").join(", ")})`,
+          chunk,
+        );
+        for (const row of rows) {
+          metaById.set(row.id, row);
+        }
+      }
+
+      for (const { memoryId, vector } of prepared) {
+        const meta = metaById.get(memoryId);
+        const index = meta ? this.indexes.get(meta.agent_id) : undefined;
+        if (index && index.getDimension() !== vector.length) {
+          throw new Error(
+            `Embedding dimension mismatch: expected ${index.getDimension()}, got ${vector.length}`,
+          );
+        }
+      }
+    }
+
+    const sql = `
+      UPDATE memories
+      SET embedding = ?
+      WHERE id = ?
+    `;
+
     this.db.transaction(() => {
-      for (const { memoryId, vector } of embeddings) {
-        this.storeEmbedding(memoryId, vector, options);
+      for (const { memoryId, vector } of prepared) {
+        this.db.execute(sql, [encodeEmbedding(vector), memoryId]);
       }
     });
+
+    const unloaded = new Set<string>();
+    for (const { memoryId, vector } of prepared) {
+      const meta = metaById.get(memoryId);
+      const index = meta ? this.indexes.get(meta.agent_id) : undefined;
+      if (index && meta) {
+        index.upsert(
+          { id: memoryId, type: meta.type, expiresAt: meta.expires_at },
+          vector,
+        );
+        this.markDirty(meta.agent_id);
+      } else if (meta) {
+        unloaded.add(meta.agent_id);
+      }
+    }
+
+    // Not loaded: the fingerprint cannot see an in-place update
+    for (const agentId of unloaded) {
+      this.removeSidecar(agentId);
+    }
+  }
+
+  /**
+   * Add newly inserted memories to the loaded indexes
+   *
+   * Called by MemoryStore after it writes rows (embedding included)
+   * directly, so a search index loaded earlier sees them without a
+   * reload. Memories without an embedding, for agents with no loaded
+   * index, or of a different dimension are skipped.
+   */
+  indexMemories(
+    memories: ReadonlyArray<
+      Pick<Memory, "id" | "agent_id" | "type" | "expires_at" | "embedding">
+    >,
+  ): void {
+    if (this.indexes.size === 0) {
+      return;
+    }
+
+    for (const memory of memories) {
+      const index = this.indexes.get(memory.agent_id);
+      const vector = index ? decodeEmbedding(memory.embedding) : null;
+      if (!index || !vector || vector.length !== index.getDimension()) {
+        continue;
+      }
+
+      index.upsert(
+        { id: memory.id, type: memory.type, expiresAt: memory.expires_at },
+        vector,
+      );
+      this.markDirty(memory.agent_id);
+    }
   }
 
   /**
@@ -130,15 +300,13 @@ export class VectorStore {
    */
   getEmbedding(memoryId: string): number[] | null {
     const sql = `SELECT embedding FROM memories WHERE id = ?`;
-    const result = this.db.queryOne<{ embedding: string | null }>(sql, [
-      memoryId,
-    ]);
-
-    if (!result || !result.embedding) {
-      return null;
-    }
+    const result = this.db.queryOne<{ embedding: Buffer | string | null }>(
+      sql,
+      [memoryId],
+    );
 
-    return JSON.parse(result.embedding);
+    const vector = decodeEmbedding(result?.embedding);
+    return vector ? Array.from(vector) : null;
   }
 
   /**
@@ -170,54 +338,55 @@ export class VectorStore {
   ): SimilarityResult[] {
     const limit = options?.limit ?? this.config.maxResults;
     const threshold = options?.threshold ?? this.config.similarityThreshold;
+    const index = this.getIndex(agentId, queryVector.length);
+
+    while (true) {
+      const hits = index.search(queryVector, {
+        limit,
+        threshold,
+        types: options?.types,
+        excludeIds: options?.excludeIds,
+      });
+
+      if (hits.length === 0) {
+        return [];
+      }
 
-    // Build query
-    let sql = `
-      SELECT id, agent_id, session_id, type, content, embedding,
-             importance, access_count, last_accessed_at, created_at,
-             expires_at, metadata
-      FROM memories
-      WHERE agent_id = ?
-      AND embedding IS NOT NULL
-      AND (expires_at IS NULL OR expires_at > ?)
-    `;
-
-    const params: any[] = [agentId, Date.now()];
-
-    if (options?.types && options.types.length > 0) {
-      sql += ` AND type IN (${options.types.map(() => "?").join(", ")})`;
-      params.push(...options.types);
-    }
-
-    if (options?.excludeIds && options.excludeIds.length > 0) {
-      sql += ` AND id NOT IN (${options.excludeIds.map(() => "?").join(", ")})`;
-      params.push(...options.excludeIds);
-    }
-
-    const memories = this.db.query<Memory>(sql, params);
-
-    // Calculate similarities
-    const results: SimilarityResult[] = [];
-    const normalizedQuery = this.normalize(queryVector);
-
-    for (const memory of memories) {
-      if (!memory.embedding) continue;
-
-      const embedding = JSON.parse(memory.embedding);
-      const similarity = this.cosineSimilarity(normalizedQuery, embedding);
+      // Load full rows for the winners only
+      const sql = `
+        SELECT id, agent_id, session_id, type, content, embedding,
+               importance, access_count, last_accessed_at, created_at,
+               expires_at, metadata
+        FROM memories
+        WHERE id IN (${hits.map(() => "?").join(", ")})
+        AND embedding IS NOT NULL
+      `;
+      const rows = this.db.query<Memory>(
+        sql,
+        hits.map((hit) => hit.id),
+      );
+      const byId = new Map(rows.map((row) => [row.id, row]));
+
+      // Memories deleted outside the VectorStore leave stale index rows
+      let stale = false;
+      for (const hit of hits) {
+        if (!byId.has(hit.id)) {
+          index.remove(hit.id);
+          stale = true;
+        }
+      }
 
-      if (similarity >= threshold) {
-        results.push({
-          memory,
-          similarity,
-          distance: 1 - similarity,
-        });
+      if (stale) {
+        this.markDirty(agentId);
+        continue;
       }
-    }
 
-    // Sort by similarity (highest first) and limit results
-    results.sort((a, b) => b.similarity - a.similarity);
-    return results.slice(0, limit);
+      return hits.map((hit) => ({
+        memory: byId.get(hit.id)!,
+        similarity: hit.similarity,
+        distance: 1 - hit.similarity,
+      }));
+    }
   }
 
   /**
@@ -456,6 +625,36 @@ export class VectorStore {
     return this.db.query<{ id: string; content: string }>(sql, params);
   }
 
+  /**
+   * Embed and store vectors for memories that have none
+   *
+   * Works with a local embedder for fully offline ingestion.
+   *
+   * @returns Number of memories embedded
+   */
+  async embedMissing(
+    agentId: string,
+    client: IEmbeddingClient,
+    options?: EmbeddingOptions & { batchSize?: number; limit?: number },
+  ): Promise<number> {
+    const batchSize = options?.batchSize ?? 512;
+    const memories = this.getMemoriesWithoutEmbeddings(agentId, options?.limit);
+
+    for (let start = 0; start < memories.length; start += batchSize) {
+      const batch = memories.slice(start, start + batchSize);
+      const vectors = await client.embed(
+        batch.map((memory) => memory.content),
+        { model: options?.model, dimensions: options?.dimension },
+      );
+      this.storeBatch(
+        batch.map((memory, i) => ({ memoryId: memory.id, vector: vectors[i] })),
+        options,
+      );
+    }
+
+    return memories.length;
+  }
+
   /**
    * Delete embedding for a memory
    */
@@ -467,6 +666,12 @@ export class VectorStore {
     `;
 
     this.db.execute(sql, [memoryId]);
+
+    for (const [agentId, index] of this.indexes.entries()) {
+      if (index.remove(memoryId)) {
+        this.markDirty(agentId);
+      }
+    }
   }
 
   /**
@@ -479,11 +684,263 @@ export class VectorStore {
       WHERE agent_id = ?
     `;
 
-    this.db.execute(sql, [agentId]);
+    const result = this.db.execute(sql, [agentId]);
+    this.invalidateIndex(agentId);
 
-    const countSql = `SELECT changes() as count`;
-    const result = this.db.queryOne<{ count: number }>(countSql, []);
-    return result?.count ?? 0;
+    return result.changes;
+  }
+
+  /**
+   * Drop the in-memory index for an agent (or all agents)
+   *
+   * Call after modifying `memories` outside the VectorStore; the index is
+   * reloaded from the database on the next search.
+   */
+  invalidateIndex(agentId?: string): void {
+    const agentIds = agentId ? [agentId] : Array.from(this.indexes.keys());
+
+    for (const id of agentIds) {
+      this.indexes.delete(id);
+      this.dirtyIndexes.delete(id);
+      this.removeSidecar(id);
+    }
+  }
+
+  /**
+   * Write modified HNSW indexes to their sidecar files
+   */
+  flushIndexes(): void {
+    for (const agentId of this.dirtyIndexes) {
+      const index = this.indexes.get(agentId);
+      if (index instanceof HnswIndex) {
+        this.writeSidecar(agentId, index);
+      }
+    }
+    this.dirtyIndexes.clear();
+  }
+
+  /**
+   * Get in-memory index statistics
+   */
+  getIndexStats(): Array<{
+    agentId: string;
+    type: "exact" | "hnsw";
+    size: number;
+    dimension: number;
+    dirty: boolean;
+  }> {
+    return Array.from(this.indexes.entries()).map(([agentId, index]) => ({
+      agentId,
+      type: index instanceof HnswIndex ? "hnsw" : "exact",
+      size: index.size,
+      dimension: index.getDimension(),
+      dirty: this.dirtyIndexes.has(agentId),
+    }));
+  }
+
+  /**
+   * Get the index for an agent, loading it from the database on first use
+   *
+   * Rows whose dimension differs from the requested one are not indexed.
+   */
+  private getIndex(agentId: string, dimension: number): VectorSearchIndex {
+    const existing = this.indexes.get(agentId);
+    if (existing) {
+      if (existing.getDimension() !== dimension) {
+        throw new Error(
+          `Vector dimension mismatch: ${dimension} vs ${existing.getDimension()}`,
+        );
+      }
+      return existing;
+    }
+
+    if (this.config.indexType === "hnsw") {
+      const loaded = this.readSidecar(agentId, dimension);
+      if (loaded) {
+        this.indexes.set(agentId, loaded);
+        return loaded;
+      }
+    }
+
+    const index: VectorSearchIndex =
+      this.config.indexType === "hnsw"
+        ? new HnswIndex(dimension, this.getHnswConfig())
+        : new VectorIndex(dimension);
+    const rows = this.db.query<{
+      id: string;
+      type: string;
+      expires_at: number | null;
+      embedding: Buffer | string;
+    }>(
+      `SELECT id, type, expires_at, embedding
+       FROM memories
+       WHERE agent_id = ? AND embedding IS NOT NULL`,
+      [agentId],
+    );
+
+    for (const row of rows) {
+      const vector = decodeEmbedding(row.embedding);
+      if (!vector || vector.length !== dimension) continue;
+
+      index.upsert(
+        { id: row.id, type: row.type, expiresAt: row.expires_at },
+        vector,
+      );
+    }
+
+    this.indexes.set(agentId, index);
+
+    if (index instanceof HnswIndex) {
+      this.writeSidecar(agentId, index);
+    }
+
+    return index;
+  }
+
+  /**
+   * HNSW parameters from the store configuration
+   */
+  private getHnswConfig(): HnswConfig {
+    return {
+      M: this.config.hnswM,
+      efConstruction: this.config.hnswEfConstruction,
+      efSearch: this.config.hnswEfSearch,
+    };
+  }
+
+  /**
+   * Record an in-memory index change; the sidecar is stale until flushed
+   */
+  private markDirty(agentId: string): void {
+    if (!(this.indexes.get(agentId) instanceof HnswIndex)) {
+      return;
+    }
+
+    if (!this.dirtyIndexes.has(agentId)) {
+      this.dirtyIndexes.add(agentId);
+      this.removeSidecar(agentId);
+    }
+  }
+
+  /**
+   * Whether HNSW indexes are persisted to sidecar files
+   */
+  private persistsIndexes(): boolean {
+    return this.config.persistIndex && !!this.db.getPath();
+  }
+
+  /**
+   * Sidecar file path for an agent's HNSW index (null when not persisted)
+   */
+  private getSidecarPath(agentId: string): string | null {
+    const dbPath = this.persistsIndexes() ? this.db.getPath() : null;
+    if (!dbPath) {
+      return null;
+    }
+
+    const safeId = agentId.replace(/[^a-zA-Z0-9_-]/g, "_");
+    return `${dbPath}.${safeId}.hnsw`;
+  }
+
+  /**
+   * Fingerprint of the agent's embedded memories
+   *
+   * Row count plus the largest and summed rowids, read in one aggregate
+   * query: detects inserts and deletes made since the sidecar was written
+   * without loading or sorting every id. In-place updates are not visible
+   * here; storeEmbedding/storeBatch delete the sidecar instead, and other
+   * writers call `invalidateIndex`.
+   */
+  private computeFingerprint(agentId: string): string {
+    const row = this.db.queryOne<{
+      count: number;
+      max_rowid: number | null;
+      sum_rowid: number | null;
+    }>(
+      `SELECT COUNT(*) AS count, MAX(rowid) AS max_rowid,
+              SUM(rowid) AS sum_rowid
+       FROM memories
+       WHERE agent_id = ? AND embedding IS NOT NULL`,
+      [agentId],
+    );
+
+    return `${row?.count ?? 0}:${row?.max_rowid ?? 0}:${row?.sum_rowid ?? 0}`;
+  }
+
+  /**
+   * Load an agent's HNSW index from its sidecar if it is still fresh
+   */
+  private readSidecar(agentId: string, dimension: number): HnswIndex | null {
+    const path = this.getSidecarPath(agentId);
+    if (!path || !existsSync(path)) {
+      return null;
+    }
+
+    try {
+      const { index, fingerprint } = HnswIndex.deserialize(readFileSync(path));
+      const config = index.getConfig();
+
+      if (
+        index.getDimension() !== dimension ||
+        config.M !== this.config.hnswM ||
+        fingerprint !== this.computeFingerprint(agentId)
+      ) {
+        return null;
+      }
+
+      index.setEfSearch(this.config.hnswEfSearch);
+      return index;
+    } catch {
+      // Corrupt or incompatible sidecar - rebuild from the database
+      return null;
+    }
+  }
+
+  /**
+   * Persist an agent's HNSW index to its sidecar
+   */
+  private writeSidecar(agentId: string, index: HnswIndex): void {
+    const path = this.getSidecarPath(agentId);
+    if (!path) {
+      return;
+    }
+
+    try {
+      writeFileSync(path, index.serialize(this.computeFingerprint(agentId)));
+    } catch {
+      // Persistence is an optimization; the index is rebuilt on next load
+    }
+  }
+
+  /**
+   * Delete an agent's sidecar file
+   */
+  private removeSidecar(agentId: string): void {
+    const path = this.getSidecarPath(agentId);
+    if (!path || !existsSync(path)) {
+      return;
+    }
+
+    try {
+      unlinkSync(path);
+    } catch {
+      // Ignore - a stale sidecar is detected by its fingerprint
+    }
+  }
+
+  /**
+   * Look up the metadata needed to index a memory
+   */
+  private getIndexMeta(
+    memoryId: string,
+  ): { agent_id: string; type: string; expires_at: number | null } | null {
+    return this.db.queryOne<{
+      agent_id: string;
+      type: string;
+      expires_at: number | null;
+    }>(`SELECT agent_id, type, expires_at FROM memories WHERE id = ?`, [
+      memoryId,
+    ]);
   }
 
   /**
@@ -19,7 +19,10 @@ export type {
   RelationshipType,
   MemoryCreateInput,
   MemoryQueryOptions,
+  MemoryTextSearchOptions,
+  MemoryTextMatch,
   MemoryStats,
+  MemoryStoreConfig,
 } from "./MemoryStore.js";
 
 // Vector Store
@@ -31,6 +34,23 @@ export type {
   VectorStoreConfig,
 } from "./VectorStore.js";
 
+// Vector Index
+export { VectorIndex } from "./VectorIndex.js";
+export type {
+  VectorSearchIndex,
+  VectorIndexEntry,
+  VectorIndexSearchOptions,
+  VectorIndexHit,
+} from "./VectorIndex.js";
+
+// HNSW Index
+export { HnswIndex } from "./HnswIndex.js";
+export type { HnswConfig } from "./HnswIndex.js";
+
+// Embedding Codec
+export { encodeEmbedding, decodeEmbedding } from "./EmbeddingCodec.js";
+export type { StoredEmbedding } from "./EmbeddingCodec.js";
+
 // Semantic Search
 export { SemanticSearch } from "./SemanticSearch.js";
 export type {
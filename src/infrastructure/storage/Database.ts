@@ -7,7 +7,7 @@
  * - Connection pooling and lifecycle management
  * - Transaction support with rollback
  * - Migration system
- * - Query execution with prepared statements
+ * - Query execution with cached prepared statements (LRU)
  * - Error handling and logging
  * - WAL mode for better concurrency
  * - Backup and restore support
@@ -42,6 +42,9 @@ export interface DatabaseConfig {
 
   /** Memory mode (default: false) */
   memory?: boolean;
+
+  /** Prepared statement cache size (default: 100, 0 disables) */
+  statementCacheSize?: number;
 }
 
 /**
@@ -75,6 +78,17 @@ export interface QueryResult<T = any> {
   lastInsertRowid: number;
 }
 
+/**
+ * Bulk Insert Options
+ */
+export interface BulkInsertOptions {
+  /** Conflict handling (default: abort) */
+  onConflict?: "abort" | "ignore" | "replace";
+
+  /** Max rows per INSERT statement (default: 500) */
+  rowsPerStatement?: number;
+}
+
 /**
  * Transaction Options
  */
@@ -83,14 +97,32 @@ export interface TransactionOptions {
   mode?: "deferred" | "immediate" | "exclusive";
 }
 
+/**
+ * Statement Cache Statistics
+ */
+export interface StatementCacheStats {
+  size: number;
+  maxSize: number;
+  hits: number;
+  misses: number;
+  evictions: number;
+}
+
 /**
  * Database Wrapper
  */
 export class DatabaseWrapper {
+  /**
+   * SQLite's default SQLITE_MAX_VARIABLE_NUMBER (3.32+)
+   */
+  static readonly MAX_VARIABLES = 32766;
+
   private db: DatabaseType | null = null;
   private config: Required<DatabaseConfig>;
   private migrations: Migration[] = [];
   private isOpen = false;
+  private statementCache: Map<string, Statement> = new Map();
+  private statementCacheStats = { hits: 0, misses: 0, evictions: 0 };
 
   constructor(config: DatabaseConfig) {
     this.config = {
@@ -101,6 +133,7 @@ export class DatabaseWrapper {
       verbose: config.verbose ?? false,
       readonly: config.readonly ?? false,
       memory: config.memory ?? false,
+      statementCacheSize: config.statementCacheSize ?? 100,
     };
   }
 
@@ -161,6 +194,7 @@ export class DatabaseWrapper {
     }
 
     try {
+      this.clearStatementCache();
       this.db.close();
       this.db = null;
       this.isOpen = false;
@@ -178,6 +212,13 @@ export class DatabaseWrapper {
     return this.isOpen && this.db !== null;
   }
 
+  /**
+   * Get the database file path (null for in-memory databases)
+   */
+  getPath(): string | null {
+    return this.config.memory ? null : this.config.path;
+  }
+
   /**
    * Execute a query that returns rows
    */
@@ -185,7 +226,7 @@ export class DatabaseWrapper {
     this.ensureOpen();
 
     try {
-      const stmt = this.db!.prepare(sql);
+      const stmt = this.getStatement(sql);
       return stmt.all(...params) as T[];
     } catch (error) {
       throw new Error(
@@ -201,7 +242,7 @@ export class DatabaseWrapper {
     this.ensureOpen();
 
     try {
-      const stmt = this.db!.prepare(sql);
+      const stmt = this.getStatement(sql);
       return (stmt.get(...params) as T) || null;
     } catch (error) {
       throw new Error(
@@ -217,7 +258,7 @@ export class DatabaseWrapper {
     this.ensureOpen();
 
     try {
-      const stmt = this.db!.prepare(sql);
+      const stmt = this.getStatement(sql);
       const info = stmt.run(...params);
 
       return {
@@ -232,6 +273,79 @@ export class DatabaseWrapper {
     }
   }
 
+  /**
+   * Insert many rows using multi-row VALUES statements in one transaction
+   *
+   * Rows are chunked so each statement stays under SQLite's bound-variable
+   * limit; the full-chunk statement is compiled once and reused.
+   * Returns the number of inserted rows.
+   */
+  insertMany(
+    table: string,
+    columns: string[],
+    rows: unknown[][],
+    options: BulkInsertOptions = {},
+  ): number {
+    this.ensureOpen();
+
+    if (rows.length === 0) {
+      return 0;
+    }
+
+    if (columns.length === 0) {
+      throw new Error("Bulk insert requires at least one column");
+    }
+
+    const rowsPerChunk = Math.max(
+      1,
+      Math.min(
+        options.rowsPerStatement ?? 500,
+        Math.floor(DatabaseWrapper.MAX_VARIABLES / columns.length),
+      ),
+    );
+    const verb =
+      options.onConflict === "ignore"
+        ? "INSERT OR IGNORE"
+        : options.onConflict === "replace"
+          ? "INSERT OR REPLACE"
+          : "INSERT";
+    const rowPlaceholder = `(${columns.map(() => "?").join(", ")})`;
+    const buildSql = (count: number) =>
+      `${verb} INTO ${table} (${columns.join(", ")}) VALUES ${new Array(count)
+        .fill(rowPlaceholder)
+        .join(", ")}`;
+
+    return this.transaction(() => {
+      let inserted = 0;
+      let fullChunk: Statement | null = null;
+
+      for (let start = 0; start < rows.length; start += rowsPerChunk) {
+        const chunk = rows.slice(start, start + rowsPerChunk);
+        const params: unknown[] = [];
+        for (const row of chunk) {
+          if (row.length !== columns.length) {
+            throw new Error(
+              `Bulk insert row has ${row.length} values, expected ${columns.length}`,
+            );
+          }
+          params.push(...row);
+        }
+
+        let stmt: Statement;
+        if (chunk.length === rowsPerChunk) {
+          fullChunk ??= this.getStatement(buildSql(rowsPerChunk));
+          stmt = fullChunk;
+        } else {
+          stmt = this.getStatement(buildSql(chunk.length));
+        }
+
+        inserted += stmt.run(...params).changes;
+      }
+
+      return inserted;
+    });
+  }
+
   /**
    * Execute multiple statements (separated by semicolons)
    */
@@ -249,6 +363,8 @@ export class DatabaseWrapper {
 
   /**
    * Prepare a statement for later execution
+   *
+   * Not cached: callers may switch the statement into raw/pluck/expand mode.
    */
   prepare(sql: string): Statement {
     this.ensureOpen();
@@ -303,6 +419,7 @@ export class DatabaseWrapper {
    */
   migrate(): void {
     this.ensureOpen();
+    this.clearStatementCache();
 
     // Create migrations table if it doesn't exist
     this.execute(`
@@ -339,6 +456,9 @@ export class DatabaseWrapper {
         console.log(`Migration ${migration.version} applied successfully`);
       }
     }
+
+    // Drop statements compiled against the pre-migration schema
+    this.clearStatementCache();
   }
 
   /**
@@ -346,6 +466,7 @@ export class DatabaseWrapper {
    */
   rollback(targetVersion: number): void {
     this.ensureOpen();
+    this.clearStatementCache();
 
     // Get applied migrations in reverse order
     const appliedMigrations = this.query<{ version: number; name: string }>(
@@ -379,6 +500,8 @@ export class DatabaseWrapper {
 
       console.log(`Migration ${migration.version} rolled back successfully`);
     }
+
+    this.clearStatementCache();
   }
 
   /**
@@ -455,6 +578,7 @@ export class DatabaseWrapper {
     freePages: number;
     size: number;
     walMode: boolean;
+    statementCache: StatementCacheStats;
   } {
     this.ensureOpen();
 
@@ -473,6 +597,11 @@ export class DatabaseWrapper {
       freePages,
       size: pageCount * pageSize,
       walMode: journalMode === "wal",
+      statementCache: {
+        size: this.statementCache.size,
+        maxSize: this.config.statementCacheSize,
+        ...this.statementCacheStats,
+      },
     };
   }
 
@@ -484,6 +613,7 @@ export class DatabaseWrapper {
 
     try {
       this.db!.exec("VACUUM");
+      this.rebuildExternalContentIndexes();
     } catch (error) {
       throw new Error(
         `Optimize failed: ${error instanceof Error ? error.message : String(error)}`,
@@ -491,6 +621,26 @@ export class DatabaseWrapper {
     }
   }
 
+  /**
+   * Rebuild external-content FTS5 indexes
+   *
+   * VACUUM may renumber the rowids of tables without an INTEGER PRIMARY KEY,
+   * which would leave indexes keyed by those rowids pointing at wrong rows.
+   */
+  private rebuildExternalContentIndexes(): void {
+    const tables = this.db!.prepare(
+      `SELECT name, sql FROM sqlite_master
+       WHERE type = 'table' AND sql LIKE '%USING fts5%'`,
+    ).all() as Array<{ name: string; sql: string }>;
+
+    for (const { name, sql } of tables) {
+      // Contentless tables (content='') cannot be rebuilt
+      if (/content\s*=\s*'[^']+'/i.test(sql)) {
+        this.db!.exec(`INSERT INTO "${name}"("${name}") VALUES ('rebuild')`);
+      }
+    }
+  }
+
   /**
    * Check database integrity
    */
@@ -513,6 +663,46 @@ export class DatabaseWrapper {
     return this.db!;
   }
 
+  /**
+   * Clear the prepared statement cache
+   */
+  clearStatementCache(): void {
+    this.statementCache.clear();
+  }
+
+  /**
+   * Get a compiled statement from the LRU cache, preparing it on a miss
+   */
+  private getStatement(sql: string): Statement {
+    const maxSize = this.config.statementCacheSize;
+    if (maxSize <= 0) {
+      return this.db!.prepare(sql);
+    }
+
+    const cached = this.statementCache.get(sql);
+    if (cached) {
+      // Move to most-recently-used position
+      this.statementCache.delete(sql);
+      this.statementCache.set(sql, cached);
+      this.statementCacheStats.hits++;
+      return cached;
+    }
+
+    this.statementCacheStats.misses++;
+    const stmt = this.db!.prepare(sql);
+    this.statementCache.set(sql, stmt);
+
+    if (this.statementCache.size > maxSize) {
+      const oldest = this.statementCache.keys().next().value;
+      if (oldest !== undefined) {
+        this.statementCache.delete(oldest);
+        this.statementCacheStats.evictions++;
+      }
+    }
+
+    return stmt;
+  }
+
   /**
    * Ensure database is open
    */
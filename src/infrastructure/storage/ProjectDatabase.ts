@@ -0,0 +1,67 @@
+/**
+ * Project Database
+ *
+ * Shared handle on a project's own SQLite database
+ * (`<root>/.nocturne/data/nocturne.db`), opened and migrated on first use.
+ * Components that can persist state fall back to it when no database is
+ * injected.
+ *
+ * Features:
+ * - One connection per project root for the life of the process
+ * - Only used in initialized projects (a `.nocturne` directory exists), so
+ *   running outside a project never creates files
+ * - Failure to open (e.g. SQLite unavailable) yields null; callers keep
+ *   their state in memory instead
+ */
+
+import { existsSync } from "fs";
+import { join, resolve } from "path";
+import { DatabaseWrapper } from "./Database.js";
+import { migrations } from "./migrations/index.js";
+import { DEFAULT_DATABASE_CONFIG } from "../../core/constants/defaults.js";
+
+const databases = new Map<string, DatabaseWrapper | null>();
+
+/**
+ * Get the migrated database of the project at `root`
+ *
+ * @returns The shared database, or null if `root` is not an initialized
+ *   project or the database cannot be opened
+ */
+export function getProjectDatabase(root: string): DatabaseWrapper | null {
+  const key = resolve(root);
+  if (databases.has(key)) {
+    return databases.get(key)!;
+  }
+
+  let db: DatabaseWrapper | null = null;
+  if (existsSync(join(key, ".nocturne"))) {
+    db = new DatabaseWrapper({
+      path: join(key, DEFAULT_DATABASE_CONFIG.path),
+      wal: DEFAULT_DATABASE_CONFIG.enableWAL,
+      timeout: DEFAULT_DATABASE_CONFIG.busyTimeout,
+    });
+
+    try {
+      db.open();
+      db.registerMigrations(migrations);
+      db.migrate();
+    } catch {
+      db.close();
+      db = null;
+    }
+  }
+
+  databases.set(key, db);
+  return db;
+}
+
+/**
+ * Close every project database (a new connection is opened on next use)
+ */
+export function closeProjectDatabases(): void {
+  for (const db of databases.values()) {
+    db?.close();
+  }
+  databases.clear();
+}
@@ -7,11 +7,17 @@
 
 // Database
 export { DatabaseWrapper, createDatabase } from "./Database.js";
+export {
+  getProjectDatabase,
+  closeProjectDatabases,
+} from "./ProjectDatabase.js";
 export type {
   DatabaseConfig,
   Migration,
   QueryResult,
   TransactionOptions,
+  StatementCacheStats,
+  BulkInsertOptions,
 } from "./Database.js";
 
 // Repositories - Base
@@ -79,4 +85,8 @@ export {
   getLatestVersion,
   validateMigrations,
   initialMigration,
+  binaryEmbeddingsMigration,
+  memoriesFtsMigration,
+  llmResponseCacheMigration,
+  symbolIndexMigration,
 } from "./migrations/index.js";
@@ -0,0 +1,84 @@
+/**
+ * Binary Embeddings Migration
+ *
+ * Converts `memories.embedding` values from JSON arrays of numbers to
+ * little-endian Float32 BLOBs. SQLite keeps BLOB values as-is regardless of
+ * the declared column affinity, so the column definition is left unchanged.
+ */
+
+import type { Migration } from "../Database.js";
+import {
+  decodeEmbedding,
+  encodeEmbedding,
+} from "../../memory/EmbeddingCodec.js";
+
+/**
+ * Rows converted per batch (keeps memory bounded on large tables)
+ */
+const BATCH_SIZE = 500;
+
+export const binaryEmbeddingsMigration: Migration = {
+  version: 2,
+  name: "binary_embeddings",
+
+  up: (db) => {
+    let converted = 0;
+
+    while (true) {
+      const rows = db.query<{ id: string; embedding: string }>(
+        `SELECT id, embedding FROM memories
+         WHERE typeof(embedding) = 'text'
+         LIMIT ?`,
+        [BATCH_SIZE],
+      );
+
+      if (rows.length === 0) {
+        break;
+      }
+
+      for (const row of rows) {
+        let blob: Buffer | null;
+        try {
+          blob = encodeEmbedding(decodeEmbedding(row.embedding)!);
+        } catch {
+          // Unparseable legacy value - drop it so it can be re-embedded
+          blob = null;
+        }
+
+        db.execute("UPDATE memories SET embedding = ? WHERE id = ?", [
+          blob,
+          row.id,
+        ]);
+      }
+
+      converted += rows.length;
+    }
+
+    console.log(`Converted ${converted} embeddings to binary format`);
+  },
+
+  down: (db) => {
+    while (true) {
+      const rows = db.query<{ id: string; embedding: Buffer }>(
+        `SELECT id, embedding FROM memories
+         WHERE typeof(embedding) = 'blob'
+         LIMIT ?`,
+        [BATCH_SIZE],
+      );
+
+      if (rows.length === 0) {
+        break;
+      }
+
+      for (const row of rows) {
+        const vector = decodeEmbedding(row.embedding);
+        db.execute("UPDATE memories SET embedding = ? WHERE id = ?", [
+          vector ? JSON.stringify(Array.from(vector)) : null,
+          row.id,
+        ]);
+      }
+    }
+
+    console.log("Converted embeddings back to JSON format");
+  },
+};
@@ -0,0 +1,67 @@
+/**
+ * Memory Full-Text Search Migration
+ *
+ * Adds an FTS5 index over `memories.content` so memory search can use
+ * BM25-ranked MATCH queries instead of `LIKE '%term%'` table scans.
+ *
+ * `memories_fts` is an external-content table keyed by the memories rowid
+ * and kept in sync by triggers; it stores only the inverted index.
+ */
+
+import type { Migration } from "../Database.js";
+
+export const memoriesFtsMigration: Migration = {
+  version: 3,
+  name: "memories_fts",
+
+  up: (db) => {
+    db.execute(`
+      CREATE VIRTUAL TABLE IF NOT EXISTS memories_fts USING fts5(
+        content,
+        content='memories',
+        content_rowid='rowid'
+      )
+    `);
+
+    db.execute(`
+      CREATE TRIGGER IF NOT EXISTS memories_fts_insert
+      AFTER INSERT ON memories
+      BEGIN
+        INSERT INTO memories_fts(rowid, content) VALUES (new.rowid, new.content);
+      END
+    `);
+
+    db.execute(`
+      CREATE TRIGGER IF NOT EXISTS memories_fts_delete
+      AFTER DELETE ON memories
+      BEGIN
+        INSERT INTO memories_fts(memories_fts, rowid, content)
+        VALUES ('delete', old.rowid, old.content);
+      END
+    `);
+
+    db.execute(`
+      CREATE TRIGGER IF NOT EXISTS memories_fts_update
+      AFTER UPDATE OF content ON memories
+      BEGIN
+        INSERT INTO memories_fts(memories_fts, rowid, content)
+        VALUES ('delete', old.rowid, old.content);
+        INSERT INTO memories_fts(rowid, content) VALUES (new.rowid, new.content);
+      END
+    `);
+
+    // Index existing rows
+    db.execute(`INSERT INTO memories_fts(memories_fts) VALUES ('rebuild')`);
+
+    console.log("Memory full-text index created successfully");
+  },
+
+  down: (db) => {
+    db.execute("DROP TRIGGER IF EXISTS memories_fts_update");
+    db.execute("DROP TRIGGER IF EXISTS memories_fts_delete");
+    db.execute("DROP TRIGGER IF EXISTS memories_fts_insert");
+    db.execute("DROP TABLE IF EXISTS memories_fts");
+
+    console.log("Memory full-text index dropped successfully");
+  },
+};
@@ -0,0 +1,47 @@
+/**
+ * LLM Response Cache Migration
+ *
+ * Adds the `llm_response_cache` table backing the persistent SQLite tier of
+ * the LLM response cache, so identical prompts are served across runs.
+ */
+
+import type { Migration } from "../Database.js";
+
+export const llmResponseCacheMigration: Migration = {
+  version: 4,
+  name: "llm_response_cache",
+
+  up: (db) => {
+    db.execute(`
+      CREATE TABLE IF NOT EXISTS llm_response_cache (
+        key TEXT PRIMARY KEY,
+        response TEXT NOT NULL,
+        size INTEGER NOT NULL,
+        created_at INTEGER NOT NULL,
+        expires_at INTEGER,
+        last_accessed_at INTEGER NOT NULL,
+        hits INTEGER DEFAULT 0
+      )
+    `);
+
+    db.execute(`
+      CREATE INDEX IF NOT EXISTS idx_llm_response_cache_accessed
+      ON llm_response_cache(last_accessed_at)
+    `);
+
+    db.execute(`
+      CREATE INDEX IF NOT EXISTS idx_llm_response_cache_expires
+      ON llm_response_cache(expires_at)
+    `);
+
+    console.log("LLM response cache table created successfully");
+  },
+
+  down: (db) => {
+    db.execute("DROP INDEX IF EXISTS idx_llm_response_cache_expires");
+    db.execute("DROP INDEX IF EXISTS idx_llm_response_cache_accessed");
+    db.execute("DROP TABLE IF EXISTS llm_response_cache");
+
+    console.log("LLM response cache table dropped successfully");
+  },
+};
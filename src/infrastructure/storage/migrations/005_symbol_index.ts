@@ -0,0 +1,73 @@
+/**
+ * Symbol Index Migration
+ *
+ * Adds the per-file symbol table used by SymbolSearchTool. `symbol_files`
+ * records the size and mtime each file was indexed at, so only changed
+ * files are re-extracted; `symbols` holds one row per definition and
+ * matching kind (`type` is the definition's primary kind), indexed for
+ * lookups by name, name prefix and kind.
+ */
+
+import type { Migration } from "../Database.js";
+
+export const symbolIndexMigration: Migration = {
+  version: 5,
+  name: "symbol_index",
+
+  up: (db) => {
+    db.execute(`
+      CREATE TABLE IF NOT EXISTS symbol_files (
+        path TEXT PRIMARY KEY,
+        size INTEGER NOT NULL,
+        mtime_ms REAL NOT NULL,
+        indexed_at INTEGER NOT NULL
+      )
+    `);
+
+    db.execute(`
+      CREATE TABLE IF NOT EXISTS symbols (
+        id INTEGER PRIMARY KEY AUTOINCREMENT,
+        file_path TEXT NOT NULL REFERENCES symbol_files(path) ON DELETE CASCADE,
+        name TEXT NOT NULL,
+        name_lower TEXT NOT NULL,
+        kind TEXT NOT NULL,
+        type TEXT NOT NULL,
+        line_number INTEGER NOT NULL,
+        column_number INTEGER NOT NULL,
+        signature TEXT,
+        documentation TEXT,
+        context TEXT,
+        visibility TEXT,
+        exported INTEGER NOT NULL DEFAULT 0,
+        is_async INTEGER NOT NULL DEFAULT 0
+      )
+    `);
+
+    db.execute(`
+      CREATE INDEX IF NOT EXISTS idx_symbols_name
+      ON symbols(name_lower, kind)
+    `);
+
+    db.execute(`
+      CREATE INDEX IF NOT EXISTS idx_symbols_kind
+      ON symbols(kind, name_lower)
+    `);
+
+    db.execute(`
+      CREATE INDEX IF NOT EXISTS idx_symbols_file
+      ON symbols(file_path)
+    `);
+
+    console.log("Symbol index tables created successfully");
+  },
+
+  down: (db) => {
+    db.execute("DROP INDEX IF EXISTS idx_symbols_file");
+    db.execute("DROP INDEX IF EXISTS idx_symbols_kind");
+    db.execute("DROP INDEX IF EXISTS idx_symbols_name");
+    db.execute("DROP TABLE IF EXISTS symbols");
+    db.execute("DROP TABLE IF EXISTS symbol_files");
+
+    console.log("Symbol index tables dropped successfully");
+  },
+};
@@ -7,16 +7,20 @@
 
 import type { Migration } from "../Database.js";
 import { initialMigration } from "./001_initial.js";
+import { binaryEmbeddingsMigration } from "./002_binary_embeddings.js";
+import { memoriesFtsMigration } from "./003_memories_fts.js";
+import { llmResponseCacheMigration } from "./004_llm_response_cache.js";
+import { symbolIndexMigration } from "./005_symbol_index.js";
 
 /**
  * All migrations in order
  */
 export const migrations: Migration[] = [
   initialMigration,
-  // Future migrations will be added here
-  // Example:
-  // migration002AddIndexes,
-  // migration003AddMemoryTables,
+  binaryEmbeddingsMigration,
+  memoriesFtsMigration,
+  llmResponseCacheMigration,
+  symbolIndexMigration,
 ];
 
 /**
@@ -80,4 +84,10 @@ export function validateMigrations(): { valid: boolean; errors: string[] } {
 }
 
 // Export individual migrations for direct access if needed
-export { initialMigration };
+export {
+  initialMigration,
+  binaryEmbeddingsMigration,
+  memoriesFtsMigration,
+  llmResponseCacheMigration,
+  symbolIndexMigration,
+};
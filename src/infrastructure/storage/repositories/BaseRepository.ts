@@ -14,7 +14,7 @@
  * - Soft delete support
  */
 
-import type { DatabaseWrapper } from "../Database.js";
+import type { BulkInsertOptions, DatabaseWrapper } from "../Database.js";
 
 /**
  * Repository Configuration
@@ -225,12 +225,7 @@ export abstract class BaseRepository<T extends Record<string, any>> {
    * Create a new record
    */
   create(data: Partial<T>): T {
-    const now = Date.now();
-    const record: any = {
-      ...data,
-      created_at: (data as any).created_at ?? now,
-      updated_at: (data as any).updated_at ?? now,
-    };
+    const record = this.withTimestamps(data, Date.now());
 
     const fields = Object.keys(record);
     const placeholders = fields.map(() => "?").join(", ");
@@ -253,13 +248,86 @@ export abstract class BaseRepository<T extends Record<string, any>> {
 
   /**
    * Create multiple records
+   *
+   * Uses multi-row INSERTs in a single transaction. Records without a
+   * primary key fall back to single-row inserts to capture their rowid.
    */
   createMany(items: Array<Partial<T>>): T[] {
+    const now = Date.now();
+    const records = items.map((item) => this.withTimestamps(item, now));
+
+    if (
+      records.some(
+        (record) => typeof record[this.config.primaryKey] === "undefined",
+      )
+    ) {
+      return this.db.transaction(() => {
+        return items.map((item) => this.create(item));
+      });
+    }
+
+    this.insertRecords(records);
+    return records as T[];
+  }
+
+  /**
+   * Insert multiple records without building return values
+   *
+   * Fast path for large imports. Returns the number of inserted rows.
+   */
+  insertMany(items: Array<Partial<T>>, options?: BulkInsertOptions): number {
+    const now = Date.now();
+    return this.insertRecords(
+      items.map((item) => this.withTimestamps(item, now)),
+      options,
+    );
+  }
+
+  /**
+   * Bulk insert records, grouping rows that share the same column set
+   */
+  protected insertRecords(
+    records: Array<Record<string, any>>,
+    options?: BulkInsertOptions,
+  ): number {
+    const groups = new Map<string, { columns: string[]; rows: any[][] }>();
+
+    for (const record of records) {
+      const columns = Object.keys(record);
+      const key = columns.join(",");
+      let group = groups.get(key);
+      if (!group) {
+        group = { columns, rows: [] };
+        groups.set(key, group);
+      }
+      group.rows.push(columns.map((column) => record[column]));
+    }
+
     return this.db.transaction(() => {
-      return items.map((item) => this.create(item));
+      let inserted = 0;
+      for (const { columns, rows } of groups.values()) {
+        inserted += this.db.insertMany(
+          this.config.tableName,
+          columns,
+          rows,
+          options,
+        );
+      }
+      return inserted;
     });
   }
 
+  /**
+   * Add default created_at/updated_at timestamps to a record
+   */
+  protected withTimestamps(data: Partial<T>, now: number): Record<string, any> {
+    return {
+      ...data,
+      created_at: (data as any).created_at ?? now,
+      updated_at: (data as any).updated_at ?? now,
+    };
+  }
+
   /**
    * Update a record by ID
    */
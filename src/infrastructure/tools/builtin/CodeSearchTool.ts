@@ -12,11 +12,30 @@
  * - Line number reporting
  * - Match count limiting
  * - Exclude patterns (e.g., node_modules)
+ * - Candidate files come from the shared workspace index (honors .gitignore)
+ * - Optional persisted trigram index narrows the files read per search
+ * - Files are read and matched concurrently (bounded), results stay in walk
+ *   order, and scanning stops once maxMatches is reached
+ * - Large files are matched on worker threads
  */
 
 import { promises as fs } from "fs";
-import { resolve, relative, join } from "path";
+import { resolve, relative, join, dirname, sep } from "path";
 import { BaseTool, type BaseToolConfig } from "../BaseTool.js";
+import { matchesAnyGlob } from "../utils/Glob.js";
+import {
+  getWorkspaceIndex,
+  type WorkspaceEntry,
+} from "../utils/WorkspaceIndex.js";
+import { getTrigramIndex, regexTrigramQuery } from "../utils/TrigramIndex.js";
+import {
+  DEFAULT_SCAN_CONCURRENCY,
+  getScanWorkerPool,
+  matchLines,
+  scanInOrder,
+  type LineMatch,
+} from "../utils/FileScanner.js";
+import { DEFAULT_PROJECT_STRUCTURE } from "../../../core/constants/defaults.js";
 import type { ToolDefinition } from "../../../core/types/llm.types.js";
 import type {
   ToolContext,
@@ -42,6 +61,21 @@ export interface CodeSearchToolConfig extends BaseToolConfig {
 
   /** Maximum context lines */
   maxContextLines?: number;
+
+  /**
+   * Narrow candidate files with a persisted trigram index
+   * (default: when the project has a .nocturne directory)
+   */
+  trigramIndex?: boolean;
+
+  /** Where the trigram index is stored (default: <root>/.nocturne/data) */
+  dataDirectory?: string;
+
+  /** Files read and matched at once (default: 16) */
+  scanConcurrency?: number;
+
+  /** Files at least this large (bytes) are matched on a worker thread */
+  workerThreshold?: number;
 }
 
 /**
@@ -134,9 +168,25 @@ export interface CodeSearchResult {
   statistics: {
     searchTimeMs: number;
     matchesPerFile: Record<string, number>;
+    /** Present when the trigram index narrowed the candidate files */
+    index?: CodeSearchIndexStatistics;
   };
 }
 
+/**
+ * Trigram index statistics for one search
+ */
+export interface CodeSearchIndexStatistics {
+  /** Files that passed the file filters */
+  candidateFiles: number;
+
+  /** Files (re-)read to bring the index up to date */
+  filesIndexed: number;
+
+  /** Time spent syncing and querying the index */
+  indexTimeMs: number;
+}
+
 /**
  * Code Search Tool
  */
@@ -163,6 +213,8 @@ export class CodeSearchTool extends BaseTool {
       maxFileSize: 1024 * 1024, // 1MB
       maxContextLines: 5,
       baseDirectory: process.cwd(),
+      scanConcurrency: DEFAULT_SCAN_CONCURRENCY,
+      workerThreshold: 256 * 1024, // 256KB
       defaultExcludes: [
         "**/node_modules/**",
         "**/dist/**",
@@ -362,7 +414,7 @@ export class CodeSearchTool extends BaseTool {
       ];
 
       // Collect files to search
-      const filesToSearch = await this.collectFiles(
+      const candidateFiles = await this.collectFiles(
         searchDir,
         recursive,
         typedArgs.include,
@@ -370,32 +422,48 @@ export class CodeSearchTool extends BaseTool {
         typedArgs.fileExtensions,
       );
 
-      // Search files
+      // Skip files the trigram index rules out
+      const { files: filesToSearch, index: indexStatistics } =
+        await this.filterWithTrigramIndex(
+          searchDir,
+          typedArgs.pattern,
+          candidateFiles,
+        );
+
+      // Search files concurrently, consuming results in walk order
       const matches: SearchMatch[] = [];
       const matchesPerFile: Record<string, number> = {};
       let filesWithMatches = 0;
       let truncated = false;
 
-      for (const file of filesToSearch) {
-        if (matches.length >= maxMatches) {
-          truncated = true;
-          break;
-        }
+      const scans = scanInOrder(
+        filesToSearch,
+        // Matches still wanted when the scan starts bound the file's share
+        (entry) =>
+          this.searchFile(
+            entry,
+            regex,
+            contextBefore,
+            contextAfter,
+            maxMatches - matches.length,
+            searchDir,
+          ),
+        this.searchConfig.scanConcurrency,
+      );
 
-        const fileMatches = await this.searchFile(
-          file,
-          regex,
-          contextBefore,
-          contextAfter,
-          maxMatches - matches.length,
-          searchDir,
-        );
+      for await (const { item: entry, index, result } of scans) {
+        const fileMatches = result.slice(0, maxMatches - matches.length);
 
         if (fileMatches.length > 0) {
           matches.push(...fileMatches);
-          matchesPerFile[relative(searchDir, file)] = fileMatches.length;
+          matchesPerFile[relative(searchDir, entry.path)] = fileMatches.length;
           filesWithMatches++;
         }
+
+        if (matches.length >= maxMatches && index < filesToSearch.length - 1) {
+          truncated = true;
+          break;
+        }
       }
 
       const searchTimeMs = Date.now() - startTime;
@@ -410,6 +478,7 @@ export class CodeSearchTool extends BaseTool {
         statistics: {
           searchTimeMs,
           matchesPerFile,
+          index: indexStatistics,
         },
       };
 
@@ -422,6 +491,7 @@ export class CodeSearchTool extends BaseTool {
           filesSearched: filesToSearch.length,
           matchesFound: matches.length,
           searchTimeMs,
+          indexUsed: indexStatistics !== undefined,
         },
       };
     } catch (error) {
@@ -437,7 +507,7 @@ export class CodeSearchTool extends BaseTool {
   }
 
   /**
-   * Collect files to search
+   * Collect files to search from the workspace index
    */
   private async collectFiles(
     directory: string,
@@ -445,132 +515,140 @@ export class CodeSearchTool extends BaseTool {
     includePatterns?: string[],
     excludePatterns?: string[],
     fileExtensions?: string[],
-  ): Promise<string[]> {
-    const files: string[] = [];
+  ): Promise<WorkspaceEntry[]> {
+    const index = getWorkspaceIndex(directory, this.searchConfig.baseDirectory);
+    return index.files(
+      directory,
+      { maxDepth: recursive ? undefined : 0, exclude: excludePatterns },
+      (entry) => {
+        // Check file extension
+        if (fileExtensions && fileExtensions.length > 0) {
+          const ext = entry.name.split(".").pop()?.toLowerCase();
+          if (!ext || !fileExtensions.includes(ext)) {
+            return false;
+          }
+        }
 
-    const walkDir = async (dir: string): Promise<void> => {
-      const entries = await fs.readdir(dir, { withFileTypes: true });
+        // Check include patterns and file size
+        return (
+          (!includePatterns ||
+            includePatterns.length === 0 ||
+            matchesAnyGlob(entry.relativePath, includePatterns)) &&
+          entry.size <= this.searchConfig.maxFileSize!
+        );
+      },
+    );
+  }
 
-      for (const entry of entries) {
-        const fullPath = join(dir, entry.name);
-        const relativePath = relative(directory, fullPath);
+  /**
+   * Keep only the files that can contain a match, according to the
+   * trigram index (synced with the workspace first)
+   *
+   * Patterns without required trigrams fall back to the full file list.
+   */
+  private async filterWithTrigramIndex(
+    directory: string,
+    pattern: string,
+    files: WorkspaceEntry[],
+  ): Promise<{ files: WorkspaceEntry[]; index?: CodeSearchIndexStatistics }> {
+    const query = regexTrigramQuery(pattern);
+    if (query.op === "all") {
+      return { files };
+    }
 
-        // Check exclude patterns
-        if (this.matchesPattern(relativePath, excludePatterns)) {
-          continue;
-        }
+    const startTime = Date.now();
+    const workspace = getWorkspaceIndex(
+      directory,
+      this.searchConfig.baseDirectory,
+    );
+    const dataDirectory =
+      this.searchConfig.dataDirectory ??
+      join(workspace.root, DEFAULT_PROJECT_STRUCTURE.data);
+    if (!(await this.trigramIndexEnabled(dataDirectory))) {
+      return { files };
+    }
 
-        if (entry.isDirectory()) {
-          if (recursive) {
-            await walkDir(fullPath);
-          }
-        } else if (entry.isFile()) {
-          // Check file extension
-          if (fileExtensions && fileExtensions.length > 0) {
-            const ext = entry.name.split(".").pop()?.toLowerCase();
-            if (!ext || !fileExtensions.includes(ext)) {
-              continue;
-            }
-          }
+    const trigrams = await getTrigramIndex(workspace.root, dataDirectory);
+    const filesIndexed = await trigrams.sync(
+      await workspace.files(
+        workspace.root,
+        { exclude: this.searchConfig.defaultExcludes },
+        (entry) =>
+          entry.size <= this.searchConfig.maxFileSize! &&
+          !entry.path.startsWith(dataDirectory + sep),
+      ),
+    );
 
-          // Check include patterns
-          if (
-            !includePatterns ||
-            includePatterns.length === 0 ||
-            this.matchesPattern(relativePath, includePatterns)
-          ) {
-            // Check file size
-            try {
-              const stats = await fs.stat(fullPath);
-              if (stats.size <= this.searchConfig.maxFileSize!) {
-                files.push(fullPath);
-              }
-            } catch {
-              // Skip files we can't stat
-            }
-          }
-        }
-      }
+    const candidates = trigrams.candidates(query)!;
+    return {
+      files: files.filter((file) => candidates.has(file.path)),
+      index: {
+        candidateFiles: files.length,
+        filesIndexed,
+        indexTimeMs: Date.now() - startTime,
+      },
     };
-
-    await walkDir(directory);
-    return files;
   }
 
   /**
-   * Check if path matches any pattern
+   * Whether to use the trigram index: as configured, else only in
+   * initialized projects (whose data directory's parent exists)
    */
-  private matchesPattern(path: string, patterns?: string[]): boolean {
-    if (!patterns || patterns.length === 0) {
+  private async trigramIndexEnabled(dataDirectory: string): Promise<boolean> {
+    if (this.searchConfig.trigramIndex !== undefined) {
+      return this.searchConfig.trigramIndex;
+    }
+    try {
+      return (await fs.stat(dirname(dataDirectory))).isDirectory();
+    } catch {
       return false;
     }
-
-    const normalizedPath = path.replace(/\\/g, "/");
-
-    return patterns.some((pattern) => {
-      const normalizedPattern = pattern.replace(/\\/g, "/");
-      const regexPattern = normalizedPattern
-        .replace(/\./g, "\\.")
-        .replace(/\*/g, ".*")
-        .replace(/\?/g, ".");
-
-      return new RegExp(`^${regexPattern}$`).test(normalizedPath);
-    });
   }
 
   /**
    * Search a single file
+   *
+   * Files at or above the worker threshold are read and matched on a
+   * worker thread when one is available.
    */
   private async searchFile(
-    filePath: string,
+    entry: WorkspaceEntry,
     regex: RegExp,
     contextBefore: number,
     contextAfter: number,
     maxMatches: number,
     baseDir: string,
   ): Promise<SearchMatch[]> {
-    try {
-      const content = await fs.readFile(filePath, "utf8");
-      const lines = content.split("\n");
-      const matches: SearchMatch[] = [];
-      const relativePath = relative(baseDir, filePath);
-
-      for (let i = 0; i < lines.length; i++) {
-        if (matches.length >= maxMatches) {
-          break;
-        }
-
-        const line = lines[i];
-        const lineMatches = Array.from(line.matchAll(regex));
+    if (maxMatches <= 0) {
+      return [];
+    }
 
-        for (const match of lineMatches) {
-          if (matches.length >= maxMatches) {
-            break;
-          }
+    try {
+      let lineMatches: LineMatch[] | null = null;
+
+      const pool = getScanWorkerPool();
+      if (
+        entry.size >= this.searchConfig.workerThreshold! &&
+        pool.isAvailable()
+      ) {
+        lineMatches = await pool
+          .matchFile(entry.path, regex, contextBefore, contextAfter, maxMatches)
+          .catch(() => null);
+      }
 
-          const column = (match.index ?? 0) + 1;
-          const contextBeforeLines =
-            contextBefore > 0
-              ? lines.slice(Math.max(0, i - contextBefore), i)
-              : undefined;
-          const contextAfterLines =
-            contextAfter > 0
-              ? lines.slice(i + 1, i + 1 + contextAfter)
-              : undefined;
-
-          matches.push({
-            file: relativePath,
-            line: i + 1,
-            column,
-            match: match[0],
-            lineContent: line,
-            contextBefore: contextBeforeLines,
-            contextAfter: contextAfterLines,
-          });
-        }
+      if (!lineMatches) {
+        const content = await fs.readFile(entry.path, "utf8");
+        lineMatches = matchLines(
+          content,
+          regex,
+          contextBefore,
+          contextAfter,
+          maxMatches,
+        );
       }
 
-      return matches;
+      const relativePath = relative(baseDir, entry.path);
+      return lineMatches.map((match) => ({ file: relativePath, ...match }));
     } catch (error) {
       // Skip files we can't read (binary, permissions, etc.)
       return [];
@@ -7,13 +7,21 @@
  * - Read entire file or specific line ranges
  * - Encoding support (utf8, base64, etc.)
  * - File existence validation
- * - Size limits for safety
+ * - Size limits for safety (full reads; ranged reads are limited by the
+ *   size of the range)
+ * - Line ranges are located by a newline scan and read without loading
+ *   the rest of the file, with line offsets cached per file
  * - Binary file detection
  */
 
 import { promises as fs } from "fs";
 import { resolve, isAbsolute } from "path";
 import { BaseTool, type BaseToolConfig } from "../BaseTool.js";
+import {
+  locateLines,
+  readRange,
+  supportsLineRanges,
+} from "../utils/LineReader.js";
 import type { ToolDefinition } from "../../../core/types/llm.types.js";
 import type {
   ToolContext,
@@ -35,6 +43,9 @@ export interface FileReadToolConfig extends BaseToolConfig {
 
   /** Whether to allow absolute paths */
   allowAbsolutePaths?: boolean;
+
+  /** Cache line offsets of files read by line range (default: true) */
+  lineIndex?: boolean;
 }
 
 /**
@@ -103,6 +114,7 @@ export class FileReadTool extends BaseTool {
       defaultEncoding: config.defaultEncoding || "utf8",
       baseDirectory: config.baseDirectory,
       allowAbsolutePaths: config.allowAbsolutePaths !== false,
+      lineIndex: config.lineIndex !== false,
     };
   }
 
@@ -249,61 +261,86 @@ export class FileReadTool extends BaseTool {
         return this.error(`Path is not a file: ${typedArgs.path}`);
       }
 
-      // Check file size
-      if (stats.size > this.fileConfig.maxFileSize!) {
-        return this.error(
-          `File size (${stats.size} bytes) exceeds maximum allowed size (${this.fileConfig.maxFileSize} bytes)`,
-        );
-      }
-
-      // Read file
       const encoding = (typedArgs.encoding ||
         this.fileConfig.defaultEncoding) as BufferEncoding;
-      let content = await fs.readFile(filePath, encoding);
-
-      // Handle line-based reading
-      if (
-        typedArgs.startLine !== undefined ||
-        typedArgs.endLine !== undefined
-      ) {
-        const lines = content.split("\n");
-        const startIdx = (typedArgs.startLine || 1) - 1;
-        const endIdx = typedArgs.endLine ? typedArgs.endLine : lines.length;
-
-        // Validate line ranges
-        if (startIdx >= lines.length) {
+      const ranged =
+        typedArgs.startLine !== undefined || typedArgs.endLine !== undefined;
+
+      let content: string;
+      let lineCount: number;
+      let bytesRead: number;
+
+      if (ranged && supportsLineRanges(encoding)) {
+        // Read only the requested lines
+        const startLine = typedArgs.startLine || 1;
+        const range = await locateLines(
+          filePath,
+          stats,
+          startLine,
+          typedArgs.endLine,
+          { cache: this.fileConfig.lineIndex },
+        );
+
+        if (range.start === null) {
           return this.error(
-            `startLine (${typedArgs.startLine}) exceeds file length (${lines.length} lines)`,
+            `startLine (${typedArgs.startLine}) exceeds file length (${range.totalLines} lines)`,
           );
         }
 
-        const selectedLines = lines.slice(startIdx, endIdx);
-
-        // Add line numbers if requested
-        if (typedArgs.includeLineNumbers) {
-          const lineNumberWidth = String(endIdx).length;
-          content = selectedLines
-            .map((line, idx) => {
-              const lineNum = String(startIdx + idx + 1).padStart(
-                lineNumberWidth,
-                " ",
-              );
-              return `${lineNum} | ${line}`;
-            })
-            .join("\n");
+        bytesRead = range.end - range.start;
+        if (bytesRead > this.fileConfig.maxFileSize!) {
+          return this.error(
+            `Requested lines (${bytesRead} bytes) exceed maximum allowed size (${this.fileConfig.maxFileSize} bytes)`,
+          );
+        }
+
+        const lines = (
+          await readRange(filePath, range.start, range.end, encoding)
+        ).split("\n");
+        // Without endLine the range runs to the last line of the file
+        const lastLine = typedArgs.endLine ?? startLine - 1 + lines.length;
+
+        content = typedArgs.includeLineNumbers
+          ? this.numberLines(lines, startLine, lastLine)
+          : lines.join("\n");
+        lineCount = lines.length;
+      } else {
+        // Check file size
+        if (stats.size > this.fileConfig.maxFileSize!) {
+          return this.error(
+            `File size (${stats.size} bytes) exceeds maximum allowed size (${this.fileConfig.maxFileSize} bytes)`,
+          );
+        }
+
+        // Read file
+        content = await fs.readFile(filePath, encoding);
+        bytesRead = stats.size;
+
+        if (ranged) {
+          const lines = content.split("\n");
+          const startIdx = (typedArgs.startLine || 1) - 1;
+          const endIdx = typedArgs.endLine ? typedArgs.endLine : lines.length;
+
+          // Validate line ranges
+          if (startIdx >= lines.length) {
+            return this.error(
+              `startLine (${typedArgs.startLine}) exceeds file length (${lines.length} lines)`,
+            );
+          }
+
+          const selectedLines = lines.slice(startIdx, endIdx);
+          content = typedArgs.includeLineNumbers
+            ? this.numberLines(selectedLines, startIdx + 1, endIdx)
+            : selectedLines.join("\n");
+          lineCount = selectedLines.length;
+        } else if (typedArgs.includeLineNumbers) {
+          // Add line numbers to entire file
+          const lines = content.split("\n");
+          content = this.numberLines(lines, 1, lines.length);
+          lineCount = lines.length;
         } else {
-          content = selectedLines.join("\n");
+          lineCount = this.countLines(content);
         }
-      } else if (typedArgs.includeLineNumbers) {
-        // Add line numbers to entire file
-        const lines = content.split("\n");
-        const lineNumberWidth = String(lines.length).length;
-        content = lines
-          .map((line, idx) => {
-            const lineNum = String(idx + 1).padStart(lineNumberWidth, " ");
-            return `${lineNum} | ${line}`;
-          })
-          .join("\n");
       }
 
       // Build result
@@ -313,19 +350,18 @@ export class FileReadTool extends BaseTool {
 
       // Add metadata if requested
       if (typedArgs.includeMetadata) {
-        const lines = content.split("\n");
         result.metadata = {
           path: filePath,
           size: stats.size,
           modified: stats.mtime,
-          lines: lines.length,
+          lines: lineCount,
           encoding,
         };
       }
 
       return this.success(result, {
-        bytesRead: stats.size,
-        linesRead: content.split("\n").length,
+        bytesRead,
+        linesRead: lineCount,
       });
     } catch (error) {
       const message = error instanceof Error ? error.message : String(error);
@@ -333,6 +369,37 @@ export class FileReadTool extends BaseTool {
     }
   }
 
+  /**
+   * Prefix lines with right-aligned line numbers
+   *
+   * @param firstLine - Number of the first line
+   * @param widestLine - Line number that sets the column width
+   */
+  private numberLines(
+    lines: string[],
+    firstLine: number,
+    widestLine: number,
+  ): string {
+    const lineNumberWidth = String(widestLine).length;
+    return lines
+      .map((line, idx) => {
+        const lineNum = String(firstLine + idx).padStart(lineNumberWidth, " ");
+        return `${lineNum} | ${line}`;
+      })
+      .join("\n");
+  }
+
+  /**
+   * Number of lines in text (as `text.split("\n").length`)
+   */
+  private countLines(text: string): number {
+    let count = 1;
+    for (let i = text.indexOf("\n"); i !== -1; i = text.indexOf("\n", i + 1)) {
+      count++;
+    }
+    return count;
+  }
+
   /**
    * Resolve file path
    */
@@ -13,11 +13,14 @@
  * - Exclude patterns
  * - Depth limiting
  * - Symbolic link handling
+ * - Served from the shared workspace index (honors .gitignore)
  */
 
 import { promises as fs } from "fs";
-import { resolve, relative, join, basename, extname } from "path";
+import { resolve, extname } from "path";
 import { BaseTool, type BaseToolConfig } from "../BaseTool.js";
+import { compileGlob } from "../utils/Glob.js";
+import { getWorkspaceIndex } from "../utils/WorkspaceIndex.js";
 import type { ToolDefinition } from "../../../core/types/llm.types.js";
 import type {
   ToolContext,
@@ -408,9 +411,11 @@ export class FileSearchTool extends BaseTool {
         ? new Date(typedArgs.modifiedBefore)
         : undefined;
 
-      // Search for files
+      // Filters
+      const { minSize, maxSize, extensions } = typedArgs;
+
+      // Search the workspace index
       const entries: FileSearchEntry[] = [];
-      let directoriesSearched = 0;
       let filesScanned = 0;
       let truncated = false;
       const matchesByType: Record<string, number> = {
@@ -419,32 +424,60 @@ export class FileSearchTool extends BaseTool {
         symlink: 0,
       };
 
-      await this.searchDirectory(
+      const nameRegex = compileGlob(typedArgs.pattern, caseSensitive);
+      const index = getWorkspaceIndex(
         searchDir,
+        this.searchConfig.baseDirectory,
+      );
+
+      const directoriesSearched = await index.walk(
         searchDir,
-        typedArgs.pattern,
-        caseSensitive,
-        fileType,
-        excludePatterns,
-        includeHidden,
-        fullPaths,
-        0,
-        maxDepth,
-        maxResults,
-        typedArgs.minSize,
-        typedArgs.maxSize,
-        modifiedAfter,
-        modifiedBefore,
-        typedArgs.extensions,
-        entries,
-        (type) => {
-          if (type === "directory") directoriesSearched++;
-          else filesScanned++;
+        {
+          maxDepth,
+          exclude: excludePatterns,
+          includeHidden,
+          includeSymlinks: this.searchConfig.followSymlinks,
         },
-        () => {
-          truncated = true;
+        (entry) => {
+          if (entry.type === "file") filesScanned++;
+
+          // Check file type filter and name pattern
+          if (fileType !== "all" && entry.type !== fileType) return;
+          if (!nameRegex.test(entry.name)) return;
+
+          // Apply filters for files
+          if (entry.type === "file") {
+            if (minSize !== undefined && entry.size < minSize) return;
+            if (maxSize !== undefined && entry.size > maxSize) return;
+            if (modifiedAfter && entry.mtimeMs < modifiedAfter.getTime()) {
+              return;
+            }
+            if (modifiedBefore && entry.mtimeMs > modifiedBefore.getTime()) {
+              return;
+            }
+            if (extensions && extensions.length > 0) {
+              const ext = extname(entry.name).slice(1).toLowerCase();
+              if (!extensions.includes(ext)) return;
+            }
+          }
+
+          if (entries.length >= maxResults) {
+            truncated = true;
+            return false;
+          }
+
+          entries.push({
+            path: fullPaths ? entry.path : entry.relativePath,
+            name: entry.name,
+            type: entry.type,
+            size: entry.size,
+            modified: new Date(entry.mtimeMs),
+            extension:
+              entry.type === "file" ? extname(entry.name).slice(1) : undefined,
+            depth: entry.depth,
+          });
+          matchesByType[entry.type]++;
         },
-        matchesByType,
       );
 
       const searchTimeMs = Date.now() - startTime;
@@ -484,264 +517,6 @@ export class FileSearchTool extends BaseTool {
     }
   }
 
-  /**
-   * Search directory recursively
-   */
-  private async searchDirectory(
-    directory: string,
-    baseDir: string,
-    pattern: string,
-    caseSensitive: boolean,
-    fileType: string,
-    excludePatterns: string[],
-    includeHidden: boolean,
-    fullPaths: boolean,
-    currentDepth: number,
-    maxDepth: number,
-    maxResults: number,
-    minSize: number | undefined,
-    maxSize: number | undefined,
-    modifiedAfter: Date | undefined,
-    modifiedBefore: Date | undefined,
-    extensions: string[] | undefined,
-    results: FileSearchEntry[],
-    onScan: (type: "file" | "directory") => void,
-    onTruncate: () => void,
-    matchesByType: Record<string, number>,
-  ): Promise<void> {
-    // Check if we've reached max results
-    if (results.length >= maxResults) {
-      onTruncate();
-      return;
-    }
-
-    // Check depth limit
-    if (currentDepth > maxDepth) {
-      return;
-    }
-
-    try {
-      const entries = await fs.readdir(directory, { withFileTypes: true });
-      onScan("directory");
-
-      for (const entry of entries) {
-        // Check if we've reached max results
-        if (results.length >= maxResults) {
-          onTruncate();
-          return;
-        }
-
-        const fullPath = join(directory, entry.name);
-        const relativePath = relative(baseDir, fullPath);
-
-        // Skip hidden files if not included
-        if (!includeHidden && entry.name.startsWith(".")) {
-          continue;
-        }
-
-        // Check exclude patterns
-        if (this.matchesPattern(relativePath, excludePatterns)) {
-          continue;
-        }
-
-        // Get entry type
-        let entryType: "file" | "directory" | "symlink";
-        if (entry.isSymbolicLink()) {
-          if (!this.searchConfig.followSymlinks) {
-            continue;
-          }
-          entryType = "symlink";
-        } else if (entry.isDirectory()) {
-          entryType = "directory";
-        } else {
-          entryType = "file";
-          onScan("file");
-        }
-
-        // Check file type filter
-        if (fileType !== "all" && entryType !== fileType) {
-          if (entry.isDirectory()) {
-            // Still recurse into directories
-            await this.searchDirectory(
-              fullPath,
-              baseDir,
-              pattern,
-              caseSensitive,
-              fileType,
-              excludePatterns,
-              includeHidden,
-              fullPaths,
-              currentDepth + 1,
-              maxDepth,
-              maxResults,
-              minSize,
-              maxSize,
-              modifiedAfter,
-              modifiedBefore,
-              extensions,
-              results,
-              onScan,
-              onTruncate,
-              matchesByType,
-            );
-          }
-          continue;
-        }
-
-        // Check if name matches pattern
-        if (!this.matchesSearchPattern(entry.name, pattern, caseSensitive)) {
-          // Still recurse into directories
-          if (entry.isDirectory()) {
-            await this.searchDirectory(
-              fullPath,
-              baseDir,
-              pattern,
-              caseSensitive,
-              fileType,
-              excludePatterns,
-              includeHidden,
-              fullPaths,
-              currentDepth + 1,
-              maxDepth,
-              maxResults,
-              minSize,
-              maxSize,
-              modifiedAfter,
-              modifiedBefore,
-              extensions,
-              results,
-              onScan,
-              onTruncate,
-              matchesByType,
-            );
-          }
-          continue;
-        }
-
-        // Get file stats
-        let stats;
-        try {
-          stats = await fs.stat(fullPath);
-        } catch {
-          continue; // Skip files we can't stat
-        }
-
-        // Apply filters for files
-        if (entryType === "file") {
-          // Size filter
-          if (minSize !== undefined && stats.size < minSize) {
-            continue;
-          }
-          if (maxSize !== undefined && stats.size > maxSize) {
-            continue;
-          }
-
-          // Modified date filter
-          if (modifiedAfter && stats.mtime < modifiedAfter) {
-            continue;
-          }
-          if (modifiedBefore && stats.mtime > modifiedBefore) {
-            continue;
-          }
-
-          // Extension filter
-          if (extensions && extensions.length > 0) {
-            const ext = extname(entry.name).slice(1).toLowerCase();
-            if (!extensions.includes(ext)) {
-              continue;
-            }
-          }
-        }
-
-        // Add to results
-        const extension =
-          entryType === "file" ? extname(entry.name).slice(1) : undefined;
-        results.push({
-          path: fullPaths ? fullPath : relativePath,
-          name: entry.name,
-          type: entryType,
-          size: stats.size,
-          modified: stats.mtime,
-          extension,
-          depth: currentDepth,
-        });
-        matchesByType[entryType]++;
-
-        // Recurse into directories
-        if (entry.isDirectory()) {
-          await this.searchDirectory(
-            fullPath,
-            baseDir,
-            pattern,
-            caseSensitive,
-            fileType,
-            excludePatterns,
-            includeHidden,
-            fullPaths,
-            currentDepth + 1,
-            maxDepth,
-            maxResults,
-            minSize,
-            maxSize,
-            modifiedAfter,
-            modifiedBefore,
-            extensions,
-            results,
-            onScan,
-            onTruncate,
-            matchesByType,
-          );
-        }
-      }
-    } catch (error) {
-      // Skip directories we can't read
-      return;
-    }
-  }
-
-  /**
-   * Check if name matches search pattern
-   */
-  private matchesSearchPattern(
-    name: string,
-    pattern: string,
-    caseSensitive: boolean,
-  ): boolean {
-    const normalizedName = caseSensitive ? name : name.toLowerCase();
-    const normalizedPattern = caseSensitive ? pattern : pattern.toLowerCase();
-
-    // Convert glob pattern to regex
-    const regexPattern = normalizedPattern
-      .replace(/\./g, "\\.")
-      .replace(/\*/g, ".*")
-      .replace(/\?/g, ".");
-
-    return new RegExp(`^${regexPattern}$`).test(normalizedName);
-  }
-
-  /**
-   * Check if path matches any pattern
-   */
-  private matchesPattern(path: string, patterns: string[]): boolean {
-    if (patterns.length === 0) {
-      return false;
-    }
-
-    const normalizedPath = path.replace(/\\/g, "/");
-
-    return patterns.some((pattern) => {
-      const normalizedPattern = pattern.replace(/\\/g, "/");
-      const regexPattern = normalizedPattern
-        .replace(/\./g, "\\.")
-        .replace(/\*\*/g, "<<<DOUBLESTAR>>>")
-        .replace(/\*/g, "[^/]*")
-        .replace(/<<<DOUBLESTAR>>>/g, ".*")
-        .replace(/\?/g, ".");
-
-      return new RegExp(`^${regexPattern}$`).test(normalizedPath);
-    });
-  }
-
   /**
    * Get tool statistics
    */
@@ -148,6 +148,8 @@ export class GitCommitTool extends BaseTool {
         tags: ["git", "version-control", "commit", "vcs"],
         version: "1.0.0",
         author: "Nocturne Labs",
+        requiresConfirmation: true,
+        hasSideEffects: true,
       },
       {
         timeout: config?.timeout || 30000,
@@ -13,11 +13,23 @@
  * - Line number and context reporting
  * - Signature extraction
  * - Documentation extraction
+ * - Candidate files come from the shared workspace index (honors .gitignore)
+ * - Per-file symbol table keyed by size and mtime: only changed files are
+ *   re-extracted, and lookups by name, prefix and kind go through an index
+ *   (persisted in the configured database, or the project database in
+ *   initialized projects)
  */
 
 import { promises as fs } from "fs";
-import { resolve, relative, join, extname } from "path";
+import { resolve, relative, extname } from "path";
 import { BaseTool, type BaseToolConfig } from "../BaseTool.js";
+import {
+  getWorkspaceIndex,
+  type WorkspaceEntry,
+} from "../utils/WorkspaceIndex.js";
+import { SymbolIndex, type SymbolRecord } from "../utils/SymbolIndex.js";
+import type { DatabaseWrapper } from "../../storage/Database.js";
+import { getProjectDatabase } from "../../storage/ProjectDatabase.js";
 import type { ToolDefinition } from "../../../core/types/llm.types.js";
 import type {
   ToolContext,
@@ -43,6 +55,16 @@ export interface SymbolSearchToolConfig extends BaseToolConfig {
 
   /** Supported file extensions by language */
   supportedExtensions?: string[];
+
+  /**
+   * Database with the symbol index tables (migration 005). Defaults to the
+   * project database when the searched workspace is an initialized
+   * project; otherwise the index lives in memory for the life of the tool.
+   */
+  database?: DatabaseWrapper;
+
+  /** Files read at once while indexing (default: 16) */
+  scanConcurrency?: number;
 }
 
 /**
@@ -65,6 +87,9 @@ export interface SymbolSearchArgs {
   /** Symbol name to search for */
   name: string;
 
+  /** Match symbols whose name starts with `name` */
+  prefix?: boolean;
+
   /** Directory to search in */
   directory?: string;
 
@@ -134,6 +159,20 @@ export interface SymbolDefinition {
   parent?: string;
 }
 
+/**
+ * Symbol index statistics for one search
+ */
+export interface SymbolSearchIndexStatistics {
+  /** Files (re-)extracted because they were new or changed */
+  filesIndexed: number;
+
+  /** Time spent bringing the index up to date */
+  indexTimeMs: number;
+
+  /** Whether the index is stored in the database */
+  persistent: boolean;
+}
+
 /**
  * Symbol Search Result
  */
@@ -158,6 +197,7 @@ export interface SymbolSearchResult {
     searchTimeMs: number;
     matchesByType: Record<string, number>;
     matchesByLanguage: Record<string, number>;
+    index?: SymbolSearchIndexStatistics;
   };
 }
 
@@ -255,11 +295,52 @@ for (const lang in SYMBOL_PATTERNS) {
   patterns.all = allPatterns;
 }
 
+/**
+ * Order in which a line's primary symbol type is detected
+ */
+const DETECTION_ORDER: SymbolType[] = [
+  "function",
+  "class",
+  "interface",
+  "type",
+  "enum",
+  "constant",
+  "variable",
+  "method",
+];
+
+/**
+ * Union of each language's patterns: one test rejects most lines before
+ * the individual patterns are tried
+ */
+const DEFINITION_PREFILTERS: Record<string, RegExp> = {};
+for (const lang in SYMBOL_PATTERNS) {
+  DEFINITION_PREFILTERS[lang] = new RegExp(
+    SYMBOL_PATTERNS[lang].all.map((pattern) => `(?:${pattern.source})`).join("|"),
+  );
+}
+
+/**
+ * Number of occurrences of a character in a string
+ */
+function countChar(text: string, char: string): number {
+  let count = 0;
+  for (
+    let i = text.indexOf(char);
+    i !== -1;
+    i = text.indexOf(char, i + 1)
+  ) {
+    count++;
+  }
+  return count;
+}
+
 /**
  * Symbol Search Tool
  */
 export class SymbolSearchTool extends BaseTool {
   private readonly searchConfig: SymbolSearchToolConfig;
+  private symbolIndexes = new Map<DatabaseWrapper | null, SymbolIndex>();
 
   constructor(config: Partial<SymbolSearchToolConfig> = {}) {
     super(
@@ -321,6 +402,11 @@ export class SymbolSearchTool extends BaseTool {
             type: "string",
             description: "Symbol name to search for (function, class, etc.)",
           },
+          prefix: {
+            type: "boolean",
+            description:
+              "Match symbols whose name starts with name (default: false)",
+          },
           directory: {
             type: "string",
             description: "Directory to search in (default: current directory)",
@@ -403,6 +489,13 @@ export class SymbolSearchTool extends BaseTool {
       return "directory must be a string";
     }
 
+    if (
+      typedArgs.prefix !== undefined &&
+      typeof typedArgs.prefix !== "boolean"
+    ) {
+      return "prefix must be a boolean";
+    }
+
     const validSymbolTypes: Array<SymbolType | "all"> = [
       "function",
       "class",
@@ -498,37 +591,65 @@ export class SymbolSearchTool extends BaseTool {
         fileExtensions,
       );
 
-      // Search for symbols
-      const symbols: SymbolDefinition[] = [];
-      const matchesByType: Record<string, number> = {};
-      const matchesByLanguage: Record<string, number> = {};
-      let truncated = false;
-
-      for (const file of filesToSearch) {
-        if (symbols.length >= maxResults) {
-          truncated = true;
-          break;
-        }
+      // Bring the symbol index up to date (only new or changed files are read)
+      const index = this.getSymbolIndex(searchDir);
+      const indexStart = Date.now();
+      const filesIndexed = await index.sync(
+        filesToSearch,
+        (path, content) =>
+          this.extractSymbols(
+            content.split("\n"),
+            this.getLanguageFromExtension(extname(path).slice(1).toLowerCase()),
+          ),
+        recursive ? searchDir : undefined,
+      );
+      const indexTimeMs = Date.now() - indexStart;
 
-        const fileSymbols = await this.searchFile(
-          file,
-          searchDir,
-          typedArgs.name,
+      // Look up definitions, ordered by file (walk order) then position
+      const order = new Map(
+        filesToSearch.map((entry, i) => [entry.path, i] as const),
+      );
+      const found = index
+        .find({
+          name: typedArgs.name,
+          prefix: typedArgs.prefix === true,
           caseSensitive,
-          symbolType,
-          includeDocumentation,
-          includeSignature,
-          maxResults - symbols.length,
+          kind: symbolType === "all" ? undefined : symbolType,
+          paths: new Set(order.keys()),
+        })
+        .sort(
+          (a, b) =>
+            order.get(a.path)! - order.get(b.path)! ||
+            a.line - b.line ||
+            a.column - b.column,
         );
 
-        for (const symbol of fileSymbols) {
-          symbols.push(symbol);
-          matchesByType[symbol.type] = (matchesByType[symbol.type] ?? 0) + 1;
+      const truncated = found.length > maxResults;
+      const symbols: SymbolDefinition[] = [];
+      const matchesByType: Record<string, number> = {};
+      const matchesByLanguage: Record<string, number> = {};
 
-          const ext = extname(file).slice(1).toLowerCase();
-          const language = this.getLanguageFromExtension(ext);
-          matchesByLanguage[language] = (matchesByLanguage[language] ?? 0) + 1;
-        }
+      for (const symbol of found.slice(0, maxResults)) {
+        symbols.push({
+          name: symbol.name,
+          type: symbol.type as SymbolType,
+          file: relative(searchDir, symbol.path),
+          line: symbol.line,
+          column: symbol.column,
+          signature: includeSignature ? symbol.signature : undefined,
+          documentation: includeDocumentation
+            ? symbol.documentation
+            : undefined,
+          context: symbol.context,
+          visibility: symbol.visibility,
+          exported: symbol.exported,
+          async: symbol.async,
+        });
+        matchesByType[symbol.type] = (matchesByType[symbol.type] ?? 0) + 1;
+
+        const ext = extname(symbol.path).slice(1).toLowerCase();
+        const language = this.getLanguageFromExtension(ext);
+        matchesByLanguage[language] = (matchesByLanguage[language] ?? 0) + 1;
       }
 
       const searchTimeMs = Date.now() - startTime;
@@ -543,6 +664,11 @@ export class SymbolSearchTool extends BaseTool {
           searchTimeMs,
           matchesByType,
           matchesByLanguage,
+          index: {
+            filesIndexed,
+            indexTimeMs,
+            persistent: index.isPersistent(),
+          },
         },
       };
 
@@ -570,194 +696,116 @@ export class SymbolSearchTool extends BaseTool {
   }
 
   /**
-   * Collect files to search
+   * Collect files to search from the workspace index
    */
   private async collectFiles(
     directory: string,
     recursive: boolean,
     excludePatterns: string[],
     fileExtensions: string[],
-  ): Promise<string[]> {
-    const files: string[] = [];
-
-    const walkDir = async (dir: string): Promise<void> => {
-      const entries = await fs.readdir(dir, { withFileTypes: true });
-
-      for (const entry of entries) {
-        const fullPath = join(dir, entry.name);
-        const relativePath = relative(directory, fullPath);
-
-        // Check exclude patterns
-        if (this.matchesPattern(relativePath, excludePatterns)) {
-          continue;
-        }
+  ): Promise<WorkspaceEntry[]> {
+    const index = getWorkspaceIndex(directory, this.searchConfig.baseDirectory);
+    return index.files(
+      directory,
+      { maxDepth: recursive ? undefined : 0, exclude: excludePatterns },
+      (entry) =>
+        fileExtensions.includes(extname(entry.name).slice(1).toLowerCase()) &&
+        entry.size <= this.searchConfig.maxFileSize!,
+    );
+  }
 
-        if (entry.isDirectory()) {
-          if (recursive) {
-            await walkDir(fullPath);
-          }
-        } else if (entry.isFile()) {
-          // Check file extension
-          const ext = extname(entry.name).slice(1).toLowerCase();
-          if (fileExtensions.includes(ext)) {
-            // Check file size
-            try {
-              const stats = await fs.stat(fullPath);
-              if (stats.size <= this.searchConfig.maxFileSize!) {
-                files.push(fullPath);
-              }
-            } catch {
-              // Skip files we can't stat
-            }
-          }
-        }
-      }
-    };
+  /**
+   * Symbol index for a search directory, created on first use
+   *
+   * Stored in the configured database, else in the project database of the
+   * directory's workspace, else in memory.
+   */
+  private getSymbolIndex(directory: string): SymbolIndex {
+    const db =
+      this.searchConfig.database ??
+      getProjectDatabase(
+        getWorkspaceIndex(directory, this.searchConfig.baseDirectory).root,
+      );
 
-    await walkDir(directory);
-    return files;
+    let index = this.symbolIndexes.get(db);
+    if (!index) {
+      index = new SymbolIndex(db, {
+        concurrency: this.searchConfig.scanConcurrency,
+      });
+      this.symbolIndexes.set(db, index);
+    }
+    return index;
   }
 
   /**
-   * Search a single file for symbol definitions
+   * Extract every symbol definition from a file's lines
    */
-  private async searchFile(
-    filePath: string,
-    baseDir: string,
-    symbolName: string,
-    caseSensitive: boolean,
-    symbolType: SymbolType | "all",
-    includeDocumentation: boolean,
-    includeSignature: boolean,
-    maxMatches: number,
-  ): Promise<SymbolDefinition[]> {
-    try {
-      const content = await fs.readFile(filePath, "utf8");
-      const lines = content.split("\n");
-      const symbols: SymbolDefinition[] = [];
-      const relativePath = relative(baseDir, filePath);
+  private extractSymbols(lines: string[], language: string): SymbolRecord[] {
+    const patterns = SYMBOL_PATTERNS[language];
+    if (!patterns) {
+      return [];
+    }
 
-      // Determine language
-      const ext = extname(filePath).slice(1).toLowerCase();
-      const language = this.getLanguageFromExtension(ext);
-      const patterns = SYMBOL_PATTERNS[language];
+    const prefilter = DEFINITION_PREFILTERS[language];
+    const symbols: SymbolRecord[] = [];
 
-      if (!patterns) {
-        return [];
-      }
-
-      // Get patterns for the requested symbol type
-      const searchPatterns =
-        symbolType === "all"
-          ? patterns.all
-          : (patterns[symbolType as SymbolType] ?? []);
+    for (let i = 0; i < lines.length; i++) {
+      const line = lines[i];
+      const trimmedLine = line.trim();
 
-      // Search for symbols
-      for (let i = 0; i < lines.length; i++) {
-        if (symbols.length >= maxMatches) {
-          break;
-        }
+      if (!prefilter.test(trimmedLine)) {
+        continue;
+      }
 
-        const line = lines[i];
-        const trimmedLine = line.trim();
+      // Names defined on this line, with every type that defines them;
+      // the line's primary type is the first type in detection order
+      const kindsByName = new Map<string, SymbolType[]>();
+      let detectedType: SymbolType | undefined;
 
-        // Try each pattern
-        for (const pattern of searchPatterns) {
+      for (const type of DETECTION_ORDER) {
+        for (const pattern of patterns[type]) {
           const match = trimmedLine.match(pattern);
-          if (match && match[1]) {
-            const matchedName = match[1];
-
-            // Check if name matches
-            const nameMatches = caseSensitive
-              ? matchedName === symbolName
-              : matchedName.toLowerCase() === symbolName.toLowerCase();
-
-            if (!nameMatches) {
-              continue;
-            }
-
-            // Determine symbol type from pattern
-            const detectedType = this.detectSymbolType(
-              trimmedLine,
-              language,
-              patterns,
-            );
-
-            // Extract additional information
-            const visibility = this.extractVisibility(trimmedLine);
-            const isExported = trimmedLine.includes("export");
-            const isAsync = trimmedLine.includes("async");
-
-            // Extract documentation
-            let documentation: string | undefined;
-            if (includeDocumentation) {
-              documentation = this.extractDocumentation(lines, i);
-            }
-
-            // Extract signature
-            let signature: string | undefined;
-            if (includeSignature) {
-              signature = this.extractSignature(lines, i, language);
-            }
-
-            // Extract context
-            const context = this.extractContext(lines, i);
-
-            symbols.push({
-              name: matchedName,
-              type: detectedType,
-              file: relativePath,
-              line: i + 1,
-              column: line.indexOf(matchedName) + 1,
-              signature,
-              documentation,
-              context,
-              visibility,
-              exported: isExported,
-              async: isAsync,
-            });
-
-            if (symbols.length >= maxMatches) {
-              break;
-            }
+          if (!match || !match[1]) {
+            continue;
+          }
+
+          detectedType ??= type;
+          const kinds = kindsByName.get(match[1]);
+          if (!kinds) {
+            kindsByName.set(match[1], [type]);
+          } else if (!kinds.includes(type)) {
+            kinds.push(type);
           }
         }
       }
 
-      return symbols;
-    } catch (error) {
-      // Skip files we can't read
-      return [];
-    }
-  }
-
-  /**
-   * Detect symbol type from line content
-   */
-  private detectSymbolType(
-    line: string,
-    language: string,
-    patterns: Record<SymbolType | "all", RegExp[]>,
-  ): SymbolType {
-    const types: SymbolType[] = [
-      "function",
-      "class",
-      "interface",
-      "type",
-      "enum",
-      "constant",
-      "variable",
-      "method",
-    ];
+      if (!detectedType) {
+        continue;
+      }
 
-    for (const type of types) {
-      const typePatterns = patterns[type];
-      if (typePatterns.some((p) => p.test(line))) {
-        return type;
+      const visibility = this.extractVisibility(trimmedLine);
+      const documentation = this.extractDocumentation(lines, i);
+      const signature = this.extractSignature(lines, i, language);
+      const context = this.extractContext(lines, i);
+
+      for (const [name, kinds] of kindsByName) {
+        symbols.push({
+          name,
+          type: detectedType,
+          kinds,
+          line: i + 1,
+          column: line.indexOf(name) + 1,
+          signature,
+          documentation,
+          context,
+          visibility,
+          exported: trimmedLine.includes("export"),
+          async: trimmedLine.includes("async"),
+        });
       }
     }
 
-    return "function"; // Default
+    return symbols;
   }
 
   /**
@@ -848,14 +896,9 @@ export class SymbolSearchTool extends BaseTool {
       signatureLines.push(line);
 
       // Count braces
-      for (const char of line) {
-        if (char === "{") {
-          braceCount++;
-          foundOpening = true;
-        } else if (char === "}") {
-          braceCount--;
-        }
-      }
+      const opening = countChar(line, "{");
+      braceCount += opening - countChar(line, "}");
+      foundOpening ||= opening > 0;
 
       // Stop at semicolon (interface/type) or opening brace
       if (line.includes(";") || (foundOpening && braceCount > 0)) {
@@ -902,29 +945,6 @@ export class SymbolSearchTool extends BaseTool {
     return languageMap[ext] ?? "javascript";
   }
 
-  /**
-   * Check if path matches any pattern
-   */
-  private matchesPattern(path: string, patterns: string[]): boolean {
-    if (patterns.length === 0) {
-      return false;
-    }
-
-    const normalizedPath = path.replace(/\\/g, "/");
-
-    return patterns.some((pattern) => {
-      const normalizedPattern = pattern.replace(/\\/g, "/");
-      const regexPattern = normalizedPattern
-        .replace(/\./g, "\\.")
-        .replace(/\*\*/g, "<<<DOUBLESTAR>>>")
-        .replace(/\*/g, "[^/]*")
-        .replace(/<<<DOUBLESTAR>>>/g, ".*")
-        .replace(/\?/g, ".");
-
-      return new RegExp(`^${regexPattern}$`).test(normalizedPath);
-    });
-  }
-
   /**
    * Get tool statistics
    */
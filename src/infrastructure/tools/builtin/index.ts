@@ -129,6 +129,7 @@ export type {
   CodeSearchToolConfig,
   CodeSearchArgs,
   CodeSearchResult,
+  CodeSearchIndexStatistics,
   SearchMatch,
 } from "./CodeSearchTool.js";
 export type {
@@ -143,4 +144,5 @@ export type {
   SymbolSearchResult,
   SymbolDefinition,
   SymbolType,
+  SymbolSearchIndexStatistics,
 } from "./SymbolSearchTool.js";
@@ -13,6 +13,59 @@ export { ToolRegistry, createToolRegistry } from "./registry/index.js";
 // Re-export built-in tools
 export * from "./builtin/index.js";
 
+// Re-export the shared workspace index
+export {
+  WorkspaceIndex,
+  getWorkspaceIndex,
+  invalidateWorkspacePaths,
+  closeWorkspaceIndexes,
+} from "./utils/WorkspaceIndex.js";
+export type {
+  WorkspaceEntry,
+  WorkspaceEntryType,
+  WorkspaceWalkOptions,
+  WorkspaceIndexOptions,
+  WorkspaceIndexStats,
+} from "./utils/WorkspaceIndex.js";
+export { compileGlob, matchesGlob, matchesAnyGlob } from "./utils/Glob.js";
+export {
+  TrigramIndex,
+  getTrigramIndex,
+  regexTrigramQuery,
+  extractTrigrams,
+} from "./utils/TrigramIndex.js";
+export type { TrigramQuery, TrigramIndexStats } from "./utils/TrigramIndex.js";
+export { SymbolIndex } from "./utils/SymbolIndex.js";
+export type {
+  SymbolRecord,
+  IndexedSymbol,
+  SymbolQuery,
+  SymbolExtractor,
+  SymbolIndexStats,
+  SymbolIndexOptions,
+} from "./utils/SymbolIndex.js";
+export {
+  scanInOrder,
+  matchLines,
+  ScanWorkerPool,
+  getScanWorkerPool,
+  closeScanWorkerPool,
+  DEFAULT_SCAN_CONCURRENCY,
+} from "./utils/FileScanner.js";
+export type {
+  LineMatch,
+  ScanResult,
+  ScanWorkerPoolConfig,
+} from "./utils/FileScanner.js";
+export {
+  locateLines,
+  readRange,
+  supportsLineRanges,
+  clearLineIndexes,
+  LINE_INDEX_STRIDE,
+} from "./utils/LineReader.js";
+export type { LineRange, LocateLinesOptions } from "./utils/LineReader.js";
+
 // Re-export interfaces and types
 export type {
   ITool,
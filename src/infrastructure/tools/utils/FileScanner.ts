@@ -0,0 +1,268 @@
+/**
+ * FileScanner
+ *
+ * Scanning engine for the search tools: reads and matches many files with
+ * a bounded number in flight, hands results back in input order, and moves
+ * CPU-bound regex matching of large files onto worker threads.
+ *
+ * Features:
+ * - Sliding-window concurrency: a slow file never stalls the others, and at
+ *   most `concurrency` files are read ahead of the consumer
+ * - Deterministic order: results are yielded in input order regardless of
+ *   completion order
+ * - Early stop: breaking out of the iteration launches no further files
+ * - Lazily spawned worker pool for large files; workers are unref'd while
+ *   idle, so they never hold the process open, and a worker failure
+ *   disables the pool so matching stays on the calling thread
+ */
+
+import { availableParallelism } from "os";
+import { WorkerPool } from "../../utils/WorkerPool.js";
+
+/**
+ * Regex match within a file
+ */
+export interface LineMatch {
+  /** Line number (1-based) */
+  line: number;
+
+  /** Column number (1-based) */
+  column: number;
+
+  /** Matched text */
+  match: string;
+
+  /** Full line content */
+  lineContent: string;
+
+  /** Context lines before */
+  contextBefore?: string[];
+
+  /** Context lines after */
+  contextAfter?: string[];
+}
+
+/**
+ * Result of scanning one input
+ */
+export interface ScanResult<TItem, TResult> {
+  item: TItem;
+  index: number;
+  result: TResult;
+}
+
+/**
+ * Scan worker pool configuration
+ */
+export interface ScanWorkerPoolConfig {
+  /** Maximum worker threads (0 = always on the calling thread) */
+  workers: number;
+}
+
+interface MatchPayload {
+  path: string;
+  source: string;
+  flags: string;
+  contextBefore: number;
+  contextAfter: number;
+  maxMatches: number;
+}
+
+/**
+ * Files read and matched at once by default
+ */
+export const DEFAULT_SCAN_CONCURRENCY = 16;
+
+/**
+ * Match a regex against every line of a file's content
+ *
+ * Self-contained (no outer references): its source is also run inside
+ * worker threads. The regex needs the global flag.
+ */
+export function matchLines(
+  content: string,
+  regex: RegExp,
+  contextBefore: number,
+  contextAfter: number,
+  maxMatches: number,
+): LineMatch[] {
+  const lines = content.split("\n");
+  const matches: LineMatch[] = [];
+
+  for (let i = 0; i < lines.length && matches.length < maxMatches; i++) {
+    const line = lines[i];
+
+    for (const match of line.matchAll(regex)) {
+      if (matches.length >= maxMatches) {
+        break;
+      }
+
+      matches.push({
+        line: i + 1,
+        column: (match.index ?? 0) + 1,
+        match: match[0],
+        lineContent: line,
+        contextBefore:
+          contextBefore > 0
+            ? lines.slice(Math.max(0, i - contextBefore), i)
+            : undefined,
+        contextAfter:
+          contextAfter > 0 ? lines.slice(i + 1, i + 1 + contextAfter) : undefined,
+      });
+    }
+  }
+
+  return matches;
+}
+
+const WORKER_SOURCE = `
+const { parentPort } = require("worker_threads");
+const { readFile } = require("fs/promises");
+const matchLines = ${matchLines.toString()};
+parentPort.on("message", async (task) => {
+  try {
+    const content = await readFile(task.path, "utf8");
+    const matches = matchLines(
+      content,
+      new RegExp(task.source, task.flags),
+      task.contextBefore,
+      task.contextAfter,
+      task.maxMatches,
+    );
+    parentPort.postMessage({ id: task.id, result: matches });
+  } catch (error) {
+    parentPort.postMessage({
+      id: task.id,
+      error: error && error.message ? error.message : String(error),
+    });
+  }
+});
+`;
+
+/**
+ * Scan items with bounded concurrency, yielding results in input order
+ *
+ * Up to `concurrency` scans run at once; the next one starts as soon as
+ * a slot frees up and the consumer has not fallen more than `concurrency`
+ * results behind. Breaking out of the loop stops launching new scans.
+ *
+ * @example
+ * ```typescript
+ * for await (const { item, result } of scanInOrder(files, searchFile, 16)) {
+ *   matches.push(...result);
+ *   if (matches.length >= maxMatches) break;
+ * }
+ * ```
+ */
+export async function* scanInOrder<TItem, TResult>(
+  items: readonly TItem[],
+  scan: (item: TItem, index: number) => Promise<TResult>,
+  concurrency = DEFAULT_SCAN_CONCURRENCY,
+): AsyncGenerator<ScanResult<TItem, TResult>> {
+  const limit = Math.max(1, Math.floor(concurrency));
+  const pending = new Map<number, Promise<TResult>>();
+  let launched = 0;
+
+  const launch = (): void => {
+    while (launched < items.length && pending.size < limit) {
+      const index = launched++;
+      const promise = scan(items[index], index);
+      // Results of scans abandoned by an early stop are never awaited
+      promise.catch(() => undefined);
+      pending.set(index, promise);
+    }
+  };
+
+  for (let index = 0; index < items.length; index++) {
+    launch();
+    const result = await pending.get(index)!;
+    pending.delete(index);
+    yield { item: items[index], index, result };
+  }
+}
+
+/**
+ * ScanWorkerPool - regex matching of large files on worker threads
+ */
+export class ScanWorkerPool {
+  private static readonly DEFAULT_CONFIG: ScanWorkerPoolConfig = {
+    workers: Math.max(0, Math.min(4, availableParallelism() - 1)),
+  };
+
+  private config: ScanWorkerPoolConfig;
+  private pool: WorkerPool<MatchPayload, LineMatch[]>;
+
+  constructor(config: Partial<ScanWorkerPoolConfig> = {}) {
+    this.config = { ...ScanWorkerPool.DEFAULT_CONFIG, ...config };
+    this.pool = new WorkerPool({
+      name: "ScanWorkerPool",
+      source: WORKER_SOURCE,
+      workers: this.config.workers,
+    });
+  }
+
+  /**
+   * Whether matching can run on worker threads
+   *
+   * False once the pool is closed or a worker has failed.
+   */
+  isAvailable(): boolean {
+    return this.pool.isAvailable();
+  }
+
+  /**
+   * Read a file and match a regex against it on a worker thread
+   *
+   * Rejects if no worker can run the task; callers fall back to
+   * `matchLines` on their own thread.
+   */
+  matchFile(
+    path: string,
+    regex: RegExp,
+    contextBefore: number,
+    contextAfter: number,
+    maxMatches: number,
+  ): Promise<LineMatch[]> {
+    return this.pool.run({
+      path,
+      source: regex.source,
+      flags: regex.flags,
+      contextBefore,
+      contextAfter,
+      maxMatches,
+    });
+  }
+
+  /**
+   * Get pool statistics
+   */
+  getStats(): { workers: number; busy: number; queued: number } {
+    return this.pool.getStats();
+  }
+
+  /**
+   * Terminate all workers and reject queued tasks
+   */
+  async close(): Promise<void> {
+    await this.pool.close();
+  }
+}
+
+let sharedPool: ScanWorkerPool | null = null;
+
+/**
+ * Worker pool shared by the search tools
+ */
+export function getScanWorkerPool(): ScanWorkerPool {
+  sharedPool ??= new ScanWorkerPool();
+  return sharedPool;
+}
+
+/**
+ * Terminate the shared worker pool (a new one is created on next use)
+ */
+export async function closeScanWorkerPool(): Promise<void> {
+  const pool = sharedPool;
+  sharedPool = null;
+  await pool?.close();
+}
@@ -0,0 +1,164 @@
+/**
+ * Glob
+ *
+ * Glob-to-RegExp compilation shared by the search tools and the workspace
+ * index. Compiled patterns are cached, so matching a pattern against many
+ * paths builds its RegExp once.
+ *
+ * Syntax:
+ * - `*` matches within a path segment, `?` one character of a segment
+ * - `**` matches across segments; a leading `**` segment also matches
+ *   zero segments
+ * - `[abc]`, `[!abc]` character classes, `{a,b}` alternatives
+ *
+ * Patterns without a `/` are matched against the entry name, so `*.ts` or
+ * `node_modules` apply at any depth; patterns with a `/` are matched against
+ * the whole relative path.
+ */
+
+const REGEX_SPECIAL = /[.+^$()|\\]/;
+
+/** Compiled patterns, keyed by flags and pattern */
+const cache = new Map<string, RegExp>();
+const MAX_CACHED_PATTERNS = 1000;
+
+/**
+ * Translate a glob into a RegExp source (without anchors)
+ */
+function globSource(glob: string): string {
+  let source = "";
+
+  for (let i = 0; i < glob.length; i++) {
+    const char = glob[i];
+
+    if (char === "*") {
+      if (glob[i + 1] === "*") {
+        const segmentStart = i === 0 || glob[i - 1] === "/";
+        i++;
+        if (segmentStart && glob[i + 1] === "/") {
+          // "**/" - any number of leading segments, including none
+          source += "(?:.*/)?";
+          i++;
+        } else {
+          source += ".*";
+        }
+      } else {
+        source += "[^/]*";
+      }
+    } else if (char === "?") {
+      source += "[^/]";
+    } else if (char === "[") {
+      const close = glob.indexOf("]", i + 2);
+      if (close === -1) {
+        source += "\\[";
+        continue;
+      }
+      let body = glob.slice(i + 1, close).replace(/\\/g, "\\\\");
+      if (body.startsWith("!")) {
+        body = "^" + body.slice(1);
+      }
+      source += `[${body}]`;
+      i = close;
+    } else if (char === "{") {
+      const close = glob.indexOf("}", i);
+      if (close === -1) {
+        source += "\\{";
+        continue;
+      }
+      const alternatives = glob.slice(i + 1, close).split(",").map(globSource);
+      source += `(?:${alternatives.join("|")})`;
+      i = close;
+    } else if (REGEX_SPECIAL.test(char)) {
+      source += "\\" + char;
+    } else {
+      source += char;
+    }
+  }
+
+  return source;
+}
+
+/**
+ * Normalize a pattern or path to forward slashes without a leading "./"
+ */
+function normalize(value: string): string {
+  const normalized = value.replace(/\\/g, "/");
+  return normalized.startsWith("./") ? normalized.slice(2) : normalized;
+}
+
+/**
+ * Compile a glob into an anchored RegExp (cached)
+ *
+ * @param pattern - Glob pattern
+ * @param caseSensitive - Whether matching is case-sensitive (default: true)
+ */
+export function compileGlob(pattern: string, caseSensitive = true): RegExp {
+  const key = (caseSensitive ? "s:" : "i:") + pattern;
+  let regex = cache.get(key);
+
+  if (!regex) {
+    if (cache.size >= MAX_CACHED_PATTERNS) {
+      cache.clear();
+    }
+    regex = new RegExp(
+      `^${globSource(normalize(pattern))}$`,
+      caseSensitive ? "" : "i",
+    );
+    cache.set(key, regex);
+  }
+
+  return regex;
+}
+
+/**
+ * Whether a relative path matches a glob
+ *
+ * @param relativePath - Path relative to the search root
+ * @param pattern - Glob pattern
+ * @param isDirectory - A directory also matches patterns that match its
+ *   contents (`dist/**` matches `dist`), so excludes prune whole subtrees
+ * @param caseSensitive - Whether matching is case-sensitive (default: true)
+ */
+export function matchesGlob(
+  relativePath: string,
+  pattern: string,
+  isDirectory = false,
+  caseSensitive = true,
+): boolean {
+  const path = normalize(relativePath);
+  const normalizedPattern = normalize(pattern);
+  const trimmed = normalizedPattern.endsWith("/")
+    ? normalizedPattern.slice(0, -1)
+    : normalizedPattern;
+
+  // "dir/" only matches directories
+  if (trimmed !== normalizedPattern && !isDirectory) {
+    return false;
+  }
+
+  const regex = compileGlob(trimmed, caseSensitive);
+
+  if (!trimmed.includes("/")) {
+    const slash = path.lastIndexOf("/");
+    return regex.test(slash === -1 ? path : path.slice(slash + 1));
+  }
+
+  return regex.test(path) || (isDirectory && regex.test(path + "/"));
+}
+
+/**
+ * Whether a relative path matches any of the globs
+ */
+export function matchesAnyGlob(
+  relativePath: string,
+  patterns: readonly string[] | undefined,
+  isDirectory = false,
+  caseSensitive = true,
+): boolean {
+  if (!patterns || patterns.length === 0) {
+    return false;
+  }
+  return patterns.some((pattern) =>
+    matchesGlob(relativePath, pattern, isDirectory, caseSensitive),
+  );
+}
@@ -0,0 +1,275 @@
+/**
+ * LineReader
+ *
+ * Ranged line reads for large files: finds the byte offsets of a line
+ * range by scanning for newlines, then reads and decodes only that range.
+ * Reading lines 10-20 of a 50MB log touches the first few kilobytes.
+ *
+ * Features:
+ * - Chunked newline scan; skipped lines are never decoded or split
+ * - Per-file line-offset index (a checkpoint every LINE_INDEX_STRIDE lines)
+ *   cached by size and mtime, so paging through a file resumes from the
+ *   nearest checkpoint instead of the start
+ * - Lines are split on "\n" exactly like `content.split("\n")`, so ranged
+ *   and full reads agree (a trailing "\r" stays part of the line)
+ *
+ * Only byte-compatible encodings (where "\n" is always the byte 0x0A) can
+ * be located this way; see `supportsLineRanges`.
+ */
+
+import { promises as fs } from "fs";
+
+/**
+ * Byte offsets of a line range
+ */
+export interface LineRange {
+  /** Offset of the first byte of the start line (null if past the end) */
+  start: number | null;
+
+  /** Offset just past the end line, excluding its newline */
+  end: number;
+
+  /** Lines in the file, when the scan reached the end */
+  totalLines: number | null;
+}
+
+/**
+ * Options for locating a line range
+ */
+export interface LocateLinesOptions {
+  /** Use and extend the cached line-offset index (default: true) */
+  cache?: boolean;
+}
+
+interface LineIndex {
+  size: number;
+  mtimeMs: number;
+  /** checkpoints[k] = offset of line k * LINE_INDEX_STRIDE + 1 */
+  checkpoints: number[];
+  /** Furthest line whose start offset is known */
+  frontierLine: number;
+  frontierOffset: number;
+  totalLines: number | null;
+}
+
+/**
+ * Lines between cached offset checkpoints
+ */
+export const LINE_INDEX_STRIDE = 1000;
+
+const SCAN_CHUNK_SIZE = 64 * 1024;
+const MAX_INDEXED_FILES = 64;
+const NEWLINE = 0x0a;
+
+const LINE_ENCODINGS = new Set<BufferEncoding>([
+  "utf8",
+  "utf-8",
+  "ascii",
+  "latin1",
+  "binary",
+]);
+
+/** Line-offset indexes by path, least recently used first */
+const indexes = new Map<string, LineIndex>();
+
+/**
+ * Whether lines can be located by byte offset in this encoding
+ */
+export function supportsLineRanges(encoding: BufferEncoding): boolean {
+  return LINE_ENCODINGS.has(encoding);
+}
+
+/**
+ * Find the byte range of lines `startLine`..`endLine` (1-based, inclusive)
+ *
+ * Without `endLine` the range extends to the end of the file. A range
+ * whose end lies past the last line is clamped to the end of the file.
+ *
+ * @param stats - Current size and mtime of the file (validates the cache)
+ */
+export async function locateLines(
+  path: string,
+  stats: { size: number; mtimeMs: number },
+  startLine: number,
+  endLine?: number,
+  options: LocateLinesOptions = {},
+): Promise<LineRange> {
+  const index = getLineIndex(path, stats, options.cache !== false);
+  const handle = await fs.open(path, "r");
+
+  try {
+    const start = await findLineStart(handle, index, startLine);
+    if (start === null) {
+      return { start: null, end: stats.size, totalLines: index.totalLines };
+    }
+
+    let end = stats.size;
+    if (endLine !== undefined) {
+      const next = await findLineStart(handle, index, endLine + 1);
+      if (next !== null) {
+        end = next - 1; // Drop the newline that ends `endLine`
+      }
+    }
+
+    return { start, end, totalLines: index.totalLines };
+  } finally {
+    await handle.close();
+  }
+}
+
+/**
+ * Read and decode a byte range of a file
+ */
+export async function readRange(
+  path: string,
+  start: number,
+  end: number,
+  encoding: BufferEncoding,
+): Promise<string> {
+  const length = Math.max(0, end - start);
+  if (length === 0) {
+    return "";
+  }
+
+  const handle = await fs.open(path, "r");
+  try {
+    const buffer = Buffer.allocUnsafe(length);
+    let filled = 0;
+    while (filled < length) {
+      const { bytesRead } = await handle.read(
+        buffer,
+        filled,
+        length - filled,
+        start + filled,
+      );
+      if (bytesRead === 0) break;
+      filled += bytesRead;
+    }
+    return buffer.toString(encoding, 0, filled);
+  } finally {
+    await handle.close();
+  }
+}
+
+/**
+ * Drop cached line-offset indexes
+ *
+ * @param paths - Files to forget (default: all)
+ */
+export function clearLineIndexes(paths?: string[]): void {
+  if (!paths) {
+    indexes.clear();
+    return;
+  }
+  for (const path of paths) {
+    indexes.delete(path);
+  }
+}
+
+/**
+ * Cached index for a file, or a fresh one if the file changed
+ */
+function getLineIndex(
+  path: string,
+  stats: { size: number; mtimeMs: number },
+  useCache: boolean,
+): LineIndex {
+  const cached = useCache ? indexes.get(path) : undefined;
+  if (
+    cached &&
+    cached.size === stats.size &&
+    cached.mtimeMs === stats.mtimeMs
+  ) {
+    // Refresh LRU position
+    indexes.delete(path);
+    indexes.set(path, cached);
+    return cached;
+  }
+
+  const index: LineIndex = {
+    size: stats.size,
+    mtimeMs: stats.mtimeMs,
+    checkpoints: [0],
+    frontierLine: 1,
+    frontierOffset: 0,
+    totalLines: null,
+  };
+
+  if (useCache) {
+    indexes.delete(path);
+    if (indexes.size >= MAX_INDEXED_FILES) {
+      indexes.delete(indexes.keys().next().value!);
+    }
+    indexes.set(path, index);
+  }
+  return index;
+}
+
+/**
+ * Byte offset where a line starts, scanning from the nearest known line
+ *
+ * @returns null if the file has fewer lines (the index then knows
+ *   `totalLines`)
+ */
+async function findLineStart(
+  handle: fs.FileHandle,
+  index: LineIndex,
+  target: number,
+): Promise<number | null> {
+  if (index.totalLines !== null && target > index.totalLines) {
+    return null;
+  }
+
+  let line: number;
+  let offset: number;
+  if (target <= index.frontierLine) {
+    const checkpoint = Math.floor((target - 1) / LINE_INDEX_STRIDE);
+    line = checkpoint * LINE_INDEX_STRIDE + 1;
+    offset = index.checkpoints[checkpoint];
+  } else {
+    line = index.frontierLine;
+    offset = index.frontierOffset;
+  }
+
+  if (line === target) {
+    return offset;
+  }
+
+  const buffer = Buffer.allocUnsafe(SCAN_CHUNK_SIZE);
+  let position = offset;
+
+  while (position < index.size) {
+    const { bytesRead } = await handle.read(
+      buffer,
+      0,
+      Math.min(SCAN_CHUNK_SIZE, index.size - position),
+      position,
+    );
+    if (bytesRead === 0) break;
+
+    let i = buffer.indexOf(NEWLINE, 0);
+    while (i !== -1 && i < bytesRead) {
+      line++;
+      offset = position + i + 1;
+
+      if (line > index.frontierLine) {
+        index.frontierLine = line;
+        index.frontierOffset = offset;
+        if ((line - 1) % LINE_INDEX_STRIDE === 0) {
+          index.checkpoints.push(offset);
+        }
+      }
+
+      if (line === target) {
+        return offset;
+      }
+      i = buffer.indexOf(NEWLINE, i + 1);
+    }
+
+    position += bytesRead;
+  }
+
+  // Reached the end: the last line starts after the final newline
+  index.totalLines = line;
+  return null;
+}
@@ -0,0 +1,535 @@
+/**
+ * SymbolIndex
+ *
+ * Per-file symbol table used by SymbolSearchTool, so "where is X defined"
+ * queries are answered from an index instead of re-reading and re-matching
+ * every candidate file.
+ *
+ * Features:
+ * - Files are keyed by path plus size and mtime; only new or changed files
+ *   are read and re-extracted
+ * - Lookups by exact name, name prefix and kind go through the
+ *   `symbols` table indexes (migration 005)
+ * - Persists in the application database when one is provided; otherwise
+ *   the table is kept in memory for the life of the process
+ * - Indexed files that disappeared from a synced directory are pruned
+ * - Changed files are read with bounded concurrency and stored in batches
+ */
+
+import { promises as fs } from "fs";
+import { sep } from "path";
+import type { DatabaseWrapper } from "../../storage/Database.js";
+import type { WorkspaceEntry } from "./WorkspaceIndex.js";
+import { DEFAULT_SCAN_CONCURRENCY, scanInOrder } from "./FileScanner.js";
+
+/**
+ * Symbol extracted from a file
+ */
+export interface SymbolRecord {
+  /** Symbol name */
+  name: string;
+
+  /** Primary kind (function, class, ...) */
+  type: string;
+
+  /** Every kind whose patterns define this name on the line */
+  kinds: string[];
+
+  /** Line number (1-based) */
+  line: number;
+
+  /** Column number (1-based) */
+  column: number;
+
+  /** Full signature/definition */
+  signature?: string;
+
+  /** Documentation/comments */
+  documentation?: string;
+
+  /** Context lines around the definition */
+  context: string[];
+
+  /** Visibility/access modifier */
+  visibility?: string;
+
+  /** Whether the symbol is exported */
+  exported: boolean;
+
+  /** Whether the symbol is async */
+  async: boolean;
+}
+
+/**
+ * Symbol with the file it is defined in
+ */
+export interface IndexedSymbol extends SymbolRecord {
+  /** Absolute file path */
+  path: string;
+}
+
+/**
+ * Symbol lookup
+ */
+export interface SymbolQuery {
+  /** Symbol name, or name prefix when `prefix` is set */
+  name: string;
+
+  /** Match names starting with `name` (default: false) */
+  prefix?: boolean;
+
+  /** Whether the name comparison is case-sensitive (default: true) */
+  caseSensitive?: boolean;
+
+  /** Only symbols defined as this kind (default: any) */
+  kind?: string;
+
+  /** Only symbols in these files (default: any indexed file) */
+  paths?: ReadonlySet<string>;
+}
+
+/**
+ * Extracts the symbols of one file
+ */
+export type SymbolExtractor = (path: string, content: string) => SymbolRecord[];
+
+/**
+ * Index statistics
+ */
+export interface SymbolIndexStats {
+  files: number;
+  symbols: number;
+  persistent: boolean;
+}
+
+interface FileState {
+  size: number;
+  mtimeMs: number;
+}
+
+interface MemoryFile extends FileState {
+  symbols: IndexedSymbol[];
+}
+
+interface SymbolRow {
+  file_path: string;
+  name: string;
+  kind: string;
+  type: string;
+  line_number: number;
+  column_number: number;
+  signature: string | null;
+  documentation: string | null;
+  context: string | null;
+  visibility: string | null;
+  exported: number;
+  is_async: number;
+}
+
+/**
+ * Symbol index options
+ */
+export interface SymbolIndexOptions {
+  /** Files read at once while syncing (default: 16) */
+  concurrency?: number;
+}
+
+/**
+ * Re-extracted files written per transaction
+ */
+const STORE_BATCH_SIZE = 64;
+
+const SYMBOL_COLUMNS = [
+  "file_path",
+  "name",
+  "name_lower",
+  "kind",
+  "type",
+  "line_number",
+  "column_number",
+  "signature",
+  "documentation",
+  "context",
+  "visibility",
+  "exported",
+  "is_async",
+];
+
+/**
+ * SymbolIndex - symbol definitions by file, name and kind
+ *
+ * @example
+ * ```typescript
+ * const index = new SymbolIndex(db);
+ * await index.sync(entries, extractSymbols, directory);
+ * const symbols = index.find({ name: "ToolExecutor", kind: "class" });
+ * ```
+ */
+export class SymbolIndex {
+  private readonly db: DatabaseWrapper | null;
+  private readonly concurrency: number;
+  private files = new Map<string, FileState>();
+  private memoryFiles = new Map<string, MemoryFile>();
+  private names = new Map<string, Set<IndexedSymbol>>();
+  private syncing: Promise<void> = Promise.resolve();
+
+  /**
+   * @param db - Database with the symbol tables (null keeps the index in memory)
+   */
+  constructor(
+    db: DatabaseWrapper | null = null,
+    options: SymbolIndexOptions = {},
+  ) {
+    this.db = db;
+    this.concurrency = options.concurrency ?? DEFAULT_SCAN_CONCURRENCY;
+
+    if (db) {
+      for (const row of db.query<{
+        path: string;
+        size: number;
+        mtime_ms: number;
+      }>("SELECT path, size, mtime_ms FROM symbol_files")) {
+        this.files.set(row.path, { size: row.size, mtimeMs: row.mtime_ms });
+      }
+    }
+  }
+
+  /**
+   * Bring the index up to date with a file listing
+   *
+   * New files and files whose size or mtime changed are read and passed to
+   * `extract`. Indexed files below `directory` that are missing from the
+   * listing are dropped if they no longer exist; files that were merely
+   * filtered out of this listing are kept for other queries.
+   *
+   * @returns Number of files read
+   */
+  sync(
+    entries: WorkspaceEntry[],
+    extract: SymbolExtractor,
+    directory?: string,
+  ): Promise<number> {
+    const run = this.syncing.then(() =>
+      this.syncNow(entries, extract, directory),
+    );
+    this.syncing = run.then(
+      () => undefined,
+      () => undefined,
+    );
+    return run;
+  }
+
+  /**
+   * Find symbol definitions
+   *
+   * Results are grouped per definition (one entry per file, line and name)
+   * in no particular order.
+   */
+  find(query: SymbolQuery): IndexedSymbol[] {
+    const lower = query.name.toLowerCase();
+    const caseSensitive = query.caseSensitive !== false;
+    const candidates = this.db
+      ? this.findRows(lower, query)
+      : this.findInMemory(lower, query);
+
+    return candidates.filter(
+      (symbol) =>
+        (!query.paths || query.paths.has(symbol.path)) &&
+        (!caseSensitive ||
+          (query.prefix
+            ? symbol.name.startsWith(query.name)
+            : symbol.name === query.name)),
+    );
+  }
+
+  /**
+   * Drop files from the index
+   */
+  remove(paths: Iterable<string>): void {
+    const removed = [...paths].filter((path) => this.files.has(path));
+    if (removed.length === 0) return;
+
+    if (this.db) {
+      this.db.transaction((db) => {
+        for (const path of removed) {
+          db.execute("DELETE FROM symbols WHERE file_path = ?", [path]);
+          db.execute("DELETE FROM symbol_files WHERE path = ?", [path]);
+        }
+      });
+    }
+
+    for (const path of removed) {
+      this.files.delete(path);
+      this.removeFromMemory(path);
+    }
+  }
+
+  /**
+   * Whether symbols are stored in a database
+   */
+  isPersistent(): boolean {
+    return this.db !== null;
+  }
+
+  /**
+   * Index statistics
+   */
+  getStats(): SymbolIndexStats {
+    let symbols = 0;
+    if (this.db) {
+      symbols =
+        this.db.queryOne<{ count: number }>(
+          "SELECT COUNT(*) AS count FROM symbols",
+        )?.count ?? 0;
+    } else {
+      for (const file of this.memoryFiles.values()) {
+        symbols += file.symbols.length;
+      }
+    }
+
+    return { files: this.files.size, symbols, persistent: this.db !== null };
+  }
+
+  private async syncNow(
+    entries: WorkspaceEntry[],
+    extract: SymbolExtractor,
+    directory?: string,
+  ): Promise<number> {
+    const seen = new Set<string>();
+    const changed: WorkspaceEntry[] = [];
+
+    for (const entry of entries) {
+      seen.add(entry.path);
+      const state = this.files.get(entry.path);
+      if (
+        !state ||
+        state.size !== entry.size ||
+        state.mtimeMs !== entry.mtimeMs
+      ) {
+        changed.push(entry);
+      }
+    }
+
+    if (directory !== undefined) {
+      await this.pruneMissing(directory, seen);
+    }
+
+    let updates: Array<{ entry: WorkspaceEntry; symbols: IndexedSymbol[] }> =
+      [];
+    const reads = scanInOrder(
+      changed,
+      (entry) => fs.readFile(entry.path, "utf8").catch(() => null),
+      this.concurrency,
+    );
+
+    for await (const { item: entry, result: content } of reads) {
+      if (content === null) continue;
+      updates.push({
+        entry,
+        symbols: extract(entry.path, content).map((symbol) => ({
+          ...symbol,
+          path: entry.path,
+        })),
+      });
+
+      if (updates.length >= STORE_BATCH_SIZE) {
+        this.store(updates);
+        updates = [];
+      }
+    }
+    this.store(updates);
+
+    return changed.length;
+  }
+
+  /**
+   * Drop indexed files below a directory that no longer exist
+   */
+  private async pruneMissing(
+    directory: string,
+    seen: Set<string>,
+  ): Promise<void> {
+    const prefix = directory.endsWith(sep) ? directory : directory + sep;
+    const unseen = [...this.files.keys()].filter(
+      (path) => path.startsWith(prefix) && !seen.has(path),
+    );
+    if (unseen.length === 0) return;
+
+    const missing: string[] = [];
+    const checks = scanInOrder(
+      unseen,
+      (path) =>
+        fs.stat(path).then(
+          (stats) => stats.isFile(),
+          () => false,
+        ),
+      this.concurrency,
+    );
+    for await (const { item: path, result: exists } of checks) {
+      if (!exists) missing.push(path);
+    }
+
+    this.remove(missing);
+  }
+
+  /**
+   * Replace the symbols of re-extracted files
+   */
+  private store(
+    updates: Array<{ entry: WorkspaceEntry; symbols: IndexedSymbol[] }>,
+  ): void {
+    if (updates.length === 0) return;
+
+    if (this.db) {
+      const now = Date.now();
+      this.db.transaction((db) => {
+        const rows: unknown[][] = [];
+        for (const { entry, symbols } of updates) {
+          db.execute("DELETE FROM symbols WHERE file_path = ?", [entry.path]);
+          db.execute(
+            `INSERT INTO symbol_files (path, size, mtime_ms, indexed_at)
+             VALUES (?, ?, ?, ?)
+             ON CONFLICT(path) DO UPDATE SET
+               size = excluded.size,
+               mtime_ms = excluded.mtime_ms,
+               indexed_at = excluded.indexed_at`,
+            [entry.path, entry.size, entry.mtimeMs, now],
+          );
+
+          for (const symbol of symbols) {
+            const context = JSON.stringify(symbol.context);
+            for (const kind of symbol.kinds) {
+              rows.push([
+                entry.path,
+                symbol.name,
+                symbol.name.toLowerCase(),
+                kind,
+                symbol.type,
+                symbol.line,
+                symbol.column,
+                symbol.signature ?? null,
+                symbol.documentation ?? null,
+                context,
+                symbol.visibility ?? null,
+                symbol.exported ? 1 : 0,
+                symbol.async ? 1 : 0,
+              ]);
+            }
+          }
+        }
+        db.insertMany("symbols", SYMBOL_COLUMNS, rows);
+      });
+    }
+
+    for (const { entry, symbols } of updates) {
+      this.files.set(entry.path, { size: entry.size, mtimeMs: entry.mtimeMs });
+      if (!this.db) {
+        this.removeFromMemory(entry.path);
+        this.memoryFiles.set(entry.path, {
+          size: entry.size,
+          mtimeMs: entry.mtimeMs,
+          symbols,
+        });
+        for (const symbol of symbols) {
+          const lower = symbol.name.toLowerCase();
+          let set = this.names.get(lower);
+          if (!set) {
+            set = new Set();
+            this.names.set(lower, set);
+          }
+          set.add(symbol);
+        }
+      }
+    }
+  }
+
+  private removeFromMemory(path: string): void {
+    const file = this.memoryFiles.get(path);
+    if (!file) return;
+    this.memoryFiles.delete(path);
+
+    for (const symbol of file.symbols) {
+      const lower = symbol.name.toLowerCase();
+      const set = this.names.get(lower);
+      if (!set) continue;
+      set.delete(symbol);
+      if (set.size === 0) this.names.delete(lower);
+    }
+  }
+
+  private findInMemory(lower: string, query: SymbolQuery): IndexedSymbol[] {
+    const sets: Array<Set<IndexedSymbol>> = [];
+    if (query.prefix) {
+      for (const [name, set] of this.names) {
+        if (name.startsWith(lower)) sets.push(set);
+      }
+    } else {
+      const set = this.names.get(lower);
+      if (set) sets.push(set);
+    }
+
+    const symbols: IndexedSymbol[] = [];
+    for (const set of sets) {
+      for (const symbol of set) {
+        if (!query.kind || symbol.kinds.includes(query.kind)) {
+          symbols.push(symbol);
+        }
+      }
+    }
+    return symbols;
+  }
+
+  private findRows(lower: string, query: SymbolQuery): IndexedSymbol[] {
+    const conditions: string[] = [];
+    const params: unknown[] = [];
+
+    if (query.prefix) {
+      // Range scan on the name index; names are identifiers, so any
+      // continuation sorts below U+FFFF
+      conditions.push("name_lower >= ? AND name_lower < ?");
+      params.push(lower, lower + "\uffff");
+    } else {
+      conditions.push("name_lower = ?");
+      params.push(lower);
+    }
+
+    if (query.kind) {
+      conditions.push("kind = ?");
+      params.push(query.kind);
+    }
+
+    const rows = this.db!.query<SymbolRow>(
+      `SELECT file_path, name, kind, type, line_number, column_number,
+              signature, documentation, context, visibility, exported, is_async
+       FROM symbols
+       WHERE ${conditions.join(" AND ")}`,
+      params,
+    );
+
+    // One row per matching kind; merge them back into one definition
+    const symbols = new Map<string, IndexedSymbol>();
+    for (const row of rows) {
+      const key = `${row.file_path}\0${row.line_number}\0${row.name}`;
+      const existing = symbols.get(key);
+      if (existing) {
+        existing.kinds.push(row.kind);
+        continue;
+      }
+      symbols.set(key, {
+        path: row.file_path,
+        name: row.name,
+        type: row.type,
+        kinds: [row.kind],
+        line: row.line_number,
+        column: row.column_number,
+        signature: row.signature ?? undefined,
+        documentation: row.documentation ?? undefined,
+        context: row.context ? (JSON.parse(row.context) as string[]) : [],
+        visibility: row.visibility ?? undefined,
+        exported: row.exported === 1,
+        async: row.is_async === 1,
+      });
+    }
+    return [...symbols.values()];
+  }
+}
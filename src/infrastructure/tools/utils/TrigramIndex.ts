@@ -0,0 +1,705 @@
+/**
+ * TrigramIndex
+ *
+ * Inverted index from trigrams (three-character substrings) to the files
+ * that contain them, used by CodeSearchTool to narrow a regex search to the
+ * few files that can possibly match before the exact regex runs.
+ *
+ * Features:
+ * - Trigram query extraction from a regex: literal runs become required
+ *   trigrams, alternations become unions; anything the extractor cannot
+ *   reason about imposes no constraint, so results are never missed
+ * - Case-insensitive (ASCII-folded) trigrams serve both search modes
+ * - Incremental sync from file sizes and mtimes; changed and deleted files
+ *   are tombstoned and compacted lazily
+ * - Binary persistence under the project's data directory
+ */
+
+import { promises as fs } from "fs";
+import { dirname, join, relative, sep } from "path";
+import type { WorkspaceEntry } from "./WorkspaceIndex.js";
+import { scanInOrder } from "./FileScanner.js";
+
+/**
+ * Trigram query
+ *
+ * `all` imposes no constraint; `literal` requires every trigram of its text.
+ */
+export type TrigramQuery =
+  | { op: "all" }
+  | { op: "literal"; text: string }
+  | { op: "and"; parts: TrigramQuery[] }
+  | { op: "or"; parts: TrigramQuery[] };
+
+/**
+ * Index statistics
+ */
+export interface TrigramIndexStats {
+  root: string;
+  files: number;
+  trigrams: number;
+  postings: number;
+  deletedFiles: number;
+}
+
+/**
+ * Indexed file
+ */
+interface IndexedFile {
+  path: string;
+  size: number;
+  mtimeMs: number;
+}
+
+/**
+ * File magic for serialized indexes
+ */
+const MAGIC = Buffer.from("NTRGM\u0001", "latin1");
+
+/**
+ * Fraction of tombstoned files that triggers a compaction
+ */
+const COMPACT_RATIO = 0.3;
+
+/**
+ * Files read at once while syncing
+ */
+const SYNC_CONCURRENCY = 32;
+
+/**
+ * Delay before a changed index is written back
+ */
+const SAVE_DELAY_MS = 1000;
+
+const ALL: TrigramQuery = { op: "all" };
+
+/** Indexes by root */
+const indexes = new Map<string, Promise<TrigramIndex>>();
+
+/**
+ * ASCII-lowercase a character code
+ */
+function fold(code: number): number {
+  return code >= 65 && code <= 90 ? code + 32 : code;
+}
+
+/**
+ * Trigram key of three character codes
+ */
+function trigramKey(a: number, b: number, c: number): number {
+  return (a * 65536 + b) * 65536 + c;
+}
+
+/**
+ * Distinct trigrams of a text (lines are indexed separately, so trigrams
+ * spanning a newline are left out)
+ */
+export function extractTrigrams(text: string): Set<number> {
+  const trigrams = new Set<number>();
+  let a = -1;
+  let b = -1;
+
+  for (let i = 0; i < text.length; i++) {
+    const c = fold(text.charCodeAt(i));
+    if (c === 10) {
+      a = b = -1;
+      continue;
+    }
+    if (a !== -1) {
+      trigrams.add(trigramKey(a, b, c));
+    }
+    a = b;
+    b = c;
+  }
+
+  return trigrams;
+}
+
+function literal(text: string): TrigramQuery {
+  return text.length >= 3 ? { op: "literal", text } : ALL;
+}
+
+function and(parts: TrigramQuery[]): TrigramQuery {
+  const required = parts.flatMap((part) =>
+    part.op === "all" ? [] : part.op === "and" ? part.parts : [part],
+  );
+  if (required.length === 0) return ALL;
+  return required.length === 1 ? required[0] : { op: "and", parts: required };
+}
+
+function or(parts: TrigramQuery[]): TrigramQuery {
+  if (parts.some((part) => part.op === "all")) return ALL;
+  return parts.length === 1 ? parts[0] : { op: "or", parts };
+}
+
+/**
+ * Recursive-descent walk over a JavaScript regex, keeping only what is
+ * certain to appear in every match
+ */
+class RegexTrigramParser {
+  private position = 0;
+
+  constructor(private readonly source: string) {}
+
+  parse(): TrigramQuery {
+    const query = this.alternation();
+    // Unbalanced input: make no claims
+    return this.position === this.source.length ? query : ALL;
+  }
+
+  private alternation(): TrigramQuery {
+    const branches = [this.concatenation()];
+    while (this.source[this.position] === "|") {
+      this.position++;
+      branches.push(this.concatenation());
+    }
+    return or(branches);
+  }
+
+  private concatenation(): TrigramQuery {
+    const parts: TrigramQuery[] = [];
+    let run = "";
+    const flush = (): void => {
+      parts.push(literal(run));
+      run = "";
+    };
+
+    while (
+      this.position < this.source.length &&
+      this.source[this.position] !== "|" &&
+      this.source[this.position] !== ")"
+    ) {
+      const atom = this.atom();
+      const quantifier = this.quantifier();
+
+      if (typeof atom === "string") {
+        if (quantifier === "optional") {
+          flush();
+        } else {
+          run += atom;
+          // A repeated character is still adjacent to what precedes it,
+          // but not necessarily to what follows
+          if (quantifier === "repeat") flush();
+        }
+        continue;
+      }
+
+      flush();
+      if (quantifier !== "optional") {
+        parts.push(atom);
+      }
+    }
+
+    flush();
+    return and(parts);
+  }
+
+  /**
+   * One atom: a folded literal character, or the query of a group
+   */
+  private atom(): string | TrigramQuery {
+    const source = this.source;
+    const char = source[this.position++];
+
+    switch (char) {
+      case "(": {
+        let lookaround = false;
+        if (source[this.position] === "?") {
+          const rest = source.slice(this.position, this.position + 3);
+          if (rest.startsWith("?:")) {
+            this.position += 2;
+          } else if (/^\?<?[=!]/.test(rest)) {
+            lookaround = true;
+            this.position += rest[1] === "<" ? 3 : 2;
+          } else if (rest.startsWith("?<")) {
+            this.position = source.indexOf(">", this.position) + 1 || source.length;
+          }
+        }
+        const query = this.alternation();
+        if (source[this.position] === ")") this.position++;
+        return lookaround ? ALL : query;
+      }
+
+      case "[": {
+        // Character classes are not expanded
+        let i = this.position;
+        if (source[i] === "^") i++;
+        if (source[i] === "]") i++;
+        while (i < source.length && source[i] !== "]") {
+          i += source[i] === "\\" ? 2 : 1;
+        }
+        this.position = i + 1;
+        return ALL;
+      }
+
+      case "\\": {
+        const next = source[this.position++] ?? "";
+        if (/[\w]/.test(next)) {
+          // Class escapes, anchors, backreferences, control and code point
+          // escapes: skip their payload
+          const payload = /^(?:x[0-9a-fA-F]{2}|u\{[0-9a-fA-F]+\}|u[0-9a-fA-F]{4}|[pP]\{[^}]*\}|k<[^>]*>|c[a-zA-Z]|\d+)/.exec(
+            source.slice(this.position - 1),
+          );
+          if (payload) this.position += payload[0].length - 1;
+          return ALL;
+        }
+        return this.literalChar(next);
+      }
+
+      case ".":
+      case "^":
+      case "$":
+      case "*":
+      case "+":
+      case "?":
+        return ALL;
+
+      default:
+        return this.literalChar(char);
+    }
+  }
+
+  private literalChar(char: string): string | TrigramQuery {
+    const code = char.charCodeAt(0);
+    // Non-ASCII letters may case-fold in ways the index does not
+    if (code > 127 || code === 10) return ALL;
+    return String.fromCharCode(fold(code));
+  }
+
+  private quantifier(): "none" | "optional" | "repeat" {
+    const source = this.source;
+    const char = source[this.position];
+    let result: "none" | "optional" | "repeat" = "none";
+
+    if (char === "*" || char === "?") {
+      this.position++;
+      result = "optional";
+    } else if (char === "+") {
+      this.position++;
+      result = "repeat";
+    } else if (char === "{") {
+      const match = /^\{(\d+)(,\d*)?\}/.exec(source.slice(this.position));
+      if (match) {
+        this.position += match[0].length;
+        result = Number(match[1]) === 0 ? "optional" : "repeat";
+      }
+    }
+
+    // Lazy modifier
+    if (result !== "none" && source[this.position] === "?") {
+      this.position++;
+    }
+    return result;
+  }
+}
+
+/**
+ * Trigrams every match of a regex must contain
+ *
+ * @param pattern - JavaScript regex source
+ * @returns Query over trigrams; `{ op: "all" }` when nothing is required
+ */
+export function regexTrigramQuery(pattern: string): TrigramQuery {
+  try {
+    return new RegexTrigramParser(pattern).parse();
+  } catch {
+    return ALL;
+  }
+}
+
+/**
+ * Intersect sorted id lists
+ */
+function intersect(a: number[], b: number[]): number[] {
+  const result: number[] = [];
+  let i = 0;
+  let j = 0;
+  while (i < a.length && j < b.length) {
+    if (a[i] === b[j]) {
+      result.push(a[i]);
+      i++;
+      j++;
+    } else if (a[i] < b[j]) {
+      i++;
+    } else {
+      j++;
+    }
+  }
+  return result;
+}
+
+/**
+ * TrigramIndex - trigram postings for the files below a root
+ *
+ * @example
+ * ```typescript
+ * const index = await getTrigramIndex(root, dataDirectory);
+ * await index.sync(files);
+ * const candidates = index.candidates(regexTrigramQuery("handle(Request|Reply)"));
+ * ```
+ */
+export class TrigramIndex {
+  readonly root: string;
+  private readonly file: string | null;
+  private files: Array<IndexedFile | null> = [];
+  private ids = new Map<string, number>();
+  private postings = new Map<number, number[]>();
+  private deletedCount = 0;
+  private syncing: Promise<void> = Promise.resolve();
+  private saveTimer: NodeJS.Timeout | null = null;
+
+  /**
+   * @param root - Directory the indexed paths are relative to
+   * @param file - Where the index is persisted (null keeps it in memory)
+   */
+  constructor(root: string, file: string | null = null) {
+    this.root = root;
+    this.file = file;
+  }
+
+  /**
+   * Load a persisted index, or start an empty one if the file is missing,
+   * corrupt or belongs to another root
+   */
+  static async load(root: string, file: string): Promise<TrigramIndex> {
+    const index = new TrigramIndex(root, file);
+    try {
+      index.restore(await fs.readFile(file));
+    } catch {
+      // Rebuilt by the next sync
+      index.files = [];
+      index.ids.clear();
+      index.postings.clear();
+      index.deletedCount = 0;
+    }
+    return index;
+  }
+
+  /**
+   * Bring the index up to date with a file listing
+   *
+   * New files and files whose size or mtime changed are (re-)read;
+   * indexed files missing from the listing are dropped.
+   *
+   * @returns Number of files read
+   */
+  sync(entries: WorkspaceEntry[]): Promise<number> {
+    const run = this.syncing.then(() => this.syncNow(entries));
+    this.syncing = run.then(
+      () => undefined,
+      () => undefined,
+    );
+    return run;
+  }
+
+  /**
+   * Files that may match a query
+   *
+   * @returns Absolute paths, or null if the query imposes no constraint
+   */
+  candidates(query: TrigramQuery): Set<string> | null {
+    const ids = this.evaluate(query);
+    if (ids === null) return null;
+
+    const paths = new Set<string>();
+    for (const id of ids) {
+      const file = this.files[id];
+      if (file) paths.add(join(this.root, file.path));
+    }
+    return paths;
+  }
+
+  /**
+   * Index statistics
+   */
+  getStats(): TrigramIndexStats {
+    let postings = 0;
+    for (const ids of this.postings.values()) postings += ids.length;
+    return {
+      root: this.root,
+      files: this.ids.size,
+      trigrams: this.postings.size,
+      postings,
+      deletedFiles: this.deletedCount,
+    };
+  }
+
+  /**
+   * Write the index to its file now
+   */
+  async save(): Promise<void> {
+    if (this.saveTimer) {
+      clearTimeout(this.saveTimer);
+      this.saveTimer = null;
+    }
+    if (!this.file) return;
+
+    await fs.mkdir(dirname(this.file), { recursive: true });
+    const temporary = `${this.file}.${process.pid}.tmp`;
+    await fs.writeFile(temporary, this.serialize());
+    await fs.rename(temporary, this.file);
+  }
+
+  private async syncNow(entries: WorkspaceEntry[]): Promise<number> {
+    const seen = new Set<string>();
+    const changed: Array<{ key: string; entry: WorkspaceEntry }> = [];
+
+    for (const entry of entries) {
+      const key = this.key(entry.path);
+      seen.add(key);
+      const id = this.ids.get(key);
+      if (id !== undefined) {
+        const file = this.files[id]!;
+        if (file.size === entry.size && file.mtimeMs === entry.mtimeMs) {
+          continue;
+        }
+        this.remove(key);
+      }
+      changed.push({ key, entry });
+    }
+
+    let removed = 0;
+    for (const key of [...this.ids.keys()]) {
+      if (!seen.has(key)) {
+        this.remove(key);
+        removed++;
+      }
+    }
+
+    const reads = scanInOrder(
+      changed,
+      ({ entry }) => fs.readFile(entry.path, "utf8").catch(() => null),
+      SYNC_CONCURRENCY,
+    );
+    for await (const { item, result: content } of reads) {
+      if (content !== null) {
+        this.add(item.key, item.entry, content);
+      }
+    }
+
+    if (changed.length > 0 || removed > 0) {
+      this.compact();
+      this.scheduleSave();
+    }
+    return changed.length;
+  }
+
+  private add(key: string, entry: WorkspaceEntry, content: string): void {
+    const id = this.files.length;
+    this.files.push({ path: key, size: entry.size, mtimeMs: entry.mtimeMs });
+    this.ids.set(key, id);
+
+    for (const trigram of extractTrigrams(content)) {
+      const ids = this.postings.get(trigram);
+      if (ids) {
+        ids.push(id);
+      } else {
+        this.postings.set(trigram, [id]);
+      }
+    }
+  }
+
+  private remove(key: string): void {
+    const id = this.ids.get(key);
+    if (id === undefined) return;
+    this.ids.delete(key);
+    this.files[id] = null;
+    this.deletedCount++;
+  }
+
+  /**
+   * Renumber live files and drop tombstones once enough have accumulated
+   *
+   * @param force - Drop any tombstones regardless of their share
+   */
+  private compact(force = false): void {
+    const total = this.files.length;
+    if (
+      this.deletedCount === 0 ||
+      (!force && (total < 64 || this.deletedCount < total * COMPACT_RATIO))
+    ) {
+      return;
+    }
+
+    const remap = new Int32Array(total).fill(-1);
+    const files: IndexedFile[] = [];
+    for (let id = 0; id < total; id++) {
+      const file = this.files[id];
+      if (file) {
+        remap[id] = files.length;
+        this.ids.set(file.path, files.length);
+        files.push(file);
+      }
+    }
+
+    for (const [trigram, ids] of this.postings) {
+      const live: number[] = [];
+      for (const id of ids) {
+        if (remap[id] !== -1) live.push(remap[id]);
+      }
+      if (live.length > 0) {
+        this.postings.set(trigram, live);
+      } else {
+        this.postings.delete(trigram);
+      }
+    }
+
+    this.files = files;
+    this.deletedCount = 0;
+  }
+
+  /**
+   * Matching file ids (sorted), or null for no constraint
+   */
+  private evaluate(query: TrigramQuery): number[] | null {
+    switch (query.op) {
+      case "all":
+        return null;
+
+      case "literal": {
+        const lists: number[][] = [];
+        for (const trigram of extractTrigrams(query.text)) {
+          const ids = this.postings.get(trigram);
+          if (!ids) return [];
+          lists.push(ids);
+        }
+        lists.sort((a, b) => a.length - b.length);
+        return lists.reduce(intersect);
+      }
+
+      case "and": {
+        let result: number[] | null = null;
+        for (const part of query.parts) {
+          const ids = this.evaluate(part);
+          if (ids === null) continue;
+          result = result === null ? ids : intersect(result, ids);
+          if (result.length === 0) break;
+        }
+        return result;
+      }
+
+      case "or": {
+        const union = new Set<number>();
+        for (const part of query.parts) {
+          const ids = this.evaluate(part);
+          if (ids === null) return null;
+          for (const id of ids) union.add(id);
+        }
+        return [...union].sort((a, b) => a - b);
+      }
+    }
+  }
+
+  private key(path: string): string {
+    const key = relative(this.root, path);
+    return sep === "/" ? key : key.split(sep).join("/");
+  }
+
+  private scheduleSave(): void {
+    if (!this.file || this.saveTimer) return;
+    this.saveTimer = setTimeout(() => {
+      this.saveTimer = null;
+      this.save().catch(() => {
+        // Best effort: a missing or stale file only costs a re-sync
+      });
+    }, SAVE_DELAY_MS);
+    this.saveTimer.unref?.();
+  }
+
+  /**
+   * Binary layout: magic, header length, JSON header (root and live files),
+   * trigram count, then per trigram its key (float64), id count and ids
+   */
+  private serialize(): Buffer {
+    this.compact(true);
+
+    const header = Buffer.from(
+      JSON.stringify({
+        root: this.root,
+        files: this.files.map((file) => [file!.path, file!.size, file!.mtimeMs]),
+      }),
+      "utf8",
+    );
+
+    let postingWords = 0;
+    for (const ids of this.postings.values()) postingWords += ids.length;
+
+    const buffer = Buffer.allocUnsafe(
+      MAGIC.length + 4 + header.length + 4 + this.postings.size * 12 +
+        postingWords * 4,
+    );
+    let offset = MAGIC.copy(buffer, 0);
+    offset = buffer.writeUInt32LE(header.length, offset);
+    offset += header.copy(buffer, offset);
+    offset = buffer.writeUInt32LE(this.postings.size, offset);
+
+    for (const [trigram, ids] of this.postings) {
+      offset = buffer.writeDoubleLE(trigram, offset);
+      offset = buffer.writeUInt32LE(ids.length, offset);
+      for (const id of ids) {
+        offset = buffer.writeUInt32LE(id, offset);
+      }
+    }
+
+    return buffer;
+  }
+
+  private restore(buffer: Buffer): void {
+    if (
+      buffer.length < MAGIC.length + 4 ||
+      !buffer.subarray(0, MAGIC.length).equals(MAGIC)
+    ) {
+      throw new Error("Invalid trigram index file");
+    }
+
+    let offset = MAGIC.length;
+    const headerLength = buffer.readUInt32LE(offset);
+    offset += 4;
+    const header = JSON.parse(
+      buffer.toString("utf8", offset, offset + headerLength),
+    ) as { root: string; files: Array<[string, number, number]> };
+    offset += headerLength;
+
+    if (header.root !== this.root) {
+      throw new Error("Trigram index belongs to another root");
+    }
+
+    this.files = header.files.map(([path, size, mtimeMs], id) => {
+      this.ids.set(path, id);
+      return { path, size, mtimeMs };
+    });
+
+    const count = buffer.readUInt32LE(offset);
+    offset += 4;
+    for (let i = 0; i < count; i++) {
+      const trigram = buffer.readDoubleLE(offset);
+      const length = buffer.readUInt32LE(offset + 8);
+      offset += 12;
+      const ids = new Array<number>(length);
+      for (let j = 0; j < length; j++) {
+        ids[j] = buffer.readUInt32LE(offset);
+        offset += 4;
+      }
+      this.postings.set(trigram, ids);
+    }
+  }
+}
+
+/**
+ * Get the shared trigram index for a root, loading it from the data
+ * directory on first use
+ *
+ * @param root - Directory whose files are indexed
+ * @param dataDirectory - Directory the index file lives in
+ */
+export function getTrigramIndex(
+  root: string,
+  dataDirectory: string,
+): Promise<TrigramIndex> {
+  let index = indexes.get(root);
+  if (!index) {
+    index = TrigramIndex.load(root, join(dataDirectory, "code-search.trigrams"));
+    indexes.set(root, index);
+  }
+  return index;
+}
@@ -0,0 +1,814 @@
+/**
+ * WorkspaceIndex
+ *
+ * In-memory index of a workspace's file tree, shared by the search tools so
+ * repeated searches do not re-walk the filesystem.
+ *
+ * Features:
+ * - Path trie of directories, files and symlinks with sizes and mtimes
+ * - Honors `.gitignore` files (negation, directory-only and anchored rules);
+ *   ignored subtrees are never read
+ * - Directories are read on first use and then served from memory
+ * - Kept fresh by `fs.watch` (one recursive watcher where the platform
+ *   supports it natively, otherwise one watcher per indexed directory)
+ * - Directories without a working watcher fall back to an mtime sweep
+ * - Explicit invalidation for callers that know what they just changed
+ * - One index per root, shared through getWorkspaceIndex()
+ */
+
+import { promises as fs, watch, type FSWatcher, type Dirent } from "fs";
+import { resolve, relative, join, sep, isAbsolute } from "path";
+import { compileGlob, matchesAnyGlob } from "./Glob.js";
+
+/**
+ * Indexed entry type
+ */
+export type WorkspaceEntryType = "file" | "directory" | "symlink";
+
+/**
+ * Entry reported by a walk
+ */
+export interface WorkspaceEntry {
+  /** Absolute path */
+  path: string;
+
+  /** Path relative to the walked directory ("/"-separated) */
+  relativePath: string;
+
+  /** Entry name */
+  name: string;
+
+  /** Entry type */
+  type: WorkspaceEntryType;
+
+  /** Size in bytes (of the target, for symlinks) */
+  size: number;
+
+  /** Last modification time (ms since epoch) */
+  mtimeMs: number;
+
+  /** Depth below the walked directory (0 = direct child) */
+  depth: number;
+}
+
+/**
+ * Walk options
+ */
+export interface WorkspaceWalkOptions {
+  /** Maximum depth to report (0 = direct children only, default: unlimited) */
+  maxDepth?: number;
+
+  /** Globs (relative to the walked directory) to skip; directories are pruned */
+  exclude?: string[];
+
+  /** Whether to report dot-files and descend into dot-directories (default: true) */
+  includeHidden?: boolean;
+
+  /** Whether to report symlinks (never followed into; default: false) */
+  includeSymlinks?: boolean;
+}
+
+/**
+ * Workspace index options
+ */
+export interface WorkspaceIndexOptions {
+  /** Whether to skip paths ignored by .gitignore files (default: true) */
+  respectGitignore?: boolean;
+
+  /** Whether to watch indexed directories for changes (default: true) */
+  watch?: boolean;
+
+  /** Maximum per-directory watchers before falling back to sweeps */
+  maxWatchers?: number;
+
+  /** Minimum time between mtime sweeps of an unwatched directory (ms) */
+  sweepIntervalMs?: number;
+}
+
+/**
+ * Index statistics
+ */
+export interface WorkspaceIndexStats {
+  root: string;
+  directories: number;
+  files: number;
+  watchers: number;
+  directoryReads: number;
+  sweeps: number;
+}
+
+/**
+ * A parsed .gitignore rule
+ */
+interface IgnoreRule {
+  regex: RegExp;
+  negate: boolean;
+  directoryOnly: boolean;
+  /** Match against the path relative to the .gitignore (else the name) */
+  anchored: boolean;
+}
+
+/**
+ * Rules of one .gitignore, with the directory they apply below
+ */
+interface IgnoreScope {
+  base: string;
+  rules: IgnoreRule[];
+}
+
+/**
+ * Trie node
+ */
+interface IndexNode {
+  name: string;
+  type: WorkspaceEntryType;
+  size: number;
+  mtimeMs: number;
+  /** Children by name, sorted; null until the directory is read */
+  children: Map<string, IndexNode> | null;
+  /** Rules from this directory's .gitignore, and its text */
+  ignore: IgnoreRule[] | null;
+  ignoreSource: string;
+  /** Needs a re-read before it is served again */
+  stale: boolean;
+  /** Last time an unwatched directory was swept */
+  checkedAt: number;
+  /** Index generation the node was last validated in */
+  generation: number;
+  watcher: FSWatcher | null;
+}
+
+/** Never indexed, whatever the ignore rules say */
+const ALWAYS_IGNORED = new Set([".git"]);
+
+/** Platforms where fs.watch supports native recursive watching */
+const NATIVE_RECURSIVE_WATCH =
+  process.platform === "darwin" || process.platform === "win32";
+
+/** Indexes by root */
+const indexes = new Map<string, WorkspaceIndex>();
+const MAX_INDEXES = 8;
+
+/**
+ * Whether a path is a directory or inside it (both resolved)
+ */
+function isWithin(directory: string, path: string): boolean {
+  const rel = relative(directory, path);
+  return rel === "" || (!rel.startsWith("..") && !isAbsolute(rel));
+}
+
+/**
+ * Parse the contents of a .gitignore file
+ */
+function parseGitignore(content: string): IgnoreRule[] {
+  const rules: IgnoreRule[] = [];
+
+  for (const rawLine of content.split("\n")) {
+    let line = rawLine.replace(/\r$/, "").replace(/(?<!\\)\s+$/, "");
+    if (line === "" || line.startsWith("#")) {
+      continue;
+    }
+
+    const negate = line.startsWith("!");
+    if (negate) {
+      line = line.slice(1);
+    }
+    line = line.replace(/^\\([#!])/, "$1");
+
+    const directoryOnly = line.endsWith("/");
+    if (directoryOnly) {
+      line = line.slice(0, -1);
+    }
+
+    const anchored = line.includes("/");
+    if (line.startsWith("/")) {
+      line = line.slice(1);
+    }
+    if (line === "") {
+      continue;
+    }
+
+    rules.push({ regex: compileGlob(line), negate, directoryOnly, anchored });
+  }
+
+  return rules;
+}
+
+/**
+ * Whether the .gitignore scopes ignore a path (last matching rule wins)
+ */
+function isIgnored(
+  scopes: IgnoreScope[],
+  relativePath: string,
+  name: string,
+  isDirectory: boolean,
+): boolean {
+  let ignored = false;
+
+  for (const scope of scopes) {
+    const path = scope.base
+      ? relativePath.slice(scope.base.length + 1)
+      : relativePath;
+    for (const rule of scope.rules) {
+      if (rule.directoryOnly && !isDirectory) continue;
+      if (rule.regex.test(rule.anchored ? path : name)) {
+        ignored = !rule.negate;
+      }
+    }
+  }
+
+  return ignored;
+}
+
+/**
+ * WorkspaceIndex - cached file tree of one workspace root
+ *
+ * @example
+ * ```typescript
+ * const index = getWorkspaceIndex(process.cwd());
+ * await index.walk("src", { exclude: ["*.test.ts"] }, (entry) => {
+ *   console.log(entry.relativePath, entry.size);
+ * });
+ * ```
+ */
+export class WorkspaceIndex {
+  readonly root: string;
+  private readonly options: Required<WorkspaceIndexOptions>;
+  private readonly rootNode: IndexNode;
+  private rootWatcher: FSWatcher | null = null;
+  private watcherCount = 0;
+  /** Bumped to revalidate every directory on its next use */
+  private generation = 0;
+  private directoryReads = 0;
+  private sweeps = 0;
+  private closed = false;
+
+  constructor(root: string, options: WorkspaceIndexOptions = {}) {
+    this.root = resolve(root);
+    this.options = {
+      respectGitignore: true,
+      watch: true,
+      maxWatchers: 4096,
+      sweepIntervalMs: 2000,
+      ...options,
+    };
+    this.rootNode = this.createNode("", "directory", 0, 0);
+
+    if (this.options.watch && NATIVE_RECURSIVE_WATCH) {
+      try {
+        this.rootWatcher = watch(
+          this.root,
+          { recursive: true, persistent: false },
+          (_event, filename) => this.handleChange(filename?.toString() ?? null),
+        );
+        this.rootWatcher.on("error", () => this.dropRootWatcher());
+      } catch {
+        this.rootWatcher = null;
+      }
+    }
+  }
+
+  /**
+   * Whether a path is the root or inside it
+   */
+  contains(path: string): boolean {
+    return isWithin(this.root, resolve(path));
+  }
+
+  /**
+   * Walk a directory depth-first, children in name order
+   *
+   * Directories are reported before their contents. Entries ignored by
+   * .gitignore are never reported.
+   *
+   * @param directory - Directory to walk (absolute, or relative to the root)
+   * @param options - Depth, exclude and visibility options
+   * @param visit - Called per entry; return false to stop the walk
+   * @returns Number of directories read from the index during the walk
+   */
+  async walk(
+    directory: string,
+    options: WorkspaceWalkOptions,
+    visit: (entry: WorkspaceEntry) => boolean | void,
+  ): Promise<number> {
+    const start = resolve(this.root, directory);
+    if (!this.contains(start)) {
+      throw new Error(`Path is outside the workspace index: ${start}`);
+    }
+
+    const located = await this.locate(relative(this.root, start));
+    if (!located || located.node.type !== "directory") {
+      throw new Error(`Directory not found: ${start}`);
+    }
+
+    const maxDepth = options.maxDepth ?? Infinity;
+    const includeHidden = options.includeHidden !== false;
+    const includeSymlinks = options.includeSymlinks === true;
+    let directories = 0;
+    let stopped = false;
+
+    const visitDirectory = async (
+      node: IndexNode,
+      rootRelative: string,
+      walkRelative: string,
+      scopes: IgnoreScope[],
+      depth: number,
+    ): Promise<void> => {
+      const children = await this.load(node, rootRelative, scopes);
+      const childScopes = node.ignore
+        ? [...scopes, { base: rootRelative, rules: node.ignore }]
+        : scopes;
+      directories++;
+
+      for (const child of children.values()) {
+        if (stopped) return;
+        if (!includeHidden && child.name.startsWith(".")) continue;
+        if (child.type === "symlink" && !includeSymlinks) continue;
+
+        const childWalkRelative = walkRelative
+          ? `${walkRelative}/${child.name}`
+          : child.name;
+        const isDirectory = child.type === "directory";
+        if (matchesAnyGlob(childWalkRelative, options.exclude, isDirectory)) {
+          continue;
+        }
+
+        const childRootRelative = rootRelative
+          ? `${rootRelative}/${child.name}`
+          : child.name;
+        const entry: WorkspaceEntry = {
+          path: join(this.root, childRootRelative),
+          relativePath: childWalkRelative,
+          name: child.name,
+          type: child.type,
+          size: child.size,
+          mtimeMs: child.mtimeMs,
+          depth,
+        };
+        if (visit(entry) === false) {
+          stopped = true;
+          return;
+        }
+
+        if (isDirectory && depth < maxDepth) {
+          await visitDirectory(
+            child,
+            childRootRelative,
+            childWalkRelative,
+            childScopes,
+            depth + 1,
+          );
+        }
+      }
+    };
+
+    await visitDirectory(
+      located.node,
+      located.path,
+      "",
+      located.scopes,
+      0,
+    );
+    return directories;
+  }
+
+  /**
+   * Collect the files below a directory
+   *
+   * @param directory - Directory to walk (absolute, or relative to the root)
+   * @param options - Walk options
+   * @param filter - Optional predicate on each file
+   */
+  async files(
+    directory: string,
+    options: WorkspaceWalkOptions = {},
+    filter?: (entry: WorkspaceEntry) => boolean,
+  ): Promise<WorkspaceEntry[]> {
+    const files: WorkspaceEntry[] = [];
+    await this.walk(directory, options, (entry) => {
+      if (entry.type === "file" && (!filter || filter(entry))) {
+        files.push(entry);
+      }
+    });
+    return files;
+  }
+
+  /**
+   * Mark paths as changed, so the next walk re-reads their directories
+   *
+   * @param paths - Changed paths; omit to revalidate the whole index
+   */
+  invalidate(paths?: string[]): void {
+    if (!paths) {
+      this.generation++;
+      return;
+    }
+    for (const path of paths) {
+      if (this.contains(path)) {
+        this.handleChange(relative(this.root, resolve(path)));
+      }
+    }
+  }
+
+  /**
+   * Index statistics
+   */
+  getStats(): WorkspaceIndexStats {
+    let directories = 0;
+    let files = 0;
+    const count = (node: IndexNode): void => {
+      if (!node.children) return;
+      directories++;
+      for (const child of node.children.values()) {
+        if (child.type === "directory") count(child);
+        else files++;
+      }
+    };
+    count(this.rootNode);
+
+    return {
+      root: this.root,
+      directories,
+      files,
+      watchers: this.watcherCount + (this.rootWatcher ? 1 : 0),
+      directoryReads: this.directoryReads,
+      sweeps: this.sweeps,
+    };
+  }
+
+  /**
+   * Stop watching and drop the index
+   */
+  close(): void {
+    this.closed = true;
+    this.dropRootWatcher();
+    this.unload(this.rootNode);
+    this.rootNode.stale = false;
+    if (indexes.get(this.root) === this) {
+      indexes.delete(this.root);
+    }
+  }
+
+  /**
+   * Find the node for a root-relative path, loading directories on the way
+   */
+  private async locate(
+    path: string,
+  ): Promise<{ node: IndexNode; path: string; scopes: IgnoreScope[] } | null> {
+    const segments = path === "" ? [] : path.split(sep);
+    let node = this.rootNode;
+    let nodePath = "";
+    let scopes: IgnoreScope[] = [];
+
+    for (const segment of segments) {
+      const children = await this.load(node, nodePath, scopes);
+      if (node.ignore) {
+        scopes = [...scopes, { base: nodePath, rules: node.ignore }];
+      }
+      const child = children.get(segment);
+      if (!child) return null;
+      node = child;
+      nodePath = nodePath ? `${nodePath}/${segment}` : segment;
+    }
+
+    return { node, path: nodePath, scopes };
+  }
+
+  /**
+   * Children of a directory node, read or revalidated as needed
+   */
+  private async load(
+    node: IndexNode,
+    path: string,
+    scopes: IgnoreScope[],
+  ): Promise<Map<string, IndexNode>> {
+    if (node.children && !node.stale) {
+      const unwatched = !node.watcher && !this.rootWatcher;
+      if (
+        node.generation !== this.generation ||
+        (unwatched &&
+          Date.now() - node.checkedAt >= this.options.sweepIntervalMs)
+      ) {
+        await this.sweep(node, path);
+      }
+      if (!node.stale) return node.children;
+    }
+
+    await this.read(node, path, scopes);
+    return node.children!;
+  }
+
+  /**
+   * Read a directory and reconcile it with the indexed children
+   */
+  private async read(
+    node: IndexNode,
+    path: string,
+    scopes: IgnoreScope[],
+  ): Promise<void> {
+    const absolute = join(this.root, path);
+    node.stale = false;
+    node.checkedAt = Date.now();
+    node.generation = this.generation;
+    this.directoryReads++;
+
+    let dirents: Dirent[];
+    try {
+      const [entries, stats] = await Promise.all([
+        fs.readdir(absolute, { withFileTypes: true }),
+        fs.stat(absolute),
+      ]);
+      dirents = entries;
+      node.mtimeMs = stats.mtimeMs;
+    } catch {
+      this.unload(node);
+      node.children = new Map();
+      return;
+    }
+
+    let ignoreSource = "";
+    if (this.options.respectGitignore) {
+      try {
+        ignoreSource = await fs.readFile(join(absolute, ".gitignore"), "utf8");
+      } catch {
+        // No .gitignore here
+      }
+    }
+
+    let previous = node.children;
+    if (ignoreSource !== node.ignoreSource) {
+      // Rules changed: indexed subtrees may now include or exclude anything
+      if (previous) {
+        for (const child of previous.values()) this.unload(child);
+      }
+      previous = null;
+      const rules = parseGitignore(ignoreSource);
+      node.ignore = rules.length > 0 ? rules : null;
+      node.ignoreSource = ignoreSource;
+    }
+    const childScopes = node.ignore
+      ? [...scopes, { base: path, rules: node.ignore }]
+      : scopes;
+
+    const children = new Map<string, IndexNode>();
+    const kept = dirents
+      .filter((dirent) => !ALWAYS_IGNORED.has(dirent.name))
+      .sort((a, b) => (a.name < b.name ? -1 : a.name > b.name ? 1 : 0));
+
+    const nodes = await Promise.all(
+      kept.map(async (dirent): Promise<IndexNode | null> => {
+        const childPath = path ? `${path}/${dirent.name}` : dirent.name;
+        const type: WorkspaceEntryType = dirent.isSymbolicLink()
+          ? "symlink"
+          : dirent.isDirectory()
+            ? "directory"
+            : "file";
+        if (
+          this.options.respectGitignore &&
+          isIgnored(childScopes, childPath, dirent.name, type === "directory")
+        ) {
+          return null;
+        }
+
+        let stats;
+        try {
+          stats = await fs.stat(join(absolute, dirent.name));
+        } catch {
+          return null; // Vanished, or a dangling symlink
+        }
+
+        const existing = previous?.get(dirent.name);
+        if (existing && existing.type === type) {
+          existing.size = stats.size;
+          if (type === "directory" && existing.mtimeMs !== stats.mtimeMs) {
+            existing.stale = true;
+          }
+          existing.mtimeMs = stats.mtimeMs;
+          return existing;
+        }
+        if (existing) this.unload(existing);
+        return this.createNode(dirent.name, type, stats.size, stats.mtimeMs);
+      }),
+    );
+
+    for (const child of nodes) {
+      if (child) children.set(child.name, child);
+    }
+    if (previous) {
+      for (const [name, child] of previous) {
+        if (children.get(name) !== child) this.unload(child);
+      }
+    }
+
+    node.children = children;
+    this.watchDirectory(node, absolute, path);
+  }
+
+  /**
+   * Cheap revalidation of a directory: re-read it if its mtime changed
+   * (entries added or removed), else refresh the stats of its files
+   */
+  private async sweep(node: IndexNode, path: string): Promise<void> {
+    const absolute = join(this.root, path);
+    node.checkedAt = Date.now();
+    node.generation = this.generation;
+    this.sweeps++;
+
+    try {
+      if ((await fs.stat(absolute)).mtimeMs !== node.mtimeMs) {
+        node.stale = true;
+        return;
+      }
+    } catch {
+      node.stale = true;
+      return;
+    }
+
+    await Promise.all(
+      [...node.children!.values()].map(async (child) => {
+        if (child.type === "directory") return;
+        try {
+          const stats = await fs.stat(join(absolute, child.name));
+          // Editing a .gitignore does not touch the directory mtime
+          if (child.name === ".gitignore" && stats.mtimeMs !== child.mtimeMs) {
+            node.stale = true;
+          }
+          child.size = stats.size;
+          child.mtimeMs = stats.mtimeMs;
+        } catch {
+          node.stale = true;
+        }
+      }),
+    );
+  }
+
+  /**
+   * Record a change reported by a watcher (or an explicit invalidation)
+   *
+   * @param path - Root-relative path of the changed entry; null if unknown
+   */
+  private handleChange(path: string | null): void {
+    if (this.closed) return;
+    if (path === null) {
+      this.generation++;
+      return;
+    }
+
+    const segments = path === "" ? [] : path.split(/[\\/]/);
+    let node: IndexNode | undefined = this.rootNode;
+    let parent: IndexNode = this.rootNode;
+
+    for (const segment of segments) {
+      if (!node?.children) break;
+      parent = node;
+      node = node.children.get(segment);
+    }
+
+    // The entry itself (if it is an indexed directory) and its parent
+    if (node?.children) node.stale = true;
+    if (parent.children) parent.stale = true;
+  }
+
+  private watchDirectory(node: IndexNode, absolute: string, path: string): void {
+    if (
+      !this.options.watch ||
+      this.rootWatcher ||
+      this.closed ||
+      node.watcher ||
+      this.watcherCount >= this.options.maxWatchers
+    ) {
+      return;
+    }
+
+    try {
+      const watcher = watch(absolute, { persistent: false }, (_event, name) => {
+        if (!name) {
+          node.stale = true;
+          return;
+        }
+        const entry = name.toString();
+        this.handleChange(path ? `${path}/${entry}` : entry);
+      });
+      watcher.on("error", () => {
+        // Fall back to sweeping this directory
+        this.closeWatcher(node);
+        node.stale = true;
+      });
+      node.watcher = watcher;
+      this.watcherCount++;
+    } catch {
+      // Watch limit reached or unsupported: swept instead
+    }
+  }
+
+  private closeWatcher(node: IndexNode): void {
+    if (node.watcher) {
+      node.watcher.close();
+      node.watcher = null;
+      this.watcherCount--;
+    }
+  }
+
+  private dropRootWatcher(): void {
+    if (this.rootWatcher) {
+      this.rootWatcher.close();
+      this.rootWatcher = null;
+      this.generation++;
+    }
+  }
+
+  /**
+   * Forget a subtree and close its watchers
+   */
+  private unload(node: IndexNode): void {
+    this.closeWatcher(node);
+    if (node.children) {
+      for (const child of node.children.values()) {
+        this.unload(child);
+      }
+    }
+    node.children = null;
+    node.ignore = null;
+    node.ignoreSource = "";
+    node.stale = true;
+  }
+
+  private createNode(
+    name: string,
+    type: WorkspaceEntryType,
+    size: number,
+    mtimeMs: number,
+  ): IndexNode {
+    return {
+      name,
+      type,
+      size,
+      mtimeMs,
+      children: null,
+      ignore: null,
+      ignoreSource: "",
+      stale: false,
+      checkedAt: 0,
+      generation: this.generation,
+      watcher: null,
+    };
+  }
+}
+
+/**
+ * Get the shared index that covers a directory
+ *
+ * Reuses an existing index whose root contains the directory; otherwise a
+ * new index is created at `root` (when it contains the directory) or at the
+ * directory itself.
+ *
+ * @param directory - Directory that will be walked
+ * @param root - Preferred workspace root (e.g. a tool's base directory)
+ */
+export function getWorkspaceIndex(
+  directory: string,
+  root: string = directory,
+): WorkspaceIndex {
+  const target = resolve(directory);
+
+  for (const index of indexes.values()) {
+    if (index.contains(target)) {
+      // Most recently used last, for eviction
+      indexes.delete(index.root);
+      indexes.set(index.root, index);
+      return index;
+    }
+  }
+
+  const preferred = resolve(root);
+  const index = new WorkspaceIndex(
+    isWithin(preferred, target) ? preferred : target,
+  );
+
+  if (indexes.size >= MAX_INDEXES) {
+    const oldest = indexes.values().next().value;
+    oldest?.close();
+  }
+  indexes.set(index.root, index);
+  return index;
+}
+
+/**
+ * Tell every shared index that paths changed
+ *
+ * @param paths - Changed absolute paths; omit to revalidate everything
+ */
+export function invalidateWorkspacePaths(paths?: string[]): void {
+  for (const index of indexes.values()) {
+    index.invalidate(paths);
+  }
+}
+
+/**
+ * Close and drop every shared index
+ */
+export function closeWorkspaceIndexes(): void {
+  for (const index of [...indexes.values()]) {
+    index.close();
+  }
+}
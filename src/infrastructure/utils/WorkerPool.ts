@@ -0,0 +1,234 @@
+/**
+ * WorkerPool - bounded pool of eval'd worker threads
+ *
+ * Shared by the tokenizer, the local embedder and the file scanner. Each
+ * task is posted to a worker as `{ id, ...payload }`; the worker replies
+ * with `{ id, result }` or `{ id, error }`.
+ *
+ * Features:
+ * - Workers are spawned lazily, up to the configured limit
+ * - Workers are unref'd while idle, so they never hold the process open
+ * - A worker that fails to start, throws or exits disables the pool: its
+ *   task and everything queued are rejected, and later tasks are rejected
+ *   immediately so callers fall back to their own thread instead of
+ *   respawning workers that keep failing
+ */
+
+import { Worker } from "worker_threads";
+
+/**
+ * Worker pool configuration
+ */
+export interface WorkerPoolConfig {
+  /** Name used in error messages */
+  name: string;
+
+  /** Worker script (CommonJS, run with `eval: true`) */
+  source: string;
+
+  /** Maximum worker threads (0 = never spawn) */
+  workers: number;
+
+  /** Produces the `workerData` of each worker (called on spawn) */
+  workerData?: () => unknown;
+}
+
+interface PoolTask<TResult> {
+  id: number;
+  payload: object;
+  resolve: (result: TResult) => void;
+  reject: (error: Error) => void;
+}
+
+interface PoolWorker<TResult> {
+  worker: Worker;
+  busy: PoolTask<TResult> | null;
+}
+
+interface WorkerReply<TResult> {
+  id: number;
+  result?: TResult;
+  error?: string;
+}
+
+/**
+ * WorkerPool - runs tasks on a bounded set of worker threads
+ */
+export class WorkerPool<TPayload extends object, TResult> {
+  private config: WorkerPoolConfig;
+  private pool: PoolWorker<TResult>[] = [];
+  private queue: PoolTask<TResult>[] = [];
+  private nextTaskId = 0;
+  private closed = false;
+  private failure: Error | null = null;
+
+  constructor(config: WorkerPoolConfig) {
+    this.config = config;
+  }
+
+  /**
+   * Whether tasks can run on worker threads
+   */
+  isAvailable(): boolean {
+    return !this.closed && !this.failure && this.config.workers > 0;
+  }
+
+  /**
+   * Run a task on a worker thread
+   *
+   * Rejects if the pool is closed, disabled or has no workers, or if the
+   * worker reports an error.
+   */
+  run(payload: TPayload): Promise<TResult> {
+    if (!this.isAvailable()) {
+      return Promise.reject(this.unavailableError());
+    }
+
+    return new Promise((resolve, reject) => {
+      this.queue.push({ id: this.nextTaskId++, payload, resolve, reject });
+      this.dispatch();
+    });
+  }
+
+  /**
+   * Get pool statistics
+   */
+  getStats(): { workers: number; busy: number; queued: number } {
+    return {
+      workers: this.pool.length,
+      busy: this.pool.filter((entry) => entry.busy).length,
+      queued: this.queue.length,
+    };
+  }
+
+  /**
+   * Terminate all workers and reject queued tasks
+   */
+  async close(): Promise<void> {
+    this.closed = true;
+    const workers = this.pool;
+    this.pool = [];
+
+    for (const task of this.queue.splice(0)) {
+      task.reject(new Error(`${this.config.name} closed`));
+    }
+    for (const entry of workers) {
+      entry.busy?.reject(new Error(`${this.config.name} closed`));
+      entry.busy = null;
+    }
+
+    await Promise.all(workers.map(({ worker }) => worker.terminate()));
+  }
+
+  private unavailableError(): Error {
+    if (this.closed) {
+      return new Error(`${this.config.name} closed`);
+    }
+    return this.failure ?? new Error(`${this.config.name} unavailable`);
+  }
+
+  /**
+   * Hand queued tasks to idle workers, spawning up to the pool size
+   */
+  private dispatch(): void {
+    while (this.queue.length > 0) {
+      let slot = this.pool.find((entry) => !entry.busy);
+      if (!slot && this.pool.length < this.config.workers) {
+        try {
+          slot = this.spawnWorker();
+        } catch (error) {
+          this.disable(error as Error);
+          return;
+        }
+      }
+      if (!slot) {
+        return;
+      }
+
+      const task = this.queue.shift()!;
+      slot.busy = task;
+      slot.worker.ref(); // Keep the process alive while work is pending
+      slot.worker.postMessage({ ...task.payload, id: task.id });
+    }
+  }
+
+  private spawnWorker(): PoolWorker<TResult> {
+    const worker = new Worker(this.config.source, {
+      eval: true,
+      workerData: this.config.workerData?.(),
+    });
+    const entry: PoolWorker<TResult> = { worker, busy: null };
+
+    worker.on("message", (message: WorkerReply<TResult>) => {
+      const task = entry.busy;
+      entry.busy = null;
+      worker.unref();
+
+      if (task && task.id === message.id) {
+        if (message.error !== undefined || message.result === undefined) {
+          task.reject(
+            new Error(message.error || `${this.config.name} worker failed`),
+          );
+        } else {
+          task.resolve(message.result);
+        }
+      }
+
+      if (this.failure) {
+        this.pool = this.pool.filter((other) => other !== entry);
+        void worker.terminate();
+        return;
+      }
+      this.dispatch();
+    });
+
+    worker.on("error", (error) => {
+      this.fail(entry, error);
+    });
+
+    worker.on("exit", (code) => {
+      this.fail(
+        entry,
+        new Error(`${this.config.name} worker exited with code ${code}`),
+      );
+    });
+
+    worker.unref();
+    this.pool.push(entry);
+    return entry;
+  }
+
+  /**
+   * Drop a broken worker, fail its task and disable the pool
+   */
+  private fail(entry: PoolWorker<TResult>, error: Error): void {
+    if (!this.pool.includes(entry)) {
+      return; // Already dropped (an "error" is followed by "exit") or closed
+    }
+
+    this.pool = this.pool.filter((other) => other !== entry);
+    entry.busy?.reject(error);
+    entry.busy = null;
+    this.disable(error);
+  }
+
+  /**
+   * Stop accepting tasks after a worker failure
+   *
+   * Workers still running a task finish it and are then terminated; idle
+   * ones are terminated now.
+   */
+  private disable(error: Error): void {
+    this.failure ??= error;
+
+    for (const task of this.queue.splice(0)) {
+      task.reject(error);
+    }
+
+    const idle = this.pool.filter((entry) => !entry.busy);
+    this.pool = this.pool.filter((entry) => entry.busy);
+    for (const { worker } of idle) {
+      void worker.terminate();
+    }
+  }
+}
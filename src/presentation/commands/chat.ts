@@ -13,10 +13,26 @@ import { ChatOrchestrator } from '../../application/services/ChatOrchestrator.js
 import { CommandRegistry } from '../../application/services/CommandRegistry.js';
 import { ModelConfigService } from '../../application/services/ModelConfigService.js';
 import { AgentService } from '../../application/services/AgentService.js';
+import { existsSync } from 'fs';
+import { homedir } from 'os';
+import { join } from 'path';
 import { CopilotClient } from '../../infrastructure/llm/CopilotClient.js';
+import { createResponseCache } from '../../infrastructure/llm/cache/index.js';
+import { DEFAULT_PROJECT_STRUCTURE } from '../../core/constants/defaults.js';
 import { Logger } from '../../infrastructure/logging/Logger.js';
 import chalk from 'chalk';
 
+/**
+ * Directory for the on-disk LLM response cache
+ *
+ * Uses the project's .nocturne/cache when run inside a project, otherwise
+ * the same layout under the user's home directory.
+ */
+function getResponseCacheDirectory(): string {
+  const root = existsSync(join(process.cwd(), '.nocturne')) ? process.cwd() : homedir();
+  return join(root, DEFAULT_PROJECT_STRUCTURE.cache, 'llm');
+}
+
 /**
  * Start the chat UI
  */
@@ -48,6 +64,10 @@ export async function startChatUI(): Promise<void> {
 
     logger.log('info', 'Initialized AgentService');
 
+    // Response cache shared by both clients: memory LRU over an on-disk tier,
+    // so identical requests are answered from disk across sessions
+    const responseCache = createResponseCache({ directory: getResponseCacheDirectory() });
+
     // Initialize router client (fast free model for intent classification)
     let routerClient = null;
     try {
@@ -55,8 +75,9 @@ export async function startChatUI(): Promise<void> {
       routerClient = new CopilotClient({
         baseURL: 'http://localhost:4141',
         model: routerModel.id,
-        timeout: 5000  // Faster timeout for router
-      });
+        timeout: 5000,  // Faster timeout for router
+        ...modelService.getRateLimitConfig()
+      }, responseCache);
       logger.log('info', `Router initialized with ${routerModel.name} (${routerModel.id})`);
     } catch (error) {
       logger.log('warn', 'Failed to initialize router client');
@@ -68,8 +89,9 @@ export async function startChatUI(): Promise<void> {
       llmClient = new CopilotClient({
         baseURL: 'http://localhost:4141',
         model: modelService.getCurrentModel().id,
-        timeout: 30000
-      });
+        timeout: 30000,
+        ...modelService.getRateLimitConfig()
+      }, responseCache);
       logger.log('info', `Main client connected: ${modelService.getCurrentModel().name}`);
     } catch (error) {
       logger.log('warn', 'Failed to initialize LLM client - natural language disabled');
@@ -115,6 +137,7 @@ export async function startChatUI(): Promise<void> {
 
     // Wait for UI to exit
     await waitUntilExit();
+    await responseCache.close();
 
   } catch (error) {
     console.error(chalk.red('Error starting chat UI:'), error);
@@ -55,8 +55,8 @@ export const ChatLayout: React.FC<ChatLayoutProps> = ({
         // Check if this is an update to an existing message
         const existingIndex = prev.findIndex(m => m.id === message.id);
         if (existingIndex >= 0) {
-          // Update existing message - don't auto-scroll
-          setShouldAutoScroll(false);
+          // Update existing message - only follow it while it is streaming
+          setShouldAutoScroll(message.metadata?.streaming === true);
           const updated = [...prev];
           updated[existingIndex] = message;
           return updated;
@@ -67,6 +67,10 @@ export const ChatLayout: React.FC<ChatLayoutProps> = ({
       });
     };
 
+    const handleMessageRemoved = (messageId: string) => {
+      setMessages(prev => prev.filter(m => m.id !== messageId));
+    };
+
     const handleChatCleared = () => {
       setMessages([]);
     };
@@ -84,6 +88,7 @@ export const ChatLayout: React.FC<ChatLayoutProps> = ({
     };
 
     eventBus.on('chat:message', handleMessage);
+    eventBus.on('chat:message:removed', handleMessageRemoved);
     eventBus.on('chat:cleared', handleChatCleared);
     eventBus.on('model:changed', handleModelChanged);
     eventBus.on('mode:changed', handleModeChanged);
@@ -91,6 +96,7 @@ export const ChatLayout: React.FC<ChatLayoutProps> = ({
 
     return () => {
       eventBus.off('chat:message', handleMessage);
+      eventBus.off('chat:message:removed', handleMessageRemoved);
       eventBus.off('chat:cleared', handleChatCleared);
       eventBus.off('model:changed', handleModelChanged);
       eventBus.off('mode:changed', handleModeChanged);
@@ -143,7 +143,12 @@ export const ChatMessageComponent: React.FC<ChatMessageProps> = ({
         renderRichContent()
       ) : (
         <Box marginLeft={2} flexDirection="column">
-          <Text color={getMessageColor()}>{message.content}</Text>
+          <Text color={getMessageColor()}>
+            {message.content}
+            {message.metadata?.streaming === true && (
+              <Text color={theme.colors.muted}>▍</Text>
+            )}
+          </Text>
         </Box>
       )}
 
@@ -47,6 +47,9 @@ export const ChatMessages: React.FC<ChatMessagesProps> = ({
     }
   }, [shouldAutoScroll, messages.length]);
 
+  // A reply is currently streaming in
+  const isStreaming = messages.some(m => m.metadata?.streaming === true);
+
   // Get the last confirmation message that's pending
   const pendingConfirmation = messages
     .filter(m => m.type === 'confirmation' && m.status === 'pending')
@@ -60,7 +63,9 @@ export const ChatMessages: React.FC<ChatMessagesProps> = ({
           <Text bold color={theme.colors.primary}>
             🤖 AI Assistant
           </Text>
-          {isProcessing && (
+          {isStreaming ? (
+            <Text color={theme.colors.warning}> (responding...)</Text>
+          ) : isProcessing && (
             <Text color={theme.colors.warning}> (thinking...)</Text>
           )}
         </Box>